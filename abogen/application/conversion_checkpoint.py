@@ -0,0 +1,363 @@
+"""Per-chapter checkpoints for resumable and incremental conversions.
+
+When a conversion runs with a checkpoint, every chapter is rendered into an
+audio shard inside a store directory. Once a shard is complete, one JSON line
+is appended to ``manifest.jsonl``. The line holds the chapter's shard key,
+its duration, the markers recorded while it rendered (timed from zero) and
+its subtitle entries.
+
+A later run reuses every chapter whose shard key still matches and renders
+only the rest. The merged output, subtitles, markers and metadata are then
+rebuilt from the shards. Two kinds of store exist:
+
+* Job checkpoints under the user cache, keyed by the job's resume token.
+  They let a retry or a server restart resume, and are removed once the
+  conversion succeeds.
+* Project render stores inside ``project_root``. They are kept with the
+  output so a re-publish after an edit only re-synthesizes changed chapters.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from abogen.application.conversion_models import ChapterPlan, ConversionPlan
+from abogen.domain.normalization import TTSContext
+
+logger = logging.getLogger(__name__)
+
+# Bump when the shard/record layout or what a fingerprint covers changes.
+CHECKPOINT_VERSION = 2
+MANIFEST_NAME = "manifest.jsonl"
+# Shard encoding for every store: 24-bit FLAC, far smaller than float WAV.
+SHARD_AUDIO_FORMAT = ("flac", "PCM_24")
+
+# Request fields that change the rendered audio, subtitles or markers of a
+# chapter. Output format, save options and metadata only affect the final mux.
+_RENDER_FIELDS = (
+    "language",
+    "tts_provider",
+    "voice",
+    "voice_profile",
+    "speed",
+    "supertonic_total_steps",
+    "chapter_intro_delay",
+    "auto_prefix_chapter_titles",
+    "normalize_chapter_opening_caps",
+    "replace_single_newlines",
+    "subtitle",
+    "pronunciation",
+    "word_substitution",
+    "subtitle_input",
+)
+
+# Normalization settings outside the ``normalization_*`` family that change
+# what the LLM pass rewrites. Connection, timeout, concurrency and cache
+# options only change how the text is obtained, so they stay out of the key.
+_RENDER_LLM_SETTINGS = ("llm_model", "llm_prompt", "llm_context_mode", "llm_batch_size")
+
+
+@dataclass
+class ChapterCheckpoint:
+    """A finished chapter as recorded in the manifest."""
+
+    chapter_idx: int
+    key: str
+    path: Path
+    duration: float
+    chapter_markers: List[Dict[str, Any]] = field(default_factory=list)
+    chunk_markers: List[Dict[str, Any]] = field(default_factory=list)
+    subtitle_entries: List[Tuple[float, float, str]] = field(default_factory=list)
+
+
+def _json_default(value: Any) -> Any:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def _stable_json(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, default=_json_default, ensure_ascii=False)
+
+
+def chapter_fingerprint(
+    request: Any,
+    chapter_idx: int,
+    chapter: ChapterPlan,
+    chapter_count: int,
+) -> str:
+    """Hash the planned content of *chapter*.
+
+    Covers the chapter's segment text and voices, its position (headings
+    and markers carry the index; the last chapter has no trailing silence)
+    and the request fields that change how it renders, including speed and
+    pronunciation overrides.
+    """
+    payload: Dict[str, Any] = {
+        "version": CHECKPOINT_VERSION,
+        "index": chapter_idx,
+        "title": chapter.title,
+        "voice_spec": chapter.voice_spec,
+        "segments": chapter.segments,
+        "request": {name: getattr(request, name, None) for name in _RENDER_FIELDS},
+        "trailing_silence": 0.0 if chapter_idx == chapter_count else request.silence_between_chapters,
+    }
+    return hashlib.sha256(_stable_json(payload).encode("utf-8")).hexdigest()
+
+
+def _render_settings(settings: Mapping[str, Any]) -> Dict[str, Any]:
+    """The normalization settings that can change a chapter's rendered text."""
+    return {
+        name: value
+        for name, value in settings.items()
+        if name.startswith("normalization_") or name in _RENDER_LLM_SETTINGS
+    }
+
+
+def shard_key(
+    plan: ConversionPlan,
+    chapter_idx: int,
+    chapter: ChapterPlan,
+    *,
+    tts_context: Optional[TTSContext] = None,
+    include_intro: bool = False,
+    collect_subtitles: bool = False,
+) -> str:
+    """Key a rendered chapter shard.
+
+    Extends the planned fingerprint with what only the executor knows: the
+    resolved normalization settings and rules, whether the intro is read at
+    the start of this chapter, and whether subtitle entries were collected.
+    """
+    fingerprint = chapter.fingerprint or chapter_fingerprint(
+        plan.request, chapter_idx, chapter, len(plan.chapters)
+    )
+    payload: Dict[str, Any] = {
+        "chapter": fingerprint,
+        "intro": plan.intro if include_intro and plan.intro and plan.intro.enabled else None,
+        "subtitles": collect_subtitles,
+    }
+    if tts_context is not None:
+        payload["normalization"] = {
+            "split_pattern": tts_context.split_pattern,
+            "pronunciation_rules": list(tts_context.pronunciation_rules or []),
+            "heteronym_rules": list(tts_context.heteronym_rules or []),
+            "settings": _render_settings(tts_context.runtime_settings or tts_context.normalization_overrides or {}),
+        }
+    return hashlib.sha256(_stable_json(payload).encode("utf-8")).hexdigest()
+
+
+class CheckpointStore:
+    """Directory of chapter shards plus an append-only manifest.
+
+    Args:
+        directory: Where shards and ``manifest.jsonl`` live.
+        audio_format: ``(format, subtype)`` for new shards. Both job
+            checkpoints and project stores use 24-bit FLAC, which keeps a
+            10-hour book's shards at a fraction of the float WAV size.
+    """
+
+    def __init__(
+        self,
+        directory: Path | str,
+        audio_format: Tuple[str, str] = SHARD_AUDIO_FORMAT,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.audio_format = audio_format
+        self._manifest = self.directory / MANIFEST_NAME
+        self._lock = threading.Lock()
+        self._records = self._read_manifest()
+
+    def _read_manifest(self) -> Dict[int, Dict[str, Any]]:
+        records: Dict[int, Dict[str, Any]] = {}
+        try:
+            with self._manifest.open("r", encoding="utf-8") as handle:
+                for line in handle:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # A torn final line from a crash mid-append.
+                        continue
+                    if record.get("version") == CHECKPOINT_VERSION:
+                        records[int(record["chapter"])] = record
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            logger.warning("Ignoring unreadable checkpoint manifest %s: %s", self._manifest, exc)
+        return records
+
+    @property
+    def has_manifest(self) -> bool:
+        return self._manifest.is_file()
+
+    def shard_path(self, chapter_idx: int) -> Path:
+        return self.directory / f"chapter_{chapter_idx:05d}.{self.audio_format[0]}"
+
+    def load(self, chapter_idx: int, key: str) -> Optional[ChapterCheckpoint]:
+        """Return the finished chapter if its shard key still matches."""
+        with self._lock:
+            record = self._records.get(chapter_idx)
+        if not record or record.get("key") != key:
+            return None
+        path = self.directory / record["shard"]
+        if not path.is_file():
+            return None
+        return ChapterCheckpoint(
+            chapter_idx=chapter_idx,
+            key=key,
+            path=path,
+            duration=float(record["duration"]),
+            chapter_markers=list(record.get("chapter_markers") or []),
+            chunk_markers=list(record.get("chunk_markers") or []),
+            subtitle_entries=[tuple(entry) for entry in record.get("subtitle_entries") or []],
+        )
+
+    def save(self, checkpoint: ChapterCheckpoint) -> None:
+        """Append a finished chapter to the manifest (after its shard is closed)."""
+        record = {
+            "version": CHECKPOINT_VERSION,
+            "chapter": checkpoint.chapter_idx,
+            "key": checkpoint.key,
+            "shard": checkpoint.path.name,
+            "duration": checkpoint.duration,
+            "chapter_markers": checkpoint.chapter_markers,
+            "chunk_markers": checkpoint.chunk_markers,
+            "subtitle_entries": [list(entry) for entry in checkpoint.subtitle_entries],
+        }
+        line = json.dumps(record, default=_json_default, ensure_ascii=False) + "\n"
+        # The shard must be durable before the manifest points at it.
+        with checkpoint.path.open("rb") as shard:
+            os.fsync(shard.fileno())
+        with self._lock:
+            with self._manifest.open("a", encoding="utf-8") as handle:
+                handle.write(line)
+                handle.flush()
+                os.fsync(handle.fileno())
+            self._records[checkpoint.chapter_idx] = record
+
+    def adopt(self, checkpoint: ChapterCheckpoint) -> ChapterCheckpoint:
+        """Copy a chapter finished in another store into this one.
+
+        Hard-links the shard when both stores share a filesystem.
+        """
+        target = self.directory / checkpoint.path.name
+        if target != checkpoint.path:
+            target.unlink(missing_ok=True)
+            try:
+                os.link(checkpoint.path, target)
+            except OSError:
+                shutil.copyfile(checkpoint.path, target)
+        adopted = dataclasses.replace(checkpoint, path=target)
+        self.save(adopted)
+        return adopted
+
+    def completed(self) -> List[int]:
+        """Chapter indexes recorded in the manifest."""
+        with self._lock:
+            return sorted(self._records)
+
+    def compact(self, chapter_count: int) -> None:
+        """Rewrite the manifest with one line per current chapter.
+
+        Drops records past ``chapter_count`` and deletes shards no record
+        points at.
+        """
+        with self._lock:
+            records = {
+                index: record for index, record in self._records.items() if index <= chapter_count
+            }
+            tmp_path = self._manifest.with_suffix(".tmp")
+            with tmp_path.open("w", encoding="utf-8") as handle:
+                for index in sorted(records):
+                    handle.write(json.dumps(records[index], ensure_ascii=False) + "\n")
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(tmp_path, self._manifest)
+            self._records = records
+            live = {record["shard"] for record in records.values()}
+        for path in self.directory.glob("chapter_*"):
+            if path.name not in live:
+                path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Delete the checkpoint directory."""
+        with self._lock:
+            self._records.clear()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def _checkpoint_root() -> Path:
+    from abogen.utils import get_user_cache_path
+
+    return Path(get_user_cache_path("checkpoints"))
+
+
+def _safe_id(checkpoint_id: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", checkpoint_id)[:128] or "job"
+
+
+def open_checkpoint(checkpoint_id: str) -> CheckpointStore:
+    """Open (or create) the checkpoint directory for a job."""
+    return CheckpointStore(_checkpoint_root() / _safe_id(checkpoint_id))
+
+
+def discard_checkpoint(checkpoint_id: Optional[str]) -> None:
+    """Remove a job's checkpoint directory if it exists."""
+    if not checkpoint_id:
+        return
+    shutil.rmtree(_checkpoint_root() / _safe_id(checkpoint_id), ignore_errors=True)
+
+
+# ─── Project render stores ───────────────────────────────────────
+
+PROJECT_RENDER_DIR = ".render"
+
+
+def open_project_store(project_root: Path | str) -> CheckpointStore:
+    """Open the render store kept inside a project folder."""
+    return CheckpointStore(Path(project_root) / PROJECT_RENDER_DIR)
+
+
+def find_previous_project_store(project_root: Path | str) -> Optional[CheckpointStore]:
+    """Return the render store of the newest earlier project of the same book.
+
+    Project folders are named ``<timestamp>_<book>``; siblings sharing the
+    book part are earlier renders of it.
+    """
+    project_root = Path(project_root)
+    stamp, sep, book = project_root.name.partition("_")
+    if not sep or not book:
+        return None
+    candidates = []
+    try:
+        siblings = list(project_root.parent.iterdir())
+    except OSError:
+        return None
+    for sibling in siblings:
+        if sibling == project_root or not sibling.is_dir():
+            continue
+        other_stamp, other_sep, other_book = sibling.name.partition("_")
+        if other_sep and other_book == book and other_stamp <= stamp:
+            manifest = sibling / PROJECT_RENDER_DIR / MANIFEST_NAME
+            if manifest.is_file():
+                candidates.append((other_stamp, manifest.stat().st_mtime, sibling))
+    if not candidates:
+        return None
+    _, _, newest = max(candidates)
+    return open_project_store(newest)
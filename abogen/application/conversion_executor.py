@@ -9,22 +9,35 @@ This is Stage 6 of the conversion flow unification plan.
 from __future__ import annotations
 
 import logging
+import shutil
+import tempfile
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import ExitStack
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
-
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from abogen.application.conversion_checkpoint import (
+    ChapterCheckpoint,
+    CheckpointStore,
+    shard_key,
+)
 from abogen.application.conversion_models import (
+    ChapterPlan,
     ConversionPlan,
 )
 from abogen.application.conversion_ports import (
     AudioSink,
+    ConversionCancelled,
     ConversionEvents,
     PipelineProvider,
     SubtitleWriter,
     VoiceResolver,
 )
 from abogen.application.conversion_result import ConversionResult
-from abogen.domain.audio_sink import open_audio_sink
+from abogen.domain.audio_sink import log_writer_stats, open_audio_sink, writer_queue_blocks
 from abogen.domain.conversion_engine import (
     SegmentStats,
     SynthParams,
@@ -32,14 +45,22 @@ from abogen.domain.conversion_engine import (
     synthesize_text,
 )
 from abogen.domain.enums import OutputFormat, SubtitleMode
+from abogen.domain.lookahead import Lookahead, LookaheadStats, log_lookahead_stats
 from abogen.domain.normalization import TTSContext
 from abogen.domain.chapter_titles import (
     apply_chapter_text_transforms,
     headings_equivalent as _headings_equivalent,
 )
+from abogen.domain.audio_buffer import SAMPLE_RATE
 from abogen.domain.output_paths import sanitize_filename_for_chapter
+from abogen.domain.progress import calc_etr_str
+from abogen.domain.segment_cache import SegmentCache
+from abogen.domain.token_timings import TokenColumns
 from abogen.infrastructure.subtitle_writer import make_subtitle_writer
 
+# Frames read per block when streaming a chapter shard into the output sinks.
+SHARD_BLOCK_FRAMES = SAMPLE_RATE * 10
+
 
 # ─── MarkerCollector ───
 
@@ -135,6 +156,29 @@ class MarkerCollector:
             "voices": [{"provider": provider, "voice": voice_spec}],
         })
 
+    @classmethod
+    def from_markers(
+        cls,
+        chapter_markers: List[Dict[str, Any]],
+        chunk_markers: List[Dict[str, Any]],
+    ) -> MarkerCollector:
+        """Rebuild a collector from previously recorded markers."""
+        collector = cls()
+        collector._chapter_markers = [dict(marker) for marker in chapter_markers]
+        collector._chunk_markers = [dict(marker) for marker in chunk_markers]
+        return collector
+
+    def absorb(self, other: MarkerCollector, offset: float) -> None:
+        """Append markers recorded by ``other``, shifted by ``offset`` seconds."""
+        for marker in other.chapter_markers:
+            self._chapter_markers.append(
+                {**marker, "start": marker["start"] + offset, "end": marker["end"] + offset}
+            )
+        for marker in other.chunk_markers:
+            self._chunk_markers.append(
+                {**marker, "start": marker["start"] + offset, "end": marker["end"] + offset}
+            )
+
     @property
     def chapter_markers(self) -> List[Dict[str, Any]]:
         return self._chapter_markers
@@ -152,6 +196,11 @@ def execute_conversion(
     tts_context: TTSContext,
     *,
     check_cancelled: Optional[Callable[[], None]] = None,
+    chapter_workers: Optional[int] = None,
+    pipeline_provider_factory: Optional[Callable[[], PipelineProvider]] = None,
+    segment_cache: Optional[SegmentCache] = None,
+    checkpoint: Optional[CheckpointStore] = None,
+    previous_render: Optional[CheckpointStore] = None,
 ) -> ConversionResult:
     """Execute a conversion plan and return the result.
 
@@ -162,6 +211,20 @@ def execute_conversion(
         voice_resolver: Resolves voice specs into loaded voices
         tts_context: Normalization context for text processing
         check_cancelled: Optional cancellation checker (overrides events.check_cancelled)
+        chapter_workers: Number of chapters synthesized concurrently
+            (overrides request.chapter_workers). Values above 1 render each
+            chapter into a temporary shard and reassemble them in order.
+        pipeline_provider_factory: Creates one pipeline provider per chapter
+            worker. Required for parallel chapters; without it the
+            executor runs serially.
+        segment_cache: Replays previously synthesized text chunks instead
+            of calling the backend again. None disables caching.
+        checkpoint: Job-scoped store of finished chapters. Chapters already
+            in it (with a matching fingerprint) are reused instead of
+            re-synthesized, and each newly finished chapter is recorded.
+        previous_render: Store saved with an earlier output of the same
+            book. Unchanged chapters are taken from it (and adopted into
+            ``checkpoint``) so only edited chapters are synthesized.
 
     Returns:
         ConversionResult with paths and markers
@@ -201,6 +264,8 @@ def execute_conversion(
         total_characters=total_characters,
     )
 
+    cache_before = segment_cache.stats() if segment_cache is not None else None
+
     # Compute subtitle flag once (used in every synthesize_text call)
     use_spacy = request.subtitle.mode not in (SubtitleMode.DISABLED, SubtitleMode.LINE)
 
@@ -237,6 +302,7 @@ def execute_conversion(
                     request.output_format,
                     metadata=meta,
                     cancel_check=check_cancelled,
+                    background_queue=writer_queue_blocks(),
                 )
             )
             result.audio_path = audio_path
@@ -265,6 +331,7 @@ def execute_conversion(
             max_subtitle_words=request.subtitle.max_words,
             language=request.language,
             use_spacy_segmentation=use_spacy,
+            segment_cache=segment_cache,
         )
 
         # Chapter directory
@@ -296,241 +363,76 @@ def execute_conversion(
             events.log("Intro synthesized.")
 
         # Chapter loop
-        for chapter_idx, chapter in enumerate(plan.chapters, 1):
-            check_cancelled()
-
-            chapter_display = f"Chapter {chapter_idx}/{len(plan.chapters)}: {chapter.title}"
-            events.log(f"Processing {chapter_display}")
-            logging.info("[executor] Chapter %d/%d: %s", chapter_idx, len(plan.chapters), chapter.title)
-
-            # Resolve chapter voice
-            chapter_provider, chapter_voice, chapter_speed, chapter_steps = _resolve_voice(
-                voice_resolver, chapter.voice_spec, request,
-                log_callback=lambda msg: events.log(msg, level="warning"),
+        workers = _resolve_chapter_workers(
+            chapter_workers if chapter_workers is not None else request.chapter_workers,
+            plan,
+            pipeline_provider_factory,
+        )
+        if workers > 1 or checkpoint is not None or previous_render is not None:
+            _execute_chapters_sharded(
+                plan=plan,
+                events=events,
+                pipeline_provider_factory=pipeline_provider_factory if workers > 1 else None,
+                shared_provider=pipeline_provider if workers == 1 else None,
+                voice_resolver=voice_resolver,
+                synth=synth,
+                collector=collector,
+                result=result,
+                stack=stack,
+                chapter_dir=chapter_dir,
+                subtitle_writer=subtitle_writer,
+                include_intro=not intro_emitted,
+                use_spacy=use_spacy,
+                check_cancelled=check_cancelled,
+                workers=workers,
+                checkpoint=checkpoint,
+                previous_render=previous_render,
+                tts_context=tts_context,
             )
-            logging.info("[executor] Chapter %d voice: provider=%s voice=%s speed=%.2f", chapter_idx, chapter_provider, chapter_voice, chapter_speed)
-            chapter_backend = pipeline_provider.get(chapter_provider, request.language, request.use_gpu)
-
-            # Record chapter start for markers
-            collector.on_chapter_start(chapter_idx - 1, chapter.title, stats.current_time)
-
-            # Per-chapter sink
-            chapter_sink: Optional[AudioSink] = None
-            chapter_path = None
-            if chapter_dir:
-                chapter_filename = sanitize_filename_for_chapter(chapter.title, chapter_idx)
-                chapter_path = chapter_dir / f"{chapter_filename}.{request.save.separate_chapters_format}"
-                chapter_sink = stack.enter_context(
-                    open_audio_sink(
-                        chapter_path,
-                        request.save.separate_chapters_format,
-                        cancel_check=check_cancelled,
-                    )
+        else:
+            prepared = stack.enter_context(
+                Lookahead(
+                    _prepare_plan_segments(plan, tts_context, use_spacy, events),
+                    name="abogen-normalize",
                 )
-                result.chapter_paths.append(chapter_path)
-
-            # Per-chapter subtitle writer
-            chapter_subtitle_writer: Optional[SubtitleWriter] = None
-            if chapter_dir and request.subtitle.mode != SubtitleMode.DISABLED and chapter_sink:
-                from abogen.infrastructure.subtitle_writer import resolve_subtitle_format
-
-                chapter_filename = sanitize_filename_for_chapter(chapter.title, chapter_idx)
-                subtitle_ext, _ = resolve_subtitle_format(
-                    request.subtitle
-                )
-                chapter_subtitle_path = chapter_dir / f"{chapter_filename}.{subtitle_ext}"
-                chapter_subtitle_writer = make_subtitle_writer(
-                    chapter_subtitle_path,
-                    request.subtitle,
-                )
-                if chapter_subtitle_writer:
-                    chapter_subtitle_writer.open()
-                    result.subtitle_paths.append(chapter_subtitle_writer.path)
-
-            # Intro delay before first chapter
-            if not intro_emitted and plan.intro and plan.intro.enabled:
-                # Intro will be emitted with first chapter
-                intro_provider, intro_voice, intro_speed, intro_steps = _resolve_voice(
-                    voice_resolver, plan.intro.voice_spec, request,
-                    log_callback=lambda msg: events.log(msg, level="warning"),
-                )
-                intro_backend = pipeline_provider.get(intro_provider, request.language, request.use_gpu)
-                synthesize_text(
-                    text=plan.intro.text,
-                    params=synth,
-                    backend=intro_backend,
-                    voice=intro_voice,
-                    speed=intro_speed or request.speed,
-                    total_steps=intro_steps,
-                    chapter_sink=chapter_sink,
-                    preview_callback=lambda text: events.log(f"  Intro: {text[:80]}"),
-                )
-                intro_emitted = True
-                if request.chapter_intro_delay > 0:
-                    _append_silence(
-                        request.chapter_intro_delay,
-                        chapter_sink=chapter_sink,
-                        audio_sink=audio_sink,
-                        stats=stats,
-                    )
-
-            # Process heading
-            heading_text = ""
-            if chapter.title:
-                heading_text = _format_heading(chapter.title, chapter_idx, request)
-                if heading_text:
-                    synthesize_text(
-                        text=heading_text,
-                        params=synth,
-                        backend=chapter_backend,
-                        voice=chapter_voice,
-                        speed=chapter_speed or request.speed,
-                        chapter_sink=chapter_sink,
-                        preview_callback=lambda text: events.log(f"  Title: {text[:80]}"),
-                    )
-                    if request.chapter_intro_delay > 0:
-                        _append_silence(
-                            request.chapter_intro_delay,
-                            chapter_sink=chapter_sink,
-                            audio_sink=audio_sink,
-                            stats=stats,
-                        )
-
-            # Heading dedup: check if first line of body matches heading
-            pending_heading_strip = False
-            if heading_text and chapter.body_text:
-                first_line = next(
-                    (line.strip() for line in chapter.body_text.splitlines() if line.strip()),
-                    "",
-                )
-                if first_line and _headings_equivalent(first_line, heading_text):
-                    pending_heading_strip = True
-
-            # Process body segments
-            for seg_idx, segment in enumerate(chapter.segments):
+            )
+            for chapter_idx, chapter in enumerate(plan.chapters, 1):
                 check_cancelled()
 
-                # Apply heading dedup to first segment (consume-once)
-                seg_text = segment.text
-                if pending_heading_strip and seg_text.strip():
-                    seg_text, heading_removed, _ = apply_chapter_text_transforms(
-                        seg_text,
-                        heading_text=heading_text,
-                        raw_title=chapter.title,
-                        strip_heading=True,
-                        normalize_caps=False,
-                    )
-                    if heading_removed:
-                        pending_heading_strip = False
-                    if not seg_text.strip():
-                        continue
-
-                # Resolve segment voice (may differ from chapter voice)
-                if segment.voice_spec != chapter.voice_spec:
-                    seg_provider, seg_voice, seg_speed, seg_steps = _resolve_voice(
-                        voice_resolver, segment.voice_spec, request,
-                        log_callback=lambda msg: events.log(msg, level="warning"),
-                    )
-                    seg_backend = pipeline_provider.get(seg_provider, request.language, request.use_gpu)
-                else:
-                    seg_provider = chapter_provider
-                    seg_voice = chapter_voice
-                    seg_speed = chapter_speed
-                    seg_steps = chapter_steps
-                    seg_backend = chapter_backend
-
-                # Track voice for chapter marker
-                collector.on_segment(seg_provider, seg_voice, segment.voice_spec)
-
-                # spaCy pre-TTS segmentation
-                from abogen.domain.conversion_pipeline import spacy_pre_tts_segmentation
-
-                is_subtitle_input = bool(
-                    request.subtitle_input
-                )
-                spacy_segments, active_split = spacy_pre_tts_segmentation(
-                    seg_text,
-                    request.language,
-                    request.subtitle.mode,
-                    is_subtitle_input=is_subtitle_input,
-                    use_spacy_segmentation=use_spacy,
-                    log_callback=lambda msg: events.log(msg),
+                chapter_sink, chapter_subtitle_writer = _open_chapter_outputs(
+                    chapter_idx, chapter, request,
+                    chapter_dir=chapter_dir,
+                    stack=stack,
+                    result=result,
+                    check_cancelled=check_cancelled,
                 )
-
-                seg_start_time = stats.current_time
-                accumulated_tokens: List[Dict[str, Any]] = []
-                for spacy_seg in spacy_segments:
-                    if not spacy_seg.strip():
-                        continue
-                    _, seg_tokens = synthesize_text(
-                        text=spacy_seg,
-                        params=synth,
-                        backend=seg_backend,
-                        voice=seg_voice,
-                        speed=seg_speed or request.speed,
-                        total_steps=seg_steps,
-                        chapter_sink=chapter_sink,
-                        preview_callback=lambda text: events.log(f"  {text[:80]}"),
-                        split_pattern_override=active_split,
-                    )
-                    accumulated_tokens.extend(seg_tokens)
-
-                # Process subtitles
-                if audio_sink and accumulated_tokens:
-                    if subtitle_writer:
-                        process_and_write_subtitles(
-                            accumulated_tokens,
-                            subtitle_writer,
-                            subtitle=request.subtitle,
-                            language=request.language,
-                            use_spacy_segmentation=use_spacy,
-                            fallback_end_time=stats.current_time,
-                        )
-                    if chapter_subtitle_writer:
-                        process_and_write_subtitles(
-                            accumulated_tokens,
-                            chapter_subtitle_writer,
-                            subtitle=request.subtitle,
-                            language=request.language,
-                            use_spacy_segmentation=use_spacy,
-                            fallback_end_time=stats.current_time,
-                        )
-
-                # Record chunk marker
-                if segment.source in ("chunk", "voice_marker"):
-                    collector.on_chunk(
-                        chunk_id=segment.chunk_id or "",
-                        chapter_index=chapter_idx - 1,
-                        chunk_index=segment.chunk_index or seg_idx,
-                        start=seg_start_time,
-                        end=stats.current_time,
-                        speaker_id=segment.speaker_id or "narrator",
-                        provider=seg_provider,
-                        voice_spec=segment.voice_spec,
-                        level=segment.level or (request.chapter_chunk.chunk_level if request.chapter_chunk else "paragraph"),
-                        characters=len(segment.text),
-                    )
-
-            # Silence between chapters
-            if chapter_idx < len(plan.chapters) and request.silence_between_chapters > 0:
-                _append_silence(
-                    request.silence_between_chapters,
+                _synthesize_chapter(
+                    chapter_idx,
+                    chapter,
+                    plan=plan,
+                    events=events,
+                    pipeline_provider=pipeline_provider,
+                    voice_resolver=voice_resolver,
+                    synth=synth,
+                    collector=collector,
                     chapter_sink=chapter_sink,
-                    audio_sink=audio_sink,
-                    stats=stats,
+                    subtitle_writer=subtitle_writer,
+                    chapter_subtitle_writer=chapter_subtitle_writer,
+                    include_intro=not intro_emitted,
+                    use_spacy=use_spacy,
+                    check_cancelled=check_cancelled,
+                    prepared=prepared,
                 )
+                intro_emitted = True
 
-            # Close chapter sink
-            if chapter_sink:
-                chapter_sink.close()
-
-            # Close chapter subtitle writer
-            if chapter_subtitle_writer:
-                chapter_subtitle_writer.close()
+                # Close chapter sink
+                if chapter_sink:
+                    chapter_sink.close()
 
-            # Record chapter end for markers
-            collector.on_chapter_end(stats.current_time)
-            logging.info("[executor] Chapter %d/%d done: time=%.1fs", chapter_idx, len(plan.chapters), stats.current_time)
+                # Close chapter subtitle writer
+                if chapter_subtitle_writer:
+                    chapter_subtitle_writer.close()
+            log_lookahead_stats(prepared.stats, "normalization")
 
         logging.info("[executor] All chapters done: total=%.1fs", stats.current_time)
 
@@ -567,6 +469,8 @@ def execute_conversion(
             collector.on_outro(outro_start, stats.current_time, outro_provider, plan.outro.voice_spec)
             events.log("Outro synthesized.")
 
+    log_writer_stats(audio_sink, "merged output")
+
     # Set result metadata
     result.chapter_markers = collector.chapter_markers
     result.chunk_markers = collector.chunk_markers
@@ -574,12 +478,795 @@ def execute_conversion(
     result.total_segments = sum(len(ch.segments) for ch in plan.chapters)
     result.total_characters = total_characters
 
+    if segment_cache is not None and cache_before is not None:
+        cache_after = segment_cache.stats()
+        logging.info(
+            "[executor] Segment cache: hits=%d misses=%d size=%.1fMB",
+            cache_after.hits - cache_before.hits,
+            cache_after.misses - cache_before.misses,
+            cache_after.bytes / (1024 * 1024),
+        )
+
     if output_layout.project_root:
         result.project_root = output_layout.project_root
 
     return result
 
 
+# ─── Chapter synthesis ──────────────────────────────────────────────
+
+
+def _open_chapter_outputs(
+    chapter_idx: int,
+    chapter: ChapterPlan,
+    request: Any,
+    *,
+    chapter_dir: Optional[Path],
+    stack: ExitStack,
+    result: ConversionResult,
+    check_cancelled: Callable[[], None],
+) -> Tuple[Optional[AudioSink], Optional[SubtitleWriter]]:
+    """Open the per-chapter audio sink and subtitle writer, if requested."""
+    if not chapter_dir:
+        return None, None
+
+    chapter_filename = sanitize_filename_for_chapter(chapter.title, chapter_idx)
+    chapter_path = chapter_dir / f"{chapter_filename}.{request.save.separate_chapters_format}"
+    chapter_sink: Optional[AudioSink] = stack.enter_context(
+        open_audio_sink(
+            chapter_path,
+            request.save.separate_chapters_format,
+            cancel_check=check_cancelled,
+            background_queue=writer_queue_blocks(),
+        )
+    )
+    result.chapter_paths.append(chapter_path)
+
+    chapter_subtitle_writer: Optional[SubtitleWriter] = None
+    if request.subtitle.mode != SubtitleMode.DISABLED and chapter_sink:
+        from abogen.infrastructure.subtitle_writer import resolve_subtitle_format
+
+        subtitle_ext, _ = resolve_subtitle_format(
+            request.subtitle
+        )
+        chapter_subtitle_path = chapter_dir / f"{chapter_filename}.{subtitle_ext}"
+        chapter_subtitle_writer = make_subtitle_writer(
+            chapter_subtitle_path,
+            request.subtitle,
+        )
+        if chapter_subtitle_writer:
+            chapter_subtitle_writer.open()
+            result.subtitle_paths.append(chapter_subtitle_writer.path)
+
+    return chapter_sink, chapter_subtitle_writer
+
+
+@dataclass
+class PreparedSegment:
+    """Body segment text made ready for the backend ahead of synthesis.
+
+    ``texts`` are the normalized spaCy pieces (blank pieces dropped) and
+    ``split_pattern`` the pattern they are split with. ``skip`` marks a
+    segment that became empty once a duplicated heading was stripped.
+    """
+
+    texts: List[str] = field(default_factory=list)
+    split_pattern: Optional[str] = None
+    skip: bool = False
+
+
+def _prepare_chapter_segments(
+    chapter_idx: int,
+    chapter: ChapterPlan,
+    *,
+    request: Any,
+    tts_context: TTSContext,
+    use_spacy: bool,
+    log: Callable[[str], None],
+) -> Iterator[PreparedSegment]:
+    """Yield one ``PreparedSegment`` per segment of *chapter*, in order.
+
+    Runs everything the body loop of ``_synthesize_chapter`` needs before the
+    backend call: heading dedup, spaCy pre-TTS segmentation and
+    ``TTSContext.normalize``.
+    """
+    from abogen.domain.conversion_pipeline import spacy_pre_tts_segmentation
+
+    heading_text = _format_heading(chapter.title, chapter_idx, request) if chapter.title else ""
+
+    # Heading dedup: check if first line of body matches heading
+    pending_heading_strip = False
+    if heading_text and chapter.body_text:
+        first_line = next(
+            (line.strip() for line in chapter.body_text.splitlines() if line.strip()),
+            "",
+        )
+        if first_line and _headings_equivalent(first_line, heading_text):
+            pending_heading_strip = True
+
+    for segment in chapter.segments:
+        # Apply heading dedup to first segment (consume-once)
+        seg_text = segment.text
+        if pending_heading_strip and seg_text.strip():
+            seg_text, heading_removed, _ = apply_chapter_text_transforms(
+                seg_text,
+                heading_text=heading_text,
+                raw_title=chapter.title,
+                strip_heading=True,
+                normalize_caps=False,
+            )
+            if heading_removed:
+                pending_heading_strip = False
+            if not seg_text.strip():
+                yield PreparedSegment(skip=True)
+                continue
+
+        spacy_segments, active_split = spacy_pre_tts_segmentation(
+            seg_text,
+            request.language,
+            request.subtitle.mode,
+            is_subtitle_input=bool(request.subtitle_input),
+            use_spacy_segmentation=use_spacy,
+            log_callback=log,
+        )
+        yield PreparedSegment(
+            texts=[tts_context.normalize(piece) for piece in spacy_segments if piece.strip()],
+            split_pattern=active_split,
+        )
+
+
+def _prepare_plan_segments(
+    plan: ConversionPlan,
+    tts_context: TTSContext,
+    use_spacy: bool,
+    events: ConversionEvents,
+) -> Iterator[PreparedSegment]:
+    """Prepared segments of every chapter of *plan*, back to back."""
+    tts_context.freeze_settings()
+    for chapter_idx, chapter in enumerate(plan.chapters, 1):
+        yield from _prepare_chapter_segments(
+            chapter_idx,
+            chapter,
+            request=plan.request,
+            tts_context=tts_context,
+            use_spacy=use_spacy,
+            log=lambda msg: events.log(msg),
+        )
+
+
+def _synthesize_chapter(
+    chapter_idx: int,
+    chapter: ChapterPlan,
+    *,
+    plan: ConversionPlan,
+    events: ConversionEvents,
+    pipeline_provider: PipelineProvider,
+    voice_resolver: VoiceResolver,
+    synth: SynthParams,
+    collector: MarkerCollector,
+    chapter_sink: Optional[AudioSink],
+    subtitle_writer: Optional[SubtitleWriter],
+    chapter_subtitle_writer: Optional[SubtitleWriter],
+    include_intro: bool,
+    use_spacy: bool,
+    check_cancelled: Callable[[], None],
+    prepared: Optional[Iterable[PreparedSegment]] = None,
+) -> Optional[LookaheadStats]:
+    """Synthesize one chapter (optional intro, heading, body, trailing silence).
+
+    Audio goes to ``synth.audio_sink`` and ``chapter_sink``; timing is
+    tracked on ``synth.stats`` and markers on ``collector``.
+
+    Body text is normalized ahead of synthesis. ``prepared`` supplies the
+    chapter's ``PreparedSegment`` items (it may run on past this chapter, as
+    in the serial loop's whole-book look-ahead); without it the chapter
+    starts its own look-ahead and returns its timing.
+    """
+    request = plan.request
+    stats = synth.stats
+    audio_sink = synth.audio_sink
+
+    chapter_display = f"Chapter {chapter_idx}/{len(plan.chapters)}: {chapter.title}"
+    events.log(f"Processing {chapter_display}")
+    logging.info("[executor] Chapter %d/%d: %s", chapter_idx, len(plan.chapters), chapter.title)
+
+    # Resolve chapter voice
+    chapter_provider, chapter_voice, chapter_speed, chapter_steps = _resolve_voice(
+        voice_resolver, chapter.voice_spec, request,
+        log_callback=lambda msg: events.log(msg, level="warning"),
+    )
+    logging.info("[executor] Chapter %d voice: provider=%s voice=%s speed=%.2f", chapter_idx, chapter_provider, chapter_voice, chapter_speed)
+    chapter_backend = pipeline_provider.get(chapter_provider, request.language, request.use_gpu)
+
+    # Record chapter start for markers
+    collector.on_chapter_start(chapter_idx - 1, chapter.title, stats.current_time)
+
+    # Intro delay before first chapter
+    if include_intro and plan.intro and plan.intro.enabled:
+        # Intro will be emitted with first chapter
+        intro_provider, intro_voice, intro_speed, intro_steps = _resolve_voice(
+            voice_resolver, plan.intro.voice_spec, request,
+            log_callback=lambda msg: events.log(msg, level="warning"),
+        )
+        intro_backend = pipeline_provider.get(intro_provider, request.language, request.use_gpu)
+        synthesize_text(
+            text=plan.intro.text,
+            params=synth,
+            backend=intro_backend,
+            voice=intro_voice,
+            speed=intro_speed or request.speed,
+            total_steps=intro_steps,
+            chapter_sink=chapter_sink,
+            preview_callback=lambda text: events.log(f"  Intro: {text[:80]}"),
+        )
+        if request.chapter_intro_delay > 0:
+            _append_silence(
+                request.chapter_intro_delay,
+                chapter_sink=chapter_sink,
+                audio_sink=audio_sink,
+                stats=stats,
+            )
+
+    # Process heading
+    heading_text = ""
+    if chapter.title:
+        heading_text = _format_heading(chapter.title, chapter_idx, request)
+        if heading_text:
+            synthesize_text(
+                text=heading_text,
+                params=synth,
+                backend=chapter_backend,
+                voice=chapter_voice,
+                speed=chapter_speed or request.speed,
+                chapter_sink=chapter_sink,
+                preview_callback=lambda text: events.log(f"  Title: {text[:80]}"),
+            )
+            if request.chapter_intro_delay > 0:
+                _append_silence(
+                    request.chapter_intro_delay,
+                    chapter_sink=chapter_sink,
+                    audio_sink=audio_sink,
+                    stats=stats,
+                )
+
+    # Process body segments
+    own_lookahead: Optional[Lookahead[PreparedSegment]] = None
+    if prepared is None:
+        own_lookahead = Lookahead(
+            _prepare_chapter_segments(
+                chapter_idx,
+                chapter,
+                request=request,
+                tts_context=synth.tts_context,
+                use_spacy=use_spacy,
+                log=lambda msg: events.log(msg),
+            ),
+            name=f"abogen-normalize-{chapter_idx}",
+        )
+        prepared = own_lookahead
+    try:
+        _synthesize_body(
+            chapter_idx,
+            chapter,
+            zip(chapter.segments, prepared),
+            request=request,
+            events=events,
+            pipeline_provider=pipeline_provider,
+            voice_resolver=voice_resolver,
+            synth=synth,
+            collector=collector,
+            chapter_sink=chapter_sink,
+            subtitle_writer=subtitle_writer,
+            chapter_subtitle_writer=chapter_subtitle_writer,
+            use_spacy=use_spacy,
+            check_cancelled=check_cancelled,
+            chapter_voice=(chapter_provider, chapter_voice, chapter_speed, chapter_steps, chapter_backend),
+        )
+    finally:
+        if own_lookahead is not None:
+            own_lookahead.close()
+
+    # Silence between chapters
+    if chapter_idx < len(plan.chapters) and request.silence_between_chapters > 0:
+        _append_silence(
+            request.silence_between_chapters,
+            chapter_sink=chapter_sink,
+            audio_sink=audio_sink,
+            stats=stats,
+        )
+
+    # Record chapter end for markers
+    collector.on_chapter_end(stats.current_time)
+    logging.info("[executor] Chapter %d/%d done: time=%.1fs", chapter_idx, len(plan.chapters), stats.current_time)
+    return own_lookahead.stats if own_lookahead is not None else None
+
+
+def _synthesize_body(
+    chapter_idx: int,
+    chapter: ChapterPlan,
+    segments: Iterable[Tuple[Any, PreparedSegment]],
+    *,
+    request: Any,
+    events: ConversionEvents,
+    pipeline_provider: PipelineProvider,
+    voice_resolver: VoiceResolver,
+    synth: SynthParams,
+    collector: MarkerCollector,
+    chapter_sink: Optional[AudioSink],
+    subtitle_writer: Optional[SubtitleWriter],
+    chapter_subtitle_writer: Optional[SubtitleWriter],
+    use_spacy: bool,
+    check_cancelled: Callable[[], None],
+    chapter_voice: Tuple[Any, Any, Any, Any, Any],
+) -> None:
+    """Speak a chapter's prepared body segments and record their markers."""
+    stats = synth.stats
+    audio_sink = synth.audio_sink
+    chapter_provider, chapter_voice_choice, chapter_speed, chapter_steps, chapter_backend = chapter_voice
+
+    for seg_idx, (segment, ready) in enumerate(segments):
+        check_cancelled()
+        if ready.skip:
+            continue
+
+        # Resolve segment voice (may differ from chapter voice)
+        if segment.voice_spec != chapter.voice_spec:
+            seg_provider, seg_voice, seg_speed, seg_steps = _resolve_voice(
+                voice_resolver, segment.voice_spec, request,
+                log_callback=lambda msg: events.log(msg, level="warning"),
+            )
+            seg_backend = pipeline_provider.get(seg_provider, request.language, request.use_gpu)
+        else:
+            seg_provider = chapter_provider
+            seg_voice = chapter_voice_choice
+            seg_speed = chapter_speed
+            seg_steps = chapter_steps
+            seg_backend = chapter_backend
+
+        # Track voice for chapter marker
+        collector.on_segment(seg_provider, seg_voice, segment.voice_spec)
+
+        seg_start_time = stats.current_time
+        accumulated_tokens = TokenColumns()
+        for piece in ready.texts:
+            _, seg_tokens = synthesize_text(
+                text=piece,
+                params=synth,
+                backend=seg_backend,
+                voice=seg_voice,
+                speed=seg_speed or request.speed,
+                total_steps=seg_steps,
+                chapter_sink=chapter_sink,
+                preview_callback=lambda text: events.log(f"  {text[:80]}"),
+                split_pattern_override=ready.split_pattern,
+                pre_normalized=True,
+            )
+            accumulated_tokens.extend(seg_tokens)
+
+        # Process subtitles
+        if audio_sink and accumulated_tokens:
+            batch = accumulated_tokens.batch()
+            if subtitle_writer:
+                process_and_write_subtitles(
+                    batch,
+                    subtitle_writer,
+                    subtitle=request.subtitle,
+                    language=request.language,
+                    use_spacy_segmentation=use_spacy,
+                    fallback_end_time=stats.current_time,
+                )
+            if chapter_subtitle_writer:
+                process_and_write_subtitles(
+                    batch,
+                    chapter_subtitle_writer,
+                    subtitle=request.subtitle,
+                    language=request.language,
+                    use_spacy_segmentation=use_spacy,
+                    fallback_end_time=stats.current_time,
+                )
+
+        # Record chunk marker
+        if segment.source in ("chunk", "voice_marker"):
+            collector.on_chunk(
+                chunk_id=segment.chunk_id or "",
+                chapter_index=chapter_idx - 1,
+                chunk_index=segment.chunk_index or seg_idx,
+                start=seg_start_time,
+                end=stats.current_time,
+                speaker_id=segment.speaker_id or "narrator",
+                provider=seg_provider,
+                voice_spec=segment.voice_spec,
+                level=segment.level or (request.chapter_chunk.chunk_level if request.chapter_chunk else "paragraph"),
+                characters=len(segment.text),
+            )
+
+
+# ─── Sharded chapters ───────────────────────────────────────────────
+
+
+@dataclass
+class ChapterShard:
+    """One chapter rendered in isolation, timed from zero."""
+
+    chapter_idx: int
+    path: Path
+    duration: float
+    collector: MarkerCollector
+    subtitle_entries: List[Tuple[float, float, str]] = field(default_factory=list)
+    normalization: Optional[LookaheadStats] = None
+
+
+class _SubtitleEntryBuffer:
+    """SubtitleWriter stand-in that keeps entries in memory for later rebasing."""
+
+    def __init__(self) -> None:
+        self.entries: List[Tuple[float, float, str]] = []
+
+    def open(self) -> None:
+        pass
+
+    def write_entry(self, start: float, end: float, text: str) -> None:
+        self.entries.append((start, end, text))
+
+    def close(self) -> None:
+        pass
+
+
+class _LockedVoiceResolver:
+    """Serializes access to a VoiceResolver shared by chapter workers."""
+
+    def __init__(self, resolver: VoiceResolver) -> None:
+        self._resolver = resolver
+        self._lock = threading.Lock()
+
+    def resolve(self, voice_spec: str) -> Any:
+        with self._lock:
+            return self._resolver.resolve(voice_spec)
+
+
+class _ParallelProgress:
+    """Aggregates per-chapter progress into the shared SegmentStats."""
+
+    def __init__(self, stats: SegmentStats, on_progress: Callable[[int, str], None]) -> None:
+        self._stats = stats
+        self._on_progress = on_progress
+        self._base_chars = stats.processed_chars
+        self._per_chapter: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def reporter(self, chapter_idx: int, chapter_stats: SegmentStats) -> Callable[[int, str], None]:
+        def _report(_percent: int, _etr: str) -> None:
+            with self._lock:
+                self._per_chapter[chapter_idx] = chapter_stats.processed_chars
+                processed = self._base_chars + sum(self._per_chapter.values())
+                self._stats.processed_chars = processed
+                total = self._stats.total_characters
+                if total:
+                    percent = min(int(processed / total * 100), 99)
+                else:
+                    percent = 0 if processed == 0 else 99
+                etr_str = calc_etr_str(time.time() - self._stats.etr_start_time, processed, total)
+                self._on_progress(percent, etr_str)
+
+        return _report
+
+
+def _shard_path(shard_dir: Path, chapter_idx: int) -> Path:
+    return shard_dir / f"chapter_{chapter_idx:05d}.wav"
+
+
+def _resolve_chapter_workers(
+    requested: Optional[int],
+    plan: ConversionPlan,
+    pipeline_provider_factory: Optional[Callable[[], PipelineProvider]],
+) -> int:
+    """Number of chapter workers to use; 1 means the serial path."""
+    try:
+        workers = int(requested or 1)
+    except (TypeError, ValueError):
+        workers = 1
+    workers = min(workers, len(plan.chapters))
+    if workers > 1 and pipeline_provider_factory is None:
+        logging.info("[executor] Chapter workers requested without a pipeline factory; running serially")
+        return 1
+    return max(1, workers)
+
+
+def _render_chapter_shard(
+    chapter_idx: int,
+    chapter: ChapterPlan,
+    *,
+    shard_path: Path,
+    audio_format: Tuple[str, str] = ("wav", "FLOAT"),
+    plan: ConversionPlan,
+    events: ConversionEvents,
+    pipeline_provider: PipelineProvider,
+    voice_resolver: VoiceResolver,
+    synth: SynthParams,
+    progress: _ParallelProgress,
+    collect_subtitles: bool,
+    include_intro: bool,
+    use_spacy: bool,
+    check_cancelled: Callable[[], None],
+) -> ChapterShard:
+    """Synthesize one chapter into an audio shard starting at t=0."""
+    chapter_stats = SegmentStats(
+        etr_start_time=synth.stats.etr_start_time,
+        total_characters=synth.stats.total_characters,
+    )
+    shard_collector = MarkerCollector()
+    entries = _SubtitleEntryBuffer() if collect_subtitles else None
+
+    shard_format, shard_subtype = audio_format
+    with open_audio_sink(shard_path, shard_format, subtype=shard_subtype, cancel_check=check_cancelled) as shard_sink:
+        shard_synth = replace(
+            synth,
+            stats=chapter_stats,
+            audio_sink=shard_sink,
+            check_cancel=check_cancelled,
+            on_progress=progress.reporter(chapter_idx, chapter_stats),
+        )
+        normalization = _synthesize_chapter(
+            chapter_idx,
+            chapter,
+            plan=plan,
+            events=events,
+            pipeline_provider=pipeline_provider,
+            voice_resolver=voice_resolver,
+            synth=shard_synth,
+            collector=shard_collector,
+            chapter_sink=None,
+            subtitle_writer=entries,
+            chapter_subtitle_writer=None,
+            include_intro=include_intro,
+            use_spacy=use_spacy,
+            check_cancelled=check_cancelled,
+        )
+
+    return ChapterShard(
+        chapter_idx=chapter_idx,
+        path=shard_path,
+        duration=chapter_stats.current_time,
+        collector=shard_collector,
+        subtitle_entries=entries.entries if entries else [],
+        normalization=normalization,
+    )
+
+
+def _append_shard(
+    shard: ChapterShard,
+    *,
+    sinks: List[AudioSink],
+    subtitle_writers: List[SubtitleWriter],
+    collector: MarkerCollector,
+    offset: float,
+) -> None:
+    """Stream a chapter shard into the output sinks, rebased to ``offset``."""
+    import soundfile as sf
+
+    if sinks:
+        for block in sf.blocks(str(shard.path), blocksize=SHARD_BLOCK_FRAMES, dtype="float32"):
+            for sink in sinks:
+                sink.write(block)
+    for writer in subtitle_writers:
+        for start, end, text in shard.subtitle_entries:
+            writer.write_entry(start=start + offset, end=end + offset, text=text)
+    collector.absorb(shard.collector, offset)
+
+
+def _execute_chapters_sharded(
+    *,
+    plan: ConversionPlan,
+    events: ConversionEvents,
+    pipeline_provider_factory: Optional[Callable[[], PipelineProvider]],
+    shared_provider: Optional[PipelineProvider] = None,
+    voice_resolver: VoiceResolver,
+    synth: SynthParams,
+    collector: MarkerCollector,
+    result: ConversionResult,
+    stack: ExitStack,
+    chapter_dir: Optional[Path],
+    subtitle_writer: Optional[SubtitleWriter],
+    include_intro: bool,
+    use_spacy: bool,
+    check_cancelled: Callable[[], None],
+    workers: int,
+    checkpoint: Optional[CheckpointStore] = None,
+    previous_render: Optional[CheckpointStore] = None,
+    tts_context: Optional[TTSContext] = None,
+) -> None:
+    """Render chapters into shards and reassemble them in order.
+
+    Each worker thread owns a pipeline provider from
+    ``pipeline_provider_factory`` (or uses ``shared_provider`` when there
+    is a single worker). Shards are appended to the merged sink as soon as
+    every earlier chapter is done, so output is written while later
+    chapters are still being synthesized.
+
+    With a ``checkpoint``, shards live in the job's checkpoint directory,
+    chapters it already holds are appended without synthesis, and every
+    newly rendered chapter is recorded there before it is merged.
+    Chapters missing from it are also looked up in ``previous_render``.
+    """
+    request = plan.request
+    stats = synth.stats
+    audio_sink = synth.audio_sink
+    collect_subtitles = subtitle_writer is not None
+
+    abort = threading.Event()
+
+    def _worker_check_cancelled() -> None:
+        if abort.is_set():
+            raise ConversionCancelled("Chapter synthesis aborted")
+        check_cancelled()
+
+    local = threading.local()
+    providers: List[PipelineProvider] = []
+    providers_lock = threading.Lock()
+
+    def _worker_provider() -> PipelineProvider:
+        if shared_provider is not None:
+            return shared_provider
+        provider = getattr(local, "provider", None)
+        if provider is None:
+            provider = pipeline_provider_factory()
+            local.provider = provider
+            with providers_lock:
+                providers.append(provider)
+        return provider
+
+    shard_dir: Optional[Path] = None
+    if checkpoint is None:
+        from abogen.utils import get_user_cache_path
+
+        shard_dir = Path(tempfile.mkdtemp(prefix="chapters-", dir=get_user_cache_path("chapter_shards")))
+        stack.callback(shutil.rmtree, shard_dir, True)
+
+    # Chapters restored from a store, keyed by index.
+    keys: Dict[int, str] = {}
+    restored: Dict[int, ChapterShard] = {}
+    reused = 0
+    if checkpoint is not None or previous_render is not None:
+        for chapter_idx, chapter in enumerate(plan.chapters, 1):
+            key = shard_key(
+                plan,
+                chapter_idx,
+                chapter,
+                tts_context=tts_context,
+                include_intro=include_intro and chapter_idx == 1,
+                collect_subtitles=collect_subtitles,
+            )
+            keys[chapter_idx] = key
+            saved = checkpoint.load(chapter_idx, key) if checkpoint is not None else None
+            if saved is None and previous_render is not None:
+                saved = previous_render.load(chapter_idx, key)
+                if saved is not None:
+                    reused += 1
+                    if checkpoint is not None:
+                        saved = checkpoint.adopt(saved)
+            if saved is not None:
+                restored[chapter_idx] = ChapterShard(
+                    chapter_idx=chapter_idx,
+                    path=saved.path,
+                    duration=saved.duration,
+                    collector=MarkerCollector.from_markers(saved.chapter_markers, saved.chunk_markers),
+                    subtitle_entries=list(saved.subtitle_entries),
+                )
+                stats.processed_chars += len(chapter.body_text)
+        if reused:
+            events.log(f"Reusing {reused}/{len(plan.chapters)} unchanged chapters from the previous render")
+        if len(restored) > reused:
+            events.log(f"Resuming: {len(restored) - reused}/{len(plan.chapters)} chapters restored from checkpoint")
+
+    if workers > 1:
+        events.log(f"Synthesizing {len(plan.chapters) - len(restored)} chapters with {workers} workers")
+
+    shared_resolver = _LockedVoiceResolver(voice_resolver)
+    progress = _ParallelProgress(stats, synth.on_progress)
+
+    def _render(chapter_idx: int, chapter: ChapterPlan) -> ChapterShard:
+        shard = _render_chapter_shard(
+            chapter_idx,
+            chapter,
+            shard_path=checkpoint.shard_path(chapter_idx) if checkpoint else _shard_path(shard_dir, chapter_idx),
+            audio_format=checkpoint.audio_format if checkpoint else ("wav", "FLOAT"),
+            plan=plan,
+            events=events,
+            pipeline_provider=_worker_provider(),
+            voice_resolver=shared_resolver,
+            synth=synth,
+            progress=progress,
+            collect_subtitles=collect_subtitles,
+            include_intro=include_intro and chapter_idx == 1,
+            use_spacy=use_spacy,
+            check_cancelled=_worker_check_cancelled,
+        )
+        if checkpoint is not None:
+            checkpoint.save(
+                ChapterCheckpoint(
+                    chapter_idx=chapter_idx,
+                    key=keys[chapter_idx],
+                    path=shard.path,
+                    duration=shard.duration,
+                    chapter_markers=shard.collector.chapter_markers,
+                    chunk_markers=shard.collector.chunk_markers,
+                    subtitle_entries=shard.subtitle_entries,
+                )
+            )
+        return shard
+
+    normalization = LookaheadStats()
+    # First worker failure; it also aborts every other worker right away
+    # rather than when the in-order merge loop reaches the failed chapter.
+    failures: List[BaseException] = []
+
+    def _on_rendered(future: Future) -> None:
+        if future.cancelled() or future.exception() is None:
+            return
+        failures.append(future.exception())
+        abort.set()
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="abogen-chapter")
+    try:
+        futures: List[Future] = []
+        for chapter_idx, chapter in enumerate(plan.chapters, 1):
+            if chapter_idx in restored:
+                done: Future = Future()
+                done.set_result(restored[chapter_idx])
+                futures.append(done)
+            else:
+                future = pool.submit(_render, chapter_idx, chapter)
+                future.add_done_callback(_on_rendered)
+                futures.append(future)
+        for chapter_idx, (chapter, future) in enumerate(zip(plan.chapters, futures), 1):
+            try:
+                shard = future.result()
+            except BaseException:
+                # Report the failure that caused the abort, not the
+                # ConversionCancelled it produced in this chapter.
+                if failures:
+                    raise failures[0]
+                raise
+            check_cancelled()
+            if shard.normalization is not None:
+                normalization.add(shard.normalization)
+
+            chapter_sink, chapter_subtitle_writer = _open_chapter_outputs(
+                chapter_idx, chapter, request,
+                chapter_dir=chapter_dir,
+                stack=stack,
+                result=result,
+                check_cancelled=check_cancelled,
+            )
+            _append_shard(
+                shard,
+                sinks=[sink for sink in (audio_sink, chapter_sink) if sink],
+                subtitle_writers=[w for w in (subtitle_writer, chapter_subtitle_writer) if w],
+                collector=collector,
+                offset=stats.current_time,
+            )
+            if audio_sink:
+                stats.current_time += shard.duration
+            if chapter_sink:
+                chapter_sink.close()
+            if chapter_subtitle_writer:
+                chapter_subtitle_writer.close()
+            if shard_dir is not None and shard.path.parent == shard_dir:
+                shard.path.unlink(missing_ok=True)
+            logging.info("[executor] Chapter %d/%d merged: time=%.1fs", chapter_idx, len(plan.chapters), stats.current_time)
+        log_lookahead_stats(normalization, "normalization")
+    except BaseException:
+        abort.set()
+        raise
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        for provider in providers:
+            try:
+                provider.dispose_all()
+            except Exception:
+                pass
+
+
 # ─── Helpers ────────────────────────────────────────────────────────
 
 
@@ -56,6 +56,7 @@ class ChapterPlan:
     body_text: str
     segments: List[SegmentPlan]
     voice_spec: str  # default voice for this chapter
+    fingerprint: str = ""  # content hash, see conversion_checkpoint.chapter_fingerprint
 
 
 @dataclass
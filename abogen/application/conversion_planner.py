@@ -9,8 +9,10 @@ This is Stage 2 of the conversion flow unification plan.
 from __future__ import annotations
 
 import logging
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from abogen.application.conversion_checkpoint import chapter_fingerprint
 from abogen.application.conversion_models import (
     ChapterPlan,
     ConversionPlan,
@@ -26,6 +28,9 @@ from abogen.domain.metadata_extraction import extract_metadata_for_file
 from abogen.domain.metadata_merge import merge_metadata
 from abogen.domain.voice_markers import split_text_by_voice_markers
 
+# Sources parsed into chapters by the text extractor rather than read as text.
+_PARSED_SOURCE_SUFFIXES = {".epub", ".pdf", ".md", ".markdown"}
+
 
 def build_conversion_plan(request: ConversionRequest) -> ConversionPlan:
     """Build a complete conversion plan from a request.
@@ -59,6 +64,8 @@ def build_conversion_plan(request: ConversionRequest) -> ConversionPlan:
 
     # 5. Build segments for each chapter
     chapters = _build_chapters(selected_chapters, request)
+    for chapter in chapters:
+        chapter.fingerprint = chapter_fingerprint(request, chapter.index, chapter, len(chapters))
 
     # 6. Build intro/outro
     intro, outro = _build_intro_outro(metadata, request)
@@ -90,6 +97,15 @@ def _extract_source_text(request: ConversionRequest) -> Optional[str]:
 
     if request.direct_text:
         text = clean_text(request.direct_text)
+    elif (
+        request.source_path
+        and request.source_path.suffix.lower() in _PARSED_SOURCE_SUFFIXES
+        and request.source_path.exists()
+    ):
+        text = _parsed_source_text(request.source_path)
+        if text is None:
+            return None
+        text = clean_text(text)
     elif request.source_path and request.source_path.exists():
         encoding = "utf-8"
         try:
@@ -118,6 +134,27 @@ def _extract_source_text(request: ConversionRequest) -> Optional[str]:
     return text
 
 
+def _parsed_source_text(source_path: Path) -> Optional[str]:
+    """Chapters of a book file as marker-delimited text.
+
+    The parsed book comes from the content-hash book cache, so queued and
+    retried jobs reuse the extraction made when the book was uploaded.
+    Chapter order matches that extraction, which keeps override indices
+    aligned.
+    """
+    from abogen.book_cache import cached_extract_from_path
+
+    try:
+        extraction = cached_extract_from_path(source_path)
+    except Exception:
+        logging.exception("Failed to parse source %s", source_path)
+        return None
+    return "\n\n".join(
+        f"<<CHAPTER_MARKER:{' '.join(chapter.title.split())}>>\n{chapter.text}"
+        for chapter in extraction.chapters
+    )
+
+
 def _extract_metadata(
     request: ConversionRequest,
 ) -> Tuple[Dict[str, Any], Optional[Any]]:
@@ -94,6 +94,10 @@ class ConversionRequest:
     cover: CoverConfig = field(default_factory=CoverConfig)
     pronunciation: PronunciationConfig = field(default_factory=PronunciationConfig)
 
+    # --- Execution ---
+    chapter_workers: int = 1
+    checkpoint_id: Optional[str] = None  # job-scoped resume key; None = no checkpoints
+
     # --- Feature configs (None = disabled) ---
     epub3_export: Optional[Epub3ExportConfig] = None
     word_substitution: Optional[WordSubstitutionConfig] = None
@@ -107,6 +111,7 @@ class ConversionRequest:
             self.tts_provider = "kokoro"
         _coerce_enums(self)
         _clamp_numerics(self)
+        self.chapter_workers = max(1, int(self.chapter_workers))
 
 
 def _apply_none_defaults(obj: ConversionRequest) -> None:
@@ -19,6 +19,11 @@ import logging
 from collections import defaultdict
 from typing import Any, Dict
 
+from abogen.application.conversion_checkpoint import (
+    find_previous_project_store,
+    open_checkpoint,
+    open_project_store,
+)
 from abogen.application.conversion_executor import execute_conversion
 from abogen.application.conversion_models import ConversionPlan
 from abogen.application.conversion_planner import build_conversion_plan
@@ -41,6 +46,12 @@ def run_conversion(
     4. Conversion execution
     5. Resource cleanup
 
+    With ``request.checkpoint_id`` set, finished chapters are checkpointed so
+    a rerun of the same job resumes at the first unfinished chapter. The
+    checkpoint is removed once the conversion succeeds. Project outputs keep
+    their chapter renders instead, and reuse unchanged chapters from the
+    previous project of the same book.
+
     Args:
         request: Normalized conversion request
         events: UI-specific callbacks (log, progress, check_cancelled)
@@ -54,6 +65,7 @@ def run_conversion(
         Exception: On TTS or I/O errors
     """
     from abogen.domain.pipeline_factory import PipelinePool
+    from abogen.domain.segment_cache import get_segment_cache
     from abogen.domain.voice_loader import VoiceCache
 
     pool = PipelinePool()
@@ -83,6 +95,19 @@ def run_conversion(
         plan = build_conversion_plan(request)
 
         # Stage 3: Execute conversion
+        # Project outputs keep their chapter renders next to the output so a
+        # later run of the same book only re-synthesizes edited chapters;
+        # the project store also serves as the checkpoint. Other outputs
+        # checkpoint into a job-scoped store that is removed on success.
+        project_root = plan.output_layout.project_root if plan.output_layout else None
+        previous_render = None
+        if project_root:
+            checkpoint = open_project_store(project_root)
+            previous_render = find_previous_project_store(project_root)
+        elif request.checkpoint_id:
+            checkpoint = open_checkpoint(request.checkpoint_id)
+        else:
+            checkpoint = None
         events.log("Starting conversion")
         result = execute_conversion(
             plan=plan,
@@ -90,6 +115,10 @@ def run_conversion(
             pipeline_provider=pool,
             voice_resolver=resolver,
             tts_context=tts_context,
+            pipeline_provider_factory=PipelinePool,
+            segment_cache=get_segment_cache(),
+            checkpoint=checkpoint,
+            previous_render=previous_render,
         )
 
         # Propagate usage counter to result
@@ -97,6 +126,10 @@ def run_conversion(
 
         # Stage 4: Finalize (m4b metadata embedding, EPUB3 generation)
         _finalize(request, result, plan, events)
+        if project_root and checkpoint is not None:
+            checkpoint.compact(len(plan.chapters))
+        elif checkpoint is not None:
+            checkpoint.clear()
 
         events.log("Conversion complete")
         logging.info("[app] run_conversion completed successfully")
@@ -0,0 +1,185 @@
+"""Persistent cache of parsed books, keyed by file content.
+
+Parsing an EPUB or PDF is the slowest step between choosing a book and
+seeing its chapters, and the same file is parsed again whenever a job is
+queued, retried or reopened. Parsed results are stored in a SQLite database
+under the user cache directory, keyed by the SHA-256 of the file contents
+plus the options that change the parser output. Because the key is the
+content and not the path, uploads of the same book under new temporary names
+and restarts of the application all hit the same entry. PDFs are not stored
+here: ``pdf_pages`` already caches their page texts by content, and building
+a PDF's chapters from those is cheap.
+
+Two kinds of records are stored: ``ExtractionResult`` values used by the
+WebUI and the conversion planner, and the ``BookParser`` output used by the
+desktop chapter dialog. Payloads are zlib-compressed JSON; cover images are
+kept as raw bytes next to them.
+
+Cache size comes from ``ABOGEN_BOOK_CACHE_MB`` (default 256; ``0`` disables
+it).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from abogen.bounded_store import BoundedStore, SharedStore
+from abogen.epub_content import html_parser_backend
+from abogen.text_extractor import ExtractedChapter, ExtractionResult, extract_from_path
+from abogen.utils import get_user_cache_path, load_config
+
+logger = logging.getLogger(__name__)
+
+# Bump when extraction or parser output changes so old entries are not reused.
+_FORMAT_VERSION = 1
+
+DEFAULT_BOOK_CACHE_MB = 256
+
+# (path, size, mtime_ns) -> content digest, so repeated lookups of an
+# unchanged file within one process do not rehash it.
+_DIGESTS: Dict[Tuple[str, int, int], str] = {}
+_DIGESTS_LIMIT = 256
+_DIGESTS_LOCK = threading.Lock()
+
+
+def file_digest(path: os.PathLike | str) -> str:
+    """SHA-256 of the file contents, memoised per path, size and mtime."""
+    path = os.path.abspath(os.fspath(path))
+    stat = os.stat(path)
+    stamp = (path, stat.st_size, stat.st_mtime_ns)
+    with _DIGESTS_LOCK:
+        cached = _DIGESTS.get(stamp)
+    if cached is not None:
+        return cached
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    value = digest.hexdigest()
+    with _DIGESTS_LOCK:
+        if len(_DIGESTS) >= _DIGESTS_LIMIT:
+            _DIGESTS.clear()
+        _DIGESTS[stamp] = value
+    return value
+
+
+def book_cache_key(path: os.PathLike | str, kind: str, *options: Any) -> str:
+    """Cache key for *kind* output of the file at *path* under *options*."""
+    parts = [file_digest(path), kind, str(_FORMAT_VERSION), html_parser_backend()]
+    parts.extend(str(option) for option in options)
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+class BookCache(BoundedStore):
+    """Thread-safe, size-bounded on-disk map of key -> parsed book."""
+
+    table = "books"
+    columns = "payload BLOB NOT NULL, cover BLOB"
+
+    def get(self, key: str) -> Optional[Tuple[Dict[str, Any], Optional[bytes]]]:
+        """Return ``(payload, cover)`` for *key*, or None on a miss."""
+        row = self._fetch(key, "payload, cover")
+        if row is None:
+            return None
+        payload, cover = row
+        try:
+            return json.loads(zlib.decompress(payload).decode("utf-8")), cover
+        except (zlib.error, ValueError):
+            self._discard(key)
+            return None
+
+    def put(self, key: str, payload: Dict[str, Any], cover: Optional[bytes] = None) -> None:
+        """Store *payload* (JSON-serialisable) and evict old books beyond the limit."""
+        blob = zlib.compress(json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        self._store(key, len(blob) + len(cover or b""), {"payload": blob, "cover": cover})
+
+
+_SHARED: SharedStore[BookCache] = SharedStore(
+    lambda max_bytes: BookCache(Path(get_user_cache_path("books")) / "books.sqlite3", max_bytes),
+    "ABOGEN_BOOK_CACHE_MB",
+    DEFAULT_BOOK_CACHE_MB,
+)
+
+
+def get_book_cache() -> Optional[BookCache]:
+    """Return the process-wide book cache, or None when disabled or unavailable."""
+    return _SHARED.get()
+
+
+def reset_book_cache() -> None:
+    """Close the process-wide cache so the next call reopens it."""
+    _SHARED.reset()
+
+
+def lookup(
+    path: os.PathLike | str, kind: str, *options: Any
+) -> Tuple[Optional[str], Optional[Tuple[Dict[str, Any], Optional[bytes]]]]:
+    """Return ``(key, cached record)`` for *kind* output of *path*.
+
+    The key is None when the cache is disabled, the file cannot be read or
+    it is a PDF (whose pages ``pdf_pages`` caches instead).
+    """
+    if Path(path).suffix.lower() == ".pdf":
+        return None, None
+    cache = get_book_cache()
+    if cache is None:
+        return None, None
+    try:
+        key = book_cache_key(path, kind, *options)
+        return key, cache.get(key)
+    except (OSError, sqlite3.Error, ValueError) as e:
+        logger.warning(f"Book cache unavailable: {e}")
+        return None, None
+
+
+def store(key: Optional[str], payload: Dict[str, Any], cover: Optional[bytes] = None) -> None:
+    """Store a record under a key from :func:`lookup`; failures are logged."""
+    cache = get_book_cache()
+    if cache is None or key is None:
+        return
+    try:
+        cache.put(key, payload, cover)
+    except (sqlite3.Error, TypeError, ValueError) as e:
+        logger.warning(f"Could not store book in cache: {e}")
+
+
+def _extraction_payload(result: ExtractionResult) -> Dict[str, Any]:
+    return {
+        "chapters": [[chapter.title, chapter.text] for chapter in result.chapters],
+        "metadata": result.metadata,
+        "cover_mime": result.cover_mime,
+    }
+
+
+def _extraction_from_record(payload: Dict[str, Any], cover: Optional[bytes]) -> ExtractionResult:
+    return ExtractionResult(
+        chapters=[ExtractedChapter(title=title, text=text) for title, text in payload["chapters"]],
+        metadata=dict(payload.get("metadata") or {}),
+        cover_image=cover,
+        cover_mime=payload.get("cover_mime"),
+    )
+
+
+def cached_extract_from_path(path: Path) -> ExtractionResult:
+    """``extract_from_path`` backed by the book cache.
+
+    Every call returns a fresh ``ExtractionResult``, so callers may modify
+    it without affecting the cached copy.
+    """
+    path = Path(path)
+    replace_single_newlines = load_config().get("replace_single_newlines", False)
+    key, record = lookup(path, "extraction", path.suffix.lower(), replace_single_newlines)
+    if record is not None:
+        logger.debug(f"Using cached extraction for {path.name}")
+        return _extraction_from_record(*record)
+    result = extract_from_path(path)
+    store(key, _extraction_payload(result), result.cover_image)
+    return result
@@ -1,8 +1,6 @@
 import os
-import re
 import logging
 import textwrap
-import urllib.parse
 from abc import ABC, abstractmethod
 
 import ebooklib
@@ -11,17 +9,11 @@ from bs4 import BeautifulSoup, NavigableString
 import fitz  # PyMuPDF
 import markdown
 
-from abogen.utils import detect_encoding
+from abogen.utils import detect_encoding, load_config
 from abogen.subtitle_utils import clean_text
 from abogen.domain.text_utils import calculate_text_length
-
-# Pre-compile frequently used regex patterns
-_BRACKETED_NUMBERS_PATTERN = re.compile(r"\[\s*\d+\s*\]")
-_STANDALONE_PAGE_NUMBERS_PATTERN = re.compile(r"^\s*\d+\s*$", re.MULTILINE)
-_PAGE_NUMBERS_AT_END_PATTERN = re.compile(r"\s+\d+\s*$", re.MULTILINE)
-_PAGE_NUMBERS_WITH_DASH_PATTERN = re.compile(
-    r"\s+[-–—]\s*\d+\s*[-–—]?\s*$", re.MULTILINE
-)
+from abogen.pdf_pages import load_pdf_page_texts
+from abogen.epub_content import EpubDocuments, find_doc_key, html_to_text
 
 
 class BaseBookParser(ABC):
@@ -133,25 +125,50 @@ class PdfParser(BaseBookParser):
         # For now, base class metadata is empty dict
         pass
 
-    def process_content(self, replace_single_newlines=True):
+    def process_content(self, replace_single_newlines=True, on_navigation=None):
+        # 1. Build the navigation from the TOC first, so callers can show it
+        #    while the pages are still being extracted
+        navigation = self.build_navigation()
+        if on_navigation is not None:
+            on_navigation(navigation)
+
+        # 2. Extract text from all pages
+        for _ in self.iter_pages():
+            pass
+
+        # 3. Rebuild so gap pages get titles from their text
+        self.build_navigation()
+
+        return self.content_texts, self.content_lengths
+
+    def iter_pages(self):
+        """
+        Yield (page_id, text) in page order, filling content_texts as pages
+        arrive. Pages come from the page cache when this file was seen before;
+        otherwise large documents are extracted by worker processes.
+        """
         if not self.pdf_doc:
             self.load()
 
-        # 1. Extract text from all pages first
-        for page_num in range(len(self.pdf_doc)):
-            text = clean_text(self.pdf_doc[page_num].get_text())
-            
-            # Clean up common PDF artifacts:
-            text = _BRACKETED_NUMBERS_PATTERN.sub("", text)
-            text = _STANDALONE_PAGE_NUMBERS_PATTERN.sub("", text)
-            text = _PAGE_NUMBERS_AT_END_PATTERN.sub("", text)
-            text = _PAGE_NUMBERS_WITH_DASH_PATTERN.sub("", text)
-
+        # clean_text reads this from the config; resolve it once for all pages.
+        replace_single_newlines = load_config().get("replace_single_newlines", True)
+        for page_num, text in load_pdf_page_texts(
+            self.book_path, len(self.pdf_doc), replace_single_newlines
+        ):
             page_id = f"page_{page_num + 1}"
             self.content_texts[page_id] = text
             self.content_lengths[page_id] = calculate_text_length(text)
+            yield page_id, text
+
+    def build_navigation(self):
+        """
+        Build processed_nav_structure from the TOC. Can run before the pages
+        are extracted; gap pages whose text is not known yet get plain
+        "Page N" titles.
+        """
+        if not self.pdf_doc:
+            self.load()
 
-        # 2. Build Navigation Structure
         toc = self.pdf_doc.get_toc()
         
         if not toc:
@@ -177,7 +194,7 @@ class PdfParser(BaseBookParser):
         else:
             self.processed_nav_structure = self._build_structure_from_toc(toc)
 
-        return self.content_texts, self.content_lengths
+        return self.processed_nav_structure
 
     def _get_page_title(self, page_num, text):
         title = f"Page {page_num + 1}"
@@ -404,6 +421,7 @@ class EpubParser(BaseBookParser):
     def __init__(self, book_path):
         self.book = None
         self.doc_content = {}
+        self.documents = None
         super().__init__(book_path)
 
     @property
@@ -475,70 +493,12 @@ class EpubParser(BaseBookParser):
         return metadata
 
     def _find_doc_key(self, base_href, doc_order, doc_order_decoded):
-        candidates = [
-            base_href,
-            urllib.parse.unquote(base_href),
-        ]
-        base_name = os.path.basename(base_href).lower()
-        for k in list(doc_order.keys()) + list(doc_order_decoded.keys()):
-            if os.path.basename(k).lower() == base_name:
-                candidates.append(k)
-        for candidate in candidates:
-            if candidate in doc_order:
-                return candidate, doc_order[candidate]
-            elif candidate in doc_order_decoded:
-                return candidate, doc_order_decoded[candidate]
-        return None, None
+        return find_doc_key(base_href, doc_order, doc_order_decoded)
 
     def _find_position_robust(self, doc_href, fragment_id):
-        if doc_href not in self.doc_content:
-            logging.warning(f"Document '{doc_href}' not found in cached content.")
-            return 0
-        html_content = self.doc_content[doc_href]
-        if not fragment_id:
-            return 0
-
-        try:
-            temp_soup = BeautifulSoup(f"<div>{html_content}</div>", "html.parser")
-            target_element = temp_soup.find(id=fragment_id)
-            if target_element:
-                tag_str = str(target_element)
-                pos = html_content.find(tag_str[: min(len(tag_str), 200)])
-                if pos != -1:
-                    return pos
-        except Exception as e:
-            logging.warning(f"BeautifulSoup failed to find id='{fragment_id}': {e}")
-
-        safe_fragment_id = re.escape(fragment_id)
-        id_name_pattern = re.compile(
-            f"<[^>]+(?:id|name)\\s*=\\s*[\"']{safe_fragment_id}[\"']", re.IGNORECASE
-        )
-        match = id_name_pattern.search(html_content)
-        if match:
-            return match.start()
-
-        id_match_str = f'id="{fragment_id}"'
-        name_match_str = f'name="{fragment_id}"'
-        id_pos = html_content.find(id_match_str)
-        name_pos = html_content.find(name_match_str)
-
-        pos = -1
-        if id_pos != -1 and name_pos != -1:
-            pos = min(id_pos, name_pos)
-        elif id_pos != -1:
-            pos = id_pos
-        elif name_pos != -1:
-            pos = name_pos
-
-        if pos != -1:
-            tag_start_pos = html_content.rfind("<", 0, pos)
-            final_pos = tag_start_pos if tag_start_pos != -1 else 0
-            return final_pos
-
-        logging.warning(
-            f"Anchor '{fragment_id}' not found in {doc_href}. Defaulting to position 0."
-        )
-        return 0
+        if self.documents is None or self.documents.content is not self.doc_content:
+            self.documents = EpubDocuments(self.book, self.doc_content)
+        return self.documents.position(doc_href, fragment_id)
 
     def _parse_ncx_navpoint(
         self,
@@ -788,33 +748,20 @@ class EpubParser(BaseBookParser):
         except Exception as e:
             raise ValueError(f"Failed to parse navigation content: {e}")
 
-        self.doc_content = {}
-        spine_docs = []
-        for spine_item_tuple in self.book.spine:
-            item_id = spine_item_tuple[0]
-            item = self.book.get_item_with_id(item_id)
-            if item:
-                spine_docs.append(item.get_name())
-        doc_order = {href: i for i, href in enumerate(spine_docs)}
-        doc_order_decoded = {
-            urllib.parse.unquote(href): i for href, i in doc_order.items()
-        }
+        self.documents = EpubDocuments(self.book)
+        self.doc_content = self.documents.content
+        doc_order = self.documents.doc_order
+        doc_order_decoded = self.documents.doc_order_decoded
 
         self.content_texts = {}
         self.content_lengths = {}
 
-        for item in self.book.get_items_of_type(ebooklib.ITEM_DOCUMENT):
-            href = item.get_name()
-            if href in doc_order or any(
-                href in nav_point.get("src", "")
-                for nav_point in nav_soup.find_all(["content", "a"])
-            ):
-                try:
-                    self.doc_content[href] = item.get_content().decode(
-                        "utf-8", errors="ignore"
-                    )
-                except Exception:
-                    self.doc_content[href] = ""
+        nav_targets = {
+            str(node.get("src") or node.get("href") or "").split("#", 1)[0]
+            for node in nav_soup.find_all(["content", "a"])
+        }
+        nav_targets.discard("")
+        self.documents.load(nav_targets)
 
         ordered_nav_entries = []
         parse_successful = False
@@ -858,114 +805,30 @@ class EpubParser(BaseBookParser):
 
         ordered_nav_entries.sort(key=lambda x: (x["doc_order"], x["position"]))
 
-        num_entries = len(ordered_nav_entries)
-        for i in range(num_entries):
-            current_entry = ordered_nav_entries[i]
+        for i, current_entry in enumerate(ordered_nav_entries):
             current_src = current_entry["src"]
-            current_doc = current_entry["doc_href"]
-            current_pos = current_entry["position"]
-            current_doc_html = self.doc_content.get(current_doc, "")
-
-            start_slice_pos = current_pos
-            slice_html = ""
-
-            next_entry = ordered_nav_entries[i + 1] if (i + 1) < num_entries else None
-
-            if next_entry:
-                next_doc = next_entry["doc_href"]
-                next_pos = next_entry["position"]
-
-                if current_doc == next_doc:
-                    slice_html = current_doc_html[start_slice_pos:next_pos]
-                else:
-                    slice_html = current_doc_html[start_slice_pos:]
-                    docs_between = []
-                    try:
-                        idx_current = spine_docs.index(current_doc)
-                        idx_next = spine_docs.index(next_doc)
-                        if idx_current < idx_next:
-                            docs_between = [
-                                spine_docs[k] for k in range(idx_current + 1, idx_next)
-                            ]
-                        elif idx_current > idx_next:
-                            docs_between = [
-                                spine_docs[k]
-                                for k in range(idx_current + 1, len(spine_docs))
-                            ]
-                            docs_between.extend(
-                                [spine_docs[k] for k in range(0, idx_next)]
-                            )
-                    except ValueError:
-                        pass
-
-                    for doc_href in docs_between:
-                        slice_html += self.doc_content.get(doc_href, "")
-                    next_doc_html = self.doc_content.get(next_doc, "")
-                    slice_html += next_doc_html[:next_pos]
-            else:
-                slice_html = current_doc_html[start_slice_pos:]
-                try:
-                    idx_current = spine_docs.index(current_doc)
-                    for doc_idx in range(idx_current + 1, len(spine_docs)):
-                        slice_html += self.doc_content.get(spine_docs[doc_idx], "")
-                except ValueError:
-                    pass
-
-            if not slice_html.strip() and current_doc_html:
-                slice_html = current_doc_html
-
-            if slice_html.strip():
-                slice_soup = BeautifulSoup(slice_html, "html.parser")
-
-                # Add line breaks after block-level elements to ensure pauses in speech
-                for tag in slice_soup.find_all(
-                    ["p", "div", "h1", "h2", "h3", "h4", "h5", "h6", "li", "blockquote"]
-                ):
-                    tag.append("\n\n")
-
-                for ol in slice_soup.find_all("ol"):
-                    start = int(ol.get("start", 1))
-                    for idx, li in enumerate(ol.find_all("li", recursive=False)):
-                        number_text = f"{start + idx}) "
-                        if li.string:
-                            li.string.replace_with(number_text + li.string)
-                        else:
-                            li.insert(0, NavigableString(number_text))
-
-                for tag in slice_soup.find_all(["sup", "sub"]):
-                    tag.decompose()
+            next_entry = (
+                ordered_nav_entries[i + 1] if (i + 1) < len(ordered_nav_entries) else None
+            )
+            slice_html = self.documents.slice(
+                current_entry["doc_href"],
+                current_entry["position"],
+                next_entry["doc_href"] if next_entry else None,
+                next_entry["position"] if next_entry else 0,
+            )
 
-                text = clean_text(slice_soup.get_text()).strip()
-                if text:
-                    self.content_texts[current_src] = text
-                    self.content_lengths[current_src] = calculate_text_length(text)
-                else:
-                    self.content_texts[current_src] = ""
-                    self.content_lengths[current_src] = 0
-            else:
-                self.content_texts[current_src] = ""
-                self.content_lengths[current_src] = 0
+            text = html_to_text(slice_html, clean=clean_text) if slice_html.strip() else ""
+            self.content_texts[current_src] = text
+            self.content_lengths[current_src] = calculate_text_length(text) if text else 0
 
         if ordered_nav_entries:
             first_entry = ordered_nav_entries[0]
-            first_doc_href = first_entry["doc_href"]
-            first_pos = first_entry["position"]
-            first_doc_order = first_entry["doc_order"]
-            prefix_html = ""
-
-            for doc_idx in range(first_doc_order):
-                if doc_idx < len(spine_docs):
-                    intermediate_doc_href = spine_docs[doc_idx]
-                    prefix_html += self.doc_content.get(intermediate_doc_href, "")
-
-            first_doc_html = self.doc_content.get(first_doc_href, "")
-            prefix_html += first_doc_html[:first_pos]
+            prefix_html = self.documents.prefix(first_entry["doc_href"], first_entry["position"])
 
             if prefix_html.strip():
-                prefix_soup = BeautifulSoup(prefix_html, "html.parser")
-                for tag in prefix_soup.find_all(["sup", "sub"]):
-                    tag.decompose()
-                prefix_text = clean_text(prefix_soup.get_text()).strip()
+                prefix_text = html_to_text(
+                    prefix_html, block_breaks=False, number_lists=False, clean=clean_text
+                )
 
                 if prefix_text:
                     prefix_chapter_src = "internal:prefix_content"
@@ -987,47 +850,15 @@ class EpubParser(BaseBookParser):
         when navigation processing fails.
         """
         logging.info("Using spine fallback for EPUB processing.")
-        self.doc_content = {}
-        spine_docs = []
-        for spine_item_tuple in self.book.spine:
-            item_id = spine_item_tuple[0]
-            item = self.book.get_item_with_id(item_id)
-            if item:
-                spine_docs.append(item.get_name())
-            else:
-                logging.warning(f"Spine item with id '{item_id}' not found.")
-
-        for item in self.book.get_items_of_type(ebooklib.ITEM_DOCUMENT):
-            href = item.get_name()
-            if href in spine_docs:
-                try:
-                    html_content = item.get_content().decode("utf-8", errors="ignore")
-                    self.doc_content[href] = html_content
-                except Exception:
-                    self.doc_content[href] = ""
+        self.documents = EpubDocuments(self.book)
+        self.doc_content = self.documents.load()
 
         self.content_texts = {}
         self.content_lengths = {}
-        for i, doc_href in enumerate(spine_docs):
+        for doc_href in self.documents.spine_docs:
             html_content = self.doc_content.get(doc_href, "")
             if html_content:
-                soup = BeautifulSoup(html_content, "html.parser")
-
-                # Handle ordered lists
-                for ol in soup.find_all("ol"):
-                    start = int(ol.get("start", 1))
-                    for idx, li in enumerate(ol.find_all("li", recursive=False)):
-                        number_text = f"{start + idx}) "
-                        if li.string:
-                            li.string.replace_with(number_text + li.string)
-                        else:
-                            li.insert(0, NavigableString(number_text))
-
-                # Remove sup/sub
-                for tag in soup.find_all(["sup", "sub"]):
-                    tag.decompose()
-
-                text = clean_text(soup.get_text()).strip()
+                text = html_to_text(html_content, block_breaks=False, clean=clean_text)
                 if text:
                     self.content_texts[doc_href] = text
                     self.content_lengths[doc_href] = calculate_text_length(text)
@@ -0,0 +1,243 @@
+"""Size-bounded SQLite stores behind the on-disk caches.
+
+The entity, LLM, parsed-book and PDF page caches each keep their entries in
+a SQLite database under the user cache directory. ``BoundedStore`` holds what
+they share: a WAL-mode connection that any thread may use (WAL lets the
+WebUI, its workers and the desktop app open the same file), an entry table
+recording each entry's size and last use, and least-recently-used eviction
+once the total size passes the budget. Subclasses add their own columns and
+child tables and keep their own payload encoding.
+
+``SharedStore`` opens one process-wide instance on first use, sized by an
+``ABOGEN_*_CACHE_MB`` variable (``0`` disables it).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Generic, Iterable, List, Mapping, Optional, Sequence, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+# Stay well below SQLite's bound-parameter limit.
+_MAX_PARAMS = 500
+
+StoreEntry = Tuple[str, int, Mapping[str, Any]]
+
+
+def cache_limit_bytes(env_var: str, default_mb: int) -> int:
+    """Byte budget from *env_var*, given in megabytes (0 when disabled)."""
+    try:
+        limit_mb = int(os.environ.get(env_var, default_mb))
+    except ValueError:
+        limit_mb = default_mb
+    return max(0, limit_mb) * 1024 * 1024
+
+
+def _chunks(keys: Sequence[str]) -> Iterable[Sequence[str]]:
+    for start in range(0, len(keys), _MAX_PARAMS):
+        yield keys[start : start + _MAX_PARAMS]
+
+
+class BoundedStore:
+    """Thread-safe, size-bounded SQLite map of key -> entry.
+
+    Entries live in ``table`` with a ``key``, the subclass's ``columns``, a
+    byte ``size`` and a ``last_used`` time. Rows of ``child_tables`` carry
+    the ``key`` of their entry and are removed with it; subclasses create
+    them in ``_create_tables``.
+    """
+
+    table = "entries"
+    columns = "payload BLOB NOT NULL"
+    child_tables: Tuple[str, ...] = ()
+
+    def __init__(self, path: Path, max_bytes: int) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max(0, int(max_bytes))
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} ("
+            " key TEXT PRIMARY KEY,"
+            f" {self.columns},"
+            " size INTEGER NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._create_tables()
+        self._conn.commit()
+
+    def _create_tables(self) -> None:
+        """Create the ``child_tables`` (the connection is open, lock not needed)."""
+
+    # Reading --------------------------------------------------------
+
+    def _fetch_many(self, keys: Sequence[str], columns: str) -> Dict[str, Tuple[Any, ...]]:
+        """*columns* of the entries present among *keys*, marking them used."""
+        found: Dict[str, Tuple[Any, ...]] = {}
+        if not keys:
+            return found
+        now = time.time()
+        with self._lock:
+            for chunk in _chunks(keys):
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, {columns} FROM {self.table} WHERE key IN ({placeholders})",
+                    list(chunk),
+                ).fetchall()
+                for row in rows:
+                    found[row[0]] = tuple(row[1:])
+            if found:
+                self._conn.executemany(
+                    f"UPDATE {self.table} SET last_used = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+                self._conn.commit()
+            self.hits += len(found)
+            self.misses += len(set(keys)) - len(found)
+        return found
+
+    def _fetch(self, key: str, columns: str) -> Optional[Tuple[Any, ...]]:
+        """*columns* of the entry for *key*, or None; marks it used."""
+        return self._fetch_many([key], columns).get(key)
+
+    def _discard(self, key: str) -> None:
+        """Drop an entry that could not be decoded; its lookup becomes a miss."""
+        with self._lock:
+            self._delete([key])
+            self._conn.commit()
+            self.hits -= 1
+            self.misses += 1
+
+    # Writing --------------------------------------------------------
+
+    def _store_many(
+        self,
+        entries: Sequence[StoreEntry],
+        children: Optional[Callable[[sqlite3.Connection], None]] = None,
+    ) -> None:
+        """Insert or replace ``(key, size, column values)`` entries, then evict.
+
+        *children* writes the entries' child-table rows in the same
+        transaction. Entries larger than the whole budget are skipped.
+        """
+        entries = [entry for entry in entries if entry[1] <= self.max_bytes]
+        if not entries:
+            return
+        names = list(entries[0][2])
+        statement = (
+            f"INSERT OR REPLACE INTO {self.table} (key, {', '.join(names)}, size, last_used)"
+            f" VALUES ({', '.join('?' * (len(names) + 3))})"
+        )
+        now = time.time()
+        keys = [key for key, _, _ in entries]
+        with self._lock:
+            self._delete_children(keys)
+            if children is not None:
+                children(self._conn)
+            self._conn.executemany(
+                statement,
+                [(key, *(values[name] for name in names), size, now) for key, size, values in entries],
+            )
+            self._evict(keep=set(keys))
+            self._conn.commit()
+
+    def _store(
+        self,
+        key: str,
+        size: int,
+        values: Mapping[str, Any],
+        children: Optional[Callable[[sqlite3.Connection], None]] = None,
+    ) -> None:
+        self._store_many([(key, size, values)], children)
+
+    def _evict(self, keep: Iterable[str] = ()) -> None:
+        """Delete least recently used entries until the total fits the budget."""
+        total = self._conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.table}").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        keep = set(keep)
+        victims: List[str] = []
+        rows = self._conn.execute(f"SELECT key, size FROM {self.table} ORDER BY last_used").fetchall()
+        for victim, size in rows:
+            if total <= self.max_bytes:
+                break
+            if victim in keep:
+                continue
+            victims.append(victim)
+            total -= size
+        self._delete(victims)
+
+    def _delete_children(self, keys: Sequence[str]) -> None:
+        for table in self.child_tables:
+            for chunk in _chunks(keys):
+                placeholders = ",".join("?" * len(chunk))
+                self._conn.execute(f"DELETE FROM {table} WHERE key IN ({placeholders})", list(chunk))
+
+    def _delete(self, keys: Sequence[str]) -> None:
+        self._delete_children(keys)
+        for chunk in _chunks(keys):
+            placeholders = ",".join("?" * len(chunk))
+            self._conn.execute(f"DELETE FROM {self.table} WHERE key IN ({placeholders})", list(chunk))
+
+    # ----------------------------------------------------------------
+
+    def clear(self) -> None:
+        with self._lock:
+            for table in (*self.child_tables, self.table):
+                self._conn.execute(f"DELETE FROM {table}")
+            self._conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+S = TypeVar("S")
+
+
+class SharedStore(Generic[S]):
+    """Process-wide cache instance, opened on first use.
+
+    *open_store* is called with the byte budget read from *env_var* and
+    returns the cache; ``get()`` returns None while the budget is 0 or the
+    cache cannot be opened. ``reset()`` closes it so the next ``get()``
+    reopens it.
+    """
+
+    def __init__(self, open_store: Callable[[int], S], env_var: str, default_mb: int) -> None:
+        self.env_var = env_var
+        self.default_mb = default_mb
+        self._open = open_store
+        self._store: Optional[S] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Optional[S]:
+        with self._lock:
+            if self._store is None:
+                max_bytes = cache_limit_bytes(self.env_var, self.default_mb)
+                if max_bytes <= 0:
+                    return None
+                try:
+                    self._store = self._open(max_bytes)
+                except (OSError, sqlite3.Error) as exc:
+                    logger.warning("Cache disabled (%s): %s", self.env_var, exc)
+                    return None
+            return self._store
+
+    def reset(self) -> None:
+        with self._lock:
+            if self._store is not None:
+                self._store.close()  # type: ignore[attr-defined]
+            self._store = None
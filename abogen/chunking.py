@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Dict, Iterable, Iterator, List, Literal, Optional, Tuple
-from typing import Pattern
 
 import re
 
@@ -195,30 +194,56 @@ def chunk_text(
     return chunks
 
 
-_DISPLAY_PATTERN_CACHE: Dict[str, Pattern[str]] = {}
-
-
-def _build_display_pattern(text: str) -> Pattern[str]:
-    cached = _DISPLAY_PATTERN_CACHE.get(text)
-    if cached is not None:
-        return cached
-    escaped = re.escape(text)
-    escaped = escaped.replace(r"\ ", r"\s+")
-    pattern = re.compile(r"(\s*" + escaped + r"\s*)", re.DOTALL)
-    _DISPLAY_PATTERN_CACHE[text] = pattern
-    return pattern
+def _skip_whitespace(source: str, index: int) -> int:
+    length = len(source)
+    while index < length and source[index].isspace():
+        index += 1
+    return index
 
 
 def _search_source_span(
     source: str, normalized: str, start: int
 ) -> Optional[Tuple[int, int]]:
-    if not normalized:
-        return None
-    pattern = _build_display_pattern(normalized)
-    match = pattern.search(source, start)
-    if not match:
+    """Find *normalized* in *source* at or after *start*, ignoring whitespace width.
+
+    Each whitespace run in *normalized* matches any non-empty whitespace run in
+    the source, and the span takes in the whitespace around the match (from
+    *start* onwards). Candidates are located with ``str.find`` on the first
+    word and confirmed by walking the remaining words with a cursor.
+    """
+    core = normalized.strip()
+    if not core:
         return None
-    return match.start(1), match.end(1)
+    needs_leading = normalized[0].isspace()
+    needs_trailing = normalized[-1].isspace()
+    first = core.split(None, 1)[0]
+    words: Optional[List[str]] = None
+
+    position = source.find(first, start)
+    while position != -1:
+        span_start = position
+        while span_start > start and source[span_start - 1].isspace():
+            span_start -= 1
+        matched = not needs_leading or span_start < position
+        if matched and source.startswith(core, position):
+            # Fast path: the source repeats the chunk's own whitespace.
+            cursor = position + len(core)
+        elif matched:
+            if words is None:
+                words = core.split()[1:]
+            cursor = position + len(first)
+            for word in words:
+                after = _skip_whitespace(source, cursor)
+                if after == cursor or not source.startswith(word, after):
+                    matched = False
+                    break
+                cursor = after + len(word)
+        if matched:
+            span_end = _skip_whitespace(source, cursor)
+            if not needs_trailing or span_end > cursor:
+                return span_start, span_end
+        position = source.find(first, position + 1)
+    return None
 
 
 def _attach_display_text(source: str, chunks: List[Dict[str, object]]) -> None:
@@ -5,11 +5,12 @@ This module provides core audio buffer manipulation functions including:
 - Audio mixing
 - Audio normalization
 - Audio buffer resizing
+- Streaming mixing and peak limiting for long timelines
 """
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Callable, Optional
 
 import numpy as np
 
@@ -237,3 +238,129 @@ def ffmpeg_time_stretch(
     )
     out, _ = proc.communicate(input=audio.tobytes())
     return np.frombuffer(out, dtype="float32")
+
+
+class PeakLimiter:
+    """Streaming peak limiter for blocks written in order.
+
+    Replaces whole-track peak normalization when the track is never held in
+    memory. Each frame (10 ms by default) is scaled by the gain that keeps
+    its peak within ``ceiling``; the gain drops instantly and recovers
+    towards 1.0 with the ``release`` time constant, so isolated overlaps
+    are tamed without touching the rest of the track.
+
+    Args:
+        ceiling: Maximum absolute sample value after limiting.
+        frame_samples: Samples sharing one gain value.
+        release_seconds: Time constant of the gain recovery.
+        sample_rate: Sample rate in Hz.
+    """
+
+    def __init__(
+        self,
+        ceiling: float = 1.0,
+        *,
+        frame_samples: int = SAMPLE_RATE // 100,
+        release_seconds: float = 0.25,
+        sample_rate: int = SAMPLE_RATE,
+    ) -> None:
+        self.ceiling = ceiling
+        self.frame_samples = max(1, frame_samples)
+        self._recovery = 1.0 - float(np.exp(-self.frame_samples / (release_seconds * sample_rate)))
+        self._gain = 1.0
+        self.peak = 0.0
+        self.limited_frames = 0
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """Return *block* with its peaks limited (float32)."""
+        block = np.asarray(block, dtype="float32")
+        if block.size == 0:
+            return block
+        peak = float(np.abs(block).max())
+        self.peak = max(self.peak, peak)
+        if peak <= self.ceiling and self._gain >= 1.0:
+            return block
+
+        frame = self.frame_samples
+        count = -(-block.size // frame)
+        padded = np.zeros(count * frame, dtype="float32")
+        padded[: block.size] = np.abs(block)
+        frame_peaks = padded.reshape(count, frame).max(axis=1)
+        gains = np.empty(count, dtype="float32")
+        gain = self._gain
+        for index, frame_peak in enumerate(frame_peaks):
+            gain += (1.0 - gain) * self._recovery
+            if frame_peak * gain > self.ceiling:
+                gain = self.ceiling / float(frame_peak)
+                self.limited_frames += 1
+            gains[index] = gain
+        self._gain = 1.0 if gain > 0.9999 else gain
+        return block * np.repeat(gains, frame)[: block.size]
+
+
+class SlidingMixer:
+    """Additive mixer over a sliding window of a long timeline.
+
+    Clips are added at absolute sample positions in non-decreasing start
+    order. Everything before the latest start can no longer change, so it
+    is passed to ``emit`` (through ``limiter`` when given) and dropped from
+    memory; only the region still covered by overlapping clips is kept.
+
+    Args:
+        emit: Receives finished float32 blocks in timeline order.
+        limiter: Optional streaming limiter applied to emitted blocks.
+        block_samples: Largest block handed to ``emit`` at once.
+    """
+
+    def __init__(
+        self,
+        emit: Callable[[np.ndarray], None],
+        *,
+        limiter: Optional[PeakLimiter] = None,
+        block_samples: int = SAMPLE_RATE * 10,
+    ) -> None:
+        self._emit = emit
+        self._limiter = limiter
+        self._block_samples = max(1, block_samples)
+        self._window = np.zeros(0, dtype="float32")
+        self._base = 0
+        self.max_window_samples = 0
+
+    @property
+    def position(self) -> int:
+        """Samples already emitted."""
+        return self._base
+
+    def add(self, clip: np.ndarray, start_sample: int) -> None:
+        """Mix *clip* in at *start_sample*, flushing what precedes it."""
+        if start_sample < self._base:
+            # Earlier than audio already emitted: keep the part still open.
+            clip = clip[self._base - start_sample :]
+            start_sample = self._base
+        self.flush(start_sample)
+        if clip.size == 0:
+            return
+        offset = start_sample - self._base
+        self._window = ensure_buffer_size(self._window, offset + clip.size)
+        self._window[offset : offset + clip.size] += clip
+        self.max_window_samples = max(self.max_window_samples, self._window.size)
+
+    def flush(self, upto_sample: int) -> None:
+        """Emit the timeline up to *upto_sample*, padding with silence."""
+        while self._base < upto_sample:
+            count = min(upto_sample - self._base, self._block_samples)
+            if self._window.size:
+                block = self._window[:count]
+                if block.size < count:
+                    block = ensure_buffer_size(block, count)
+                self._window = self._window[count:]
+            else:
+                block = np.zeros(count, dtype="float32")
+            if self._limiter is not None:
+                block = self._limiter.process(block)
+            self._emit(block)
+            self._base += count
+
+    def finish(self, total_samples: int = 0) -> None:
+        """Emit everything mixed so far, padded to at least *total_samples*."""
+        self.flush(max(total_samples, self._base + self._window.size))
@@ -6,14 +6,22 @@ to various output formats (WAV, FLAC via soundfile; compressed via ffmpeg).
 Usage:
     with open_audio_sink(path, "wav") as sink:
         sink.write(audio_data)
+
+Pass ``background_queue=N`` to move encoding and disk I/O onto a writer
+thread fed by a bounded queue of N blocks, so ffmpeg back-pressure or a slow
+disk does not stall synthesis.
 """
 
 from __future__ import annotations
 
+import logging
 import os
+import queue
 import subprocess
 import sys
-from dataclasses import dataclass
+import threading
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -23,12 +31,32 @@ from abogen.domain.audio_buffer import SAMPLE_RATE
 from abogen.domain.audio_helpers import build_ffmpeg_command
 
 
+# Blocks buffered by a background writer; one block is usually one TTS segment.
+DEFAULT_WRITER_QUEUE_BLOCKS = 64
+
+
+@dataclass
+class SinkWriterStats:
+    """Counters of a background audio writer."""
+
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    blocks_written: int = 0
+    stall_seconds: float = 0.0  # producer time blocked on a full queue
+    write_seconds: float = 0.0  # writer time spent in the wrapped sink
+
+
 @dataclass(frozen=True)
 class AudioSink:
-    """Represents an open audio output target."""
+    """Represents an open audio output target.
+
+    ``stats`` is set on background sinks and returns a SinkWriterStats
+    snapshot.
+    """
 
     write: Callable[[np.ndarray], None]
     close: Callable[[], None]
+    stats: Optional[Callable[[], SinkWriterStats]] = field(default=None, compare=False)
 
     def __enter__(self) -> AudioSink:
         return self
@@ -37,6 +65,100 @@ class AudioSink:
         self.close()
 
 
+def writer_queue_blocks() -> int:
+    """Background writer queue size from ``ABOGEN_AUDIO_WRITER_QUEUE`` (0 = synchronous)."""
+    try:
+        return max(0, int(os.environ.get("ABOGEN_AUDIO_WRITER_QUEUE", DEFAULT_WRITER_QUEUE_BLOCKS)))
+    except ValueError:
+        return DEFAULT_WRITER_QUEUE_BLOCKS
+
+
+def background_sink(sink: AudioSink, *, max_blocks: int = DEFAULT_WRITER_QUEUE_BLOCKS) -> AudioSink:
+    """Wrap *sink* so writes are performed by a dedicated writer thread.
+
+    ``write()`` enqueues the array without copying and returns at once
+    unless ``max_blocks`` writes are already pending, so callers must not
+    modify an array after passing it in. An exception raised by the wrapped
+    sink is re-raised by the next ``write()`` and by ``close()``; ``close()``
+    drains the queue before closing the wrapped sink.
+    """
+    pending: "queue.Queue[Optional[np.ndarray]]" = queue.Queue(maxsize=max(1, max_blocks))
+    stats = SinkWriterStats()
+    lock = threading.Lock()
+    errors: list[BaseException] = []
+    closed = threading.Event()
+
+    def _drain() -> None:
+        while True:
+            block = pending.get()
+            if block is None:
+                return
+            with lock:
+                stats.queue_depth = pending.qsize()
+            if errors:
+                continue
+            started = time.perf_counter()
+            try:
+                sink.write(block)
+            except BaseException as exc:  # surfaced to the producer
+                errors.append(exc)
+            with lock:
+                stats.blocks_written += 1
+                stats.write_seconds += time.perf_counter() - started
+
+    writer = threading.Thread(target=_drain, name="abogen-audio-writer", daemon=True)
+    writer.start()
+
+    def _write(data: np.ndarray) -> None:
+        if errors:
+            raise errors[0]
+        if closed.is_set():
+            raise ValueError("write to a closed audio sink")
+        try:
+            pending.put_nowait(data)
+        except queue.Full:
+            started = time.perf_counter()
+            pending.put(data)
+            with lock:
+                stats.stall_seconds += time.perf_counter() - started
+        with lock:
+            stats.queue_depth = pending.qsize()
+            stats.max_queue_depth = max(stats.max_queue_depth, stats.queue_depth)
+
+    def _close() -> None:
+        if closed.is_set():
+            return
+        closed.set()
+        pending.put(None)
+        writer.join()
+        try:
+            sink.close()
+        finally:
+            if errors:
+                raise errors[0]
+
+    def _stats() -> SinkWriterStats:
+        with lock:
+            return SinkWriterStats(**vars(stats))
+
+    return AudioSink(write=_write, close=_close, stats=_stats)
+
+
+def log_writer_stats(sink: Optional[AudioSink], label: str) -> None:
+    """Log queue and stall metrics of a background sink, if it is one."""
+    if sink is None or sink.stats is None:
+        return
+    snapshot = sink.stats()
+    logging.info(
+        "[audio] %s writer: blocks=%d max_queue=%d stall=%.2fs write=%.2fs",
+        label,
+        snapshot.blocks_written,
+        snapshot.max_queue_depth,
+        snapshot.stall_seconds,
+        snapshot.write_seconds,
+    )
+
+
 def _ensure_ffmpeg() -> None:
     """Ensure static ffmpeg binaries are on PATH."""
     import static_ffmpeg  # type: ignore
@@ -67,6 +189,8 @@ def open_audio_sink(
     cancel_check: Optional[Callable[[], bool]] = None,
     extra_ffmpeg_args: Optional[list[str]] = None,
     ffmpeg_cmd: Optional[list[str]] = None,
+    subtype: Optional[str] = None,
+    background_queue: int = 0,
 ) -> AudioSink:
     """Open an audio output sink for writing raw float32 PCM samples.
 
@@ -77,6 +201,9 @@ def open_audio_sink(
         cancel_check: Optional callable; if it returns True, writes are silently skipped.
         extra_ffmpeg_args: Optional extra args inserted after ffmpeg header (ignored when ffmpeg_cmd is provided).
         ffmpeg_cmd: Optional pre-built ffmpeg command list (for m4b with cover art etc.).
+        subtype: Optional soundfile subtype for WAV/FLAC (e.g. "FLOAT"); defaults to the format's default.
+        background_queue: When positive, wrap the sink with ``background_sink``
+            using a queue of this many blocks.
 
     Returns:
         AudioSink with write() and close() methods.
@@ -92,6 +219,7 @@ def open_audio_sink(
             samplerate=SAMPLE_RATE,
             channels=1,
             format=fmt.upper(),
+            subtype=subtype,
         )
 
         def _write_wav(data: np.ndarray) -> None:
@@ -102,7 +230,8 @@ def open_audio_sink(
         def _close_wav() -> None:
             soundfile_obj.close()
 
-        return AudioSink(write=_write_wav, close=_close_wav)
+        wav_sink = AudioSink(write=_write_wav, close=_close_wav)
+        return background_sink(wav_sink, max_blocks=background_queue) if background_queue > 0 else wav_sink
 
     # Compressed formats: pipe through ffmpeg
     _ensure_ffmpeg()
@@ -121,11 +250,13 @@ def open_audio_sink(
     def _write_compressed(data: np.ndarray) -> None:
         if (cancel_check and cancel_check()) or process.stdin is None or process.stdin.closed:
             return
-        process.stdin.write(data.tobytes())
+        # Hand ffmpeg the array's own buffer instead of a tobytes() copy.
+        process.stdin.write(memoryview(np.ascontiguousarray(data, dtype=np.float32)).cast("B"))
 
     def _close_compressed() -> None:
         if process.stdin and not process.stdin.closed:
             process.stdin.close()
         process.wait()
 
-    return AudioSink(write=_write_compressed, close=_close_compressed)
+    ffmpeg_sink = AudioSink(write=_write_compressed, close=_close_compressed)
+    return background_sink(ffmpeg_sink, max_blocks=background_queue) if background_queue > 0 else ffmpeg_sink
@@ -19,14 +19,16 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass, field
-from typing import Any, Callable, Optional, Protocol
+from typing import Any, Callable, Dict, Optional, Protocol, Sequence
 
 from abogen.domain.audio_sink import AudioSink
 from abogen.domain.conversion_pipeline import tts_segments
 from abogen.domain.enums import Language, SubtitleMode
 from abogen.domain.normalization import TTSContext
 from abogen.domain.progress import calc_etr_str
+from abogen.domain.segment_cache import SegmentCache, segment_cache_key
 from abogen.domain.subtitle_generation import process_subtitle_tokens
+from abogen.domain.token_timings import TokenBatch, TokenColumns
 
 
 class CancelChecker(Protocol):
@@ -48,7 +50,7 @@ class SegmentInfo:
     """Read-only info about a TTS segment, passed to on_segment callback."""
     graphemes: str
     audio: Any
-    tokens: list
+    tokens: Sequence[Dict[str, Any]]
     duration: float
     chunk_start: float
 
@@ -88,19 +90,44 @@ def run_tts_segment_loop(
         ``process_subtitle_tokens`` and writing entries to subtitle writers.
     """
     local_segments = 0
-    accumulated_tokens: list[dict] = []
+    segment_tokens: list[TokenColumns] = []
+    start_time = params.stats.current_time
+
+    cache = params.segment_cache
+    cache_key = None
+    segments: Any = None
+    if cache is not None:
+        cache_key = segment_cache_key(
+            backend=backend,
+            voice=voice,
+            speed=speed,
+            total_steps=total_steps,
+            text=text,
+            split_pattern=split_pattern,
+        )
+        if cache_key is not None:
+            segments = cache.get(cache_key, start_time)
+    recorded: Optional[list] = None
+    if segments is None:
+        segments = tts_segments(
+            text,
+            backend=backend,
+            voice=voice,
+            speed=speed,
+            split_pattern=split_pattern,
+            current_time=start_time,
+            total_steps=total_steps,
+        )
+        if cache_key is not None:
+            recorded = []
 
-    for seg in tts_segments(
-        text,
-        backend=backend,
-        voice=voice,
-        speed=speed,
-        split_pattern=split_pattern,
-        current_time=params.stats.current_time,
-        total_steps=total_steps,
-    ):
+    cancelled = False
+    for seg in segments:
         if params.check_cancel():
+            cancelled = True
             break
+        if recorded is not None:
+            recorded.append(seg)
 
         local_segments += 1
         params.stats.processed_chars += len(seg.graphemes)
@@ -127,7 +154,7 @@ def run_tts_segment_loop(
             info = SegmentInfo(
                 graphemes=seg.graphemes,
                 audio=seg.audio,
-                tokens=list(seg.tokens) if seg.tokens else [],
+                tokens=seg.tokens,
                 duration=seg.duration,
                 chunk_start=getattr(seg, "chunk_start", params.stats.current_time),
             )
@@ -141,17 +168,22 @@ def run_tts_segment_loop(
 
         # Accumulate subtitle tokens (default path; skipped if on_segment handles it)
         if not on_segment and params.subtitle_mode != SubtitleMode.DISABLED and seg.tokens:
-            accumulated_tokens.extend(seg.tokens)
+            segment_tokens.append(seg.tokens)
 
         # Update timing
         if params.audio_sink:
             params.stats.current_time += seg.duration
 
-    return local_segments, accumulated_tokens
+    # Stored and joined only after the loop: tts_segments patches boundary
+    # whitespace on a segment's tokens once the next segment arrives.
+    if recorded is not None and not cancelled:
+        cache.put(cache_key, recorded, start_time)
+
+    return local_segments, TokenColumns.concat(segment_tokens)
 
 
 def process_and_write_subtitles(
-    accumulated_tokens: list[dict],
+    accumulated_tokens: "TokenColumns | TokenBatch | list[dict]",
     subtitle_writer: Any,
     *,
     subtitle: "SubtitleConfig | str",
@@ -206,6 +238,7 @@ class SynthParams:
     max_subtitle_words: int = 50
     language: Language = Language.EN_US
     use_spacy_segmentation: bool = False
+    segment_cache: Optional[SegmentCache] = None
 
 
 def synthesize_text(
@@ -220,13 +253,16 @@ def synthesize_text(
     preview_callback: Optional[Callable[[str], None]] = None,
     on_segment: Optional[Callable[[SegmentInfo], None]] = None,
     split_pattern_override: Optional[str] = None,
+    pre_normalized: bool = False,
 ) -> tuple[int, list]:
     """Normalize text and run TTS — the single entry point for both UIs.
 
     Combines TTSContext.normalize() + run_tts_segment_loop() into one call.
     UI-specific concerns (provider resolution, progress display) stay in the UI.
+    Pass ``pre_normalized=True`` when *text* already went through
+    ``params.tts_context.normalize`` (e.g. in a look-ahead stage).
     """
-    normalized = params.tts_context.normalize(text)
+    normalized = text if pre_normalized else params.tts_context.normalize(text)
     return run_tts_segment_loop(
         text=normalized,
         params=params,
@@ -16,6 +16,7 @@ import numpy as np
 
 from abogen.domain.audio_helpers import to_float32
 from abogen.domain.normalization import prepare_text_for_tts
+from abogen.domain.token_timings import TokenColumns
 from abogen.domain.tokens import FakeToken
 from abogen.domain.audio_buffer import SAMPLE_RATE
 
@@ -132,7 +133,7 @@ class SegmentResult:
     audio: np.ndarray
     duration: float
     chunk_start: float
-    tokens: List[Dict[str, Any]] = field(default_factory=list)
+    tokens: TokenColumns = field(default_factory=TokenColumns)
 
 
 def tts_segments(
@@ -173,7 +174,7 @@ def tts_segments(
     segment_iter = backend(text, **kwargs)
 
     chunk_start = current_time
-    prev_tokens: Optional[List[Dict[str, Any]]] = None
+    prev_tokens: Optional[TokenColumns] = None
     prev_was_fallback = True
 
     for segment in segment_iter:
@@ -192,15 +193,14 @@ def tts_segments(
             tokens_list = [FakeToken(graphemes, 0, duration)]
             was_fallback = True
 
-        tokens = [
-            {
-                "start": chunk_start + (tok.start_ts or 0),
-                "end": chunk_start + (tok.end_ts or 0),
-                "text": tok.text,
-                "whitespace": tok.whitespace,
-            }
-            for tok in tokens_list
-        ]
+        tokens = TokenColumns()
+        for tok in tokens_list:
+            tokens.append(
+                chunk_start + (tok.start_ts or 0),
+                chunk_start + (tok.end_ts or 0),
+                tok.text,
+                tok.whitespace,
+            )
 
         # When the engine splits text on a punctuation pattern, the
         # whitespace between segments is consumed by the split. Restore a
@@ -210,9 +210,9 @@ def tts_segments(
         if (
             not prev_was_fallback
             and prev_tokens
-            and not prev_tokens[-1].get("whitespace")
+            and not prev_tokens[-1]["whitespace"]
         ):
-            prev_tokens[-1]["whitespace"] = " "
+            prev_tokens.set_whitespace(-1, " ")
 
         yield SegmentResult(
             graphemes=graphemes,
@@ -324,7 +324,7 @@ def emit_text_to_sinks(
     from abogen.domain.subtitle_generation import process_subtitle_tokens
 
     segments_emitted = 0
-    accumulated_tokens: List[Dict[str, Any]] = []
+    segment_tokens: List[TokenColumns] = []
 
     for seg in emit_text_segments(
         text,
@@ -346,27 +346,32 @@ def emit_text_to_sinks(
         if audio_sink:
             audio_sink.write(seg.audio)
 
-        # Collect tokens
-        accumulated_tokens.extend(seg.tokens)
+        # Collect tokens (copied after the loop: tts_segments patches
+        # boundary whitespace on a segment once the next one arrives)
+        segment_tokens.append(seg.tokens)
 
     # Flush subtitle tokens
-    if subtitle_writer and accumulated_tokens:
+    accumulated_tokens = TokenColumns.concat(segment_tokens)
+    batch = accumulated_tokens.batch() if accumulated_tokens else None
+    if subtitle_writer and batch is not None:
         _use_spacy = subtitle_mode not in (SubtitleMode.DISABLED, SubtitleMode.LINE)
         new_entries: List[tuple] = []
         process_subtitle_tokens(
-            accumulated_tokens,
+            batch,
             new_entries,
             max_subtitle_words,
             subtitle_mode,
             subtitle_lang,
             use_spacy_segmentation=_use_spacy,
-            fallback_end_time=current_time + sum(t["end"] - t["start"] for t in accumulated_tokens if accumulated_tokens),
+            fallback_end_time=current_time + batch.total_duration(),
         )
         for start, end, text_entry in new_entries:
             subtitle_writer.write_entry(start=start, end=end, text=text_entry)
 
     new_time = current_time
-    if accumulated_tokens:
-        new_time = max(t["end"] for t in accumulated_tokens)
+    if batch is not None:
+        timed_ends = batch.ends[~np.isnan(batch.ends)]
+        if timed_ends.size:
+            new_time = float(timed_ends.max())
 
     return segments_emitted, new_time, accumulated_tokens
@@ -0,0 +1,158 @@
+"""Run a producer ahead of its consumer in a background thread.
+
+The executor uses this to normalize and segment upcoming text while the TTS
+backend is busy with the current segment. Items are produced in order into a
+bounded queue; the consumer iterates as usual and only waits when the
+producer has fallen behind. ``LookaheadStats`` records how long producing
+took and how long the consumer actually waited, so the difference is the
+work the overlap hid.
+
+Queue depth comes from ``ABOGEN_NORMALIZE_LOOKAHEAD`` (default 16 items;
+``0`` produces inline on the consumer's thread).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Generic, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_LOOKAHEAD_ITEMS = 16
+
+_DONE = object()
+
+
+@dataclass
+class LookaheadStats:
+    """Timing of a look-ahead stage."""
+
+    items: int = 0
+    produce_seconds: float = 0.0
+    wait_seconds: float = 0.0
+
+    @property
+    def hidden_seconds(self) -> float:
+        """Producer time that overlapped with the consumer's own work."""
+        return max(0.0, self.produce_seconds - self.wait_seconds)
+
+    def add(self, other: "LookaheadStats") -> None:
+        self.items += other.items
+        self.produce_seconds += other.produce_seconds
+        self.wait_seconds += other.wait_seconds
+
+
+class _Failure:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def lookahead_items() -> int:
+    """Queue depth from ``ABOGEN_NORMALIZE_LOOKAHEAD`` (0 = inline)."""
+    try:
+        return max(0, int(os.environ.get("ABOGEN_NORMALIZE_LOOKAHEAD", DEFAULT_LOOKAHEAD_ITEMS)))
+    except ValueError:
+        return DEFAULT_LOOKAHEAD_ITEMS
+
+
+class Lookahead(Generic[T]):
+    """Iterate *source* with up to *depth* items produced ahead of time.
+
+    An exception raised by *source* is re-raised by the consumer at the
+    position where it occurred. ``close()`` (or leaving the ``with`` block)
+    stops the producer; items not consumed yet are discarded.
+    """
+
+    def __init__(self, source: Iterable[T], *, depth: Optional[int] = None, name: str = "abogen-lookahead") -> None:
+        self.stats = LookaheadStats()
+        self._source = iter(source)
+        self._depth = lookahead_items() if depth is None else max(0, depth)
+        self._stop = threading.Event()
+        self._finished = False
+        self._thread: Optional[threading.Thread] = None
+        if self._depth:
+            self._queue: "queue.Queue[object]" = queue.Queue(maxsize=self._depth)
+            self._thread = threading.Thread(target=self._produce, name=name, daemon=True)
+            self._thread.start()
+
+    def _put(self, item: object) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self) -> None:
+        try:
+            while not self._stop.is_set():
+                started = time.perf_counter()
+                try:
+                    item = next(self._source)
+                except StopIteration:
+                    break
+                self.stats.produce_seconds += time.perf_counter() - started
+                if not self._put(item):
+                    return
+        except BaseException as exc:  # surfaced to the consumer
+            self._put(_Failure(exc))
+            return
+        self._put(_DONE)
+
+    def __iter__(self) -> Iterator[T]:
+        return self
+
+    def __next__(self) -> T:
+        if self._finished:
+            raise StopIteration
+        started = time.perf_counter()
+        if self._thread is None:
+            try:
+                item: object = next(self._source)
+            except StopIteration:
+                self._finished = True
+                raise
+            elapsed = time.perf_counter() - started
+            self.stats.produce_seconds += elapsed
+        else:
+            item = self._queue.get()
+            elapsed = time.perf_counter() - started
+        self.stats.wait_seconds += elapsed
+        if item is _DONE:
+            self._finished = True
+            raise StopIteration
+        if isinstance(item, _Failure):
+            self._finished = True
+            raise item.error
+        self.stats.items += 1
+        return item  # type: ignore[return-value]
+
+    def close(self) -> None:
+        self._finished = True
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "Lookahead[T]":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def log_lookahead_stats(stats: LookaheadStats, label: str) -> None:
+    """Log how much producer time the overlap hid from the consumer."""
+    logging.info(
+        "[lookahead] %s: items=%d produce=%.2fs waited=%.2fs hidden=%.2fs",
+        label,
+        stats.items,
+        stats.produce_seconds,
+        stats.wait_seconds,
+        stats.hidden_seconds,
+    )
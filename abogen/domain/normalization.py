@@ -7,13 +7,19 @@ normalization.  The latter is the single entry point that both the Web UI and
 PyQt Desktop GUI should use.
 
 Also provides ``TTSContext`` — a dataclass bundling all pre-compiled normalization
-resources so they can be created once and passed as a single object.
+resources so they can be created once and passed as a single object.  The
+context also freezes the merged runtime settings and ``ApostropheConfig``, so
+per-segment normalization does no settings work; ``get_settings_resolution_stats``
+counts how often (and how long) settings are still resolved on the hot path.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Mapping, Optional
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 from abogen.domain.enums import Language
 from abogen.kokoro_text_normalization import (
@@ -29,12 +35,77 @@ from abogen.normalization_settings import (
 _BASE_APOSTROPHE_CONFIG = ApostropheConfig()
 
 
+# ─── Settings resolution ─────────────────────────────────────────
+
+
+@dataclass
+class SettingsResolutionStats:
+    """Profiling counter for settings resolved during normalization.
+
+    Attributes:
+        calls: Number of times settings were loaded, merged and turned into an
+            ``ApostropheConfig``.
+        seconds: Total wall time spent doing so.
+    """
+
+    calls: int = 0
+    seconds: float = 0.0
+
+    @property
+    def per_call_us(self) -> float:
+        """Average overhead per resolution in microseconds."""
+        return self.seconds / self.calls * 1e6 if self.calls else 0.0
+
+
+_SETTINGS_STATS = SettingsResolutionStats()
+_SETTINGS_STATS_LOCK = threading.Lock()
+
+
+def get_settings_resolution_stats() -> SettingsResolutionStats:
+    """Return a snapshot of the settings-resolution profiling counter."""
+    with _SETTINGS_STATS_LOCK:
+        return replace(_SETTINGS_STATS)
+
+
+def reset_settings_resolution_stats() -> None:
+    """Zero the settings-resolution profiling counter."""
+    with _SETTINGS_STATS_LOCK:
+        _SETTINGS_STATS.calls = 0
+        _SETTINGS_STATS.seconds = 0.0
+
+
+def resolve_normalization_settings(
+    normalization_overrides: Optional[Mapping[str, Any]] = None,
+) -> Tuple[Mapping[str, Any], ApostropheConfig]:
+    """Merge runtime settings with overrides and build the apostrophe config.
+
+    Args:
+        normalization_overrides: Per-job overrides applied on top of the
+            runtime settings.
+
+    Returns:
+        ``(settings, apostrophe_config)``; ``settings`` is read-only.
+    """
+    start = time.perf_counter()
+    runtime_settings = get_runtime_settings()
+    if normalization_overrides:
+        runtime_settings = _apply_overrides(runtime_settings, normalization_overrides)
+    apostrophe_config = build_apostrophe_config(settings=runtime_settings, base=_BASE_APOSTROPHE_CONFIG)
+    elapsed = time.perf_counter() - start
+    with _SETTINGS_STATS_LOCK:
+        _SETTINGS_STATS.calls += 1
+        _SETTINGS_STATS.seconds += elapsed
+    return MappingProxyType(runtime_settings), apostrophe_config
+
+
 @dataclass
 class TTSContext:
     """Bundles pre-compiled normalization resources for TTS processing.
 
     Created once per conversion job and passed to ``prepare_text_for_tts``
-    instead of threading 5 separate parameters.
+    instead of threading 5 separate parameters. ``runtime_settings`` and
+    ``apostrophe_config`` are frozen by ``build_tts_context`` (or on first use
+    for contexts built by hand) so normalizing a segment does no settings work.
     """
 
     split_pattern: str = r"(?<=[.!?\-])\s+"
@@ -42,15 +113,26 @@ class TTSContext:
     heteronym_rules: Optional[List[Dict[str, Any]]] = None
     normalization_overrides: Optional[Mapping[str, Any]] = None
     usage_counter: Dict[str, int] = field(default_factory=dict)
+    runtime_settings: Optional[Mapping[str, Any]] = None
+    apostrophe_config: Optional[ApostropheConfig] = None
+
+    def freeze_settings(self) -> None:
+        """Resolve and store the merged settings unless already frozen."""
+        if self.runtime_settings is None or self.apostrophe_config is None:
+            self.runtime_settings, self.apostrophe_config = resolve_normalization_settings(
+                self.normalization_overrides
+            )
 
     def normalize(self, text: str) -> str:
         """Shorthand: normalize text using this context's compiled rules."""
+        self.freeze_settings()
         return prepare_text_for_tts(
             text,
             heteronym_rules=self.heteronym_rules,
             pronunciation_rules=self.pronunciation_rules,
-            normalization_overrides=self.normalization_overrides,
             usage_counter=self.usage_counter,
+            runtime_settings=self.runtime_settings,
+            apostrophe_config=self.apostrophe_config,
         )
 
 
@@ -60,11 +142,10 @@ def normalize_text_for_pipeline(
     normalization_overrides: Optional[Mapping[str, Any]] = None,
 ) -> str:
     """Normalize text using runtime settings with optional overrides."""
-    runtime_settings = get_runtime_settings()
-    if normalization_overrides:
-        runtime_settings = _apply_overrides(runtime_settings, normalization_overrides)
-    apostrophe_config = build_apostrophe_config(settings=runtime_settings, base=_BASE_APOSTROPHE_CONFIG)
-    return _normalize_for_pipeline(text, config=apostrophe_config, settings=runtime_settings)
+    runtime_settings, apostrophe_config = resolve_normalization_settings(normalization_overrides)
+    return _normalize_for_pipeline(
+        text, config=apostrophe_config, settings=runtime_settings, config_is_resolved=True
+    )
 
 
 def prepare_text_for_tts(
@@ -74,6 +155,8 @@ def prepare_text_for_tts(
     pronunciation_rules: Optional[List[Dict[str, Any]]] = None,
     normalization_overrides: Optional[Mapping[str, Any]] = None,
     usage_counter: Optional[Dict[str, int]] = None,
+    runtime_settings: Optional[Mapping[str, Any]] = None,
+    apostrophe_config: Optional[ApostropheConfig] = None,
 ) -> str:
     """Apply the full text normalization pipeline before TTS synthesis.
 
@@ -99,6 +182,10 @@ def prepare_text_for_tts(
     usage_counter:
         Mutable dict that tracks how many times each pronunciation override was
         applied.  Passed through to ``apply_pronunciation_rules``.
+    runtime_settings, apostrophe_config:
+        Pre-resolved settings from ``resolve_normalization_settings`` (as
+        frozen on ``TTSContext``).  When both are given, settings are not
+        reloaded and ``normalization_overrides`` is ignored.
 
     Returns
     -------
@@ -118,12 +205,12 @@ def prepare_text_for_tts(
     if pronunciation_rules:
         result = apply_pronunciation_rules(result, pronunciation_rules, usage_counter)
 
-    runtime_settings = get_runtime_settings()
-    if normalization_overrides:
-        runtime_settings = _apply_overrides(runtime_settings, normalization_overrides)
-    apostrophe_config = build_apostrophe_config(settings=runtime_settings, base=_BASE_APOSTROPHE_CONFIG)
+    if runtime_settings is None or apostrophe_config is None:
+        runtime_settings, apostrophe_config = resolve_normalization_settings(normalization_overrides)
 
-    return _normalize_for_pipeline(result, config=apostrophe_config, settings=runtime_settings)
+    return _normalize_for_pipeline(
+        result, config=apostrophe_config, settings=runtime_settings, config_is_resolved=True
+    )
 
 
 def build_tts_context(
@@ -177,15 +264,10 @@ def build_tts_context(
     if pronunciation is None:
         pronunciation = PronunciationConfig()
 
-    # Get runtime normalization settings
-    runtime_settings = get_runtime_settings()
-
-    # Apply per-job normalization overrides
-    if pronunciation.normalization_overrides:
-        runtime_settings = _apply_overrides(runtime_settings, pronunciation.normalization_overrides)
-
-    # Build apostrophe config
-    apostrophe_config = build_apostrophe_config(settings=runtime_settings)
+    # Resolve runtime settings + per-job overrides once; frozen on the context
+    runtime_settings, apostrophe_config = resolve_normalization_settings(
+        pronunciation.normalization_overrides
+    )
 
     # Validate LLM apostrophe mode
     apostrophe_mode = str(runtime_settings.get("normalization_apostrophe_mode", "spacy")).lower()
@@ -242,4 +324,6 @@ def build_tts_context(
         heteronym_rules=heteronym_rules,
         normalization_overrides=pronunciation.normalization_overrides,
         usage_counter=usage_counter if usage_counter is not None else {},
+        runtime_settings=runtime_settings,
+        apostrophe_config=apostrophe_config,
     )
@@ -7,13 +7,89 @@ override sources with precedence rules.
 
 from __future__ import annotations
 
+import heapq
 import re
-from typing import Any, Dict, Iterable, List, Mapping, Optional
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from abogen.entity_analysis import normalize_token as normalize_entity_token
 from abogen.entity_analysis import normalize_manual_override_token
 
 
+_POSSESSIVE_PATTERN = "(?P<possessive>'s|\u2019s|\u2019)?"
+
+
+class PronunciationRules(list):
+    """Compiled token rules plus a combined single-pass matcher.
+
+    Behaves like the plain rule list (longest token first) so existing callers
+    can keep iterating it, while :func:`apply_pronunciation_rules` uses
+    ``matcher`` to find every candidate token in one scan of the text.
+    """
+
+    def __init__(self, rules: Iterable[Dict[str, Any]] = ()) -> None:
+        super().__init__(rules)
+        self.matcher, self.lookup = _build_matcher(self)
+
+
+def _trie_regex(node: Dict[str, Any]) -> str:
+    """Render a character trie as a regex that prefers the longest branch."""
+    terminal = "" in node
+    branches = [
+        re.escape(char) + _trie_regex(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ""
+    if len(branches) == 1 and not terminal:
+        return branches[0]
+    body = "(?:" + "|".join(branches) + ")"
+    return body + "?" if terminal else body
+
+
+def _build_matcher(
+    rules: List[Dict[str, Any]],
+) -> Tuple[Optional[re.Pattern[str]], Dict[str, int]]:
+    """Merge rule tokens into one trie-shaped, case-insensitive regex.
+
+    The pattern is a zero-width lookahead so ``finditer`` reports the longest
+    token starting at every word boundary, including overlapping ones.
+
+    Returns:
+        ``(matcher, lookup)`` where ``lookup`` maps a lower-cased token to its
+        index in *rules*.
+    """
+    trie: Dict[str, Any] = {}
+    lookup: Dict[str, int] = {}
+    for index, rule in enumerate(rules):
+        key = str(rule.get("token") or "").lower()
+        if not key or key in lookup:
+            continue
+        lookup[key] = index
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[""] = True
+    if not lookup:
+        return None, lookup
+    matcher = re.compile(
+        rf"(?i)(?<!\w)(?=(?P<token>{_trie_regex(trie)}){_POSSESSIVE_PATTERN}(?!\w))"
+    )
+    return matcher, lookup
+
+
+def _rule_at(
+    text: str, position: int, rules: List[Dict[str, Any]], first: int
+) -> Optional[Tuple[int, re.Match[str]]]:
+    """Return the first rule from index *first* matching at *position*."""
+    for index in range(first, len(rules)):
+        match = rules[index]["pattern"].match(text, position)
+        if match is not None:
+            return index, match
+    return None
+
+
 def compile_pronunciation_rules(
     overrides: Optional[Iterable[Mapping[str, Any]]],
 ) -> List[Dict[str, Any]]:
@@ -76,7 +152,7 @@ def compile_pronunciation_rules(
         token_value = candidate["token"]
         pronunciation_value = candidate["replacement"]
         escaped = re.escape(token_value)
-        pattern = re.compile(rf"(?i)(?<!\w){escaped}(?P<possessive>'s|\u2019s|\u2019)?(?!\w)")
+        pattern = re.compile(rf"(?i)(?<!\w){escaped}{_POSSESSIVE_PATTERN}(?!\w)")
         compiled.append(
             {
                 "pattern": pattern,
@@ -86,7 +162,7 @@ def compile_pronunciation_rules(
             }
         )
 
-    return compiled
+    return PronunciationRules(compiled)
 
 
 def compile_heteronym_sentence_rules(
@@ -152,24 +228,92 @@ def apply_pronunciation_rules(
     rules: List[Dict[str, Any]],
     usage_counter: Optional[Dict[str, int]] = None,
 ) -> str:
+    """Replace override tokens in *text* using a single scan.
+
+    Candidates are taken from the original text and accepted longest token
+    first (ties go to the earlier rule, then the earlier position), so the
+    result matches applying each rule in turn, except that replacements are
+    never re-scanned by shorter rules.
+
+    Args:
+        text: Text to rewrite.
+        rules: Rules from :func:`compile_pronunciation_rules`. Plain rule lists
+            are accepted too; their matcher is built on the fly.
+        usage_counter: Optional ``normalized -> count`` map updated once per
+            replaced occurrence.
+
+    Returns:
+        The rewritten text.
+    """
     if not text or not rules:
         return text
 
-    result = text
-    for rule in rules:
-        pattern = rule["pattern"]
-        pronunciation_value = rule["replacement"]
-        usage_key = str(rule.get("normalized") or "").strip()
+    matcher = getattr(rules, "matcher", None)
+    lookup = getattr(rules, "lookup", None)
+    if lookup is None:
+        matcher, lookup = _build_matcher(rules)
+    if matcher is None:
+        return text
 
-        def _replacement(match: re.Match[str]) -> str:
+    # (-token length, rule index, start, end, possessive suffix)
+    heap: List[Tuple[int, int, int, int, str]] = []
+    for match in matcher.finditer(text):
+        start = match.start()
+        index = lookup.get(match.group("token").lower())
+        if index is None:
+            found = _rule_at(text, start, rules, 0)
+            if found is None:
+                continue
+            index, rule_match = found
+            end, suffix = rule_match.end(), rule_match.group("possessive") or ""
+        else:
+            end = max(match.end("token"), match.end("possessive"))
             suffix = match.group("possessive") or ""
-            if usage_counter is not None and usage_key:
-                usage_counter[usage_key] = usage_counter.get(usage_key, 0) + 1
-            return pronunciation_value + suffix
-
-        result = pattern.sub(_replacement, result)
-
-    return result
+        heap.append((-len(rules[index]["token"]), index, start, end, suffix))
+    if not heap:
+        return text
+    heapq.heapify(heap)
+
+    starts: List[int] = []
+    accepted: List[Tuple[int, int, int, str]] = []
+    while heap:
+        _, index, start, end, suffix = heapq.heappop(heap)
+        slot = bisect_right(starts, start)
+        overlaps = (slot > 0 and accepted[slot - 1][1] > start) or (
+            slot < len(accepted) and accepted[slot][0] < end
+        )
+        if overlaps:
+            # A longer token claimed part of this span; a shorter rule may
+            # still fit at the same position.
+            found = _rule_at(text, start, rules, index + 1)
+            if found is not None:
+                next_index, rule_match = found
+                heapq.heappush(
+                    heap,
+                    (
+                        -len(rules[next_index]["token"]),
+                        next_index,
+                        start,
+                        rule_match.end(),
+                        rule_match.group("possessive") or "",
+                    ),
+                )
+            continue
+        starts.insert(slot, start)
+        accepted.insert(slot, (start, end, index, suffix))
+
+    pieces: List[str] = []
+    cursor = 0
+    for start, end, index, suffix in accepted:
+        rule = rules[index]
+        pieces.append(text[cursor:start])
+        pieces.append(rule["replacement"] + suffix)
+        cursor = end
+        usage_key = str(rule.get("normalized") or "").strip()
+        if usage_counter is not None and usage_key:
+            usage_counter[usage_key] = usage_counter.get(usage_key, 0) + 1
+    pieces.append(text[cursor:])
+    return "".join(pieces)
 
 
 def merge_pronunciation_overrides(job: Any) -> List[Dict[str, Any]]:
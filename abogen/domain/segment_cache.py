@@ -0,0 +1,341 @@
+"""Content-addressed on-disk cache of synthesized TTS segments.
+
+``run_tts_segment_loop`` consults this cache before calling the backend. An
+entry holds everything one backend call produced for a chunk of normalized
+text: float32 PCM for every segment, the segment graphemes and the token
+timings (relative to the start of the chunk). Re-running a job after a small
+edit then only synthesizes the chunks whose text actually changed.
+
+Entries are ``.npz`` files named by the SHA-256 of
+(provider, language, voice, speed, total_steps, split pattern, text). The
+directory is bounded in size and evicted least-recently-used first; a hit
+refreshes the file's mtime so recency survives restarts.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from abogen.bounded_store import SharedStore
+from abogen.domain.audio_buffer import SAMPLE_RATE
+from abogen.domain.token_timings import TokenColumns
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEGMENT_CACHE_MB = 1024
+
+# Bump when the entry layout or the meaning of a key changes.
+_FORMAT_VERSION = 1
+_SUFFIX = ".npz"
+
+
+@dataclass
+class SegmentCacheStats:
+    """Hit/miss counters and current size of a SegmentCache."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class CachedSegment:
+    """One segment replayed from the cache (mirrors ``SegmentResult``)."""
+
+    graphemes: str
+    audio: np.ndarray
+    duration: float
+    chunk_start: float
+    tokens: TokenColumns
+
+
+# ─── Keys ────────────────────────────────────────────────────────
+
+_VOICE_DIGESTS: "Dict[int, tuple[Any, str]]" = {}
+_VOICE_DIGESTS_LOCK = threading.Lock()
+
+
+def _voice_identity(voice: Any) -> Optional[str]:
+    """Stable identity for a voice name or a loaded voice tensor."""
+    if isinstance(voice, str):
+        return f"name:{voice}"
+    if voice is None:
+        return None
+    with _VOICE_DIGESTS_LOCK:
+        cached = _VOICE_DIGESTS.get(id(voice))
+        if cached is not None and cached[0]() is voice:
+            return cached[1]
+    try:
+        data = voice.detach().cpu().numpy() if hasattr(voice, "detach") else np.asarray(voice)
+        digest = "tensor:" + hashlib.sha1(np.ascontiguousarray(data).tobytes()).hexdigest()
+    except Exception:
+        return None
+    try:
+        ref = weakref.ref(voice)
+    except TypeError:
+        return digest
+    with _VOICE_DIGESTS_LOCK:
+        _VOICE_DIGESTS[id(voice)] = (ref, digest)
+    return digest
+
+
+def segment_cache_key(
+    *,
+    backend: Any,
+    voice: Any,
+    speed: float,
+    total_steps: Optional[int],
+    text: str,
+    split_pattern: str,
+) -> Optional[str]:
+    """Return the cache key for one backend call, or None if uncacheable.
+
+    Only backends that declare a ``plugin_id`` (pipelines from
+    ``create_pipeline``) are cached; their output is a pure function of the
+    key parts.
+    """
+    provider = getattr(backend, "plugin_id", None)
+    voice_id = _voice_identity(voice)
+    if not provider or voice_id is None:
+        return None
+    language = getattr(backend, "language", None)
+    parts = [
+        str(_FORMAT_VERSION),
+        str(provider),
+        str(getattr(language, "value", language) or ""),
+        voice_id,
+        repr(float(speed)),
+        repr(total_steps),
+        split_pattern or "",
+        text,
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+# ─── Cache ───────────────────────────────────────────────────────
+
+
+class SegmentCache:
+    """Size-bounded LRU directory of synthesized chunks. Thread-safe."""
+
+    def __init__(self, directory: Path | str, max_bytes: int) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max(0, int(max_bytes))
+        self._lock = threading.Lock()
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._stats = SegmentCacheStats()
+        self._load_index()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_SUFFIX}"
+
+    def _load_index(self) -> None:
+        found = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(_SUFFIX):
+                stat = entry.stat()
+                found.append((stat.st_mtime, entry.name[: -len(_SUFFIX)], stat.st_size))
+        for _, key, size in sorted(found):
+            self._index[key] = size
+        self._stats.entries = len(self._index)
+        self._stats.bytes = sum(self._index.values())
+
+    def stats(self) -> SegmentCacheStats:
+        """Return a snapshot of the counters."""
+        with self._lock:
+            return SegmentCacheStats(**vars(self._stats))
+
+    def get(self, key: str, start_time: float = 0.0) -> Optional[List[CachedSegment]]:
+        """Load the segments stored under *key*, shifted to *start_time*."""
+        path = self._path(key)
+        with self._lock:
+            known = key in self._index
+            if known:
+                self._index.move_to_end(key)
+        if not known:
+            with self._lock:
+                self._stats.misses += 1
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                audio = data["audio"]
+                offsets = data["offsets"]
+                meta = json.loads(bytes(data["meta"]).decode("utf-8"))
+            os.utime(path)
+        except (OSError, ValueError, KeyError) as exc:
+            logger.debug("Dropping unreadable segment cache entry %s: %s", key, exc)
+            self._discard(key)
+            with self._lock:
+                self._stats.misses += 1
+            return None
+
+        segments = []
+        for index, seg_meta in enumerate(meta["segments"]):
+            seg_audio = audio[offsets[index] : offsets[index + 1]]
+            chunk_start = start_time + seg_meta["chunk_start"]
+            tokens = TokenColumns()
+            for tok in seg_meta["tokens"]:
+                tokens.append(
+                    start_time + tok["start"],
+                    start_time + tok["end"],
+                    tok["text"],
+                    tok["whitespace"],
+                )
+            segments.append(
+                CachedSegment(
+                    graphemes=seg_meta["graphemes"],
+                    audio=seg_audio,
+                    duration=len(seg_audio) / SAMPLE_RATE,
+                    chunk_start=chunk_start,
+                    tokens=tokens,
+                )
+            )
+        with self._lock:
+            self._stats.hits += 1
+        return segments
+
+    def put(self, key: str, segments: Sequence[Any], start_time: float = 0.0) -> None:
+        """Store the segments of one backend call.
+
+        *segments* are ``SegmentResult``-like objects whose timings are
+        absolute; they are stored relative to *start_time*.
+        """
+        if not segments or self.max_bytes <= 0:
+            return
+        audio = np.concatenate([np.asarray(seg.audio, dtype=np.float32) for seg in segments])
+        offsets = np.cumsum([0] + [len(seg.audio) for seg in segments], dtype=np.int64)
+        meta = {
+            "segments": [
+                {
+                    "graphemes": seg.graphemes,
+                    "chunk_start": seg.chunk_start - start_time,
+                    "tokens": [
+                        {
+                            "start": float(tok.get("start") or 0.0) - start_time,
+                            "end": float(tok.get("end") or 0.0) - start_time,
+                            "text": str(tok.get("text") or ""),
+                            "whitespace": str(tok.get("whitespace") or ""),
+                        }
+                        for tok in (seg.tokens or [])
+                    ],
+                }
+                for seg in segments
+            ]
+        }
+        meta_bytes = np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8)
+
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                np.savez(handle, audio=audio, offsets=offsets, meta=meta_bytes)
+            size = os.path.getsize(tmp_name)
+            if size > self.max_bytes:
+                os.unlink(tmp_name)
+                return
+            os.replace(tmp_name, self._path(key))
+        except OSError as exc:
+            logger.debug("Could not store segment cache entry %s: %s", key, exc)
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            previous = self._index.pop(key, 0)
+            self._index[key] = size
+            self._stats.bytes += size - previous
+            self._stats.entries = len(self._index)
+            self._stats.stores += 1
+            victims = self._evict_locked()
+        for victim in victims:
+            try:
+                self._path(victim).unlink()
+            except OSError:
+                pass
+
+    def _evict_locked(self) -> List[str]:
+        victims = []
+        while self._stats.bytes > self.max_bytes and self._index:
+            key, size = self._index.popitem(last=False)
+            self._stats.bytes -= size
+            self._stats.evictions += 1
+            victims.append(key)
+        self._stats.entries = len(self._index)
+        return victims
+
+    def _discard(self, key: str) -> None:
+        with self._lock:
+            size = self._index.pop(key, None)
+            if size is not None:
+                self._stats.bytes -= size
+                self._stats.entries = len(self._index)
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        with self._lock:
+            keys = list(self._index)
+            self._index.clear()
+            self._stats.bytes = 0
+            self._stats.entries = 0
+        for key in keys:
+            try:
+                self._path(key).unlink()
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        """Nothing to release: entries are plain files."""
+
+
+# ─── Process-wide instance ───────────────────────────────────────
+
+
+def _open_segment_cache(max_bytes: int) -> SegmentCache:
+    from abogen.utils import get_user_cache_path
+
+    return SegmentCache(get_user_cache_path("segments"), max_bytes)
+
+
+_SHARED: SharedStore[SegmentCache] = SharedStore(
+    _open_segment_cache, "ABOGEN_SEGMENT_CACHE_MB", DEFAULT_SEGMENT_CACHE_MB
+)
+
+
+def get_segment_cache() -> Optional[SegmentCache]:
+    """Return the shared cache, or None when disabled.
+
+    Sized by ``ABOGEN_SEGMENT_CACHE_MB`` (default 1024; ``0`` disables it) and
+    stored under the user cache directory.
+    """
+    return _SHARED.get()
+
+
+def reset_segment_cache() -> None:
+    """Forget the shared cache instance (entries stay on disk)."""
+    _SHARED.reset()
@@ -260,6 +260,14 @@ SETTINGS_REGISTRY: list[Setting] = [
     Setting("llm_context_mode", str, lambda: _default_llm("llm_context_mode") or "sentence",
             valid_values=("sentence",),
             description="LLM context mode"),
+    Setting("llm_concurrency", int, lambda: _default_llm("llm_concurrency") or 4,
+            min_value=1, max_value=32,
+            description="Concurrent LLM normalization requests"),
+    Setting("llm_batch_size", int, lambda: _default_llm("llm_batch_size") or 1,
+            min_value=1, max_value=32,
+            description="Sentences packed into one LLM tool call"),
+    Setting("llm_cache", bool, lambda: _default_llm("llm_cache") is not False,
+            description="Cache LLM normalization results on disk"),
 
     # ── Normalization (booleans) ─────────────────────────────────
     Setting("normalization_numbers", bool, True,
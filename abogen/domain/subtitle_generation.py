@@ -8,14 +8,17 @@ Sentence + Highlighting).
 from __future__ import annotations
 
 import re
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
 
 from abogen.domain.enums import Language, SubtitleMode
 from abogen.domain.split_pattern import PUNCTUATION_SENTENCE, PUNCTUATION_SENTENCE_COMMA
+from abogen.domain.token_timings import TokenBatch
 
 
 def process_subtitle_tokens(
-    tokens_with_timestamps: List[dict],
+    tokens_with_timestamps: Union[TokenBatch, List[dict]],
     subtitle_entries: List[Tuple[float, float, str]],
     max_subtitle_words: int,
     subtitle_mode: str,
@@ -28,8 +31,8 @@ def process_subtitle_tokens(
     This function modifies subtitle_entries in-place by appending new entries.
     
     Args:
-        tokens_with_timestamps: List of token dictionaries with 'start', 'end', 'text',
-            and 'whitespace' keys.
+        tokens_with_timestamps: A TokenBatch, or a list of token dictionaries
+            with 'start', 'end', 'text', and 'whitespace' keys.
         subtitle_entries: List to append subtitle entries to (modified in-place).
             Each entry is a tuple of (start_time, end_time, text).
         max_subtitle_words: Maximum number of words per subtitle entry.
@@ -39,10 +42,10 @@ def process_subtitle_tokens(
         use_spacy_segmentation: Whether to use spaCy for sentence boundary detection.
         fallback_end_time: Fallback end time for the last entry if none is available.
     """
-    if not tokens_with_timestamps:
+    if tokens_with_timestamps is None or len(tokens_with_timestamps) == 0:
         return
 
-    processed_tokens = tokens_with_timestamps
+    processed_tokens = TokenBatch.coerce(tokens_with_timestamps)
 
     # For English with spaCy enabled and sentence-based modes, use spaCy for sentence boundaries
     # spaCy is disabled when subtitle mode is "Disabled" or "Line"
@@ -76,68 +79,90 @@ def process_subtitle_tokens(
         )
 
 
+# ─── Token batch helpers ─────────────────────────────────────────
+
+
+def _time_value(value: float) -> Optional[float]:
+    """Convert a batch time back to the float/None used in entries."""
+    return None if np.isnan(value) else float(value)
+
+
+def _followed_by_space(tokens: TokenBatch) -> np.ndarray:
+    """True for tokens whose whitespace is exactly one space."""
+    single = (tokens.offsets[1:] - tokens.text_ends) == 1
+    flags = np.zeros(len(tokens), dtype=bool)
+    buffer = tokens.buffer
+    for index in np.flatnonzero(single):
+        flags[index] = buffer[tokens.text_ends[index]] == " "
+    return flags
+
+
+def _text_matches(tokens: TokenBatch, separator: str) -> np.ndarray:
+    """True for tokens whose text (not whitespace) contains *separator*."""
+    positions = [match.start() for match in re.finditer(separator, tokens.buffer)]
+    flags = np.zeros(len(tokens), dtype=bool)
+    if positions:
+        hits = np.asarray(positions, dtype=np.int64)
+        owners = np.searchsorted(tokens.offsets, hits, side="right") - 1
+        inside = hits < tokens.text_ends[owners]
+        flags[owners[inside]] = True
+    return flags
+
+
+def _append_group(
+    tokens: TokenBatch,
+    first: int,
+    last: int,
+    subtitle_entries: List[Tuple[float, float, str]],
+) -> None:
+    subtitle_entries.append(
+        (
+            _time_value(tokens.starts[first]),
+            _time_value(tokens.ends[last]),
+            tokens.span_text(first, last).strip(),
+        )
+    )
+
+
 def _process_karaoke_highlighting(
-    tokens: List[dict],
+    tokens: TokenBatch,
     subtitle_entries: List[Tuple[float, float, str]],
     max_subtitle_words: int,
     fallback_end_time: Optional[float],
 ) -> None:
     """Process tokens for Sentence + Highlighting mode (karaoke effect)."""
-    separator = rf"[{PUNCTUATION_SENTENCE}]"
-    current_sentence = []
-    word_count = 0
-
-    for token in tokens:
-        current_sentence.append(token)
-        word_count += 1
+    breaks = _text_matches(tokens, rf"[{PUNCTUATION_SENTENCE}]") & _followed_by_space(tokens)
+    durations = tokens.ends - tokens.starts
+    # Tokens without timing get a half-second highlight.
+    centiseconds = np.where(np.isnan(durations), 0.5, durations) * 100
+
+    def _karaoke_entry(first: int, last: int) -> None:
+        karaoke_text = "".join(
+            f"{{\\kf{int(centiseconds[index])}}}"
+            + tokens.buffer[tokens.offsets[index] : tokens.offsets[index + 1]]
+            for index in range(first, last + 1)
+        )
+        subtitle_entries.append(
+            (_time_value(tokens.starts[first]), _time_value(tokens.ends[last]), karaoke_text.strip())
+        )
 
+    first = 0
+    for index in range(len(tokens)):
         # Split sentences based on separator or word count
-        if (
-            re.search(separator, token["text"]) and token.get("whitespace") == " "
-        ) or word_count >= max_subtitle_words:
-            if current_sentence:
-                # Create karaoke subtitle entry for this sentence
-                start_time = current_sentence[0]["start"]
-                end_time = current_sentence[-1]["end"]
-
-                # Generate karaoke text with timing
-                karaoke_text = ""
-                for t in current_sentence:
-                    # Calculate duration in centiseconds
-                    duration = (
-                        t["end"] - t["start"]
-                        if t.get("end") is not None and t.get("start") is not None
-                        else 0.5
-                    )
-                    duration_cs = int(duration * 100)
-                    # Add karaoke effect
-                    karaoke_text += f"{{\\kf{duration_cs}}}{t['text']}{t.get('whitespace', '') or ''}"
-
-                subtitle_entries.append(
-                    (start_time, end_time, karaoke_text.strip())
-                )
-                current_sentence = []
-                word_count = 0
+        if breaks[index] or index - first + 1 >= max_subtitle_words:
+            _karaoke_entry(first, index)
+            first = index + 1
 
     # Add any remaining tokens as a sentence
-    if current_sentence:
-        start_time = current_sentence[0]["start"]
-        end_time = current_sentence[-1]["end"]
-
-        # Generate karaoke text for remaining tokens
-        karaoke_text = ""
-        for t in current_sentence:
-            duration = t["end"] - t["start"] if t.get("end") and t.get("start") else 0.5
-            duration_cs = int(duration * 100)
-            karaoke_text += f"{{\\kf{duration_cs}}}{t['text']}{t.get('whitespace', '') or ''}"
-        subtitle_entries.append((start_time, end_time, karaoke_text.strip()))
+    if first < len(tokens):
+        _karaoke_entry(first, len(tokens) - 1)
 
     # Fallback for last entry
     _apply_fallback_end_time(subtitle_entries, fallback_end_time)
 
 
 def _process_spacy_sentences(
-    tokens: List[dict],
+    tokens: TokenBatch,
     subtitle_entries: List[Tuple[float, float, str]],
     max_subtitle_words: int,
     subtitle_mode: str,
@@ -163,11 +188,8 @@ def _process_spacy_sentences(
         )
         return
 
-    # Build full text and track character positions to token indices
-    full_text = ""
-    for token in tokens:
-        text_part = token["text"] + (token.get("whitespace") or "")
-        full_text += text_part
+    # The joined buffer is the full text; token i ends at offsets[i + 1].
+    full_text = tokens.buffer
 
     # Get sentence boundaries from spaCy
     doc = nlp(full_text)
@@ -175,64 +197,38 @@ def _process_spacy_sentences(
 
     # For "Sentence + Comma" mode, also split on commas
     if subtitle_mode == SubtitleMode.SENTENCE_COMMA:
-        comma_positions = [
-            i + 1 for i, c in enumerate(full_text) if c == ","
-        ]
+        comma_positions = [match.end() for match in re.finditer(",", full_text)]
         sentence_boundaries = sorted(
             set(sentence_boundaries + comma_positions)
         )
 
     # Group tokens by sentence boundaries
-    current_sentence = []
-    word_count = 0
-    current_char_pos = 0
+    first = 0
     boundary_idx = 0
+    token_ends = tokens.offsets[1:]
 
-    for token in tokens:
-        current_sentence.append(token)
-        word_count += 1
-        text_len = len(token["text"]) + len(token.get("whitespace") or "")
-        current_char_pos += text_len
-
+    for index in range(len(tokens)):
         # Check if we've hit a sentence boundary or max words
         at_boundary = (
             boundary_idx < len(sentence_boundaries)
-            and current_char_pos >= sentence_boundaries[boundary_idx]
+            and token_ends[index] >= sentence_boundaries[boundary_idx]
         )
-        if at_boundary or word_count >= max_subtitle_words:
-            if current_sentence:
-                start_time = current_sentence[0]["start"]
-                end_time = current_sentence[-1]["end"]
-                sentence_text = "".join(
-                    t["text"] + (t.get("whitespace") or "")
-                    for t in current_sentence
-                )
-                subtitle_entries.append(
-                    (start_time, end_time, sentence_text.strip())
-                )
-                current_sentence = []
-                word_count = 0
+        if at_boundary or index - first + 1 >= max_subtitle_words:
+            _append_group(tokens, first, index, subtitle_entries)
+            first = index + 1
             if at_boundary:
                 boundary_idx += 1
 
     # Add remaining tokens
-    if current_sentence:
-        start_time = current_sentence[0]["start"]
-        end_time = current_sentence[-1]["end"]
-        sentence_text = "".join(
-            t["text"] + (t.get("whitespace") or "")
-            for t in current_sentence
-        )
-        subtitle_entries.append(
-            (start_time, end_time, sentence_text.strip())
-        )
+    if first < len(tokens):
+        _append_group(tokens, first, len(tokens) - 1, subtitle_entries)
 
     # Fallback for last entry
     _apply_fallback_end_time(subtitle_entries, fallback_end_time)
 
 
 def _process_regex_sentences(
-    tokens: List[dict],
+    tokens: TokenBatch,
     subtitle_entries: List[Tuple[float, float, str]],
     max_subtitle_words: int,
     subtitle_mode: str,
@@ -247,44 +243,23 @@ def _process_regex_sentences(
     else:  # Sentence + Comma
         separator = rf"[{PUNCTUATION_SENTENCE_COMMA}]"
 
-    current_sentence = []
-    word_count = 0
-
-    for token in tokens:
-        current_sentence.append(token)
-        word_count += 1
+    breaks = _text_matches(tokens, separator) & _followed_by_space(tokens)
+    first = 0
 
+    for index in range(len(tokens)):
         # Split sentences based on separator or word count
-        if (
-            re.search(separator, token["text"]) and token.get("whitespace") == " "
-        ) or word_count >= max_subtitle_words:
-            if current_sentence:
-                # Create subtitle entry for this sentence
-                start_time = current_sentence[0]["start"]
-                end_time = current_sentence[-1]["end"]
-
-                # Simplified text joining logic
-                sentence_text = ""
-                for t in current_sentence:
-                    sentence_text += t["text"] + (t.get("whitespace") or "")
-
-                subtitle_entries.append(
-                    (start_time, end_time, sentence_text.strip())
-                )
-                current_sentence = []
-                word_count = 0
+        if breaks[index] or index - first + 1 >= max_subtitle_words:
+            _append_group(tokens, first, index, subtitle_entries)
+            first = index + 1
 
     # Add any remaining tokens as a sentence (split multi-sentence FakeToken)
-    if current_sentence:
-        start_time = current_sentence[0]["start"]
-        end_time = current_sentence[-1]["end"]
+    if first < len(tokens):
+        last = len(tokens) - 1
+        start_time = _time_value(tokens.starts[first])
+        end_time = _time_value(tokens.ends[last])
+        sentence_text = tokens.span_text(first, last).strip()
 
-        sentence_text = ""
-        for t in current_sentence:
-            sentence_text += t["text"] + (t.get("whitespace") or "")
-        sentence_text = sentence_text.strip()
-
-        if len(current_sentence) == 1:
+        if first == last:
             parts = re.split(rf"(?<={separator})\s+", sentence_text)
             if len(parts) > 1:
                 d = end_time - start_time
@@ -292,9 +267,9 @@ def _process_regex_sentences(
                     e = end_time if i == len(parts) - 1 else start_time + d * len(p) / len(sentence_text)
                     subtitle_entries.append((start_time, e, p.strip()))
                     start_time = e
-                current_sentence = []
+                first = len(tokens)
 
-        if current_sentence:
+        if first < len(tokens):
             subtitle_entries.append((start_time, end_time, sentence_text))
 
     # Fallback for last entry
@@ -302,7 +277,7 @@ def _process_regex_sentences(
 
 
 def _process_word_count(
-    tokens: List[dict],
+    tokens: TokenBatch,
     subtitle_entries: List[Tuple[float, float, str]],
     max_subtitle_words: int,
     subtitle_mode: str,
@@ -315,40 +290,24 @@ def _process_word_count(
     except (ValueError, IndexError):
         word_count = 1
 
-    current_group = []
+    spaces = _followed_by_space(tokens)
+    first = 0
     space_count = 0
 
-    for token in tokens:
-        current_group.append(token)
-
+    for index in range(len(tokens)):
         # Count spaces after tokens (in the whitespace field)
-        if token.get("whitespace", "") == " ":
+        if spaces[index]:
             space_count += 1
 
             # Split after counting N spaces
             if space_count >= word_count:
-                text = "".join(
-                    t["text"] + (t.get("whitespace") or "")
-                    for t in current_group
-                )
-                subtitle_entries.append(
-                    (
-                        current_group[0]["start"],
-                        current_group[-1]["end"],
-                        text.strip(),
-                    )
-                )
-                current_group = []
+                _append_group(tokens, first, index, subtitle_entries)
+                first = index + 1
                 space_count = 0
 
     # Add any remaining tokens
-    if current_group:
-        text = "".join(
-            t["text"] + (t.get("whitespace") or "") for t in current_group
-        )
-        subtitle_entries.append(
-            (current_group[0]["start"], current_group[-1]["end"], text.strip())
-        )
+    if first < len(tokens):
+        _append_group(tokens, first, len(tokens) - 1, subtitle_entries)
 
     # Fallback for last entry
     _apply_fallback_end_time(subtitle_entries, fallback_end_time)
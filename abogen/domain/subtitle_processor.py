@@ -1,26 +1,34 @@
 """Subtitle-to-audio processing pipeline.
 
 Converts subtitle files (SRT/ASS/VTT/timestamp text) into audio by
-generating TTS for each entry and mixing into a buffer.
+generating TTS for each entry and mixing it into a streamed timeline.
 """
 
 from __future__ import annotations
 
 import logging
+import os
+import queue
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Callable, List, Optional, Tuple
+from typing import Any, Callable, Deque, Iterator, List, Optional, Tuple
 
 import numpy as np
 
 from abogen.domain.audio_buffer import (
+    PeakLimiter,
+    SlidingMixer,
+    concatenate_audio,
     fit_audio_to_duration,
     ffmpeg_time_stretch,
-    mix_audio,
-    normalize_audio,
     SAMPLE_RATE,
 )
 from abogen.domain.audio_helpers import to_float32
+from abogen.domain.audio_sink import AudioSink
 from abogen.domain.progress import calc_etr_str
 from abogen.subtitle_utils import (
     parse_ass_file,
@@ -56,7 +64,6 @@ def parse_subtitle_file(
     if is_timestamp_text:
         return parse_timestamp_text_file(file_path)
 
-    import os
     ext = os.path.splitext(file_path)[1].lower()
     if ext == ".srt":
         return parse_srt_file(file_path)
@@ -143,6 +150,149 @@ def speed_up_audio(
     return np.concatenate([to_float32(c) for c in chunks])
 
 
+# Entries in flight per subtitle worker, bounding memory held ahead of the mixer.
+LOOKAHEAD_PER_WORKER = 2
+
+
+def subtitle_workers() -> int:
+    """Concurrent subtitle entries from ``ABOGEN_SUBTITLE_WORKERS`` (default 1)."""
+    try:
+        return max(1, int(os.environ.get("ABOGEN_SUBTITLE_WORKERS", "1") or 1))
+    except ValueError:
+        return 1
+
+
+class _BackendPool:
+    """Pipeline instances shared by subtitle workers, created on demand.
+
+    ``backend`` is the first instance; up to ``size - 1`` more come from
+    ``factory`` the first time every existing instance is busy (a failed
+    creation just waits for a busy one). Instances created here are
+    disposed by ``close()``.
+    """
+
+    def __init__(self, backend: Any, factory: Optional[Callable[[], Any]], size: int) -> None:
+        self.size = max(1, int(size))
+        self._factory = factory
+        self._idle: "queue.Queue[Any]" = queue.Queue()
+        self._idle.put(backend)
+        self._created: List[Any] = []
+        self._count = 1
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def acquire(self) -> Iterator[Any]:
+        try:
+            instance = self._idle.get_nowait()
+        except queue.Empty:
+            instance = self._create()
+            if instance is None:
+                instance = self._idle.get()
+        try:
+            yield instance
+        finally:
+            self._idle.put(instance)
+
+    def _create(self) -> Any:
+        with self._lock:
+            if self._factory is None or self._count >= self.size:
+                return None
+            self._count += 1
+        try:
+            instance = self._factory()
+        except Exception as exc:
+            logger.warning("Could not create subtitle worker pipeline: %s", exc)
+            return None
+        with self._lock:
+            self._created.append(instance)
+        logger.info("Subtitle worker pipeline %d/%d ready", len(self._created) + 1, self.size)
+        return instance
+
+    def close(self) -> None:
+        with self._lock:
+            created, self._created = self._created, []
+        for instance in created:
+            try:
+                instance.dispose()
+            except Exception:
+                pass
+
+
+def _synthesize_entry(
+    text: str,
+    *,
+    start_time: float,
+    end_time: Optional[float],
+    next_start: float,
+    backend: Any,
+    voice: Any,
+    speed: float,
+    cancel_check: Callable[[], bool],
+    use_gaps: bool,
+    is_timestamp_text: bool,
+    subtitle_speed_method: str,
+    sample_rate: int,
+) -> Optional[np.ndarray]:
+    """Synthesize one subtitle entry, fitted to its time slot.
+
+    Returns None if cancelled mid-entry.
+    """
+    subtitle_duration = None if end_time is None else end_time - start_time
+
+    # Generate TTS
+    results = [
+        r for r in backend(
+            text, voice=voice, speed=speed, split_pattern=None
+        )
+        if not cancel_check()
+    ]
+    if cancel_check():
+        return None
+
+    audio_chunks = [r.audio for r in results]
+    full_audio = (
+        np.concatenate([to_float32(a) for a in audio_chunks])
+        if audio_chunks
+        else np.zeros(int((subtitle_duration or 0) * sample_rate), dtype="float32")
+    )
+    audio_duration = len(full_audio) / sample_rate
+
+    # Timing adjustment
+    if is_timestamp_text:
+        end_time = start_time + audio_duration
+        subtitle_duration = audio_duration
+    elif use_gaps:
+        end_time = min(start_time + audio_duration, next_start)
+        subtitle_duration = end_time - start_time
+    elif subtitle_duration is None:
+        subtitle_duration = audio_duration
+        end_time = start_time + audio_duration
+
+    # Speed up if needed
+    speedup_threshold = next_start - start_time if use_gaps else subtitle_duration
+    if audio_duration > speedup_threshold and speedup_threshold > 0:
+        speed_factor = audio_duration / speedup_threshold
+        full_audio = speed_up_audio(
+            full_audio, speed_factor,
+            method=subtitle_speed_method,
+            backend=backend, text=text,
+            voice=voice, base_speed=speed,
+            sample_rate=sample_rate,
+        )
+        audio_duration = len(full_audio) / sample_rate
+
+    # Adjust duration after speed change
+    if use_gaps:
+        end_time = min(start_time + audio_duration, next_start)
+        subtitle_duration = end_time - start_time
+    elif subtitle_duration is None:
+        subtitle_duration = audio_duration
+        end_time = start_time + audio_duration
+
+    # Pad or trim to subtitle duration
+    return fit_audio_to_duration(full_audio, subtitle_duration, sample_rate)
+
+
 def process_subtitle_entries(
     subtitles: List[Tuple[float, Optional[float], str]],
     *,
@@ -157,12 +307,22 @@ def process_subtitle_entries(
     is_timestamp_text: bool = False,
     subtitle_speed_method: str = "tts",
     sample_rate: int = SAMPLE_RATE,
+    audio_sink: Optional[AudioSink] = None,
+    backend_factory: Optional[Callable[[], Any]] = None,
+    workers: int = 1,
 ) -> np.ndarray:
-    """Process subtitle entries: generate TTS for each and mix into buffer.
+    """Process subtitle entries: generate TTS for each and mix into the timeline.
 
     This is the core domain logic for subtitle-to-audio conversion.
     UI-specific concerns (signals, widgets) are handled via callbacks.
 
+    Entries are rendered in start-time order through a ``SlidingMixer``, so
+    only the audio of overlapping entries is held in memory; finished parts
+    of the timeline go through a streaming ``PeakLimiter`` (instead of a
+    whole-track peak normalization) to ``audio_sink``. With several
+    ``workers`` the next entries are synthesized ahead on a pool of pipeline
+    instances (at most ``LOOKAHEAD_PER_WORKER`` per worker in flight).
+
     Args:
         subtitles: List of (start, end, text) tuples.
         backend: TTS pipeline callable.
@@ -176,103 +336,124 @@ def process_subtitle_entries(
         is_timestamp_text: Whether input is timestamp text.
         subtitle_speed_method: "ffmpeg" or "tts" for speed adjustment.
         sample_rate: Audio sample rate.
+        audio_sink: Receives the audio as it is finished. Without a sink
+            the whole timeline is collected and returned.
+        backend_factory: Creates extra pipeline instances so up to
+            ``workers`` entries (including their speed-up regeneration) are
+            synthesized concurrently; ``backend`` is one of the instances.
+            Entries are still mixed in start-time order.
+        workers: Number of entries synthesized at once (needs
+            ``backend_factory`` when above 1).
 
     Returns:
-        Mixed audio buffer (float32).
+        Mixed audio buffer (float32); empty when written to ``audio_sink``.
     """
     if not subtitles:
         return np.array([], dtype="float32")
 
+    subtitles = sorted(subtitles, key=lambda entry: entry[0])
     max_end = max((end for _, end, _ in subtitles if end is not None), default=0)
-    buffer_samples = int(max_end * sample_rate) + sample_rate
-    audio_buffer = np.zeros(buffer_samples, dtype="float32")
+    timeline_samples = int(max_end * sample_rate) + sample_rate
+
+    collected: List[np.ndarray] = []
+    limiter = PeakLimiter(sample_rate=sample_rate)
+    mixer = SlidingMixer(
+        audio_sink.write if audio_sink is not None else collected.append,
+        limiter=limiter,
+        block_samples=sample_rate * 10,
+    )
     etr_start = time.time()
     total = len(subtitles)
-
-    for idx, (start_time, end_time, text) in enumerate(subtitles, 1):
-        if cancel_check():
-            break
-
-        processed_text = text.replace("\n", " ") if replace_newlines else text
-        next_start = (
-            subtitles[idx][0]
-            if (use_gaps and idx < total)
-            else float("inf")
-        )
-        subtitle_duration = None if end_time is None else end_time - start_time
-
-        is_auto_end = is_timestamp_text or (use_gaps and idx == total) or end_time is None
-        if log_callback:
-            log_callback(
-                f"\n[{idx}/{total}] {format_time_range(start_time, end_time, is_auto_end)}: {processed_text}"
-            )
-
-        # Generate TTS
-        results = [
-            r for r in backend(
-                processed_text, voice=voice, speed=speed, split_pattern=None
-            )
-            if not cancel_check()
-        ]
-        if cancel_check():
-            break
-
-        audio_chunks = [r.audio for r in results]
-        full_audio = (
-            np.concatenate([to_float32(a) for a in audio_chunks])
-            if audio_chunks
-            else np.zeros(int((subtitle_duration or 0) * sample_rate), dtype="float32")
-        )
-        audio_duration = len(full_audio) / sample_rate
-
-        # Timing adjustment
-        if is_timestamp_text:
-            end_time = start_time + audio_duration
-            subtitle_duration = audio_duration
-        elif use_gaps:
-            end_time = min(start_time + audio_duration, next_start)
-            subtitle_duration = end_time - start_time
-        elif subtitle_duration is None:
-            subtitle_duration = audio_duration
-            end_time = start_time + audio_duration
-
-        # Speed up if needed
-        speedup_threshold = next_start - start_time if use_gaps else subtitle_duration
-        if audio_duration > speedup_threshold and speedup_threshold > 0:
-            speed_factor = audio_duration / speedup_threshold
-            full_audio = speed_up_audio(
-                full_audio, speed_factor,
-                method=subtitle_speed_method,
-                backend=backend, text=processed_text,
-                voice=voice, base_speed=speed,
+    pool = _BackendPool(backend, backend_factory, workers if backend_factory is not None else 1)
+    executor = (
+        ThreadPoolExecutor(max_workers=pool.size, thread_name_prefix="abogen-subtitle")
+        if pool.size > 1
+        else None
+    )
+    # Entries synthesized ahead of the one being mixed, oldest first.
+    pending: Deque[Tuple[int, float, "Future[Optional[np.ndarray]]"]] = deque()
+
+    def _render(text: str, start_time: float, end_time: Optional[float], next_start: float) -> Optional[np.ndarray]:
+        with pool.acquire() as entry_backend:
+            return _synthesize_entry(
+                text,
+                start_time=start_time,
+                end_time=end_time,
+                next_start=next_start,
+                backend=entry_backend,
+                voice=voice,
+                speed=speed,
+                cancel_check=cancel_check,
+                use_gaps=use_gaps,
+                is_timestamp_text=is_timestamp_text,
+                subtitle_speed_method=subtitle_speed_method,
                 sample_rate=sample_rate,
             )
-            audio_duration = len(full_audio) / sample_rate
-
-        # Adjust duration after speed change
-        if use_gaps:
-            end_time = min(start_time + audio_duration, next_start)
-            subtitle_duration = end_time - start_time
-        elif subtitle_duration is None:
-            subtitle_duration = audio_duration
-            end_time = start_time + audio_duration
 
-        # Pad or trim to subtitle duration
-        full_audio = fit_audio_to_duration(full_audio, subtitle_duration, sample_rate)
-
-        # Mix into buffer
-        start_sample = int(start_time * sample_rate)
-        audio_buffer = mix_audio(audio_buffer, full_audio, start_sample)
+    def _mix(idx: int, start_time: float, full_audio: Optional[np.ndarray]) -> bool:
+        if full_audio is None:
+            return False
+        mixer.add(full_audio, int(start_time * sample_rate))
 
         # Progress
         if progress_callback:
             percent = min(int(idx / total * 100), 99)
             etr = calc_etr_str(time.time() - etr_start, idx, total)
             progress_callback(percent, etr)
+        return True
+
+    def _mix_oldest() -> bool:
+        idx, start_time, future = pending.popleft()
+        return _mix(idx, start_time, future.result())
+
+    try:
+        for idx, (start_time, end_time, text) in enumerate(subtitles, 1):
+            if cancel_check():
+                break
+
+            processed_text = text.replace("\n", " ") if replace_newlines else text
+            next_start = (
+                subtitles[idx][0]
+                if (use_gaps and idx < total)
+                else float("inf")
+            )
 
-    # Normalize if needed
-    if np.abs(audio_buffer).max() > 1.0:
-        logger.info("Normalizing audio (peak: %.2f)", np.abs(audio_buffer).max())
-        audio_buffer = normalize_audio(audio_buffer)
+            is_auto_end = is_timestamp_text or (use_gaps and idx == total) or end_time is None
+            if log_callback:
+                log_callback(
+                    f"\n[{idx}/{total}] {format_time_range(start_time, end_time, is_auto_end)}: {processed_text}"
+                )
 
-    return audio_buffer
+            if executor is None:
+                if not _mix(idx, start_time, _render(processed_text, start_time, end_time, next_start)):
+                    break
+                continue
+
+            pending.append(
+                (idx, start_time, executor.submit(_render, processed_text, start_time, end_time, next_start))
+            )
+            if len(pending) >= pool.size * LOOKAHEAD_PER_WORKER and not _mix_oldest():
+                break
+        while pending and not cancel_check() and _mix_oldest():
+            pass
+    finally:
+        for _, _, future in pending:
+            future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=True)
+        pool.close()
+
+    # A cancelled job's sink discards writes; don't pad it with silence.
+    if audio_sink is None or not cancel_check():
+        mixer.finish(timeline_samples)
+    if limiter.limited_frames:
+        logger.info(
+            "Limited overlapping audio (peak: %.2f, %.1fs affected)",
+            limiter.peak,
+            limiter.limited_frames * limiter.frame_samples / sample_rate,
+        )
+    logger.debug("Subtitle mixer window peaked at %.1fs", mixer.max_window_samples / sample_rate)
+
+    if audio_sink is not None:
+        return np.array([], dtype="float32")
+    return concatenate_audio(*collected)
@@ -0,0 +1,164 @@
+"""Columnar storage for timed TTS tokens.
+
+TTS backends report one token per word with a start/end time, its text and
+the whitespace that follows it. ``TokenBatch`` keeps a sequence of such
+tokens as two float arrays plus one joined text buffer with offsets. Token
+``i`` spans ``buffer[offsets[i]:offsets[i + 1]]``: its text runs up to
+``text_ends[i]`` and its trailing whitespace follows. The text of any run of
+tokens is then one slice, and subtitle grouping stays linear in the length
+of a chapter.
+
+``TokenColumns`` is the growable form the synthesis loop appends to as
+segments arrive; ``batch()`` freezes it into a ``TokenBatch`` at flush time.
+Both still iterate as ``{"start", "end", "text", "whitespace"}`` dicts for
+callers that expect them.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Union
+
+import numpy as np
+
+
+def _time(value: float) -> Optional[float]:
+    return None if math.isnan(value) else float(value)
+
+
+def _token_dict(start: float, end: float, text: str, whitespace: str) -> Dict[str, Any]:
+    return {"start": _time(start), "end": _time(end), "text": text, "whitespace": whitespace}
+
+
+class TokenColumns:
+    """Growable token columns, appended to as TTS segments arrive.
+
+    Missing times are stored as NaN and read back as None.
+    """
+
+    __slots__ = ("_starts", "_ends", "_texts", "_spaces")
+
+    def __init__(self) -> None:
+        self._starts = array("d")
+        self._ends = array("d")
+        self._texts: List[str] = []
+        self._spaces: List[str] = []
+
+    def append(self, start: Optional[float], end: Optional[float], text: str, whitespace: str) -> None:
+        self._starts.append(math.nan if start is None else start)
+        self._ends.append(math.nan if end is None else end)
+        self._texts.append(text)
+        self._spaces.append(whitespace)
+
+    def extend(self, tokens: Union["TokenColumns", Iterable[Mapping[str, Any]]]) -> None:
+        """Append *tokens* (columns, or token dicts)."""
+        if isinstance(tokens, TokenColumns):
+            self._starts.extend(tokens._starts)
+            self._ends.extend(tokens._ends)
+            self._texts.extend(tokens._texts)
+            self._spaces.extend(tokens._spaces)
+            return
+        for token in tokens:
+            self.append(
+                token.get("start"),
+                token.get("end"),
+                str(token.get("text") or ""),
+                str(token.get("whitespace") or ""),
+            )
+
+    @classmethod
+    def concat(cls, parts: Iterable["TokenColumns"]) -> "TokenColumns":
+        columns = cls()
+        for part in parts:
+            columns.extend(part)
+        return columns
+
+    def set_whitespace(self, index: int, whitespace: str) -> None:
+        self._spaces[index] = whitespace
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        return _token_dict(self._starts[index], self._ends[index], self._texts[index], self._spaces[index])
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for values in zip(self._starts, self._ends, self._texts, self._spaces):
+            yield _token_dict(*values)
+
+    def batch(self) -> "TokenBatch":
+        """Freeze the columns into a ``TokenBatch``."""
+        count = len(self)
+        text_lengths = np.fromiter(map(len, self._texts), dtype=np.int64, count=count)
+        space_lengths = np.fromiter(map(len, self._spaces), dtype=np.int64, count=count)
+        offsets = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(text_lengths + space_lengths, out=offsets[1:])
+        parts: List[str] = [""] * (2 * count)
+        parts[0::2] = self._texts
+        parts[1::2] = self._spaces
+        return TokenBatch(
+            np.frombuffer(self._starts, dtype=np.float64).copy(),
+            np.frombuffer(self._ends, dtype=np.float64).copy(),
+            "".join(parts),
+            offsets,
+            offsets[:-1] + text_lengths,
+        )
+
+
+@dataclass(frozen=True)
+class TokenBatch:
+    """Immutable batch of timed tokens (see module docstring)."""
+
+    starts: np.ndarray
+    ends: np.ndarray
+    buffer: str
+    offsets: np.ndarray  # len(tokens) + 1 start positions in buffer
+    text_ends: np.ndarray  # end of each token's text (whitespace follows)
+
+    @classmethod
+    def from_dicts(cls, tokens: Iterable[Mapping[str, Any]]) -> "TokenBatch":
+        """Build a batch from ``{"start", "end", "text", "whitespace"}`` dicts.
+
+        Missing times become NaN.
+        """
+        columns = TokenColumns()
+        columns.extend(tokens)
+        return columns.batch()
+
+    @classmethod
+    def coerce(
+        cls, tokens: Union["TokenBatch", TokenColumns, Iterable[Mapping[str, Any]]]
+    ) -> "TokenBatch":
+        if isinstance(tokens, TokenBatch):
+            return tokens
+        if isinstance(tokens, TokenColumns):
+            return tokens.batch()
+        return cls.from_dicts(tokens)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def text(self, index: int) -> str:
+        return self.buffer[self.offsets[index] : self.text_ends[index]]
+
+    def whitespace(self, index: int) -> str:
+        return self.buffer[self.text_ends[index] : self.offsets[index + 1]]
+
+    def span_text(self, first: int, last: int) -> str:
+        """Joined text and whitespace of tokens ``first..last`` inclusive."""
+        return self.buffer[self.offsets[first] : self.offsets[last + 1]]
+
+    def shifted(self, seconds: float) -> "TokenBatch":
+        """Return a copy with every time moved by *seconds*."""
+        return TokenBatch(self.starts + seconds, self.ends + seconds, self.buffer, self.offsets, self.text_ends)
+
+    def total_duration(self) -> float:
+        """Sum of token durations, ignoring tokens without times."""
+        return float(np.nansum(self.ends - self.starts))
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Yield tokens as dicts, for callers that still expect them."""
+        for index in range(len(self)):
+            yield _token_dict(self.starts[index], self.ends[index], self.text(index), self.whitespace(index))
@@ -13,23 +13,6 @@ _Language = Any  # type: ignore[misc,assignment]
 Doc = Any  # type: ignore[misc,assignment]
 Span = Any  # type: ignore[misc,assignment]
 
-_SPACY: Any = None
-_SPACY_LOADED = False
-
-
-def _get_spacy() -> Any:
-    """Import spaCy lazily (it pulls in torch/thinc, ~2s at startup)."""
-    global _SPACY, _SPACY_LOADED
-    if not _SPACY_LOADED:
-        _SPACY_LOADED = True
-        try:  # pragma: no cover - fallback when spaCy not available during tests
-            import spacy  # type: ignore[import-not-found]
-        except Exception:  # pragma: no cover - spaCy optional during runtime bootstrap
-            spacy = None
-        _SPACY = spacy
-    return _SPACY
-
-
 _TITLE_PREFIXES = (
     "mr",
     "mrs",
@@ -147,7 +130,7 @@ class EntityRecord:
             "samples": list(self.samples),
             "chapter_indices": chapter_indices,
             "first_chapter": first_chapter,
-            "forms": self.forms.most_common(6),
+            "forms": [[form, count] for form, count in self.forms.most_common(6)],
         }
 
 
@@ -157,15 +140,63 @@ class EntityExtractionResult:
     cache_key: str
     elapsed: float
     errors: List[str]
+    # Seconds spent per stage ("load", "parse", "aggregate", or "cache" on a
+    # cache hit); sums to elapsed.
+    timings: Dict[str, float] = field(default_factory=dict)
 
 
 class EntityModelError(RuntimeError):
     pass
 
 
-_MODEL_CACHE: Dict[str, Any] = {}
 _MODEL_LOCK = threading.RLock()
 
+DEFAULT_PIPE_BATCH_SIZE = 32
+# Consecutive paragraphs are packed into docs of up to this many characters:
+# small enough to keep parser memory flat, large enough that per-doc overhead
+# stays negligible.
+_DOC_TARGET_CHARS = 20_000
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+
+def _pipe_settings(batch_size: Optional[int], n_process: Optional[int]) -> Tuple[int, int]:
+    """Resolve ``nlp.pipe`` settings, falling back to the environment.
+
+    ``ABOGEN_ENTITY_BATCH_SIZE`` (default 32) and ``ABOGEN_ENTITY_PROCESSES``
+    (default 1; values above 1 fork worker processes).
+    """
+
+    def _env(name: str, default: int) -> int:
+        try:
+            return int(os.environ.get(name, default))
+        except ValueError:
+            return default
+
+    if batch_size is None:
+        batch_size = _env("ABOGEN_ENTITY_BATCH_SIZE", DEFAULT_PIPE_BATCH_SIZE)
+    if n_process is None:
+        n_process = _env("ABOGEN_ENTITY_PROCESSES", 1)
+    return max(1, batch_size), max(1, n_process)
+
+
+def _split_chapter(text: str) -> List[str]:
+    """Split a chapter into paragraph-aligned pieces of bounded size."""
+    pieces: List[str] = []
+    current: List[str] = []
+    size = 0
+    for paragraph in _PARAGRAPH_BREAK.split(text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if current and size + len(paragraph) > _DOC_TARGET_CHARS:
+            pieces.append("\n\n".join(current))
+            current, size = [], 0
+        current.append(paragraph)
+        size += len(paragraph) + 2
+    if current:
+        pieces.append("\n\n".join(current))
+    return pieces
+
 
 def _resolve_model_name(language: str) -> str:
     override = os.environ.get("ABOGEN_SPACY_MODEL")
@@ -177,28 +208,37 @@ def _resolve_model_name(language: str) -> str:
     return "en_core_web_sm"
 
 
+def _model_version(model_name: str) -> Optional[str]:
+    """Installed version of a packaged spaCy model, without loading it."""
+    from importlib import metadata
+
+    for candidate in (model_name, model_name.replace("_", "-")):
+        try:
+            return metadata.version(candidate)
+        except metadata.PackageNotFoundError:
+            continue
+        except Exception:
+            return None
+    return None
+
+
 def _load_model(language: str) -> Any:
-    spacy = _get_spacy()
-    if spacy is None:
-        raise EntityModelError(
-            "spaCy is not available. Install spaCy to enable entity extraction."
-        )
+    from abogen.spacy_utils import pipeline_view
 
     model_name = _resolve_model_name(language)
-    cache_key = model_name.lower()
-    with _MODEL_LOCK:
-        if cache_key in _MODEL_CACHE:
-            return _MODEL_CACHE[cache_key]
-        try:
-            nlp = spacy.load(model_name)  # type: ignore[arg-type]
-        except OSError as exc:  # pragma: no cover - external dependency failure
-            raise EntityModelError(
-                f"spaCy model '{model_name}' is not installed. Download it with "
-                "`python -m spacy download en_core_web_sm`."
-            ) from exc
-        nlp.max_length = max(nlp.max_length, 2_000_000)
-        _MODEL_CACHE[cache_key] = nlp
-        return nlp
+    try:
+        nlp = pipeline_view(model_name)
+    except ImportError as exc:
+        raise EntityModelError(
+            "spaCy is not available. Install spaCy to enable entity extraction."
+        ) from exc
+    except OSError as exc:  # pragma: no cover - external dependency failure
+        raise EntityModelError(
+            f"spaCy model '{model_name}' is not installed. Download it with "
+            "`python -m spacy download en_core_web_sm`."
+        ) from exc
+    nlp.max_length = 2_000_000
+    return nlp
 
 
 def _normalize_label(text: str) -> str:
@@ -292,7 +332,16 @@ def extract_entities(
     chapters: Iterable[Mapping[str, Any]],
     *,
     language: str = "en",
+    batch_size: Optional[int] = None,
+    n_process: Optional[int] = None,
+    use_cache: bool = True,
 ) -> EntityExtractionResult:
+    """Collect people and other named entities across *chapters*.
+
+    Chapters are split into paragraph-sized docs and parsed with
+    ``nlp.pipe``; results are merged in chapter order, so the summary does
+    not depend on ``batch_size`` or ``n_process`` (see ``_pipe_settings``).
+    """
     start = time.perf_counter()
     normalized_language = language or "en"
     combined_hasher = hashlib.sha1()
@@ -315,22 +364,65 @@ def extract_entities(
     if not chapter_texts:
         return _empty_result(cache_key)
 
+    from abogen.entity_cache import entity_cache_key, get_entity_cache
+
+    model_name = _resolve_model_name(normalized_language)
+    model_version = _model_version(model_name)
+    cache = get_entity_cache() if use_cache and model_version else None
+    stored_key = entity_cache_key(cache_key, model_name, model_version or "")
+    if cache is not None:
+        cached = cache.get(stored_key)
+        if cached is not None:
+            elapsed = time.perf_counter() - start
+            return EntityExtractionResult(
+                summary=cached,
+                cache_key=cache_key,
+                elapsed=elapsed,
+                errors=[],
+                timings={"cache": elapsed},
+            )
+
     try:
         nlp = _load_model(normalized_language)
     except EntityModelError as exc:
         return _empty_result(cache_key, str(exc))
+    loaded = time.perf_counter()
 
     records: Dict[Tuple[str, str], EntityRecord] = {}
     tokens_for_index: Dict[str, Dict[str, Any]] = {}
     processed_tokens = 0
 
-    for chapter_index, text in chapter_texts:
-        trimmed = text.strip()
-        if not trimmed:
-            continue
-        if len(trimmed) + 1024 > nlp.max_length:
-            nlp.max_length = len(trimmed) + 1024
-        doc = nlp(trimmed)
+    pieces = [
+        (piece, chapter_index)
+        for chapter_index, text in chapter_texts
+        for piece in _split_chapter(text)
+    ]
+    longest = max((len(piece) for piece, _ in pieces), default=0)
+    with _MODEL_LOCK:
+        if longest + 1024 > nlp.max_length:
+            nlp.max_length = longest + 1024
+    batch_size, n_process = _pipe_settings(batch_size, n_process)
+    # Token offset of the next doc within its chapter, so positions match a
+    # whole-chapter parse.
+    chapter_offsets: Dict[int, int] = {}
+    parse_seconds = 0.0
+
+    def _parsed_docs() -> Iterable[Tuple[Any, int]]:
+        nonlocal parse_seconds
+        stream = iter(
+            nlp.pipe(pieces, as_tuples=True, batch_size=batch_size, n_process=n_process)
+        )
+        while True:
+            started = time.perf_counter()
+            item = next(stream, None)
+            parse_seconds += time.perf_counter() - started
+            if item is None:
+                return
+            yield item
+
+    for doc, chapter_index in _parsed_docs():
+        offset = chapter_offsets.get(chapter_index, 0)
+        chapter_offsets[chapter_index] = offset + len(doc)
 
         def _register_span(span: Any, category_hint: Optional[str] = None) -> None:
             nonlocal processed_tokens
@@ -363,7 +455,7 @@ def extract_entities(
             )
             record.register(
                 chapter_index=chapter_index,
-                position=span.start,
+                position=offset + span.start,
                 text=span.text,
                 sentence=sentence,
             )
@@ -389,8 +481,6 @@ def extract_entities(
         for span in _extract_propn_tokens(doc):
             _register_span(span, category_hint="entities")
 
-    elapsed = time.perf_counter() - start
-
     people_records = [
         record for record in records.values() if record.category == "people"
     ]
@@ -435,8 +525,21 @@ def extract_entities(
         },
     }
 
+    if cache is not None:
+        cache.put(stored_key, summary)
+
+    finished = time.perf_counter()
+    timings = {
+        "load": loaded - start,
+        "parse": parse_seconds,
+        "aggregate": finished - loaded - parse_seconds,
+    }
     return EntityExtractionResult(
-        summary=summary, cache_key=cache_key, elapsed=elapsed, errors=[]
+        summary=summary,
+        cache_key=cache_key,
+        elapsed=finished - start,
+        errors=[],
+        timings=timings,
     )
 
 
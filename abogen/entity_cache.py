@@ -0,0 +1,73 @@
+"""Persistent cache of entity-analysis summaries.
+
+``extract_entities`` hashes the chapter texts into a ``cache_key``. Summaries
+are stored in a small SQLite database under the user cache directory, keyed
+by that hash together with the spaCy model name and version. Re-opening a
+known book, or refreshing its entities, then skips the spaCy pass entirely.
+The database is bounded in size; the least recently used summaries are
+evicted first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .bounded_store import BoundedStore, SharedStore
+from .utils import get_user_cache_path
+
+# Bump when extraction changes in a way that alters summaries for the same
+# text and model.
+_SCHEMA_VERSION = 1
+
+DEFAULT_ENTITY_CACHE_MB = 64
+
+
+def entity_cache_key(cache_key: str, model_name: str, model_version: str) -> str:
+    raw = "\x1f".join((str(_SCHEMA_VERSION), cache_key, model_name.lower(), model_version))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class EntityCache(BoundedStore):
+    """Thread-safe, size-bounded on-disk map of key -> entity summary."""
+
+    table = "summaries"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached summary for *key*, or None."""
+        row = self._fetch(key, "payload")
+        if row is None:
+            return None
+        try:
+            return json.loads(zlib.decompress(row[0]).decode("utf-8"))
+        except (zlib.error, ValueError):
+            self._discard(key)
+            return None
+
+    def put(self, key: str, summary: Dict[str, Any]) -> None:
+        """Store *summary* and evict old entries beyond the size limit."""
+        payload = zlib.compress(json.dumps(summary, ensure_ascii=False).encode("utf-8"))
+        self._store(key, len(payload), {"payload": payload})
+
+
+_SHARED: SharedStore[EntityCache] = SharedStore(
+    lambda max_bytes: EntityCache(Path(get_user_cache_path("entities")) / "summaries.sqlite3", max_bytes),
+    "ABOGEN_ENTITY_CACHE_MB",
+    DEFAULT_ENTITY_CACHE_MB,
+)
+
+
+def get_entity_cache() -> Optional[EntityCache]:
+    """Return the process-wide cache, or None when disabled or unavailable.
+
+    Sized by ``ABOGEN_ENTITY_CACHE_MB`` (default 64; ``0`` disables it).
+    """
+    return _SHARED.get()
+
+
+def reset_entity_cache() -> None:
+    """Close the process-wide cache so the next call reopens it."""
+    _SHARED.reset()
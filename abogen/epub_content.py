@@ -0,0 +1,463 @@
+"""Shared EPUB content engine: spine documents, anchors and HTML-to-text.
+
+Both EPUB readers (``book_parser.EpubParser`` for the desktop dialog and
+``text_extractor.EpubExtractor`` for the WebUI) slice spine documents at
+navigation anchors and turn the resulting HTML into speakable text. This
+module does that work once per document:
+
+* ``EpubDocuments`` decodes each spine document a single time and indexes
+  its ``id``/``name`` anchors in one pass, so resolving many TOC fragments in
+  the same file does not re-parse it.
+* ``html_to_text`` walks the markup as a stream of start/end/data events
+  instead of building, mutating and re-serialising a soup. Block elements end
+  with a paragraph break, items of ``<ol>`` lists are numbered from the
+  list's ``start`` attribute, and ``<sup>``/``<sub>`` content is dropped. The
+  event source is the standard library ``html.parser``, which matches what
+  the soup-based readers produced. ``ABOGEN_HTML_PARSER=lxml`` switches to
+  lxml's faster HTML parser when it is installed; lxml closes unclosed list
+  items itself and drops CDATA, so the text of such markup differs.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import urllib.parse
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import ebooklib
+from ebooklib import epub
+
+from abogen.utils import clean_text
+
+logger = logging.getLogger(__name__)
+
+BLOCK_TAGS = frozenset(
+    ("p", "div", "h1", "h2", "h3", "h4", "h5", "h6", "li", "blockquote")
+)
+# Elements whose content is never spoken.
+_DROPPED_TAGS = frozenset(("sup", "sub"))
+# Elements whose text BeautifulSoup's get_text() never returned.
+_SILENT_TAGS = frozenset(("script", "style", "template"))
+_VOID_TAGS = frozenset(
+    (
+        "area", "base", "br", "col", "embed", "hr", "img", "input", "keygen",
+        "link", "meta", "param", "source", "track", "wbr", "basefont", "bgsound",
+        "frame", "spacer", "command", "menuitem",
+    )
+)
+_TITLE_HEADINGS = ("h1", "h2", "h3")
+_PRESERVE_WHITESPACE_TAGS = frozenset(("pre", "textarea"))
+_ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+
+_ANCHOR_TAG_PATTERN = re.compile(r"<[A-Za-z][^>]*>")
+_ANCHOR_ATTR_PATTERN = re.compile(
+    r"[\s\"'](id|name)\s*=\s*([\"'])(.*?)\2", re.IGNORECASE | re.DOTALL
+)
+
+
+# ─── HTML to text ─────────────────────────────────────────────────
+
+
+@dataclass
+class DocumentText:
+    """Text of an HTML fragment plus the title candidates seen while walking it."""
+
+    text: str
+    title: Optional[str] = None
+    headings: Dict[str, str] = field(default_factory=dict)
+
+    def resolve_title(self, fallback: str) -> str:
+        """``<title>``, else the first ``<h1>``, ``<h2>`` or ``<h3>`` with text."""
+        if self.title:
+            return self.title
+        for tag in _TITLE_HEADINGS:
+            if self.headings.get(tag):
+                return self.headings[tag]
+        return fallback
+
+
+class _TextWalker:
+    """Collect speakable text from start/end/data events.
+
+    Mirrors what BeautifulSoup produced for these documents: an element is
+    closed by its own end tag or by the end tag of an ancestor, unmatched end
+    tags are ignored, anything still open is closed at the end, and a text
+    run made only of whitespace becomes a single newline or space.
+    """
+
+    def __init__(self, block_breaks: bool, number_lists: bool) -> None:
+        self.block_breaks = block_breaks
+        self.number_lists = number_lists
+        self.parts: List[str] = []
+        # Open elements as [tag, next list number or None]
+        self._stack: List[List] = []
+        self._pending: List[str] = []
+        self._preserve = 0
+        self._dropped = 0
+        self._silent = 0
+        self._title: Optional[List[str]] = None
+        self._in_title = 0
+        # First element of each heading level: finished text, or the open
+        # element's stack depth and collected strings.
+        self._headings: Dict[str, str] = {}
+        self._open_headings: Dict[str, Tuple[int, List[str]]] = {}
+
+    # lxml target interface ------------------------------------------
+
+    def start(self, tag, attrs) -> None:
+        self._flush()
+        tag = tag.lower() if isinstance(tag, str) else ""
+        if tag in _VOID_TAGS:
+            return
+        visible = not (self._dropped or self._silent)
+        if tag == "li" and self.number_lists and self._stack and self._stack[-1][0] == "ol":
+            parent = self._stack[-1]
+            if visible:
+                self.parts.append(f"{parent[1]}) ")
+            parent[1] += 1
+        counter = None
+        if tag == "ol":
+            counter = _list_start(dict(attrs).get("start") if attrs else None)
+        self._stack.append([tag, counter])
+        if tag in _DROPPED_TAGS:
+            self._dropped += 1
+        elif tag in _SILENT_TAGS:
+            self._silent += 1
+        elif tag in _PRESERVE_WHITESPACE_TAGS:
+            self._preserve += 1
+        elif tag == "title" and self._title is None:
+            self._title = []
+            self._in_title = len(self._stack)
+        elif tag in _TITLE_HEADINGS and tag not in self._headings and tag not in self._open_headings:
+            self._open_headings[tag] = (len(self._stack), [])
+
+    def end(self, tag) -> None:
+        self._flush()
+        tag = tag.lower() if isinstance(tag, str) else ""
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index][0] == tag:
+                while len(self._stack) > index:
+                    self._pop()
+                return
+
+    def data(self, text: str) -> None:
+        self._pending.append(text)
+
+    def comment(self, text: str) -> None:
+        # Comments are not spoken but still separate text runs.
+        self._flush()
+
+    def pi(self, target: str, data: Optional[str] = None) -> None:
+        self._flush()
+
+    def close(self) -> None:
+        self._flush()
+        while self._stack:
+            self._pop()
+
+    # ----------------------------------------------------------------
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        text = "".join(self._pending)
+        self._pending = []
+        if self._silent:
+            return
+        if not self._preserve and not text.strip(_ASCII_SPACES):
+            text = "\n" if "\n" in text else " "
+        if self._in_title and self._title is not None:
+            self._title.append(text)
+        for _, parts in self._open_headings.values():
+            parts.append(text)
+        if not self._dropped:
+            self.parts.append(text)
+
+    def _pop(self) -> None:
+        depth = len(self._stack)
+        tag = self._stack.pop()[0]
+        if tag in _DROPPED_TAGS:
+            self._dropped -= 1
+        elif tag in _SILENT_TAGS:
+            self._silent -= 1
+        elif tag in _PRESERVE_WHITESPACE_TAGS:
+            self._preserve -= 1
+        if depth == self._in_title:
+            self._in_title = 0
+        if tag in self._open_headings and self._open_headings[tag][0] == depth:
+            parts = self._open_headings.pop(tag)[1]
+            self._headings[tag] = "".join(part.strip() for part in parts)
+        if self.block_breaks and tag in BLOCK_TAGS and not (self._dropped or self._silent):
+            self.parts.append("\n\n")
+
+    def result(self) -> DocumentText:
+        title = "".join(self._title).strip() if self._title else None
+        return DocumentText(text="".join(self.parts), title=title or None, headings=dict(self._headings))
+
+
+def _list_start(value) -> int:
+    try:
+        return int(str(value)) if value is not None else 1
+    except (TypeError, ValueError):
+        return 1
+
+
+class _StdlibEvents(HTMLParser):
+    """Feed ``html.parser`` events into a ``_TextWalker``."""
+
+    def __init__(self, walker: _TextWalker) -> None:
+        super().__init__(convert_charrefs=True)
+        self.walker = walker
+
+    def handle_starttag(self, tag, attrs):
+        self.walker.start(tag, attrs)
+
+    def handle_startendtag(self, tag, attrs):
+        self.walker.start(tag, attrs)
+        self.walker.end(tag)
+
+    def handle_endtag(self, tag):
+        self.walker.end(tag)
+
+    def handle_data(self, data):
+        self.walker.data(data)
+
+    def handle_comment(self, data):
+        self.walker.comment(data)
+
+    def handle_pi(self, data):
+        self.walker.pi(data)
+
+    def handle_decl(self, decl):
+        self.walker.comment(decl)
+
+    def unknown_decl(self, data):
+        self.walker.comment(data)
+        if data.startswith("CDATA["):
+            self.walker.data(data[6:])
+            self.walker.comment(data)
+
+
+def _lxml_parser_class():
+    if os.environ.get("ABOGEN_HTML_PARSER", "").strip().lower() != "lxml":
+        return None
+    try:
+        from lxml import etree  # type: ignore[import]
+    except ImportError:
+        return None
+    return etree.HTMLParser
+
+
+def html_parser_backend() -> str:
+    """Name of the event source ``html_to_text`` will use."""
+    return "lxml" if _lxml_parser_class() is not None else "html.parser"
+
+
+def walk_html(html: str, *, block_breaks: bool = True, number_lists: bool = True) -> DocumentText:
+    """Walk *html* once and return its raw text and title candidates."""
+    walker = _TextWalker(block_breaks, number_lists)
+    if not html:
+        return walker.result()
+    lxml_parser = _lxml_parser_class()
+    if lxml_parser is not None:
+        try:
+            parser = lxml_parser(target=walker)
+            parser.feed(html)
+            parser.close()
+            return walker.result()
+        except Exception as e:  # lxml rejects some inputs html.parser accepts
+            logger.debug(f"lxml could not parse document, using html.parser: {e}")
+            walker = _TextWalker(block_breaks, number_lists)
+    events = _StdlibEvents(walker)
+    events.feed(html)
+    events.close()
+    walker.close()
+    return walker.result()
+
+
+def html_to_text(
+    html: str,
+    *,
+    block_breaks: bool = True,
+    number_lists: bool = True,
+    clean: Callable[[str], str] = clean_text,
+) -> str:
+    """Cleaned, speakable text of an HTML fragment.
+
+    *clean* normalises the whitespace of the walked text; the desktop reader
+    passes ``subtitle_utils.clean_text``.
+    """
+    if not html:
+        return ""
+    return clean(walk_html(html, block_breaks=block_breaks, number_lists=number_lists).text).strip()
+
+
+def document_text(
+    html: str, fallback_title: str, *, clean: Callable[[str], str] = clean_text
+) -> Tuple[str, str]:
+    """Text and title of a whole document from a single walk.
+
+    The title is the ``<title>`` element, else the first non-empty
+    ``<h1>``-``<h3>``, else *fallback_title*.
+    """
+    walked = walk_html(html)
+    return clean(walked.text).strip(), walked.resolve_title(fallback_title)
+
+
+# ─── Spine documents ──────────────────────────────────────────────
+
+
+def _index_anchors(html: str) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """Map each ``id`` and ``name`` value to the offset of its tag."""
+    ids: Dict[str, int] = {}
+    names: Dict[str, int] = {}
+    for tag in _ANCHOR_TAG_PATTERN.finditer(html):
+        for attr in _ANCHOR_ATTR_PATTERN.finditer(tag.group(0)):
+            target = ids if attr.group(1).lower() == "id" else names
+            target.setdefault(attr.group(3), tag.start())
+    return ids, names
+
+
+def find_doc_key(
+    base_href: str, doc_order: Dict[str, int], doc_order_decoded: Dict[str, int]
+) -> Tuple[Optional[str], Optional[int]]:
+    """Resolve a navigation href to a spine document and its order.
+
+    Tries the href as given, URL-decoded, and any spine document with the
+    same file name.
+    """
+    candidates = [base_href, urllib.parse.unquote(base_href)]
+    base_name = os.path.basename(urllib.parse.unquote(base_href)).lower()
+    for key in list(doc_order) + list(doc_order_decoded):
+        if os.path.basename(key).lower() == base_name:
+            candidates.append(key)
+    for candidate in candidates:
+        if candidate in doc_order:
+            return candidate, doc_order[candidate]
+        if candidate in doc_order_decoded:
+            return candidate, doc_order_decoded[candidate]
+    return None, None
+
+
+class EpubDocuments:
+    """Spine order and decoded HTML of an EPUB, each read only once.
+
+    *content* may be an existing href -> HTML dict to share with the caller.
+    """
+
+    def __init__(self, book: Optional[epub.EpubBook], content: Optional[Dict[str, str]] = None) -> None:
+        self.book = book
+        self.spine_docs: List[str] = []
+        for spine_entry in book.spine if book is not None else ():
+            item = book.get_item_with_id(spine_entry[0])
+            if item:
+                self.spine_docs.append(item.get_name())
+            else:
+                logger.warning(f"Spine item with id '{spine_entry[0]}' not found.")
+        self.doc_order = {href: index for index, href in enumerate(self.spine_docs)}
+        self.doc_order_decoded = {
+            urllib.parse.unquote(href): index for href, index in self.doc_order.items()
+        }
+        self._spine_index: Dict[str, int] = {}
+        for index, href in enumerate(self.spine_docs):
+            self._spine_index.setdefault(href, index)
+        self.content: Dict[str, str] = {} if content is None else content
+        self._anchors: Dict[str, Tuple[Dict[str, int], Dict[str, int]]] = {}
+
+    def load(self, extra_targets: Iterable[str] = ()) -> Dict[str, str]:
+        """Decode spine documents and any other documents in *extra_targets*."""
+        needed = set(self.doc_order)
+        for target in extra_targets:
+            needed.add(target)
+            needed.add(urllib.parse.unquote(target))
+        self.content.clear()
+        self._anchors.clear()
+        for item in self.book.get_items_of_type(ebooklib.ITEM_DOCUMENT):
+            href = item.get_name()
+            if href not in needed and urllib.parse.unquote(href) not in needed:
+                continue
+            try:
+                self.content[href] = item.get_content().decode("utf-8", errors="ignore")
+            except Exception as e:
+                logger.error(f"Error decoding EPUB document {href}: {e}")
+                self.content[href] = ""
+        return self.content
+
+    def find_doc_key(self, base_href: str) -> Tuple[Optional[str], Optional[int]]:
+        return find_doc_key(base_href, self.doc_order, self.doc_order_decoded)
+
+    def position(self, doc_href: str, fragment_id: Optional[str]) -> int:
+        """Offset of the element with id/name *fragment_id* in *doc_href*."""
+        if doc_href not in self.content:
+            logger.warning(f"Document '{doc_href}' not found in cached EPUB content.")
+            return 0
+        if not fragment_id:
+            return 0
+        anchors = self._anchors.get(doc_href)
+        if anchors is None:
+            anchors = self._anchors[doc_href] = _index_anchors(self.content[doc_href])
+        ids, names = anchors
+        if fragment_id in ids:
+            return ids[fragment_id]
+        if fragment_id in names:
+            return names[fragment_id]
+        logger.warning(f"Anchor '{fragment_id}' not found in {doc_href}. Defaulting to start.")
+        return 0
+
+    def docs_between(self, current_doc: str, next_doc: Optional[str]) -> List[str]:
+        """Spine documents strictly between two documents (wrapping around)."""
+        current_idx = self._spine_index.get(current_doc)
+        if current_idx is None:
+            return []
+        if next_doc is None:
+            return self.spine_docs[current_idx + 1 :]
+        next_idx = self._spine_index.get(next_doc)
+        if next_idx is None:
+            return []
+        if current_idx < next_idx:
+            return self.spine_docs[current_idx + 1 : next_idx]
+        if current_idx > next_idx:
+            return self.spine_docs[current_idx + 1 :] + self.spine_docs[:next_idx]
+        return []
+
+    def slice(
+        self,
+        doc_href: str,
+        position: int,
+        next_doc: Optional[str],
+        next_position: int = 0,
+        source: Optional[str] = None,
+    ) -> str:
+        """HTML from an anchor up to the next one (or the end of the book).
+
+        Falls back to the whole starting document when the slice is blank,
+        with a warning naming the navigation *source* when one is given.
+        """
+        current_html = self.content.get(doc_href, "")
+        if next_doc == doc_href:
+            slice_html = current_html[position:next_position]
+        else:
+            pieces = [current_html[position:]]
+            pieces.extend(self.content.get(href, "") for href in self.docs_between(doc_href, next_doc))
+            if next_doc is not None:
+                pieces.append(self.content.get(next_doc, "")[:next_position])
+            slice_html = "".join(pieces)
+        if not slice_html.strip() and current_html:
+            if source is not None:
+                logger.warning(
+                    "No content found for navigation source '%s'. Using full document fallback.",
+                    source,
+                )
+            return current_html
+        return slice_html
+
+    def prefix(self, doc_href: str, position: int) -> str:
+        """HTML of the spine before an anchor (front matter ahead of the TOC)."""
+        index = self._spine_index.get(doc_href, -1)
+        pieces = [self.content.get(href, "") for href in self.spine_docs[: max(index, 0)]]
+        pieces.append(self.content.get(doc_href, "")[:position])
+        return "".join(pieces)
@@ -199,15 +199,17 @@ def _load_spacy(language: str) -> Any:
     if spacy is None:
         return None
 
+    from abogen.spacy_utils import BLANK_PREFIX, pipeline_view
+
     # English only for now.
     # Use installed small model; keep it simple.
     lang = (language or "en").lower()
     if lang.startswith("en"):
         try:
-            return spacy.load("en_core_web_sm")
+            return pipeline_view("en_core_web_sm", exclude=("ner",))
         except Exception:
-            return spacy.blank("en")
-    return spacy.blank("xx")
+            return pipeline_view(BLANK_PREFIX + "en")
+    return pipeline_view(BLANK_PREFIX + "xx")
 
 
 def extract_heteronym_overrides(
@@ -20,6 +20,8 @@ from typing import (
     Tuple,
 )
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 logger = logging.getLogger(__name__)
 
@@ -1589,18 +1591,19 @@ def normalize_apostrophes(
         and cfg.ambiguous_past_modal_mode == "contextual"
     )
 
-    need_contextual = False
+    # Only the sentences holding ambiguous tokens are sent to spaCy.
+    ambiguous_starts: List[int] = []
     if (use_contextual_s or use_contextual_d) and token_entries:
-        for token_value, _, _ in token_entries:
-            if use_contextual_s and _is_ambiguous_s(token_value):
-                need_contextual = True
-                break
-            if use_contextual_d and _is_ambiguous_d(token_value):
-                need_contextual = True
-                break
+        for token_value, start, _ in token_entries:
+            if (use_contextual_s and _is_ambiguous_s(token_value)) or (
+                use_contextual_d and _is_ambiguous_d(token_value)
+            ):
+                ambiguous_starts.append(start)
 
     contextual_resolutions = (
-        resolve_ambiguous_contractions(text) if need_contextual else {}
+        resolve_ambiguous_contractions(text, positions=ambiguous_starts)
+        if ambiguous_starts
+        else {}
     )
 
     results: List[Tuple[str, str, str]] = []
@@ -2065,6 +2068,31 @@ _LLM_REGEX_TOOL_CHOICE = {
     "type": "function",
     "function": {"name": _LLM_REGEX_TOOL_NAME},
 }
+_LLM_BATCH_SYSTEM_PROMPT = (
+    "You assist with audiobook preparation. The user message lists several numbered sentences "
+    "([1], [2], ...). Review each sentence, identify any apostrophes or contractions that should be "
+    "expanded for clarity, and respond by calling the apply_regex_replacements tool once. Each "
+    "replacement must target a single token, set 'sentence' to the number of the sentence it applies "
+    "to, include a precise regex pattern, and provide the exact replacement text. If no changes are "
+    "required, call the tool with an empty replacements list. Do not rewrite the sentences directly."
+)
+
+
+def _build_batch_regex_tool() -> Dict[str, Any]:
+    tool = json.loads(json.dumps(_LLM_REGEX_TOOL))
+    items = tool["function"]["parameters"]["properties"]["replacements"]["items"]
+    items["properties"]["sentence"] = {
+        "type": "integer",
+        "description": "1-based number of the sentence this replacement applies to.",
+    }
+    items["required"] = list(items["required"]) + ["sentence"]
+    tool["function"]["description"] = (
+        "Return regex substitutions to normalize apostrophes or contractions in the numbered sentences."
+    )
+    return tool
+
+
+_LLM_BATCH_REGEX_TOOL = _build_batch_regex_tool()
 _LLM_ALLOWED_REGEX_FLAGS = {
     "IGNORECASE": re.IGNORECASE,
     "MULTILINE": re.MULTILINE,
@@ -2093,28 +2121,150 @@ def _split_sentences_for_llm(text: str) -> List[str]:
     return [segment for segment in sentences if segment]
 
 
+# One long-lived pool per worker count. Pools are never shut down, so jobs
+# running side by side with different ``llm_concurrency`` values cannot
+# tear down each other's executor mid-submit.
+_LLM_EXECUTORS: Dict[int, ThreadPoolExecutor] = {}
+_LLM_EXECUTOR_LOCK = threading.Lock()
+
+
+def _llm_executor(workers: int) -> ThreadPoolExecutor:
+    """Shared request pool; worker threads keep their keep-alive connections."""
+    with _LLM_EXECUTOR_LOCK:
+        executor = _LLM_EXECUTORS.get(workers)
+        if executor is None:
+            executor = _LLM_EXECUTORS[workers] = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix=f"abogen-llm{workers}"
+            )
+        return executor
+
+
+# (cache key, sentence, paragraph)
+_LLMWorkItem = Tuple[Tuple[str, str, str, str], str, str]
+
+
+def _request_llm_rewrites(
+    llm_config: Any,
+    prompt_template: str,
+    batch: Sequence[_LLMWorkItem],
+) -> Dict[Tuple[str, str, str, str], str]:
+    """Send one tool call for *batch* and return rewritten sentences by key."""
+    from abogen.llm_client import generate_completion
+
+    paragraph = batch[0][2]
+    if len(batch) == 1:
+        key, sentence, _ = batch[0]
+        prompt_context = {
+            "text": sentence,
+            "sentence": sentence,
+            "paragraph": paragraph,
+        }
+        completion = generate_completion(
+            llm_config,
+            system_message=_LLM_SYSTEM_PROMPT,
+            user_message=_render_mustache(prompt_template, prompt_context),
+            tools=[_LLM_REGEX_TOOL],
+            tool_choice=_LLM_REGEX_TOOL_CHOICE,
+        )
+        return {key: _apply_llm_regex_replacements(sentence, completion)}
+
+    numbered = "\n".join(
+        f"[{number}] {sentence}" for number, (_, sentence, _) in enumerate(batch, 1)
+    )
+    prompt_context = {"text": numbered, "sentence": numbered, "paragraph": paragraph}
+    completion = generate_completion(
+        llm_config,
+        system_message=_LLM_BATCH_SYSTEM_PROMPT,
+        user_message=_render_mustache(prompt_template, prompt_context),
+        tools=[_LLM_BATCH_REGEX_TOOL],
+        tool_choice=_LLM_REGEX_TOOL_CHOICE,
+    )
+    replacements = _extract_llm_replacements(completion)
+    rewritten: Dict[Tuple[str, str, str, str], str] = {}
+    for number, (key, sentence, _) in enumerate(batch, 1):
+        updated = sentence
+        for spec in replacements:
+            # Unnumbered replacements are token-targeted; apply them to all.
+            if spec.get("sentence", number) == number:
+                updated = _apply_single_regex_replacement(updated, spec)
+        rewritten[key] = updated
+    return rewritten
+
+
+def _run_llm_requests(
+    llm_config: Any,
+    prompt_template: str,
+    batches: List[List[_LLMWorkItem]],
+    *,
+    concurrency: int,
+    cache: Any,
+) -> Dict[Tuple[str, str, str, str], str]:
+    """Run *batches* with bounded concurrency, caching each as it completes."""
+    results: Dict[Tuple[str, str, str, str], str] = {}
+
+    def _store(rewritten: Dict[Tuple[str, str, str, str], str]) -> None:
+        results.update(rewritten)
+        if cache is not None:
+            cache.put_many(rewritten)
+
+    if concurrency <= 1 or len(batches) <= 1:
+        for batch in batches:
+            _store(_request_llm_rewrites(llm_config, prompt_template, batch))
+        return results
+
+    executor = _llm_executor(concurrency)
+    futures = [
+        executor.submit(_request_llm_rewrites, llm_config, prompt_template, batch)
+        for batch in batches
+    ]
+    try:
+        for future in as_completed(futures):
+            _store(future.result())
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+    return results
+
+
 def _normalize_with_llm(
     text: str,
     *,
     settings: Mapping[str, Any],
     config: ApostropheConfig,
 ) -> str:
+    """Let the LLM fix apostrophes, one tool call per sentence (or batch).
+
+    Sentences are first looked up in the on-disk cache; the rest are grouped
+    per paragraph into batches of ``llm_batch_size`` and sent through a pool
+    of ``llm_concurrency`` keep-alive workers.
+    """
     from abogen.normalization_settings import (
         build_llm_configuration,
         DEFAULT_LLM_PROMPT,
     )
-    from abogen.llm_client import generate_completion, LLMClientError
+    from abogen.llm_cache import cache_key, get_llm_cache
+    from abogen.llm_client import LLMClientError
 
     llm_config = build_llm_configuration(settings)
     if not llm_config.is_configured():
         raise LLMClientError("LLM configuration is incomplete")
 
     prompt_template = str(settings.get("llm_prompt") or DEFAULT_LLM_PROMPT)
+    concurrency = max(1, int(settings.get("llm_concurrency", 1) or 1))
+    batch_size = max(1, int(settings.get("llm_batch_size", 1) or 1))
+    cache = get_llm_cache() if settings.get("llm_cache", False) else None
+
     lines = text.splitlines(keepends=True)
     if not lines:
         return text
 
-    normalized_lines: List[str] = []
+    # Pass 1: split lines into sentences and collect the distinct work items.
+    # Each layout entry is either a finished line or
+    # (leading_ws, core, trailing_ws + newline, sentence keys).
+    layout: List[Any] = []
+    work: Dict[Tuple[str, str, str, str], _LLMWorkItem] = {}
+    paragraphs: Dict[str, List[_LLMWorkItem]] = {}
     for raw_line in lines:
         newline = ""
         if raw_line.endswith(("\r", "\n")):
@@ -2125,7 +2275,7 @@ def _normalize_with_llm(
             line_body = raw_line
 
         if not line_body.strip():
-            normalized_lines.append(line_body + newline)
+            layout.append(line_body + newline)
             continue
 
         leading_ws = line_body[: len(line_body) - len(line_body.lstrip())]
@@ -2134,33 +2284,47 @@ def _normalize_with_llm(
 
         sentences = _split_sentences_for_llm(core)
         if not sentences:
-            normalized_lines.append(line_body + newline)
+            layout.append(line_body + newline)
             continue
 
-        paragraph_context = core
-        rewritten_sentences: List[str] = []
+        keys = []
         for sentence in sentences:
-            prompt_context = {
-                "text": sentence,
-                "sentence": sentence,
-                "paragraph": paragraph_context,
-            }
-            prompt = _render_mustache(prompt_template, prompt_context)
-            completion = generate_completion(
+            key = cache_key(llm_config.model, prompt_template, sentence, core)
+            keys.append(key)
+            if key not in work:
+                item = (key, sentence, core)
+                work[key] = item
+                paragraphs.setdefault(core, []).append(item)
+        layout.append((leading_ws, core, trailing_ws + newline, keys))
+
+    # Pass 2: resolve from cache, then ask the LLM for the rest.
+    results = cache.get_many(work) if cache is not None else {}
+    batches: List[List[_LLMWorkItem]] = []
+    for items in paragraphs.values():
+        pending = [item for item in items if item[0] not in results]
+        for start in range(0, len(pending), batch_size):
+            batches.append(pending[start : start + batch_size])
+    if batches:
+        results.update(
+            _run_llm_requests(
                 llm_config,
-                system_message=_LLM_SYSTEM_PROMPT,
-                user_message=prompt,
-                tools=[_LLM_REGEX_TOOL],
-                tool_choice=_LLM_REGEX_TOOL_CHOICE,
-            )
-            rewritten_sentences.append(
-                _apply_llm_regex_replacements(sentence, completion)
+                prompt_template,
+                batches,
+                concurrency=concurrency,
+                cache=cache,
             )
+        )
 
+    # Pass 3: reassemble in the original order.
+    normalized_lines: List[str] = []
+    for entry in layout:
+        if isinstance(entry, str):
+            normalized_lines.append(entry)
+            continue
+        leading_ws, core, tail, keys = entry
+        rewritten_sentences = [results[key] for key in keys]
         normalized_core = " ".join(filter(None, rewritten_sentences)) or core
-
-        rebuilt = f"{leading_ws}{normalized_core}{trailing_ws}{newline}"
-        normalized_lines.append(rebuilt)
+        normalized_lines.append(f"{leading_ws}{normalized_core}{tail}")
 
     result = "".join(normalized_lines)
     return result if result else text
@@ -2234,6 +2398,10 @@ def _coerce_replacement_list(raw: Any) -> List[Dict[str, Any]]:
         if isinstance(count, int) and count >= 0:
             entry["count"] = count
 
+        sentence = item.get("sentence")
+        if isinstance(sentence, int) and not isinstance(sentence, bool):
+            entry["sentence"] = sentence
+
         replacements.append(entry)
 
     return replacements
@@ -2300,8 +2468,13 @@ def normalize_for_pipeline(
     *,
     config: Optional[ApostropheConfig] = None,
     settings: Optional[Mapping[str, Any]] = None,
+    config_is_resolved: bool = False,
 ) -> str:
-    """Normalize text for the synthesis pipeline with runtime settings."""
+    """Normalize text for the synthesis pipeline with runtime settings.
+
+    Pass ``config_is_resolved=True`` when *config* was already built from
+    *settings* via ``build_apostrophe_config`` to skip rebuilding it.
+    """
 
     from abogen.normalization_settings import (
         build_apostrophe_config,
@@ -2310,8 +2483,11 @@ def normalize_for_pipeline(
     from abogen.llm_client import LLMClientError
 
     runtime_settings = settings or get_runtime_settings()
-    base_config = config or DEFAULT_APOSTROPHE_CONFIG
-    cfg = build_apostrophe_config(settings=runtime_settings, base=base_config)
+    if config_is_resolved and config is not None and settings:
+        cfg = config
+    else:
+        base_config = config or DEFAULT_APOSTROPHE_CONFIG
+        cfg = build_apostrophe_config(settings=runtime_settings, base=base_config)
 
     mode = str(runtime_settings.get("normalization_apostrophe_mode", "spacy")).lower()
     normalized = text
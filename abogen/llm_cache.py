@@ -0,0 +1,81 @@
+"""Persistent cache for LLM sentence normalization.
+
+Rewritten sentences are stored in a small SQLite database under the user
+cache directory, keyed by (model, prompt template, sentence, paragraph hash).
+Re-running or retrying a job therefore never sends the same sentence to the
+LLM twice. The database is bounded by ``ABOGEN_LLM_CACHE_MB`` (default 64;
+``0`` disables it); the least recently used sentences are evicted first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from .bounded_store import BoundedStore, SharedStore
+from .utils import get_user_cache_path
+
+# Bump when the request shape (system prompt, tool schema, batching) changes
+# in a way that can alter responses for an identical key.
+_SCHEMA_VERSION = 1
+
+DEFAULT_LLM_CACHE_MB = 64
+
+CacheKey = Tuple[str, str, str, str]
+
+
+def cache_key(model: str, prompt_template: str, sentence: str, paragraph: str) -> CacheKey:
+    """Build the cache key for one sentence.
+
+    The paragraph is hashed so long paragraphs don't bloat the key.
+    """
+    paragraph_hash = hashlib.sha1(paragraph.encode("utf-8")).hexdigest()
+    return (model, prompt_template, sentence, paragraph_hash)
+
+
+def _digest(key: CacheKey) -> str:
+    raw = "\x1f".join((str(_SCHEMA_VERSION),) + key)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMNormalizationCache(BoundedStore):
+    """Thread-safe, size-bounded on-disk map of cache key -> rewritten sentence."""
+
+    table = "sentences"
+    columns = "model TEXT NOT NULL, result TEXT NOT NULL"
+
+    def __init__(self, path: Path, max_bytes: int = DEFAULT_LLM_CACHE_MB * 1024 * 1024) -> None:
+        super().__init__(path, max_bytes)
+
+    def get_many(self, keys: Iterable[CacheKey]) -> Dict[CacheKey, str]:
+        """Return cached results for *keys* that are present."""
+        digests = {_digest(key): key for key in keys}
+        rows = self._fetch_many(list(digests), "result")
+        return {digests[digest]: row[0] for digest, row in rows.items()}
+
+    def put_many(self, entries: Dict[CacheKey, str]) -> None:
+        """Store rewritten sentences and evict old ones beyond the size limit."""
+        self._store_many(
+            [
+                (_digest(key), len(key[0]) + len(value.encode("utf-8")), {"model": key[0], "result": value})
+                for key, value in entries.items()
+            ]
+        )
+
+
+_SHARED: SharedStore[LLMNormalizationCache] = SharedStore(
+    lambda max_bytes: LLMNormalizationCache(Path(get_user_cache_path("llm")) / "normalization.sqlite3", max_bytes),
+    "ABOGEN_LLM_CACHE_MB",
+    DEFAULT_LLM_CACHE_MB,
+)
+
+
+def get_llm_cache() -> Optional[LLMNormalizationCache]:
+    """Return the process-wide cache, or ``None`` when disabled or unavailable."""
+    return _SHARED.get()
+
+
+def reset_llm_cache() -> None:
+    """Close the process-wide cache so the next call reopens it."""
+    _SHARED.reset()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import http.client
 import json
+import threading
 from dataclasses import dataclass
 from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 from urllib import error, parse, request
@@ -67,6 +69,94 @@ def _build_headers(api_key: str) -> Dict[str, str]:
     return headers
 
 
+# Keep-alive connections, one per (thread, scheme, host, port). A session of
+# normalization requests then reuses a single TCP/TLS connection per worker
+# instead of reconnecting for every sentence.
+_CONNECTIONS = threading.local()
+
+
+def _uses_proxy(parsed: parse.ParseResult) -> bool:
+    proxies = request.getproxies()
+    if parsed.scheme not in proxies:
+        return False
+    return not request.proxy_bypass(parsed.hostname or "")
+
+
+def _pooled_connection(
+    parsed: parse.ParseResult, timeout: float
+) -> Tuple[http.client.HTTPConnection, bool]:
+    """Return ``(connection, reused)`` for the current thread."""
+    pool: Optional[Dict[Tuple[str, str], http.client.HTTPConnection]]
+    pool = getattr(_CONNECTIONS, "pool", None)
+    if pool is None:
+        pool = _CONNECTIONS.pool = {}
+    key = (parsed.scheme, parsed.netloc)
+    conn = pool.get(key)
+    if conn is not None:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+    factory = (
+        http.client.HTTPSConnection
+        if parsed.scheme == "https"
+        else http.client.HTTPConnection
+    )
+    conn = factory(parsed.hostname or "", parsed.port, timeout=timeout)
+    pool[key] = conn
+    return conn, False
+
+
+def _drop_connection(parsed: parse.ParseResult) -> None:
+    pool = getattr(_CONNECTIONS, "pool", None) or {}
+    conn = pool.pop((parsed.scheme, parsed.netloc), None)
+    if conn is not None:
+        conn.close()
+
+
+def close_connections() -> None:
+    """Close the calling thread's keep-alive connections."""
+    pool = getattr(_CONNECTIONS, "pool", None) or {}
+    for conn in pool.values():
+        conn.close()
+    pool.clear()
+
+
+def _send_keep_alive(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    data_bytes: Optional[bytes],
+    timeout: float,
+) -> bytes:
+    parsed = parse.urlparse(url)
+    target = parsed.path or "/"
+    if parsed.query:
+        target += f"?{parsed.query}"
+    for attempt in range(2):
+        conn, reused = _pooled_connection(parsed, timeout)
+        try:
+            conn.request(method, target, body=data_bytes, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+        except (http.client.HTTPException, ConnectionError) as exc:
+            _drop_connection(parsed)
+            # The server may have closed an idle connection; retry once fresh.
+            if reused and attempt == 0:
+                continue
+            raise LLMClientError(f"LLM request failed: {exc}") from exc
+        except OSError as exc:
+            _drop_connection(parsed)
+            raise LLMClientError(f"LLM request failed: {exc}") from exc
+        if response.will_close:
+            _drop_connection(parsed)
+        if response.status >= 400:
+            message = body.decode("utf-8", "ignore") or response.reason
+            raise LLMClientError(f"LLM request failed ({response.status}): {message}")
+        return body
+    raise LLMClientError("LLM request failed")  # pragma: no cover
+
+
 def _perform_request(
     method: str,
     url: str,
@@ -79,12 +169,35 @@ def _perform_request(
     if payload is not None:
         data_bytes = json.dumps(payload).encode("utf-8")
     request_headers = dict(headers or {})
+    parsed = parse.urlparse(url)
+    if parsed.scheme in {"http", "https"} and not _uses_proxy(parsed):
+        body = _send_keep_alive(
+            method.upper(), url, request_headers, data_bytes, timeout
+        )
+    else:
+        body = _send_urllib(method, url, request_headers, data_bytes, timeout)
+
+    if not body:
+        return None
+    try:
+        return json.loads(body.decode("utf-8"))
+    except json.JSONDecodeError as exc:
+        raise LLMClientError("LLM response was not valid JSON") from exc
+
+
+def _send_urllib(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    data_bytes: Optional[bytes],
+    timeout: float,
+) -> bytes:
     req = request.Request(
-        url, data=data_bytes, headers=request_headers, method=method.upper()
+        url, data=data_bytes, headers=headers, method=method.upper()
     )
     try:
         with request.urlopen(req, timeout=timeout) as response:
-            body = response.read()
+            return response.read()
     except error.HTTPError as exc:  # pragma: no cover - defensive network guard
         message = exc.read().decode("utf-8", "ignore") if exc.fp else exc.reason
         raise LLMClientError(f"LLM request failed ({exc.code}): {message}") from exc
@@ -93,13 +206,6 @@ def _perform_request(
     except Exception as exc:  # pragma: no cover - defensive network guard
         raise LLMClientError("LLM request failed") from exc
 
-    if not body:
-        return None
-    try:
-        return json.loads(body.decode("utf-8"))
-    except json.JSONDecodeError as exc:
-        raise LLMClientError("LLM response was not valid JSON") from exc
-
 
 def list_models(configuration: LLMConfiguration) -> List[Dict[str, str]]:
     if not configuration.is_configured() and not configuration.base_url.strip():
@@ -33,6 +33,9 @@ _SETTINGS_DEFAULTS: Dict[str, Any] = {
     "llm_timeout": 30.0,
     "llm_prompt": DEFAULT_LLM_PROMPT,
     "llm_context_mode": "sentence",
+    "llm_concurrency": 4,
+    "llm_batch_size": 1,
+    "llm_cache": True,
     "normalization_numbers": True,
     "normalization_numbers_year_style": "american",
     "normalization_currency": True,
@@ -72,6 +75,9 @@ _ENVIRONMENT_KEYS: Dict[str, str] = {
     "llm_timeout": "ABOGEN_LLM_TIMEOUT",
     "llm_prompt": "ABOGEN_LLM_PROMPT",
     "llm_context_mode": "ABOGEN_LLM_CONTEXT_MODE",
+    "llm_concurrency": "ABOGEN_LLM_CONCURRENCY",
+    "llm_batch_size": "ABOGEN_LLM_BATCH_SIZE",
+    "llm_cache": "ABOGEN_LLM_CACHE",
 }
 
 NORMALIZATION_SAMPLE_TEXTS: Dict[str, str] = {
@@ -96,6 +102,8 @@ def _environment_defaults() -> Dict[str, Any]:
             overrides[key] = _coerce_bool(value, default)
         elif isinstance(default, float):
             overrides[key] = _coerce_float(value, float(default))
+        elif isinstance(default, int):
+            overrides[key] = _coerce_int(value, default)
         else:
             overrides[key] = value
     return overrides
@@ -127,6 +135,13 @@ def _coerce_float(value: Any, default: float) -> float:
         return default
 
 
+def _coerce_int(value: Any, default: int) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
 def _apply_llm_migrations(settings: Dict[str, Any]) -> None:
     prompt_value = str(settings.get("llm_prompt") or "")
     if prompt_value.strip() == _LEGACY_REWRITE_ONLY_PROMPT.strip():
@@ -151,6 +166,8 @@ def _extract_settings(source: Mapping[str, Any]) -> Dict[str, Any]:
             extracted[key] = _coerce_bool(raw_value, default)
         elif isinstance(default, float):
             extracted[key] = _coerce_float(raw_value, default)
+        elif isinstance(default, int):
+            extracted[key] = _coerce_int(raw_value, default)
         else:
             extracted[key] = (
                 str(raw_value or "") if isinstance(default, str) else raw_value
@@ -0,0 +1,230 @@
+"""Parallel PDF page-text extraction with a persistent per-file cache.
+
+``PdfParser`` needs the cleaned text of every page before it can show a
+book. Large PDFs are split into page ranges that worker processes extract
+independently, each opening its own ``fitz`` document; results come back in
+page order so callers can consume pages as they arrive. Cleaned page texts
+are stored in a SQLite cache keyed by the file's content hash, so opening the
+same PDF again reads pages straight from disk.
+
+Worker count comes from ``ABOGEN_PDF_WORKERS`` (default: CPU count, at most
+4; ``1`` disables the pool). Cache size comes from
+``ABOGEN_PDF_PAGE_CACHE_MB`` (default 256; ``0`` disables it).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import multiprocessing
+import os
+import re
+import sqlite3
+import zlib
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+import fitz  # PyMuPDF
+
+from abogen.bounded_store import BoundedStore, SharedStore
+from abogen.subtitle_utils import clean_text
+from abogen.utils import get_user_cache_path
+
+logger = logging.getLogger(__name__)
+
+# Pre-compile frequently used regex patterns
+_BRACKETED_NUMBERS_PATTERN = re.compile(r"\[\s*\d+\s*\]")
+_STANDALONE_PAGE_NUMBERS_PATTERN = re.compile(r"^\s*\d+\s*$", re.MULTILINE)
+_PAGE_NUMBERS_AT_END_PATTERN = re.compile(r"\s+\d+\s*$", re.MULTILINE)
+_PAGE_NUMBERS_WITH_DASH_PATTERN = re.compile(
+    r"\s+[-–—]\s*\d+\s*[-–—]?\s*$", re.MULTILINE
+)
+
+# Bump when page cleanup changes so cached texts are not reused.
+_CLEANUP_VERSION = 1
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_PAGE_CACHE_MB = 256
+# Below this many pages, starting worker processes costs more than it saves.
+_PARALLEL_MIN_PAGES = 64
+_PAGES_PER_TASK = 32
+
+
+def clean_pdf_page_text(text: str, replace_single_newlines: bool) -> str:
+    """Clean raw ``get_text()`` output and strip common PDF artifacts."""
+    text = clean_text(text, replace_single_newlines=replace_single_newlines)
+    text = _BRACKETED_NUMBERS_PATTERN.sub("", text)
+    text = _STANDALONE_PAGE_NUMBERS_PATTERN.sub("", text)
+    text = _PAGE_NUMBERS_AT_END_PATTERN.sub("", text)
+    text = _PAGE_NUMBERS_WITH_DASH_PATTERN.sub("", text)
+    return text
+
+
+def _extract_page_range(
+    book_path: str, first: int, stop: int, replace_single_newlines: bool
+) -> List[str]:
+    """Worker entry point: cleaned texts of pages ``first..stop-1``."""
+    with fitz.open(book_path) as document:
+        return [
+            clean_pdf_page_text(document[page_num].get_text(), replace_single_newlines)
+            for page_num in range(first, stop)
+        ]
+
+
+def pdf_page_workers(page_count: int) -> int:
+    """Number of extraction processes to use for a document."""
+    if page_count < _PARALLEL_MIN_PAGES:
+        return 1
+    default = min(os.cpu_count() or 1, DEFAULT_MAX_WORKERS)
+    try:
+        workers = int(os.environ.get("ABOGEN_PDF_WORKERS", default))
+    except ValueError:
+        workers = default
+    return max(1, min(workers, -(-page_count // _PAGES_PER_TASK)))
+
+
+def iter_pdf_page_texts(
+    book_path: str,
+    page_count: int,
+    replace_single_newlines: bool,
+    workers: Optional[int] = None,
+) -> Iterator[str]:
+    """Yield the cleaned text of every page, in page order.
+
+    With more than one worker, page ranges are extracted in a process pool
+    (spawned, so the caller's threads and open documents are not inherited).
+    If the pool cannot be used the remaining pages are extracted in-process.
+    """
+    workers = pdf_page_workers(page_count) if workers is None else workers
+    next_page = 0
+    if workers > 1:
+        ranges = [
+            (first, min(first + _PAGES_PER_TASK, page_count))
+            for first in range(0, page_count, _PAGES_PER_TASK)
+        ]
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ) as pool:
+                futures: List[Future] = [
+                    pool.submit(_extract_page_range, book_path, first, stop, replace_single_newlines)
+                    for first, stop in ranges
+                ]
+                for future in futures:
+                    texts = future.result()
+                    yield from texts
+                    next_page += len(texts)
+        except (OSError, RuntimeError) as e:
+            # BrokenProcessPool is a RuntimeError.
+            logger.warning(f"Parallel PDF extraction failed, continuing in-process: {e}")
+    if next_page < page_count:
+        with fitz.open(book_path) as document:
+            for page_num in range(next_page, page_count):
+                yield clean_pdf_page_text(document[page_num].get_text(), replace_single_newlines)
+
+
+def pdf_cache_key(book_path: str, replace_single_newlines: bool) -> str:
+    """Content hash of the file combined with the cleanup options."""
+    digest = hashlib.sha256()
+    with open(book_path, "rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    digest.update(f"\x1f{_CLEANUP_VERSION}\x1f{int(bool(replace_single_newlines))}".encode())
+    return digest.hexdigest()
+
+
+class PdfPageCache(BoundedStore):
+    """Thread-safe, size-bounded on-disk map of file key -> page texts."""
+
+    table = "books"
+    columns = "page_count INTEGER NOT NULL"
+    child_tables = ("pages",)
+
+    def _create_tables(self) -> None:
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            " key TEXT NOT NULL,"
+            " page INTEGER NOT NULL,"
+            " payload BLOB NOT NULL,"
+            " PRIMARY KEY (key, page))"
+        )
+
+    def iter_pages(self, key: str) -> Optional[Iterator[str]]:
+        """Return an iterator over the cached pages of *key*, or None.
+
+        Only fully stored books are returned; pages are decompressed lazily.
+        """
+        row = self._fetch(key, "page_count")
+        if row is None:
+            return None
+        return self._read_pages(key, row[0])
+
+    def _read_pages(self, key: str, page_count: int) -> Iterator[str]:
+        for first in range(0, page_count, _PAGES_PER_TASK):
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT payload FROM pages WHERE key = ? AND page >= ? AND page < ? ORDER BY page",
+                    (key, first, first + _PAGES_PER_TASK),
+                ).fetchall()
+            for (payload,) in rows:
+                yield zlib.decompress(payload).decode("utf-8")
+
+    def put(self, key: str, pages: List[str]) -> None:
+        """Store all *pages* of a book and evict old books beyond the limit."""
+        payloads = [zlib.compress(text.encode("utf-8")) for text in pages]
+
+        def write_pages(conn: sqlite3.Connection) -> None:
+            conn.executemany(
+                "INSERT INTO pages (key, page, payload) VALUES (?, ?, ?)",
+                [(key, index, payload) for index, payload in enumerate(payloads)],
+            )
+
+        size = sum(len(payload) for payload in payloads)
+        self._store(key, size, {"page_count": len(pages)}, write_pages)
+
+
+_SHARED: SharedStore[PdfPageCache] = SharedStore(
+    lambda max_bytes: PdfPageCache(Path(get_user_cache_path("pdf_pages")) / "pages.sqlite3", max_bytes),
+    "ABOGEN_PDF_PAGE_CACHE_MB",
+    DEFAULT_PAGE_CACHE_MB,
+)
+
+
+def get_pdf_page_cache() -> Optional[PdfPageCache]:
+    """Return the process-wide page cache, or None when disabled or unavailable."""
+    return _SHARED.get()
+
+
+def reset_pdf_page_cache() -> None:
+    """Close the process-wide cache so the next call reopens it."""
+    _SHARED.reset()
+
+
+def load_pdf_page_texts(
+    book_path: str, page_count: int, replace_single_newlines: bool
+) -> Iterator[Tuple[int, str]]:
+    """Yield ``(page_num, text)`` from the cache, or extract and then cache."""
+    cache = get_pdf_page_cache()
+    key = None
+    if cache is not None:
+        try:
+            key = pdf_cache_key(book_path, replace_single_newlines)
+            cached = cache.iter_pages(key)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"PDF page cache unavailable: {e}")
+            cache = cached = None
+        if cached is not None:
+            yield from enumerate(cached)
+            return
+
+    pages: List[str] = []
+    for page_num, text in enumerate(iter_pdf_page_texts(book_path, page_count, replace_single_newlines)):
+        pages.append(text)
+        yield page_num, text
+
+    if cache is not None and key is not None and len(pages) == page_count:
+        try:
+            cache.put(key, pages)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not store PDF pages in cache: {e}")
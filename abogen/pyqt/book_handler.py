@@ -60,8 +60,9 @@ class HandlerDialog(QDialog):
     _merge_chapters_at_end = True
     _save_as_project = False  # New class variable for save_as_project option
 
-    # Cache for processed book content to avoid reprocessing
-    # Key: (book_path, modification_time, file_type)
+    # In-memory cache for processed book content to avoid reprocessing; backed
+    # by abogen.book_cache on disk.
+    # Key: (book_path, modification_time, file_type, replace_single_newlines)
     # Value: dict with content_texts, content_lengths, doc_content (for epub), markdown_toc (for markdown)
     _content_cache = {}
 
@@ -69,6 +70,8 @@ class HandlerDialog(QDialog):
         """Minimal QThread that runs a callable and emits an error string on exception."""
 
         error = pyqtSignal(str)
+        # Emitted with a preliminary nav structure before the content is ready
+        navigation = pyqtSignal(list)
 
         def __init__(self, target_callable):
             super().__init__()
@@ -277,6 +280,7 @@ class HandlerDialog(QDialog):
         self._loader_thread = HandlerDialog._LoaderThread(self._preprocess_content)
         self._loader_thread.finished.connect(self._on_load_finished)
         self._loader_thread.error.connect(self._on_load_error)
+        self._loader_thread.navigation.connect(self._on_navigation_ready)
         # ensure thread instance is deleted when done
         self._loader_thread.finished.connect(self._loader_thread.deleteLater)
         self._loader_thread.start()
@@ -289,8 +293,20 @@ class HandlerDialog(QDialog):
             self.splitter.setVisible(True)
         self._hide_loading_overlay()
 
+    def _on_navigation_ready(self, nav_structure):
+        """Show the table of contents while the pages are still loading."""
+        self.processed_nav_structure = nav_structure
+        self._build_tree()
+        self.treeWidget.expandAll()
+        # Read-only until the content arrives and _on_load_finished rebuilds it
+        self.treeWidget.setEnabled(False)
+        if getattr(self, "splitter", None) is not None:
+            self.splitter.setVisible(True)
+        self._show_loading_overlay("Extracting pages...")
+
     def _on_load_finished(self):
         """Called in the main thread when background loading finished."""
+        self.treeWidget.setEnabled(True)
         # Build the tree now that content_texts/content_lengths/etc. are ready
         try:
             # Rebuild tree based on file type
@@ -344,9 +360,23 @@ class HandlerDialog(QDialog):
 
         cache_key = (self.book_path, mod_time, self.parser.file_type, replace_single_newlines)
 
-        # Check if content is already cached
-        if cache_key in HandlerDialog._content_cache:
-            cached_data = HandlerDialog._content_cache[cache_key]
+        # Check the in-memory cache first, then the on-disk book cache that is
+        # keyed by file content and shared across sessions.
+        disk_key = None
+        cached_data = HandlerDialog._content_cache.get(cache_key)
+        if cached_data is None:
+            from abogen import book_cache
+
+            disk_key, record = book_cache.lookup(
+                self.book_path, "parser", self.parser.file_type, replace_single_newlines
+            )
+            if record is not None:
+                cached_data, cover = record
+                if cover:
+                    cached_data["book_metadata"]["cover_image"] = cover
+                HandlerDialog._content_cache[cache_key] = cached_data
+
+        if cached_data is not None:
             self.content_texts = cached_data["content_texts"]
             self.content_lengths = cached_data["content_lengths"]
             if "processed_nav_structure" in cached_data:
@@ -365,7 +395,14 @@ class HandlerDialog(QDialog):
 
         # Process content if not cached
         try:
-            self.parser.process_content(replace_single_newlines=replace_single_newlines)
+            if self.parser.file_type == "pdf":
+                # The TOC is known before the pages; show it while they load.
+                self.parser.process_content(
+                    replace_single_newlines=replace_single_newlines,
+                    on_navigation=self._loader_thread.navigation.emit,
+                )
+            else:
+                self.parser.process_content(replace_single_newlines=replace_single_newlines)
             self.content_texts = self.parser.content_texts
             self.content_lengths = self.parser.content_lengths
             self.processed_nav_structure = self.parser.processed_nav_structure
@@ -385,6 +422,13 @@ class HandlerDialog(QDialog):
         }
 
         HandlerDialog._content_cache[cache_key] = cache_data
+        if self.content_texts:
+            from abogen import book_cache
+
+            # Cover bytes go in their own column; the rest is stored as JSON.
+            metadata = dict(self.book_metadata or {})
+            cover = metadata.pop("cover_image", None)
+            book_cache.store(disk_key, {**cache_data, "book_metadata": metadata}, cover)
         logging.info(f"Cached content for {os.path.basename(self.book_path)}")
 
 
@@ -27,6 +27,7 @@ from abogen.domain.enums import Language
 from abogen.domain.subtitle_processor import (
     parse_subtitle_file,
     process_subtitle_entries,
+    subtitle_workers,
 )
 from abogen.domain.output_paths import (
     resolve_output_directory,
@@ -35,7 +36,9 @@ from abogen.domain.output_paths import (
 )
 from abogen.domain.audio_helpers import build_ffmpeg_command, to_float32
 from abogen.domain.audio_sink import open_audio_sink
+from abogen.domain.pipeline_factory import create_pipeline_for_job
 from abogen.domain.conversion_engine import run_tts_segment_loop, synthesize_text, SynthParams, SegmentStats, SegmentInfo
+from abogen.domain.segment_cache import get_segment_cache
 from abogen.domain.intro_outro import resolve_intro, resolve_outro
 from abogen.domain.audio_buffer import (
     create_silence,
@@ -1011,6 +1014,7 @@ class ConversionThread(QThread):
                             max_subtitle_words=self.max_subtitle_words,
                             language=self.lang_code,
                             use_spacy_segmentation=getattr(self, "use_spacy_segmentation", False),
+                            segment_cache=get_segment_cache(),
                         )
 
                         try:
@@ -1241,8 +1245,8 @@ class ConversionThread(QThread):
             # Load voice
             loaded_voice = resolve_voice(self.voice, tts, self.use_gpu)
 
-            # Process all subtitles via domain
-            audio_buffer = process_subtitle_entries(
+            # Process all subtitles via domain; audio streams into the sink
+            process_subtitle_entries(
                 subtitles,
                 backend=self.backend,
                 voice=loaded_voice,
@@ -1254,6 +1258,11 @@ class ConversionThread(QThread):
                 use_gaps=getattr(self, "use_silent_gaps", False),
                 is_timestamp_text=is_timestamp_text,
                 subtitle_speed_method=getattr(self, "subtitle_speed_method", "tts"),
+                audio_sink=merged_sink,
+                backend_factory=lambda: create_pipeline_for_job(
+                    "kokoro", language=self.lang_code, use_gpu=self.use_gpu
+                ),
+                workers=subtitle_workers(),
             )
 
             if self.cancel_requested:
@@ -1272,10 +1281,8 @@ class ConversionThread(QThread):
                 )
                 subtitle_writer.write_entry(start_time, end_time, display_text)
 
-            # Write the complete audio buffer
             self.log_updated.emit(("\nFinalizing audio. Please wait...", "grey"))
             if merged_sink:
-                merged_sink.write(to_float32(audio_buffer))
                 merged_sink.close()
 
             if subtitle_writer:
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import bisect
 import os
 import logging
-from dataclasses import dataclass
-from functools import lru_cache
-from typing import Any, Dict, Optional, Tuple
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 # spaCy is intentionally NOT imported at module level: importing it pulls in
-# thinc -> torch, which costs seconds of startup time. It is imported lazily
-# inside _load_spacy_model below.
+# thinc -> torch, which costs seconds of startup time. Models come lazily from
+# the registry in abogen.spacy_utils.
 
 # Lazy spaCy type hints to avoid a hard dependency at import time.
 Language = Any  # type: ignore[assignment]
@@ -34,38 +37,59 @@ class ContractionResolution:
 _DEFAULT_MODEL = os.environ.get("ABOGEN_SPACY_MODEL", "en_core_web_sm")
 
 
-@lru_cache(maxsize=1)
+# Models that failed to load, so each is only attempted (and reported) once.
+_UNAVAILABLE_MODELS: Set[str] = set()
+
+
 def _load_spacy_model(model: str = _DEFAULT_MODEL) -> Optional[Language]:
-    try:  # pragma: no cover - optional dependency
-        import spacy
-    except Exception:  # pragma: no cover - spaCy unavailable at runtime
-        logger.debug("spaCy is not installed; skipping contraction disambiguation")
+    """Shared view of *model* without NER, from the process-wide registry."""
+    if model in _UNAVAILABLE_MODELS:
         return None
+    from abogen.spacy_utils import pipeline_view
 
     try:
-        nlp = spacy.load(model)
+        return pipeline_view(model, exclude=("ner",))
+    except ImportError:  # pragma: no cover - spaCy unavailable at runtime
+        logger.debug("spaCy is not installed; skipping contraction disambiguation")
     except Exception as exc:  # pragma: no cover - depends on environment
         logger.warning("Failed to load spaCy model '%s': %s", model, exc)
-        return None
-    return nlp
+    _UNAVAILABLE_MODELS.add(model)
+    return None
 
 
-def resolve_ambiguous_contractions(
-    text: str, *, model: Optional[str] = None
-) -> Dict[Tuple[int, int], ContractionResolution]:
-    """Use spaCy to disambiguate ambiguous contractions in *text*.
+# Sentence ends: terminal punctuation (plus closing quotes/brackets) followed
+# by whitespace, or a blank line. Only used to pick what to parse, so it can
+# be cruder than spaCy's own segmentation.
+_SENTENCE_BREAK_RE = re.compile(r"[.!?\u2026]+[\"'\u201d\u2019)\]]*\s+|\n\s*\n")
+_CANDIDATE_RE = re.compile(r"\w'[sd]\b", re.IGNORECASE)
 
-    Returns a mapping from (start, end) spans to their resolved expansion.
-    Only ambiguous `'s` and `'d` contractions are considered.
-    """
-    if not text:
-        return {}
+_PIPE_BATCH_SIZE = 64
+_MEMO_LIMIT = 4096
 
-    nlp = _load_spacy_model(model or _DEFAULT_MODEL)
-    if nlp is None:
-        return {}
+# (model, sentence) -> resolutions with sentence-relative offsets, LRU order.
+_SENTENCE_MEMO: "OrderedDict[Tuple[str, str], Tuple[ContractionResolution, ...]]" = OrderedDict()
+_MEMO_LOCK = threading.Lock()
 
-    doc = nlp(text)
+
+def _sentence_spans(text: str, positions: Iterable[int]) -> List[Tuple[int, int]]:
+    """``(start, end)`` of each sentence of *text* containing a position."""
+    bounds = [0]
+    bounds.extend(match.end() for match in _SENTENCE_BREAK_RE.finditer(text))
+    bounds.append(len(text))
+    spans: List[Tuple[int, int]] = []
+    for position in sorted(set(positions)):
+        index = bisect.bisect_right(bounds, position) - 1
+        start, end = bounds[index], bounds[min(index + 1, len(bounds) - 1)]
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        if start < end and (not spans or spans[-1] != (start, end)):
+            spans.append((start, end))
+    return spans
+
+
+def _resolve_doc(doc: Any) -> Tuple[ContractionResolution, ...]:
     resolutions: Dict[Tuple[int, int], ContractionResolution] = {}
     for token in doc:
         if token.text == "'s":
@@ -80,6 +104,67 @@ def resolve_ambiguous_contractions(
 
         if resolution.span not in resolutions:
             resolutions[resolution.span] = resolution
+    return tuple(resolutions.values())
+
+
+def _shifted(resolution: ContractionResolution, offset: int) -> ContractionResolution:
+    return replace(resolution, start=resolution.start + offset, end=resolution.end + offset)
+
+
+def resolve_ambiguous_contractions(
+    text: str,
+    *,
+    model: Optional[str] = None,
+    positions: Optional[Iterable[int]] = None,
+) -> Dict[Tuple[int, int], ContractionResolution]:
+    """Use spaCy to disambiguate ambiguous contractions in *text*.
+
+    Returns a mapping from (start, end) spans to their resolved expansion.
+    Only ambiguous `'s` and `'d` contractions are considered.
+
+    Only the sentences containing *positions* (character offsets of the
+    ambiguous tokens; by default every `'s`/`'d`) are parsed. They go through
+    ``nlp.pipe`` in one batch, and results are memoised per sentence, so
+    repeated sentences are never parsed twice.
+    """
+    if not text:
+        return {}
+
+    if positions is None:
+        positions = [match.start() for match in _CANDIDATE_RE.finditer(text)]
+    spans = _sentence_spans(text, positions)
+    if not spans:
+        return {}
+
+    model_name = model or _DEFAULT_MODEL
+    nlp = _load_spacy_model(model_name)
+    if nlp is None:
+        return {}
+
+    sentences = [text[start:end] for start, end in spans]
+    found: Dict[str, Tuple[ContractionResolution, ...]] = {}
+    with _MEMO_LOCK:
+        for sentence in sentences:
+            cached = _SENTENCE_MEMO.get((model_name, sentence))
+            if cached is not None:
+                _SENTENCE_MEMO.move_to_end((model_name, sentence))
+                found[sentence] = cached
+
+    missing = list(dict.fromkeys(sentence for sentence in sentences if sentence not in found))
+    if missing:
+        for sentence, doc in zip(missing, nlp.pipe(missing, batch_size=_PIPE_BATCH_SIZE)):
+            found[sentence] = _resolve_doc(doc)
+        with _MEMO_LOCK:
+            for sentence in missing:
+                _SENTENCE_MEMO[(model_name, sentence)] = found[sentence]
+            while len(_SENTENCE_MEMO) > _MEMO_LIMIT:
+                _SENTENCE_MEMO.popitem(last=False)
+
+    resolutions: Dict[Tuple[int, int], ContractionResolution] = {}
+    for (start, _), sentence in zip(spans, sentences):
+        for resolution in found[sentence]:
+            shifted = _shifted(resolution, start)
+            resolutions.setdefault(shifted.span, shifted)
     return resolutions
 
 
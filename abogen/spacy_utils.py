@@ -1,12 +1,54 @@
 """
-Lazy-loaded spaCy utilities for sentence segmentation.
+Lazy-loaded spaCy utilities: a process-wide model registry and sentence
+segmentation.
+
+Every spaCy consumer (segmentation, contraction disambiguation, entity and
+heteronym analysis) goes through one registry, so each model is loaded once
+per process with all of its components. Consumers get a ``PipelineView``
+that runs only the components they need; views never modify the shared
+pipeline, so any number of threads can use them at once. Idle models can be
+evicted with ``evict_models`` and ``model_memory_report`` describes what is
+resident.
+
+Three segmentation modes are available (``ABOGEN_SPACY_SEGMENTER``):
+
+* ``parser`` (default): sentences from the dependency parser. Most accurate
+  with quotes, parentheses and complex structure, and slowest.
+* ``senter``: the model's trained sentence recognizer instead of the
+  parser; several times faster at a small cost in agreement.
+* ``sentencizer``: punctuation rules on a blank pipeline; needs no model.
+
+Segmentation views are cached per (language, mode) and shared by all threads.
 """
 
+import itertools
+import os
+import threading
+import time
+
 from abogen.domain.enums import Language
 
-# Cached spaCy module and models (lazy loaded)
+# Cached spaCy module (lazy loaded)
 _spacy = None
+# Segmentation views per (language, mode)
 _nlp_cache = {}
+_nlp_lock = threading.Lock()
+
+# Loaded models by name; guarded by _registry_lock.
+_registry = {}
+_registry_lock = threading.RLock()
+
+# Prefix for registry names that build a blank pipeline, e.g. "blank:en".
+BLANK_PREFIX = "blank:"
+
+# Components that assign sentence boundaries.
+_SENTENCE_COMPONENTS = {"parser", "senter", "sentencizer"}
+
+SEGMENTATION_MODES = ("parser", "senter", "sentencizer")
+DEFAULT_SEGMENTATION_MODE = "parser"
+
+# Components never needed for segmentation.
+_SEGMENTATION_EXCLUDED = ["ner", "tagger", "lemmatizer", "attribute_ruler"]
 
 # Language code to spaCy model mapping
 SPACY_MODELS = {
@@ -34,16 +76,260 @@ def _load_spacy():
     return _spacy
 
 
-def get_spacy_model(language: Language, log_callback=None):
+class _ModelEntry:
+    """A loaded pipeline and its bookkeeping."""
+
+    def __init__(self, name, nlp, rss_delta):
+        self.name = name
+        self.nlp = nlp
+        self.rss_delta = rss_delta
+        self.loaded_at = time.time()
+        self.last_used = time.monotonic()
+        self.views = {}
+
+
+class PipelineView:
+    """Runs a subset of a shared pipeline's components, in pipeline order.
+
+    Components disabled in the loaded model (such as ``senter``) can be
+    included. ``extra`` holds standalone components that run after the
+    selected ones. Holding a view keeps its model alive after eviction.
+    """
+
+    def __init__(self, entry, components, extra=()):
+        self._entry = entry
+        self.nlp = entry.nlp
+        self.model_name = entry.name
+        self.pipe_names = [name for name, _ in components] + [name for name, _ in extra]
+        self._procs = [proc for _, proc in components] + [proc for _, proc in extra]
+        self._native = not extra and all(name in self.nlp.pipe_names for name, _ in components)
+
+    @property
+    def max_length(self):
+        return self.nlp.max_length
+
+    @max_length.setter
+    def max_length(self, value):
+        # Shared by every view of the model, so it is only ever raised.
+        self.nlp.max_length = max(self.nlp.max_length, value)
+
+    def __call__(self, text):
+        self._entry.last_used = time.monotonic()
+        doc = self.nlp.make_doc(text)
+        for proc in self._procs:
+            doc = proc(doc)
+        return doc
+
+    def pipe(self, texts, *, as_tuples=False, batch_size=None, n_process=1):
+        """Like ``Language.pipe`` restricted to this view's components."""
+        self._entry.last_used = time.monotonic()
+        if self._native:
+            disable = [name for name in self.nlp.pipe_names if name not in self.pipe_names]
+            return self.nlp.pipe(
+                texts, as_tuples=as_tuples, batch_size=batch_size, n_process=n_process, disable=disable
+            )
+        if as_tuples:
+            pairs, contexts = itertools.tee(texts)
+            docs = self._pipe_docs((text for text, _ in pairs), batch_size)
+            return zip(docs, (context for _, context in contexts))
+        return self._pipe_docs(texts, batch_size)
+
+    def _pipe_docs(self, texts, batch_size):
+        docs = (self.nlp.make_doc(text) for text in texts)
+        for proc in self._procs:
+            if hasattr(proc, "pipe"):
+                docs = proc.pipe(docs, batch_size=batch_size or self.nlp.batch_size)
+            else:
+                docs = map(proc, docs)
+        return docs
+
+
+def _resident_bytes():
+    try:
+        import psutil
+    except ImportError:
+        return None
+    try:
+        return psutil.Process().memory_info().rss
+    except Exception:
+        return None
+
+
+def _load_pipeline(spacy, model_name):
+    if model_name.startswith(BLANK_PREFIX):
+        return spacy.blank(model_name[len(BLANK_PREFIX):])
+    # Every component is loaded, including ones disabled by default, so one
+    # instance serves every consumer.
+    return spacy.load(model_name)
+
+
+def load_model(model_name):
+    """Return the shared pipeline for *model_name*, loading it on first use.
+
+    Raises ``ImportError`` when spaCy is missing and ``OSError`` when the
+    model is not installed.
+    """
+    return _acquire(model_name).nlp
+
+
+def _acquire(model_name):
+    with _registry_lock:
+        entry = _registry.get(model_name)
+        if entry is None:
+            spacy = _load_spacy()
+            if spacy is None:
+                raise ImportError("spaCy is not installed")
+            before = _resident_bytes()
+            nlp = _load_pipeline(spacy, model_name)
+            after = _resident_bytes()
+            rss_delta = after - before if before is not None and after is not None else None
+            entry = _registry[model_name] = _ModelEntry(model_name, nlp, rss_delta)
+        entry.last_used = time.monotonic()
+        return entry
+
+
+def pipeline_view(model_name, *, include=None, exclude=(), sentences=False):
+    """Return a cached view of *model_name* running only some components.
+
+    Args:
+        model_name: Installed model package, or ``"blank:<lang>"``.
+        include: Component names to run; defaults to the components the
+            model enables by default.
+        exclude: Component names to leave out.
+        sentences: Add a rule-based sentencizer when no selected component
+            assigns sentence boundaries.
+
+    Raises ``ImportError``/``OSError`` like ``load_model``.
+    """
+    key = (tuple(include) if include is not None else None, tuple(exclude), sentences)
+    with _registry_lock:
+        entry = _acquire(model_name)
+        view = entry.views.get(key)
+        if view is None:
+            nlp = entry.nlp
+            wanted = set(nlp.pipe_names if include is None else include) - set(exclude)
+            components = [(name, proc) for name, proc in nlp.components if name in wanted]
+            extra = []
+            if sentences and not _SENTENCE_COMPONENTS & {name for name, _ in components}:
+                from spacy.pipeline import Sentencizer
+
+                extra.append(("sentencizer", Sentencizer()))
+            view = entry.views[key] = PipelineView(entry, components, extra)
+        return view
+
+
+def evict_models(max_idle_seconds=None):
+    """Drop models unused for at least *max_idle_seconds* (all when None).
+
+    Returns the evicted model names. Memory is released once no caller
+    still holds a view of the model.
+    """
+    now = time.monotonic()
+    with _registry_lock:
+        evicted = [
+            name
+            for name, entry in _registry.items()
+            if max_idle_seconds is None or now - entry.last_used >= max_idle_seconds
+        ]
+        for name in evicted:
+            del _registry[name]
+    if evicted:
+        with _nlp_lock:
+            for key, view in list(_nlp_cache.items()):
+                if view.model_name in evicted:
+                    del _nlp_cache[key]
+    return evicted
+
+
+def _weights_bytes(nlp):
+    """Bytes held by the parameters of every component plus vectors."""
+    total = 0
+    seen = set()
+    for _, proc in nlp.components:
+        model = getattr(proc, "model", None)
+        if model is None or not hasattr(model, "walk"):
+            continue
+        for node in model.walk():
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            for param in node.param_names:
+                if node.has_param(param):
+                    total += getattr(node.get_param(param), "nbytes", 0)
+    vectors = getattr(nlp.vocab, "vectors", None)
+    total += getattr(getattr(vectors, "data", None), "nbytes", 0) or 0
+    return total
+
+
+def model_memory_report():
+    """Describe every resident model, for diagnostics.
+
+    ``weights_bytes`` counts component parameters and vectors;
+    ``rss_delta_bytes`` is the process growth measured while loading (None
+    without psutil).
+    """
+    now = time.monotonic()
+    with _registry_lock:
+        entries = list(_registry.values())
+    return [
+        {
+            "model": entry.name,
+            "components": list(entry.nlp.component_names),
+            "views": sorted({", ".join(view.pipe_names) for view in entry.views.values()}),
+            "weights_bytes": _weights_bytes(entry.nlp),
+            "rss_delta_bytes": entry.rss_delta,
+            "loaded_at": entry.loaded_at,
+            "idle_seconds": round(now - entry.last_used, 1),
+        }
+        for entry in entries
+    ]
+
+
+def segmentation_mode():
+    """Segmentation mode from ``ABOGEN_SPACY_SEGMENTER`` (default ``parser``)."""
+    mode = os.environ.get("ABOGEN_SPACY_SEGMENTER", DEFAULT_SEGMENTATION_MODE).strip().lower()
+    return mode if mode in SEGMENTATION_MODES else DEFAULT_SEGMENTATION_MODE
+
+
+def _segmentation_source(model_name, mode):
+    """Registry name loaded for *mode*: a blank pipeline for ``sentencizer``."""
+    if mode == "sentencizer":
+        return BLANK_PREFIX + model_name.split("_", 1)[0]
+    return model_name
+
+
+def _segmentation_view(model_name, mode):
+    """View of *model_name* for *mode*; raises OSError if the model is missing."""
+    if mode == "sentencizer":
+        return pipeline_view(_segmentation_source(model_name, mode), sentences=True)
+
+    if mode == "senter":
+        nlp = load_model(model_name)
+        include = [
+            name
+            for name in nlp.component_names
+            if name == "senter" or (name in nlp.pipe_names and name not in ["parser"] + _SEGMENTATION_EXCLUDED)
+        ]
+        return pipeline_view(model_name, include=include, sentences=True)
+
+    # The parser handles sentence segmentation involving parentheses,
+    # quotes, and complex structure. We only skip heavier components we
+    # don't need like NER.
+    return pipeline_view(model_name, exclude=_SEGMENTATION_EXCLUDED, sentences=True)
+
+
+def get_spacy_model(language: Language, log_callback=None, mode=None):
     """
     Get or load a spaCy model for the given language.
 
     Args:
         language: Language enum value.
         log_callback: Optional function to log messages
+        mode: Segmentation mode (see module docstring); defaults to
+            ``segmentation_mode()``.
 
     Returns:
-        Loaded spaCy model or None if unavailable
+        ``PipelineView`` of the shared model, or None if unavailable
     """
 
     def log(msg, is_error=False):
@@ -61,8 +347,11 @@ def get_spacy_model(language: Language, log_callback=None):
             f"language must be Language enum, got {type(language).__name__}: {language!r}"
         )
 
-    if language in _nlp_cache:
-        return _nlp_cache[language]
+    mode = mode or segmentation_mode()
+    cache_key = (language, mode)
+    cached = _nlp_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
     model_name = SPACY_MODELS.get(language)
     if not model_name:
@@ -75,53 +364,41 @@ def get_spacy_model(language: Language, log_callback=None):
         log("\nspaCy: Module not installed, falling back to default segmentation...")
         return None
 
-    # Try to load the model
-    try:
-        log(f"\nLoading spaCy model '{model_name}'...")
-        # sentence segmentation involving parentheses, quotes, and complex structure.
-        # We only disable heavier components we don't need like NER.
-        nlp = spacy.load(
-            model_name,
-            disable=["ner", "tagger", "lemmatizer", "attribute_ruler"],
-        )
-
-        # Ensure a sentence segmentation strategy is in place
-        # The parser provides sents, but if it's missing (unlikely for core models), fallback to sentencizer
-        if "parser" not in nlp.pipe_names and "sentencizer" not in nlp.pipe_names:
-            nlp.add_pipe("sentencizer")
+    # One loader at a time, so concurrent jobs share a single instance.
+    with _nlp_lock:
+        cached = _nlp_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        _nlp_cache[language] = nlp
-        return nlp
-    except OSError:
-        # Model not found, attempt download
-        log(f"\nspaCy: Downloading model '{model_name}'...")
+        # Try to load the model
         try:
-            from spacy.cli import download
-
-            download(model_name)
-            # Retry loading with the same fix
-            nlp = spacy.load(
-                model_name,
-                disable=["ner", "tagger", "lemmatizer", "attribute_ruler"],
-            )
-            if "parser" not in nlp.pipe_names and "sentencizer" not in nlp.pipe_names:
-                nlp.add_pipe("sentencizer")
-
-            _nlp_cache[language] = nlp
-            log(f"spaCy model '{model_name}' downloaded and loaded")
+            log(f"\nLoading spaCy model '{_segmentation_source(model_name, mode)}' ({mode} segmentation)...")
+            nlp = _segmentation_view(model_name, mode)
+            _nlp_cache[cache_key] = nlp
             return nlp
+        except OSError:
+            # Model not found, attempt download
+            log(f"\nspaCy: Downloading model '{model_name}'...")
+            try:
+                from spacy.cli import download
+
+                download(model_name)
+                nlp = _segmentation_view(model_name, mode)
+                _nlp_cache[cache_key] = nlp
+                log(f"spaCy model '{model_name}' downloaded and loaded")
+                return nlp
+            except Exception as e:
+                log(
+                    f"\nspaCy: Failed to download model '{model_name}': {e}...",
+                    is_error=True,
+                )
+                return None
         except Exception as e:
-            log(
-                f"\nspaCy: Failed to download model '{model_name}': {e}...",
-                is_error=True,
-            )
+            log(f"\nspaCy: Error loading model '{model_name}': {e}...", is_error=True)
             return None
-    except Exception as e:
-        log(f"\nspaCy: Error loading model '{model_name}': {e}...", is_error=True)
-        return None
 
 
-def segment_sentences(text, language: Language, log_callback=None):
+def segment_sentences(text, language: Language, log_callback=None, mode=None):
     """
     Segment text into sentences using spaCy.
 
@@ -129,11 +406,12 @@ def segment_sentences(text, language: Language, log_callback=None):
         text: Text to segment
         language: Language enum value
         log_callback: Optional function to log messages
+        mode: Segmentation mode; defaults to ``segmentation_mode()``
 
     Returns:
         List of sentence strings, or None if spaCy unavailable
     """
-    nlp = get_spacy_model(language, log_callback)
+    nlp = get_spacy_model(language, log_callback, mode=mode)
     if nlp is None:
         return None
 
@@ -157,6 +435,7 @@ def is_spacy_available():
 
 
 def clear_cache():
-    """Clear the model cache to free memory."""
-    global _nlp_cache
-    _nlp_cache.clear()
+    """Evict every model and segmentation view to free memory."""
+    with _nlp_lock:
+        _nlp_cache.clear()
+    evict_models()
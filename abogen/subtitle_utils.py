@@ -36,12 +36,13 @@ def clean_subtitle_text(text):
 
 
 
-def clean_text(text, *args, **kwargs):
+def clean_text(text, *args, replace_single_newlines=None, **kwargs):
     # Remove metadata tags first
     text = _METADATA_TAG_PATTERN.sub("", text)
-    # Load replace_single_newlines from config
-    cfg = load_config()
-    replace_single_newlines = cfg.get("replace_single_newlines", True)
+    # Load replace_single_newlines from config unless the caller resolved it
+    if replace_single_newlines is None:
+        cfg = load_config()
+        replace_single_newlines = cfg.get("replace_single_newlines", True)
     # Collapse all whitespace (excluding newlines) into single spaces per line and trim edges
     # Use pre-compiled pattern for better performance
     lines = [_WHITESPACE_PATTERN.sub(" ", line).strip() for line in text.splitlines()]
@@ -5,18 +5,18 @@ import logging
 import mimetypes
 import re
 import textwrap
-import urllib.parse
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
+from typing import Dict, List, Optional, Tuple
 
 import ebooklib  # type: ignore[import]
 import fitz  # type: ignore[import]
 import markdown  # type: ignore[import]
-from bs4 import BeautifulSoup, NavigableString  # type: ignore[import]
+from bs4 import BeautifulSoup  # type: ignore[import]
 from ebooklib import epub  # type: ignore[import]
 
-from .utils import clean_text, detect_encoding
+from .epub_content import EpubDocuments, document_text, find_doc_key, html_to_text
+from .utils import clean_text, detect_encoding, load_config
 from .domain.text_utils import calculate_text_length
 
 logger = logging.getLogger(__name__)
@@ -220,18 +220,20 @@ def _build_metadata_payload(
 
 
 def _extract_pdf(path: Path) -> ExtractionResult:
+    # pdf_pages imports subtitle_utils, which imports this module.
+    from .pdf_pages import load_pdf_page_texts
+
     metadata_source = MetadataSource()
     chapters: List[ExtractedChapter] = []
     with fitz.open(str(path)) as document:
         metadata_source = _collect_pdf_metadata(document)
-        pages = cast(Iterable[fitz.Page], document)
-        for index, page in enumerate(pages):
-            page_obj = cast(Any, page)
-            text = _clean_pdf_text(page_obj.get_text())
-            if not text:
-                continue
-            title = f"Page {index + 1}"
-            chapters.append(ExtractedChapter(title=title, text=text))
+        page_count = len(document)
+    replace_single_newlines = load_config().get("replace_single_newlines", False)
+    for index, text in load_pdf_page_texts(str(path), page_count, replace_single_newlines):
+        text = text.strip()
+        if not text:
+            continue
+        chapters.append(ExtractedChapter(title=f"Page {index + 1}", text=text))
     if not chapters:
         chapters.append(ExtractedChapter(title=path.stem, text=""))
     metadata = _build_metadata_payload(metadata_source, len(chapters), "pdf", path.stem)
@@ -266,15 +268,6 @@ def _collect_pdf_metadata(document: fitz.Document) -> MetadataSource:
     return metadata
 
 
-def _clean_pdf_text(text: str) -> str:
-    cleaned = clean_text(text)
-    cleaned = re.sub(r"\[\s*\d+\s*\]", "", cleaned)
-    cleaned = re.sub(r"^\s*\d+\s*$", "", cleaned, flags=re.MULTILINE)
-    cleaned = re.sub(r"\s+\d+\s*$", "", cleaned, flags=re.MULTILINE)
-    cleaned = re.sub(r"\s+[-–—]\s*\d+\s*[-–—]?\s*$", "", cleaned, flags=re.MULTILINE)
-    return cleaned.strip()
-
-
 def _extract_markdown(path: Path) -> ExtractionResult:
     encoding = detect_encoding(str(path))
     raw = path.read_text(encoding=encoding, errors="replace")
@@ -407,8 +400,9 @@ class EpubExtractor:
     def __init__(self, path: Path) -> None:
         self.path = path
         self.book = epub.read_epub(str(path))
-        self.doc_content: Dict[str, str] = {}
-        self.spine_docs: List[str] = []
+        self.documents = EpubDocuments(self.book)
+        self.doc_content: Dict[str, str] = self.documents.content
+        self.spine_docs: List[str] = self.documents.spine_docs
 
     def extract(self) -> ExtractionResult:
         metadata_source = self._collect_metadata()
@@ -580,14 +574,9 @@ class EpubExtractor:
         nav_content = nav_item.get_content().decode("utf-8", errors="ignore")
         nav_soup = BeautifulSoup(nav_content, parser_type)
 
-        self.spine_docs = self._build_spine_docs()
-        doc_order = {href: index for index, href in enumerate(self.spine_docs)}
-        doc_order_decoded = {
-            urllib.parse.unquote(href): index for href, index in doc_order.items()
-        }
-
-        nav_targets = self._collect_nav_targets(nav_soup, nav_type)
-        self._cache_relevant_documents(doc_order, nav_targets)
+        doc_order = self.documents.doc_order
+        doc_order_decoded = self.documents.doc_order_decoded
+        self.documents.load(self._collect_nav_targets(nav_soup, nav_type))
 
         ordered_entries: List[NavEntry] = []
         if nav_type == "ncx":
@@ -625,30 +614,17 @@ class EpubExtractor:
 
     def _process_spine_fallback(self) -> List[ExtractedChapter]:
         chapters: List[ExtractedChapter] = []
-        self.spine_docs = self._build_spine_docs()
-        self.doc_content = {}
-
-        for item in self.book.get_items_of_type(ebooklib.ITEM_DOCUMENT):
-            href = item.get_name()
-            if href not in self.spine_docs:
-                continue
-            try:
-                html_content = item.get_content().decode("utf-8", errors="ignore")
-            except Exception as exc:
-                logger.error("Error decoding EPUB document %s: %s", href, exc)
-                html_content = ""
-            self.doc_content[href] = html_content
+        self.documents.load()
 
         for index, doc_href in enumerate(self.spine_docs):
             html_content = self.doc_content.get(doc_href, "")
             if not html_content:
                 continue
-            text = self._html_to_text(html_content)
+            text, title = document_text(
+                html_content, fallback_title=f"Untitled Chapter {index + 1}"
+            )
             if not text:
                 continue
-            title = self._resolve_document_title(
-                html_content, fallback=f"Untitled Chapter {index + 1}"
-            )
             chapters.append(ExtractedChapter(title=title, text=text))
         return chapters
 
@@ -719,15 +695,6 @@ class EpubExtractor:
 
         return nav_item, nav_type
 
-    def _build_spine_docs(self) -> List[str]:
-        docs: List[str] = []
-        for spine_entry in self.book.spine:
-            item_id = spine_entry[0]
-            item = self.book.get_item_with_id(item_id)
-            if item:
-                docs.append(item.get_name())
-        return docs
-
     def _collect_nav_targets(self, nav_soup: BeautifulSoup, nav_type: str) -> List[str]:
         targets: List[str] = []
         if nav_type == "ncx":
@@ -744,26 +711,6 @@ class EpubExtractor:
                     targets.append(href_value.split("#", 1)[0])
         return targets
 
-    def _cache_relevant_documents(
-        self, doc_order: Dict[str, int], nav_targets: List[str]
-    ) -> None:
-        needed: set[str] = set(doc_order.keys())
-        for target in nav_targets:
-            needed.add(target)
-            needed.add(urllib.parse.unquote(target))
-
-        self.doc_content = {}
-        for item in self.book.get_items_of_type(ebooklib.ITEM_DOCUMENT):
-            href = item.get_name()
-            if href not in needed and urllib.parse.unquote(href) not in needed:
-                continue
-            try:
-                html_content = item.get_content().decode("utf-8", errors="ignore")
-            except Exception as exc:
-                logger.error("Error decoding EPUB document %s: %s", href, exc)
-                html_content = ""
-            self.doc_content[href] = html_content
-
     def _parse_ncx_navpoint(
         self,
         nav_point,
@@ -782,11 +729,9 @@ class EpubExtractor:
 
         if src:
             base_href, fragment = src.split("#", 1) if "#" in src else (src, None)
-            doc_key, doc_idx = self._find_doc_key(
-                base_href, doc_order, doc_order_decoded
-            )
+            doc_key, doc_idx = find_doc_key(base_href, doc_order, doc_order_decoded)
             if doc_key is not None and doc_idx is not None:
-                position = self._find_position_robust(doc_key, fragment)
+                position = self.documents.position(doc_key, fragment)
                 ordered_entries.append(
                     NavEntry(
                         src=src,
@@ -835,11 +780,9 @@ class EpubExtractor:
 
         if src:
             base_href, fragment = src.split("#", 1) if "#" in src else (src, None)
-            doc_key, doc_idx = self._find_doc_key(
-                base_href, doc_order, doc_order_decoded
-            )
+            doc_key, doc_idx = find_doc_key(base_href, doc_order, doc_order_decoded)
             if doc_key is not None and doc_idx is not None:
-                position = self._find_position_robust(doc_key, fragment)
+                position = self.documents.position(doc_key, fragment)
                 ordered_entries.append(
                     NavEntry(
                         src=src,
@@ -862,67 +805,6 @@ class EpubExtractor:
                     child_li, ordered_entries, doc_order, doc_order_decoded
                 )
 
-    def _find_doc_key(
-        self,
-        base_href: str,
-        doc_order: Dict[str, int],
-        doc_order_decoded: Dict[str, int],
-    ) -> Tuple[Optional[str], Optional[int]]:
-        candidates = {base_href, urllib.parse.unquote(base_href)}
-        base_name = urllib.parse.unquote(base_href).split("/")[-1].lower()
-        for key in list(doc_order.keys()) + list(doc_order_decoded.keys()):
-            if key.split("/")[-1].lower() == base_name:
-                candidates.add(key)
-        for candidate in candidates:
-            if candidate in doc_order:
-                return candidate, doc_order[candidate]
-            if candidate in doc_order_decoded:
-                return candidate, doc_order_decoded[candidate]
-        return None, None
-
-    def _find_position_robust(self, doc_href: str, fragment_id: Optional[str]) -> int:
-        if doc_href not in self.doc_content:
-            logger.warning("Document '%s' not found in cached EPUB content.", doc_href)
-            return 0
-        html_content = self.doc_content[doc_href]
-        if not fragment_id:
-            return 0
-
-        try:
-            temp_soup = BeautifulSoup(f"<div>{html_content}</div>", "html.parser")
-            target_element = temp_soup.find(id=fragment_id)
-            if target_element:
-                tag_str = str(target_element)
-                pos = html_content.find(tag_str[: min(len(tag_str), 200)])
-                if pos != -1:
-                    return pos
-        except Exception:
-            logger.debug(
-                "BeautifulSoup failed to locate id '%s' in %s", fragment_id, doc_href
-            )
-
-        safe_fragment_id = re.escape(fragment_id)
-        id_name_pattern = re.compile(
-            f"<[^>]+(?:id|name)\\s*=\\s*[\"']{safe_fragment_id}[\"']",
-            re.IGNORECASE,
-        )
-        match = id_name_pattern.search(html_content)
-        if match:
-            return match.start()
-
-        id_pos = html_content.find(f'id="{fragment_id}"')
-        name_pos = html_content.find(f'name="{fragment_id}"')
-        candidates = [pos for pos in (id_pos, name_pos) if pos != -1]
-        if candidates:
-            pos = min(candidates)
-            tag_start = html_content.rfind("<", 0, pos)
-            return tag_start if tag_start != -1 else pos
-
-        logger.warning(
-            "Anchor '%s' not found in %s. Defaulting to start.", fragment_id, doc_href
-        )
-        return 0
-
     def _slice_entries(self, ordered_entries: List[NavEntry]) -> List[ExtractedChapter]:
         chapters: List[ExtractedChapter] = []
         for index, entry in enumerate(ordered_entries):
@@ -930,7 +812,7 @@ class EpubExtractor:
                 ordered_entries[index + 1] if index + 1 < len(ordered_entries) else None
             )
             slice_html = self._slice_entry(entry, next_entry)
-            text = self._html_to_text(slice_html)
+            text = html_to_text(slice_html)
             if not text:
                 continue
             title = entry.title or "Untitled Section"
@@ -942,56 +824,15 @@ class EpubExtractor:
         current_entry: NavEntry,
         next_entry: Optional[NavEntry],
     ) -> str:
-        current_doc = current_entry.doc_href
-        current_pos = current_entry.position
-        current_html = self.doc_content.get(current_doc, "")
-        if not current_html:
+        if not self.doc_content.get(current_entry.doc_href):
             return ""
-
-        if next_entry and next_entry.doc_href == current_doc:
-            return current_html[current_pos : next_entry.position]
-
-        slice_html = current_html[current_pos:]
-        if next_entry:
-            docs_between = self._docs_between(current_doc, next_entry.doc_href)
-            for doc_href in docs_between:
-                slice_html += self.doc_content.get(doc_href, "")
-            next_doc_html = self.doc_content.get(next_entry.doc_href, "")
-            slice_html += next_doc_html[: next_entry.position]
-        else:
-            for doc_href in self._docs_between(current_doc, None):
-                slice_html += self.doc_content.get(doc_href, "")
-
-        if not slice_html.strip():
-            logger.warning(
-                "No content found for navigation source '%s'. Using full document fallback.",
-                current_entry.src,
-            )
-            return current_html
-        return slice_html
-
-    def _docs_between(self, current_doc: str, next_doc: Optional[str]) -> List[str]:
-        docs: List[str] = []
-        try:
-            current_idx = self.spine_docs.index(current_doc)
-        except ValueError:
-            return docs
-
-        if next_doc is None:
-            docs.extend(self.spine_docs[current_idx + 1 :])
-            return docs
-
-        try:
-            next_idx = self.spine_docs.index(next_doc)
-        except ValueError:
-            return docs
-
-        if current_idx < next_idx:
-            docs.extend(self.spine_docs[current_idx + 1 : next_idx])
-        elif current_idx > next_idx:
-            docs.extend(self.spine_docs[current_idx + 1 :])
-            docs.extend(self.spine_docs[:next_idx])
-        return docs
+        return self.documents.slice(
+            current_entry.doc_href,
+            current_entry.position,
+            next_entry.doc_href if next_entry else None,
+            next_entry.position if next_entry else 0,
+            source=current_entry.src,
+        )
 
     def _append_prefix_content(
         self,
@@ -1001,60 +842,10 @@ class EpubExtractor:
         if not ordered_entries:
             return
         first_entry = ordered_entries[0]
-        first_doc = first_entry.doc_href
-        first_pos = first_entry.position
-        if first_pos <= 0:
+        if first_entry.position <= 0:
             return
 
-        prefix_html = ""
-        try:
-            first_idx = self.spine_docs.index(first_doc)
-        except ValueError:
-            first_idx = -1
-
-        if first_idx > 0:
-            for doc_href in self.spine_docs[:first_idx]:
-                prefix_html += self.doc_content.get(doc_href, "")
-        prefix_html += self.doc_content.get(first_doc, "")[:first_pos]
-        prefix_text = self._html_to_text(prefix_html)
+        prefix_html = self.documents.prefix(first_entry.doc_href, first_entry.position)
+        prefix_text = html_to_text(prefix_html)
         if prefix_text and (not chapters or prefix_text != chapters[0].text):
             chapters.insert(0, ExtractedChapter(title="Introduction", text=prefix_text))
-
-    def _html_to_text(self, html: str) -> str:
-        if not html:
-            return ""
-        soup = BeautifulSoup(html, "html.parser")
-
-        # Add line breaks after block-level elements to ensure pauses in speech
-        for tag in soup.find_all(
-            ["p", "div", "h1", "h2", "h3", "h4", "h5", "h6", "li", "blockquote"]
-        ):
-            tag.append("\n\n")
-
-        for ol in soup.find_all("ol"):
-            start_attr = ol.get("start")
-            try:
-                start = int(str(start_attr)) if start_attr is not None else 1
-            except (TypeError, ValueError):
-                start = 1
-            for idx, li in enumerate(ol.find_all("li", recursive=False)):
-                number_text = f"{start + idx}) "
-                existing = li.string
-                if isinstance(existing, NavigableString):
-                    existing.replace_with(NavigableString(number_text + str(existing)))
-                else:
-                    li.insert(0, NavigableString(number_text))
-        for tag in soup.find_all(["sup", "sub"]):
-            tag.decompose()
-        text = clean_text(soup.get_text())
-        return text.strip()
-
-    def _resolve_document_title(self, html_content: str, fallback: str) -> str:
-        soup = BeautifulSoup(html_content, "html.parser")
-        if soup.title and soup.title.string:
-            return soup.title.string.strip()
-        for heading_tag in ("h1", "h2", "h3"):
-            heading = soup.find(heading_tag)
-            if heading and heading.get_text(strip=True):
-                return heading.get_text(strip=True)
-        return fallback
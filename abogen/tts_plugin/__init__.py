@@ -52,6 +52,7 @@ Usage:
         VoiceLister,
         PreviewGenerator,
         StreamingSynthesizer,
+        SegmentStreamer,
         CancelableSession,
         # Host Context
         HostContext,
@@ -71,6 +72,7 @@ Usage:
 from abogen.tts_plugin.capabilities import (
     CancelableSession,
     PreviewGenerator,
+    SegmentStreamer,
     StreamingSynthesizer,
     VoiceLister,
 )
@@ -154,6 +156,7 @@ __all__ = [
     "VoiceLister",
     "PreviewGenerator",
     "StreamingSynthesizer",
+    "SegmentStreamer",
     "CancelableSession",
     # Host Context
     "HostContext",
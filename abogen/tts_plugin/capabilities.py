@@ -9,7 +9,12 @@ from __future__ import annotations
 from typing import Iterator, Protocol, runtime_checkable
 
 from abogen.tts_plugin.manifest import VoiceManifest
-from abogen.tts_plugin.types import SynthesisRequest, SynthesizedAudio, VoiceSelection
+from abogen.tts_plugin.types import (
+    AudioSegment,
+    SynthesisRequest,
+    SynthesizedAudio,
+    VoiceSelection,
+)
 
 
 @runtime_checkable
@@ -83,6 +88,34 @@ class StreamingSynthesizer(Protocol):
         yield b""  # pragma: no cover
 
 
+@runtime_checkable
+class SegmentStreamer(Protocol):
+    """Protocol for per-segment streaming synthesis.
+
+    Optional capability of EngineSession, not Engine. Unlike
+    StreamingSynthesizer, each yielded segment keeps its graphemes and token
+    timings, so hosts can write audio and subtitles while later segments are
+    still being synthesized.
+    """
+
+    def synthesizeSegments(self, request: SynthesisRequest) -> Iterator[AudioSegment]:
+        """Synthesize audio one segment at a time.
+
+        Args:
+            request: The synthesis request.
+
+        Yields:
+            AudioSegment per synthesized chunk, in text order. ``audio`` may be
+            a zero-copy bytes-like view of the engine output rather than ``bytes``.
+
+        Raises:
+            CancelledError: If cancel() is called during iteration.
+            EngineError: On synthesis failure.
+        """
+        ...
+        yield  # pragma: no cover
+
+
 @runtime_checkable
 class CancelableSession(Protocol):
     """Protocol for cancellation support.
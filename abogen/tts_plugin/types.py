@@ -106,7 +106,9 @@ class AudioSegment:
 
     Attributes:
         graphemes: The text this segment was synthesized from.
-        audio: Raw float32 PCM audio bytes for this segment.
+        audio: Raw float32 PCM audio for this segment. Usually ``bytes``;
+            segments yielded by SegmentStreamer may carry a zero-copy
+            bytes-like view (e.g. ``memoryview``) instead.
         sample_rate: Sample rate of ``audio``.
         tokens: Per-token timing details, when the engine provides them.
     """
@@ -6,6 +6,7 @@ calling the Plugin Manager directly.
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from typing import Any, Iterator
 
 import numpy as np
@@ -119,6 +120,39 @@ def resolve_voice_to_plugin(spec: str, fallback: str = "kokoro") -> str:
     return fallback
 
 
+@dataclass
+class _Token:
+    text: str
+    whitespace: str = ""
+    start_ts: float = 0.0
+    end_ts: float = 0.0
+
+
+@dataclass
+class _Segment:
+    graphemes: str
+    audio: np.ndarray
+    tokens: list[Any] = field(default_factory=list)
+
+
+def _to_segment(seg: Any) -> _Segment:
+    """Convert a plugin AudioSegment to the pipeline's segment shape."""
+    tokens = [
+        _Token(
+            text=tok.text,
+            whitespace=tok.whitespace,
+            start_ts=tok.start,
+            end_ts=tok.end,
+        )
+        for tok in seg.tokens
+    ]
+    return _Segment(
+        graphemes=seg.graphemes,
+        audio=np.frombuffer(seg.audio, dtype=np.float32),
+        tokens=tokens,
+    )
+
+
 class Pipeline:
     """Callable wrapper around Engine / EngineSession.
 
@@ -127,10 +161,22 @@ class Pipeline:
         pipeline = create_pipeline("kokoro", language=Language.EN_US, device="cpu")
         for segment in pipeline(text, voice="af_nova", speed=1.0):
             audio = segment.audio
+
+    ``plugin_id`` and ``language`` identify what the pipeline produces; the
+    segment cache keys on them and skips pipelines that leave them unset.
     """
 
-    def __init__(self, engine: Any, **engine_kwargs: Any) -> None:
+    def __init__(
+        self,
+        engine: Any,
+        *,
+        plugin_id: str | None = None,
+        language: Language | None = None,
+        **engine_kwargs: Any,
+    ) -> None:
         self._engine = engine
+        self.plugin_id = plugin_id
+        self.language = language
         self._engine_kwargs = engine_kwargs
         self._session: Any = None
 
@@ -168,40 +214,24 @@ class Pipeline:
             format=AudioFormat(mime="audio/wav", extension="wav"),
         )
 
-        result = session.synthesize(request)
+        from abogen.tts_plugin.capabilities import SegmentStreamer
 
-        from dataclasses import dataclass, field
-
-        @dataclass
-        class Token:
-            text: str
-            whitespace: str = ""
-            start_ts: float = 0.0
-            end_ts: float = 0.0
+        if isinstance(session, SegmentStreamer):
+            # Stream segments straight through: audio is viewed, never copied
+            # or accumulated, so callers can write each one immediately.
+            for seg in session.synthesizeSegments(request):
+                yield _to_segment(seg)
+            return
 
-        @dataclass
-        class Segment:
-            graphemes: str
-            audio: np.ndarray
-            tokens: list[Any] = field(default_factory=list)
+        result = session.synthesize(request)
 
         if result.segments:
             for seg in result.segments:
-                audio_array = np.frombuffer(seg.audio, dtype=np.float32)
-                tokens = [
-                    Token(
-                        text=tok.text,
-                        whitespace=tok.whitespace,
-                        start_ts=tok.start,
-                        end_ts=tok.end,
-                    )
-                    for tok in seg.tokens
-                ]
-                yield Segment(graphemes=seg.graphemes, audio=audio_array, tokens=tokens)
+                yield _to_segment(seg)
             return
 
         audio_array = np.frombuffer(result.data, dtype=np.float32)
-        yield Segment(graphemes=text, audio=audio_array)
+        yield _Segment(graphemes=text, audio=audio_array)
 
     def load_single_voice(self, voice_name: str) -> Any:
         engine_pipeline = getattr(self._engine, '_pipeline', None)
@@ -262,4 +292,4 @@ def create_pipeline(
     config = EngineConfig(device=device, language=language)
 
     engine = manager.create_engine(plugin_id, context=ctx, model_path=None, config=config)
-    return Pipeline(engine)
+    return Pipeline(engine, plugin_id=plugin_id, language=language)
@@ -16,6 +16,7 @@ Engine converts Language → its own format internally.
 from __future__ import annotations
 
 import logging
+import os
 from pathlib import Path
 from typing import Any
 
@@ -76,6 +77,9 @@ def _build_request(job: Job) -> ConversionRequest:
         read_closing_outro=job.read_closing_outro,
         auto_prefix_chapter_titles=job.auto_prefix_chapter_titles,
         normalize_chapter_opening_caps=job.normalize_chapter_opening_caps,
+        # Execution
+        chapter_workers=_resolve_chapter_workers(),
+        checkpoint_id=job.resume_token or job.id,
         # Metadata
         metadata_tags=job.metadata_tags or {},
         # Grouped configs
@@ -114,6 +118,13 @@ def _build_request(job: Job) -> ConversionRequest:
     )
 
 
+def _resolve_chapter_workers() -> int:
+    try:
+        return max(1, int(os.environ.get("ABOGEN_CHAPTER_WORKERS", "1") or 1))
+    except ValueError:
+        return 1
+
+
 def _resolve_output_format(fmt: str) -> OutputFormat:
     try:
         return OutputFormat.from_str(fmt)
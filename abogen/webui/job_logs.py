@@ -0,0 +1,177 @@
+"""Bounded per-job log buffer.
+
+A job keeps its most recent log entries in memory. Older entries spill to a
+gzip file under the internal cache, a batch at a time. Every entry gets a
+sequence number that increases for the lifetime of the job. The SSE log
+stream uses this number as its event id, so a reconnecting client resumes
+from ``Last-Event-ID`` instead of downloading the history again. Readers
+block on a condition variable until a new entry arrives, so they do not
+need to poll.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Deque, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOG_CAPACITY = 2000
+
+
+@dataclass
+class JobLog:
+    timestamp: float
+    message: str
+    level: str = "info"
+
+
+def log_capacity() -> int:
+    """In-memory entries per job from ``ABOGEN_JOB_LOG_CAPACITY``."""
+    try:
+        return max(16, int(os.environ.get("ABOGEN_JOB_LOG_CAPACITY", DEFAULT_LOG_CAPACITY)))
+    except ValueError:
+        return DEFAULT_LOG_CAPACITY
+
+
+def _spill_dir() -> Path:
+    from abogen.utils import get_internal_cache_path
+
+    return Path(get_internal_cache_path("job_logs"))
+
+
+class JobLogBuffer:
+    """Ring of the newest log entries of one job, with a gzip spill file.
+
+    Reads like a list of JobLog for templates and callers: iteration,
+    ``len()``, indexing, ``reversed()`` and truthiness all apply to the
+    entries still in memory.
+    """
+
+    def __init__(self, capacity: Optional[int] = None, job_id: str = "") -> None:
+        self.capacity = capacity or log_capacity()
+        self.job_id = job_id
+        self._entries: Deque[JobLog] = deque()
+        self._first_seq = 0  # sequence number of self._entries[0]
+        self._cond = threading.Condition()
+        self._spill_path: Optional[Path] = None
+
+    # List-like view ------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+    def __iter__(self) -> Iterator[JobLog]:
+        with self._cond:
+            return iter(list(self._entries))
+
+    def __reversed__(self) -> Iterator[JobLog]:
+        with self._cond:
+            return reversed(list(self._entries))
+
+    def __getitem__(self, index: Any) -> Any:
+        with self._cond:
+            if isinstance(index, slice):
+                return list(self._entries)[index]
+            return self._entries[index]
+
+    @property
+    def next_seq(self) -> int:
+        """Sequence number the next appended entry will get."""
+        return self._first_seq + len(self._entries)
+
+    # Writing -------------------------------------------------------------
+    def append(self, entry: JobLog) -> None:
+        with self._cond:
+            self._entries.append(entry)
+            if len(self._entries) > self.capacity:
+                self._spill_locked(max(1, self.capacity // 4))
+            self._cond.notify_all()
+
+    def restore(self, entries: Iterable[JobLog], next_seq: Optional[int] = None) -> None:
+        """Replace the buffer with persisted entries ending at *next_seq*."""
+        with self._cond:
+            self._entries = deque(entries)
+            while len(self._entries) > self.capacity:
+                self._entries.popleft()
+            end = next_seq if next_seq is not None else len(self._entries)
+            self._first_seq = max(0, end - len(self._entries))
+            self._cond.notify_all()
+
+    def _spill_file(self) -> Optional[Path]:
+        if self._spill_path is None and self.job_id:
+            self._spill_path = _spill_dir() / f"{self.job_id}.jsonl.gz"
+        return self._spill_path
+
+    def _spill_locked(self, count: int) -> None:
+        batch = [self._entries.popleft() for _ in range(count)]
+        first = self._first_seq
+        self._first_seq += count
+        try:
+            path = self._spill_file()
+            if path is None:
+                return
+            lines = "".join(
+                json.dumps([first + offset, entry.timestamp, entry.level, entry.message]) + "\n"
+                for offset, entry in enumerate(batch)
+            )
+            # Each batch is its own gzip member; readers see one stream.
+            with gzip.open(path, "at", encoding="utf-8") as handle:
+                handle.write(lines)
+        except OSError as exc:
+            logger.debug("Dropping %d spilled log entries for job %s: %s", count, self.job_id, exc)
+
+    def discard_spill(self) -> None:
+        """Delete the spill file of this job."""
+        try:
+            path = self._spill_file()
+            if path is not None:
+                path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    # Reading -------------------------------------------------------------
+    def _read_spilled(self, cursor: int) -> List[Tuple[int, JobLog]]:
+        found: List[Tuple[int, JobLog]] = []
+        try:
+            path = self._spill_file()
+            if path is None or not path.exists():
+                return []
+            with gzip.open(path, "rt", encoding="utf-8") as handle:
+                for line in handle:
+                    seq, timestamp, level, message = json.loads(line)
+                    if seq >= cursor:
+                        found.append((seq, JobLog(timestamp=timestamp, message=message, level=level)))
+        except (OSError, EOFError, ValueError) as exc:
+            logger.debug("Could not read spilled logs for job %s: %s", self.job_id, exc)
+        return found
+
+    def since(self, cursor: int) -> List[Tuple[int, JobLog]]:
+        """Return ``(seq, entry)`` pairs with ``seq >= cursor``."""
+        with self._cond:
+            first = self._first_seq
+            memory = list(self._entries)
+        cursor = max(0, cursor)
+        spilled = self._read_spilled(cursor) if cursor < first else []
+        spilled = [item for item in spilled if item[0] < first]
+        start = max(0, cursor - first)
+        return spilled + [(first + offset, entry) for offset, entry in enumerate(memory) if offset >= start]
+
+    def wait(self, cursor: int, timeout: float) -> bool:
+        """Block until an entry with ``seq >= cursor`` exists or *timeout* passes."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self.next_seq > cursor, timeout=timeout)
+
+    def notify(self) -> None:
+        """Wake waiting readers without appending (e.g. on a status change)."""
+        with self._cond:
+            self._cond.notify_all()
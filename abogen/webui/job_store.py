@@ -0,0 +1,122 @@
+"""Journaled on-disk store for the WebUI job queue.
+
+Each job is one row of a SQLite database in WAL mode. The queue order and
+the state version live in a small ``meta`` table. ``ConversionService`` only
+writes the rows of jobs whose serialized state changed, so a status change
+costs one small transaction regardless of how many finished jobs the history
+holds. SQLite checkpoints the WAL into the main file on its own.
+
+The previous format, a single ``queue_state.json`` rewritten on every change,
+is imported once when the database is first created.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class JobStateStore:
+    """Thread-safe map of job id -> serialized job, plus the queue order."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL stays consistent after a crash; at worst the last
+        # transactions before a power loss are rolled back.
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY,"
+            " created_at REAL NOT NULL,"
+            " payload TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def version(self) -> Optional[int]:
+        """State version recorded by the last write, or None for a new store."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        return int(row[0]) if row else None
+
+    def queue(self) -> List[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'queue'").fetchone()
+        return list(json.loads(row[0])) if row else []
+
+    def iter_jobs(self) -> Iterator[Tuple[str, str]]:
+        """Yield ``(id, payload)`` rows oldest first, a batch at a time."""
+        with self._lock:
+            cursor = self._conn.execute("SELECT id, payload FROM jobs ORDER BY created_at")
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(64)
+            if not rows:
+                return
+            yield from rows
+
+    def write(
+        self,
+        *,
+        version: int,
+        upserts: Mapping[str, Tuple[float, str]] | None = None,
+        deletes: Iterable[str] = (),
+        queue: Optional[List[str]] = None,
+    ) -> None:
+        """Apply one delta in a single transaction.
+
+        Args:
+            version: State version to record.
+            upserts: ``job id -> (created_at, payload JSON)`` for changed jobs.
+            deletes: Ids of removed jobs.
+            queue: New queue order, or None to leave it unchanged.
+        """
+        deletes = list(deletes)
+        with self._lock, self._conn:
+            if upserts:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO jobs (id, created_at, payload) VALUES (?, ?, ?)",
+                    [(job_id, created_at, payload) for job_id, (created_at, payload) in upserts.items()],
+                )
+            if deletes:
+                self._conn.executemany("DELETE FROM jobs WHERE id = ?", [(job_id,) for job_id in deletes])
+            if queue is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('queue', ?)", (json.dumps(queue),)
+                )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (str(version),)
+            )
+
+    def import_snapshot(self, snapshot: Mapping[str, Any]) -> None:
+        """Load a legacy ``queue_state.json`` document into the store."""
+        upserts: Dict[str, Tuple[float, str]] = {}
+        for entry in snapshot.get("jobs", []):
+            if isinstance(entry, Mapping) and entry.get("id"):
+                upserts[str(entry["id"])] = (
+                    float(entry.get("created_at") or 0.0),
+                    json.dumps(entry, separators=(",", ":")),
+                )
+        self.write(
+            version=int(snapshot.get("version", 0) or 0),
+            upserts=upserts,
+            queue=[str(job_id) for job_id in snapshot.get("queue", [])],
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
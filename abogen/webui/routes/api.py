@@ -43,7 +43,7 @@ from abogen.integrations.calibre_opds import (
 )
 from abogen.webui.routes.utils.service import get_service
 from abogen.webui.routes.utils.form import build_pending_job_from_extraction
-from abogen.text_extractor import extract_from_path
+from abogen.book_cache import cached_extract_from_path
 from werkzeug.utils import secure_filename
 
 api_bp = Blueprint("api", __name__)
@@ -468,7 +468,7 @@ def api_calibre_opds_import() -> ResponseReturnValue:
         file_path = temp_dir / f"{uuid.uuid4().hex}_{filename}"
         file_path.write_bytes(content)
         
-        extraction = extract_from_path(file_path)
+        extraction = cached_extract_from_path(file_path)
         
         if metadata_overrides:
             extraction.metadata.update(metadata_overrides)
@@ -631,3 +631,20 @@ def api_entity_pronunciation_preview() -> ResponseReturnValue:
         return jsonify({"audio_base64": audio_base64})
     except Exception as e:
         return jsonify({"error": str(e)}), 400
+
+@api_bp.get("/diagnostics/spacy-models")
+def api_spacy_models() -> ResponseReturnValue:
+    from abogen.spacy_utils import model_memory_report
+
+    return jsonify({"models": model_memory_report()})
+
+
+@api_bp.post("/diagnostics/spacy-models/evict")
+def api_spacy_models_evict() -> ResponseReturnValue:
+    from abogen.spacy_utils import evict_models
+
+    payload = request.get_json(force=True, silent=True) or {}
+    idle_seconds = payload.get("idle_seconds")
+    if idle_seconds is not None:
+        idle_seconds = coerce_float(idle_seconds, 0.0)
+    return jsonify({"evicted": evict_models(idle_seconds)})
@@ -109,23 +109,23 @@ def send_job_to_audiobookshelf(job_id: str) -> ResponseReturnValue:
     settings = stored_integration_config("audiobookshelf")
     if not settings or not settings.get("enabled"):
         job.add_log("Audiobookshelf upload skipped: integration is disabled.", level="warning")
-        service._persist_state()
+        service._persist_state(job)
         return _panel_response()
 
     config = build_audiobookshelf_config(settings)
     if config is None:
         job.add_log("Audiobookshelf upload skipped: configure base URL, API token, and library ID first.", level="warning")
-        service._persist_state()
+        service._persist_state(job)
         return _panel_response()
     if not config.folder_id:
         job.add_log("Audiobookshelf upload skipped: enter the folder name or ID in the Audiobookshelf settings.", level="warning")
-        service._persist_state()
+        service._persist_state(job)
         return _panel_response()
 
     audio_path = locate_job_audio(job)
     if not audio_path or not audio_path.exists():
         job.add_log("Audiobookshelf upload skipped: audio output not found.", level="warning")
-        service._persist_state()
+        service._persist_state(job)
         return _panel_response()
 
     overwrite_requested = request.form.get("overwrite") == "true" or request.args.get("overwrite") == "true"
@@ -138,11 +138,11 @@ def send_job_to_audiobookshelf(job_id: str) -> ResponseReturnValue:
             existing_items = AudiobookshelfClient(config).find_existing_items(display_title, folder_id=config.folder_id)
         except AudiobookshelfUploadError as exc:
             job.add_log(f"Audiobookshelf lookup failed: {exc}", level="error")
-            service._persist_state()
+            service._persist_state(job)
             return _panel_response()
         if existing_items:
             job.add_log(f"Audiobookshelf already contains '{display_title}'. Awaiting overwrite confirmation.", level="warning")
-            service._persist_state()
+            service._persist_state(job)
             if request.headers.get("HX-Request"):
                 detail = {
                     "jobId": job.id,
@@ -170,7 +170,7 @@ def send_job_to_audiobookshelf(job_id: str) -> ResponseReturnValue:
         )
     except Exception as exc:
         job.add_log(f"Audiobookshelf integration error: {exc}", level="error")
-    service._persist_state()
+    service._persist_state(job)
     return _panel_response()
 
 @jobs_bp.post("/clear-finished")
@@ -237,22 +237,29 @@ def stream_logs(job_id: str) -> ResponseReturnValue:
     job = get_service().get_job(job_id)
     if not job:
         abort(404)
-        
+
+    # Event ids are log sequence numbers; a reconnecting EventSource sends
+    # the last one it saw, so only newer entries are replayed.
+    last_event_id = request.headers.get("Last-Event-ID") or request.args.get("cursor")
+    try:
+        cursor = int(last_event_id) + 1 if last_event_id is not None else 0
+    except ValueError:
+        cursor = 0
+
     def generate():
-        last_index = 0
+        nonlocal cursor
         while True:
-            current_logs = job.logs
-            if len(current_logs) > last_index:
-                for log in current_logs[last_index:]:
-                    yield f"data: {json.dumps({'timestamp': log.timestamp, 'level': log.level, 'message': log.message})}\n\n"
-                last_index = len(current_logs)
-            
+            for seq, log in job.logs.since(cursor):
+                payload = json.dumps({"timestamp": log.timestamp, "level": log.level, "message": log.message})
+                yield f"id: {seq}\ndata: {payload}\n\n"
+                cursor = seq + 1
+
             if job.status in {JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED}:
                 break
-            
-            import time
-            time.sleep(0.5)
-            
+
+            if not job.logs.wait(cursor, timeout=15.0):
+                yield ": keep-alive\n\n"
+
     return Response(generate(), mimetype="text/event-stream")
 
 @jobs_bp.get("/<job_id>/reader")
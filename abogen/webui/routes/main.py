@@ -21,6 +21,7 @@ from abogen.webui.routes.utils.form import (
     apply_prepare_form,
     render_jobs_panel,
 )
+from abogen.book_cache import cached_extract_from_path
 from abogen.text_extractor import extract_from_path
 from abogen.voice_profiles import serialize_profiles
 
@@ -157,7 +158,7 @@ def wizard_upload():
     file.save(file_path)
 
     try:
-        extraction = extract_from_path(file_path)
+        extraction = cached_extract_from_path(file_path)
             
         result = build_pending_job_from_extraction(
             stored_path=file_path,
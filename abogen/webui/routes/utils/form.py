@@ -822,7 +822,13 @@ def render_jobs_panel() -> str:
     jobs = get_service().list_jobs()
     active_statuses = {JobStatus.PENDING, JobStatus.RUNNING, JobStatus.PAUSED}
     active_jobs = [job for job in jobs if job.status in active_statuses]
-    active_jobs.sort(key=lambda job: ((job.queue_position or 10_000), -job.created_at))
+    active_jobs.sort(
+        key=lambda job: (
+            job.status != JobStatus.RUNNING,
+            job.queue_position or 10_000,
+            -job.created_at,
+        )
+    )
     finished_jobs = [job for job in jobs if job.status not in active_statuses]
     download_flags = {job.id: job_download_flags(job) for job in jobs}
     return render_template(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
@@ -15,6 +16,9 @@ from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Optional, Mapping
 
 from abogen.domain.metadata_helpers import normalize_metadata_map
+from abogen.application.conversion_checkpoint import discard_checkpoint
+from abogen.webui.job_logs import JobLog, JobLogBuffer
+from abogen.webui.job_store import JobStateStore
 
 from abogen.domain.enums import Language
 from abogen.utils import console_handler, get_internal_cache_path, get_user_settings_dir
@@ -29,6 +33,28 @@ def _create_set_event() -> threading.Event:
 
 STATE_VERSION = 8
 
+# Jobs with at least this many characters count against the large-job limit,
+# so a handful of long books cannot occupy every worker at once.
+DEFAULT_LARGE_JOB_CHARACTERS = 500_000
+
+
+def _iter_safely(items: Iterable[Any]) -> Iterable[Any]:
+    """Yield from *items*, stopping quietly if the underlying read fails."""
+    try:
+        yield from items
+    except Exception:
+        return
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
 
 _JOB_LOGGER = logging.getLogger("abogen.jobs")
 if not _JOB_LOGGER.handlers:
@@ -70,13 +96,6 @@ class JobStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
-class JobLog:
-    timestamp: float
-    message: str
-    level: str = "info"
-
-
 @dataclass
 class JobResult:
     audio_path: Optional[Path] = None
@@ -123,7 +142,7 @@ class Job:
     total_characters: int = 0
     processed_characters: int = 0
     etr_str: str = ""
-    logs: List[JobLog] = field(default_factory=list)
+    logs: JobLogBuffer = field(default_factory=JobLogBuffer, repr=False, compare=False)
     error: Optional[str] = None
     result: JobResult = field(default_factory=JobResult)
     chapters: List[Dict[str, Any]] = field(default_factory=list)
@@ -151,6 +170,13 @@ class Job:
     speaker_voice_languages: List[str] = field(default_factory=list)
     applied_speaker_config: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.logs, JobLogBuffer):
+            entries = list(self.logs or [])
+            self.logs = JobLogBuffer()
+            self.logs.restore(entries)
+        self.logs.job_id = self.id
+
     @property
     def estimated_time_remaining(self) -> Optional[float]:
         """
@@ -321,11 +347,29 @@ class ConversionService:
         *,
         uploads_root: Optional[Path] = None,
         poll_interval: float = 0.5,
+        max_workers: Optional[int] = None,
+        max_jobs_per_provider: Optional[int] = None,
+        large_job_characters: Optional[int] = None,
+        max_large_jobs: Optional[int] = None,
     ) -> None:
         self._jobs: Dict[str, Job] = {}
         self._queue: List[str] = []
         self._lock = threading.RLock()
-        self._worker_thread: Optional[threading.Thread] = None
+        self._worker_threads: List[threading.Thread] = []
+        self._active_jobs: Dict[str, Job] = {}
+        if max_workers is None:
+            max_workers = _env_int("ABOGEN_MAX_WORKERS", 1)
+        if max_jobs_per_provider is None:
+            max_jobs_per_provider = _env_int("ABOGEN_MAX_JOBS_PER_PROVIDER", 0)
+        if large_job_characters is None:
+            large_job_characters = _env_int("ABOGEN_LARGE_JOB_CHARACTERS", DEFAULT_LARGE_JOB_CHARACTERS)
+        if max_large_jobs is None:
+            max_large_jobs = _env_int("ABOGEN_MAX_LARGE_JOBS", 1)
+        self._max_workers = max(1, int(max_workers))
+        # Zero (or negative) disables the corresponding admission limit.
+        self._max_jobs_per_provider = max(0, int(max_jobs_per_provider))
+        self._large_job_characters = max(0, int(large_job_characters))
+        self._max_large_jobs = max(0, int(max_large_jobs))
         self._stop_event = threading.Event()
         self._wake_event = threading.Event()
         self._output_root = output_root
@@ -335,6 +379,10 @@ class ConversionService:
         self._pending_jobs: Dict[str, PendingJob] = {}
         self._state_path = self._determine_state_path()
         self._ensure_directories()
+        self._store = self._open_store()
+        # Digest of each job's last persisted payload, and the last queue.
+        self._persisted: Dict[str, bytes] = {}
+        self._persisted_queue: Optional[List[str]] = None
         self._load_state()
 
     # Public API ---------------------------------------------------------
@@ -483,10 +531,12 @@ class ConversionService:
             job.pause_event.set()
             if job.status == JobStatus.PENDING:
                 job.status = JobStatus.CANCELLED
-                self._queue.remove(job_id)
+                if job_id in self._queue:
+                    self._queue.remove(job_id)
                 job.finished_at = time.time()
                 self._update_queue_positions_locked()
-            self._persist_state()
+                job.logs.notify()
+            self._persist_state(job)
             return True
 
     def pause(self, job_id: str) -> bool:
@@ -509,7 +559,7 @@ class ConversionService:
                 job.status = JobStatus.PAUSED
                 job.paused = True
                 job.pause_event.clear()
-            self._persist_state()
+            self._persist_state(job)
             return True
 
     def resume(self, job_id: str) -> bool:
@@ -538,7 +588,7 @@ class ConversionService:
                     job.status = JobStatus.RUNNING
                 job.add_log("Resume requested", level="info")
 
-            self._persist_state()
+            self._persist_state(job)
             return True
 
     def retry(self, job_id: str) -> Optional[Job]:
@@ -607,6 +657,8 @@ class ConversionService:
                 normalization_overrides=job.normalization_overrides,
             )
 
+            # Share the checkpoint so the retry resumes where this job stopped.
+            new_job.resume_token = job.resume_token or job.id
             new_job.speaker_voice_languages = list(job.speaker_voice_languages)
             new_job.applied_speaker_config = job.applied_speaker_config
             new_job.add_log(f"Retry created from job {job.id}", level="info")
@@ -622,6 +674,8 @@ class ConversionService:
             if job.status in {JobStatus.RUNNING}:
                 return False
             self._jobs.pop(job_id)
+            discard_checkpoint(job.resume_token or job.id)
+            job.logs.discard_spill()
             if job_id in self._queue:
                 self._queue.remove(job_id)
                 self._update_queue_positions_locked()
@@ -644,6 +698,8 @@ class ConversionService:
             for job_id, job in list(self._jobs.items()):
                 if job.status in finished_statuses:
                     self._jobs.pop(job_id)
+                    discard_checkpoint(job.resume_token or job.id)
+                    job.logs.discard_spill()
                     removed += 1
 
             if removed:
@@ -654,9 +710,12 @@ class ConversionService:
     def shutdown(self) -> None:
         self._stop_event.set()
         self._wake_event.set()
-        if self._worker_thread and self._worker_thread.is_alive():
-            self._worker_thread.join(timeout=5)
-            self._worker_thread = None
+        with self._lock:
+            workers = list(self._worker_threads)
+            self._worker_threads = []
+        for worker in workers:
+            if worker.is_alive():
+                worker.join(timeout=5)
 
     # Internal -----------------------------------------------------------
     def _ensure_directories(self) -> None:
@@ -666,40 +725,91 @@ class ConversionService:
 
     def _ensure_worker(self) -> None:
         with self._lock:
-            if self._worker_thread and self._worker_thread.is_alive():
+            self._worker_threads = [worker for worker in self._worker_threads if worker.is_alive()]
+            if len(self._worker_threads) >= self._max_workers:
                 return
             self._stop_event.clear()
-            self._worker_thread = threading.Thread(
-                target=self._worker_loop,
-                name="abogen-conversion-worker",
-                daemon=True,
+            while len(self._worker_threads) < self._max_workers:
+                name = "abogen-conversion-worker"
+                if self._max_workers > 1:
+                    name = f"{name}-{len(self._worker_threads) + 1}"
+                worker = threading.Thread(
+                    target=self._worker_loop,
+                    name=name,
+                    daemon=True,
+                )
+                self._worker_threads.append(worker)
+                worker.start()
+
+    def _is_large_job(self, job: Job) -> bool:
+        return bool(self._large_job_characters) and job.total_characters >= self._large_job_characters
+
+    def _can_admit_locked(self, job: Job) -> bool:
+        """Return True when starting ``job`` keeps the active set within limits."""
+        if self._max_jobs_per_provider:
+            provider = getattr(job, "tts_provider", "kokoro")
+            same_provider = sum(
+                1 for active in self._active_jobs.values()
+                if getattr(active, "tts_provider", "kokoro") == provider
             )
-            self._worker_thread.start()
+            if same_provider >= self._max_jobs_per_provider:
+                return False
+        if self._max_large_jobs and self._is_large_job(job):
+            large_active = sum(1 for active in self._active_jobs.values() if self._is_large_job(active))
+            if large_active >= self._max_large_jobs:
+                return False
+        return True
+
+    def _claim_next_job_locked(self) -> Optional[Job]:
+        """Pop the first admissible job from the queue and mark it active.
+
+        Jobs blocked by an admission limit keep their place; later jobs that
+        fit may start ahead of them.
+        """
+        self._queue = [
+            job_id for job_id in self._queue
+            if job_id in self._jobs and self._jobs[job_id].status not in {
+                JobStatus.CANCELLED,
+                JobStatus.COMPLETED,
+                JobStatus.FAILED,
+            }
+        ]
+        for job_id in self._queue:
+            job = self._jobs[job_id]
+            if not self._can_admit_locked(job):
+                continue
+            self._queue.remove(job_id)
+            self._active_jobs[job_id] = job
+            job.queue_position = None
+            self._update_queue_positions_locked()
+            return job
+        return None
 
     def _worker_loop(self) -> None:
         while not self._stop_event.is_set():
-            job = None
             with self._lock:
                 self._wake_event.clear()
-                while self._queue and self._jobs[self._queue[0]].status in {
-                    JobStatus.CANCELLED,
-                    JobStatus.COMPLETED,
-                    JobStatus.FAILED,
-                }:
-                    self._queue.pop(0)
-                if self._queue:
-                    job = self._jobs[self._queue.pop(0)]
-                else:
-                    self._update_queue_positions_locked()
+                job = self._claim_next_job_locked()
             if job is None:
                 self._wake_event.wait(timeout=self._poll_interval)
                 continue
-            if job.cancel_requested:
-                job.add_log("Job cancelled before start", level="warning")
-                job.status = JobStatus.CANCELLED
-                job.finished_at = time.time()
-                continue
-            self._run_job(job)
+            try:
+                if job.cancel_requested:
+                    job.add_log("Job cancelled before start", level="warning")
+                    job.status = JobStatus.CANCELLED
+                    job.finished_at = time.time()
+                    job.logs.notify()
+                    self._persist_state(job)
+                    continue
+                if job.status == JobStatus.PAUSED:
+                    # Paused between being claimed and starting; resume() requeues it.
+                    continue
+                self._run_job(job)
+            finally:
+                with self._lock:
+                    self._active_jobs.pop(job.id, None)
+                    # A freed slot may unblock a job another worker skipped.
+                    self._wake_event.set()
 
     def _run_job(self, job: Job) -> None:
         job.pause_event.set()
@@ -708,7 +818,7 @@ class ConversionService:
         job.status = JobStatus.RUNNING
         job.started_at = time.time()
         job.add_log("Job started", level="info")
-        self._persist_state()
+        self._persist_state(job)
         try:
             self._runner(job)
         except Exception as exc:  # pragma: no cover - defensive
@@ -733,7 +843,7 @@ class ConversionService:
             job.finished_at = time.time()
         finally:
             job.pause_event.set()
-            self._persist_state()
+            self._persist_state(job)
             with self._lock:
                 self._update_queue_positions_locked()
 
@@ -742,10 +852,12 @@ class ConversionService:
             job = self._jobs.get(job_id)
             if job:
                 job.queue_position = index
-        self._persist_state()
+        self._persist_state(*(self._jobs[job_id] for job_id in self._queue if job_id in self._jobs))
 
     def _remove_job_locked(self, job_id: str) -> None:
-        self._jobs.pop(job_id, None)
+        job = self._jobs.pop(job_id, None)
+        if job is not None:
+            job.logs.discard_spill()
         if job_id in self._queue:
             self._queue.remove(job_id)
         self._update_queue_positions_locked()
@@ -788,7 +900,8 @@ class ConversionService:
             "total_characters": job.total_characters,
             "processed_characters": job.processed_characters,
             "error": job.error,
-            "logs": [log.__dict__ for log in job.logs][-500:],
+            "logs": [log.__dict__ for log in job.logs[-500:]],
+            "log_seq": job.logs.next_seq,
             "result": {
                 "audio_path": result_audio,
                 "subtitle_paths": result_subtitles,
@@ -822,22 +935,60 @@ class ConversionService:
             "normalization_overrides": dict(job.normalization_overrides),
         }
 
-    def _persist_state(self) -> None:
+    def _persist_state(self, *jobs: Job) -> None:
+        """Write the state of *jobs* (every job when none are given).
+
+        Only jobs whose serialized payload changed since the last write are
+        stored; removed jobs and queue changes are always picked up.
+        """
+        if self._store is None:
+            return
         try:
             with self._lock:
-                snapshot = {
-                    "version": STATE_VERSION,
-                    "jobs": [self._serialize_job(job) for job in self._jobs.values()],
-                    "queue": list(self._queue),
-                }
-            tmp_path = self._state_path.with_suffix(".tmp")
-            with tmp_path.open("w", encoding="utf-8") as handle:
-                json.dump(snapshot, handle, indent=2)
-            os.replace(tmp_path, self._state_path)
+                targets = jobs or tuple(self._jobs.values())
+                upserts: Dict[str, tuple[float, str]] = {}
+                digests: Dict[str, bytes] = {}
+                for job in targets:
+                    if self._jobs.get(job.id) is not job:
+                        continue
+                    payload = json.dumps(self._serialize_job(job), separators=(",", ":"))
+                    digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+                    if self._persisted.get(job.id) != digest:
+                        upserts[job.id] = (job.created_at, payload)
+                        digests[job.id] = digest
+                deletes = [job_id for job_id in self._persisted if job_id not in self._jobs]
+                queue = list(self._queue)
+                queue_changed = queue != self._persisted_queue
+                if not upserts and not deletes and not queue_changed:
+                    return
+                self._store.write(
+                    version=STATE_VERSION,
+                    upserts=upserts,
+                    deletes=deletes,
+                    queue=queue if queue_changed else None,
+                )
+                self._persisted.update(digests)
+                for job_id in deletes:
+                    self._persisted.pop(job_id, None)
+                self._persisted_queue = queue
         except Exception:
             # Persistence failures should not disrupt runtime; ignore.
             pass
 
+    def _open_store(self) -> Optional[JobStateStore]:
+        """Open the job database next to the legacy JSON state file."""
+        try:
+            store = JobStateStore(self._state_path.with_suffix(".sqlite3"))
+        except Exception:
+            return None
+        if store.version() is None and self._state_path.exists():
+            try:
+                with self._state_path.open("r", encoding="utf-8") as handle:
+                    store.import_snapshot(json.load(handle))
+            except Exception:
+                pass
+        return store
+
     def _determine_state_path(self) -> Path:
         override_file = os.environ.get("ABOGEN_QUEUE_STATE_PATH")
         if override_file:
@@ -921,7 +1072,10 @@ class ConversionService:
         job.total_characters = int(payload.get("total_characters", 0))
         job.processed_characters = int(payload.get("processed_characters", 0))
         job.error = payload.get("error")
-        job.logs = [JobLog(**entry) for entry in payload.get("logs", [])]
+        job.logs.restore(
+            (JobLog(**entry) for entry in payload.get("logs", [])),
+            payload.get("log_seq"),
+        )
         result_payload = payload.get("result", {})
         audio_path_raw = result_payload.get("audio_path")
         job.result.audio_path = Path(audio_path_raw) if audio_path_raw else None
@@ -963,28 +1117,26 @@ class ConversionService:
         return job
 
     def _load_state(self) -> None:
-        if not self._state_path.exists():
+        if self._store is None:
             return
         try:
-            with self._state_path.open("r", encoding="utf-8") as handle:
-                payload = json.load(handle)
+            version = self._store.version() or 0
+            if version not in {STATE_VERSION, STATE_VERSION - 1}:
+                return
+            queue_payload = self._store.queue()
+            rows = self._store.iter_jobs()
         except Exception:
             return
 
-        version = int(payload.get("version", 0) or 0)
-        if version not in {STATE_VERSION, STATE_VERSION - 1}:
-            return
-
-        jobs_payload = payload.get("jobs", [])
-        queue_payload = payload.get("queue", [])
         loaded_jobs: Dict[str, Job] = {}
         requeue: List[str] = []
 
-        for entry in jobs_payload:
+        for job_id, raw in _iter_safely(rows):
             try:
-                job = self._deserialize_job(entry)
+                job = self._deserialize_job(json.loads(raw))
             except Exception:
                 continue
+            self._persisted[job_id] = hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
 
             if job.status in {JobStatus.RUNNING, JobStatus.PAUSED}:
                 job.status = JobStatus.PENDING
@@ -1003,6 +1155,7 @@ class ConversionService:
         with self._lock:
             self._jobs = loaded_jobs
             self._queue = [job_id for job_id in queue_payload if job_id in loaded_jobs]
+            self._persisted_queue = list(self._queue)
             for job_id in requeue:
                 if job_id not in self._queue:
                     self._queue.append(job_id)
@@ -1219,6 +1372,7 @@ def build_service(
     *,
     output_root: Optional[Path] = None,
     uploads_root: Optional[Path] = None,
+    max_workers: Optional[int] = None,
 ) -> ConversionService:
     global _service_instance
     output_root = output_root or default_storage_root()
@@ -1226,6 +1380,7 @@ def build_service(
         output_root=output_root,
         uploads_root=uploads_root,
         runner=runner,
+        max_workers=max_workers,
     )
     _service_instance = service
     return service
@@ -0,0 +1,134 @@
+"""Benchmark: display-text alignment in ``abogen.chunking``.
+
+Usage::
+
+    python -m benchmarks.chunk_alignment [--words 200000] [--file book.txt] [--repeat 3]
+
+Splits a book into paragraph and sentence chunks the way ``chunk_text`` does
+and times mapping every chunk back to its source span with the cursor walk in
+``abogen.chunking`` and with the per-chunk regex search it replaced
+(reproduced here as the reference). Reports chunks per second and how many
+spans differ from the reference. Without ``--file`` a synthetic book with
+irregular whitespace is generated.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import random
+import re
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Pattern, Tuple
+
+from abogen import chunking
+
+
+def _reference_attach(source: str, chunks: List[Dict[str, object]]) -> None:
+    patterns: Dict[str, Pattern[str]] = {}
+
+    def search(candidate: str, start: int) -> Optional[Tuple[int, int]]:
+        pattern = patterns.get(candidate)
+        if pattern is None:
+            escaped = re.escape(candidate).replace(r"\ ", r"\s+")
+            pattern = patterns[candidate] = re.compile(r"(\s*" + escaped + r"\s*)", re.DOTALL)
+        match = pattern.search(source, start)
+        return (match.start(1), match.end(1)) if match else None
+
+    cursor = 0
+    for chunk in chunks:
+        candidate = str(chunk.get("display_text") or chunk.get("text") or "")
+        if not candidate:
+            continue
+        match = search(candidate, cursor)
+        if match is None and cursor:
+            match = search(candidate, 0)
+        if match is None:
+            chunk.setdefault("display_text", candidate)
+            continue
+        chunk["display_text"] = source[match[0] : match[1]]
+        cursor = match[1]
+
+
+def _synthetic_book(words: int, rng: random.Random) -> str:
+    vocabulary = (
+        "the rain kept falling on old harbour town he opened door and looked outside nobody "
+        "answered so waited it was thought longest night of year why would anyone come here now "
+        "she laughed quietly across grey water lamps flickered"
+    ).split()
+    separators = [" ", " ", " ", " ", "  ", "\n", "\t"]
+    endings = [".", ".", ".", "!", "?", ". Mr."]
+    paragraphs: List[str] = []
+    count = 0
+    while count < words:
+        sentences = []
+        for _ in range(rng.randint(2, 9)):
+            length = rng.randint(4, 18)
+            body = "".join(
+                rng.choice(vocabulary) + (rng.choice(separators) if index < length - 1 else "")
+                for index in range(length)
+            )
+            sentences.append(body.capitalize() + rng.choice(endings))
+            count += length
+        paragraphs.append(" ".join(sentences))
+    return "\n\n".join(paragraphs)
+
+
+def _chunks(text: str, level: str) -> List[Dict[str, object]]:
+    chunks: List[Dict[str, object]] = []
+    for paragraph in chunking._iter_paragraphs(text):
+        if level == "paragraph":
+            chunks.append({"text": chunking._normalize_whitespace(paragraph)})
+            continue
+        for _, raw_sentence in chunking._split_sentences(paragraph):
+            chunks.append({"text": chunking._normalize_whitespace(raw_sentence), "display_text": raw_sentence})
+    return chunks
+
+
+def _time(
+    attach: Callable[[str, List[Dict[str, object]]], None],
+    text: str,
+    chunks: List[Dict[str, object]],
+    repeat: int,
+) -> Tuple[float, List[Dict[str, object]]]:
+    best = float("inf")
+    result: List[Dict[str, object]] = []
+    for _ in range(repeat):
+        result = copy.deepcopy(chunks)
+        start = time.perf_counter()
+        attach(text, result)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=200_000)
+    parser.add_argument("--file", type=Path, help="plain-text book to align instead of synthetic text")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    if args.file:
+        text = args.file.read_text(encoding="utf-8", errors="replace")
+    else:
+        text = _synthetic_book(args.words, random.Random(args.seed))
+    print(f"{len(text.split())} words, {len(text) / 1e6:.1f} MB")
+
+    print(f"{'level':<10} {'chunks':>7} {'regex/s':>10} {'walk/s':>10} {'speedup':>8} {'differ':>7}")
+    for level in ("paragraph", "sentence"):
+        chunks = _chunks(text, level)
+        reference_seconds, reference = _time(_reference_attach, text, chunks, args.repeat)
+        seconds, aligned = _time(chunking._attach_display_text, text, chunks, args.repeat)
+        differing = sum(
+            1 for old, new in zip(reference, aligned) if old.get("display_text") != new.get("display_text")
+        )
+        print(
+            f"{level:<10} {len(chunks):7d} {len(chunks) / reference_seconds:10.0f} "
+            f"{len(chunks) / seconds:10.0f} {reference_seconds / seconds:8.2f} {differing:7d}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Benchmark: streaming HTML-to-text against the BeautifulSoup conversion.
+
+Usage::
+
+    python -m benchmarks.epub_text [--corpus DIR_OR_EPUB ...] [--limit 500] [--repeat 3]
+
+Builds a regression corpus from the spine documents of the given EPUB files
+and any ``.html``/``.xhtml`` files under the given directories (default: the
+EPUB fixtures in ``tests/fixtures``). Every document is converted with the
+BeautifulSoup conversion the EPUB readers used before (reproduced here as
+the reference) and with ``abogen.epub_content.html_to_text`` on each
+available event source. Reports documents per second and how many outputs
+differ from the reference, printing the first differences.
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import os
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+import ebooklib
+from bs4 import BeautifulSoup, NavigableString
+from ebooklib import epub
+
+from abogen import epub_content
+from abogen.utils import clean_text
+
+
+def _reference_html_to_text(html: str) -> str:
+    if not html:
+        return ""
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup.find_all(["p", "div", "h1", "h2", "h3", "h4", "h5", "h6", "li", "blockquote"]):
+        tag.append("\n\n")
+    for ol in soup.find_all("ol"):
+        start_attr = ol.get("start")
+        try:
+            start = int(str(start_attr)) if start_attr is not None else 1
+        except (TypeError, ValueError):
+            start = 1
+        for idx, li in enumerate(ol.find_all("li", recursive=False)):
+            number_text = f"{start + idx}) "
+            existing = li.string
+            if isinstance(existing, NavigableString):
+                existing.replace_with(NavigableString(number_text + str(existing)))
+            else:
+                li.insert(0, NavigableString(number_text))
+    for tag in soup.find_all(["sup", "sub"]):
+        tag.decompose()
+    return clean_text(soup.get_text()).strip()
+
+
+def _load_corpus(sources: List[Path], limit: int) -> List[Tuple[str, str]]:
+    documents: List[Tuple[str, str]] = []
+    for source in sources:
+        if source.is_file() and source.suffix.lower() == ".epub":
+            book = epub.read_epub(str(source))
+            for item in book.get_items_of_type(ebooklib.ITEM_DOCUMENT):
+                documents.append((f"{source.name}:{item.get_name()}", item.get_content().decode("utf-8", errors="ignore")))
+        elif source.is_dir():
+            for root, _, files in os.walk(source):
+                for name in sorted(files):
+                    if name.lower().endswith((".html", ".xhtml", ".htm")):
+                        path = Path(root) / name
+                        documents.append((str(path), path.read_text(encoding="utf-8", errors="ignore")))
+                        if len(documents) >= limit:
+                            return documents
+        if len(documents) >= limit:
+            break
+    return documents[:limit]
+
+
+def _time(convert: Callable[[str], str], documents: List[Tuple[str, str]], repeat: int) -> Tuple[float, List[str]]:
+    best = float("inf")
+    outputs: List[str] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        outputs = [convert(html) for _, html in documents]
+        best = min(best, time.perf_counter() - start)
+    return best, outputs
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, nargs="*", default=[Path("tests/fixtures")])
+    parser.add_argument("--limit", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--show", type=int, default=3, help="differences to print per backend")
+    args = parser.parse_args(argv)
+
+    sources: List[Path] = []
+    for path in args.corpus:
+        sources.extend(sorted(path.glob("*.epub")) if path.is_dir() and any(path.glob("*.epub")) else [path])
+    documents = _load_corpus(sources, args.limit)
+    if not documents:
+        parser.error("corpus is empty")
+    size_mb = sum(len(html) for _, html in documents) / 1e6
+    print(f"{len(documents)} documents, {size_mb:.1f} MB of HTML")
+
+    reference_seconds, reference = _time(_reference_html_to_text, documents, args.repeat)
+    print(f"{'backend':<14} {'docs/s':>8} {'speedup':>8} {'differ':>7}")
+    print(f"{'soup':<14} {len(documents) / reference_seconds:8.0f} {1.0:8.2f} {0:7d}")
+
+    backends = ["html.parser"]
+    if epub_content._lxml_parser_class() is not None:
+        backends.append("lxml")
+    previous = os.environ.get("ABOGEN_HTML_PARSER")
+    try:
+        for backend in backends:
+            os.environ["ABOGEN_HTML_PARSER"] = backend
+            seconds, outputs = _time(epub_content.html_to_text, documents, args.repeat)
+            differing = [index for index, (old, new) in enumerate(zip(reference, outputs)) if old != new]
+            print(
+                f"{backend:<14} {len(documents) / seconds:8.0f} "
+                f"{reference_seconds / seconds:8.2f} {len(differing):7d}"
+            )
+            for index in differing[: args.show]:
+                diff = difflib.unified_diff(
+                    reference[index].splitlines(), outputs[index].splitlines(), "soup", backend, n=0, lineterm=""
+                )
+                print(f"  {documents[index][0]}")
+                for line in list(diff)[2:8]:
+                    print(f"    {line[:120]}")
+    finally:
+        if previous is None:
+            os.environ.pop("ABOGEN_HTML_PARSER", None)
+        else:
+            os.environ["ABOGEN_HTML_PARSER"] = previous
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Micro-benchmark: per-segment settings overhead in text normalization.
+
+Usage::
+
+    python -m benchmarks.normalization_settings [--segments 2000]
+
+Normalizes the same short segments twice: through ``prepare_text_for_tts``
+without a context (settings resolved on every call, as before) and through a
+``TTSContext`` from ``build_tts_context`` (settings frozen once). Reports the
+settings-resolution profiling counter for both runs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from abogen.domain.enums import Language
+from abogen.domain.normalization import (
+    build_tts_context,
+    get_settings_resolution_stats,
+    prepare_text_for_tts,
+    reset_settings_resolution_stats,
+)
+
+_SEGMENTS = (
+    "It's late, and the '90s band won't play.",
+    "Dr. Smith paid $5 on 12/03/2021 at 10:30.",
+    "The boss's dogs' collars were new.",
+    "Call me Ishmael.",
+)
+
+
+def _run(label: str, normalize, segments: list[str]) -> None:
+    reset_settings_resolution_stats()
+    start = time.perf_counter()
+    for segment in segments:
+        normalize(segment)
+    elapsed = time.perf_counter() - start
+    stats = get_settings_resolution_stats()
+    print(
+        f"{label:<10} {elapsed / len(segments) * 1e6:9.1f} us/segment  "
+        f"settings resolved {stats.calls:5d}x  "
+        f"({stats.per_call_us:.1f} us/resolution, "
+        f"{stats.seconds / len(segments) * 1e6:.1f} us/segment)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--segments", type=int, default=2000)
+    args = parser.parse_args()
+
+    segments = [_SEGMENTS[i % len(_SEGMENTS)] for i in range(args.segments)]
+    overrides = {"normalization_numbers_year_style": "american"}
+
+    # Warm spaCy / settings caches so neither run pays the one-off load.
+    prepare_text_for_tts(segments[0])
+
+    _run(
+        "per-call",
+        lambda text: prepare_text_for_tts(text, normalization_overrides=overrides),
+        segments,
+    )
+
+    from abogen.domain.config_types import PronunciationConfig
+
+    ctx = build_tts_context(
+        language=Language.EN_US,
+        pronunciation=PronunciationConfig(normalization_overrides=overrides),
+    )
+    _run("frozen", ctx.normalize, segments)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Micro-benchmark: single-pass pronunciation matcher vs. one regex per rule.
+
+Usage::
+
+    python -m benchmarks.pronunciation_rules [--rules 500] [--segments 2000]
+
+Builds a synthetic override list and a chapter's worth of sentences that
+mention a subset of the tokens, then times ``apply_pronunciation_rules``
+against the previous implementation (one ``pattern.sub`` per rule).
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import string
+import time
+from typing import Any, Dict, List, Optional
+
+from abogen.domain.pronunciation import (
+    apply_pronunciation_rules,
+    compile_pronunciation_rules,
+)
+
+
+def apply_rules_per_regex(
+    text: str,
+    rules: List[Dict[str, Any]],
+    usage_counter: Optional[Dict[str, int]] = None,
+) -> str:
+    """The previous implementation: one full scan of *text* per rule."""
+    result = text
+    for rule in rules:
+        pronunciation_value = rule["replacement"]
+        usage_key = str(rule.get("normalized") or "").strip()
+
+        def _replacement(match: re.Match[str]) -> str:
+            if usage_counter is not None and usage_key:
+                usage_counter[usage_key] = usage_counter.get(usage_key, 0) + 1
+            return pronunciation_value + (match.group("possessive") or "")
+
+        result = rule["pattern"].sub(_replacement, result)
+    return result
+
+
+def _make_overrides(count: int, rng: random.Random) -> List[Dict[str, str]]:
+    overrides = []
+    for index in range(count):
+        length = rng.randint(4, 10)
+        name = "".join(rng.choice(string.ascii_lowercase) for _ in range(length))
+        token = name.capitalize()
+        if index % 5 == 0:
+            token = f"{token} {rng.choice(['Hall', 'Street', 'Tower'])}"
+        overrides.append({"token": token, "pronunciation": f"{name}-ish"})
+    return overrides
+
+
+def _make_segments(
+    overrides: List[Dict[str, str]], count: int, rng: random.Random
+) -> List[str]:
+    filler = "the quick brown fox jumps over a lazy dog while it rains".split()
+    segments = []
+    for _ in range(count):
+        words = rng.choices(filler, k=rng.randint(15, 40))
+        for _ in range(rng.randint(0, 3)):
+            words.insert(rng.randrange(len(words)), rng.choice(overrides)["token"] + "'s")
+        segments.append(" ".join(words) + ".")
+    return segments
+
+
+def _time(label: str, func, segments, rules, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for segment in segments:
+            func(segment, rules, {})
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<14} {best * 1000:9.1f} ms  ({best / len(segments) * 1e6:.1f} us/segment)")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rules", type=int, default=500)
+    parser.add_argument("--segments", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(1234)
+    overrides = _make_overrides(args.rules, rng)
+    segments = _make_segments(overrides, args.segments, rng)
+
+    start = time.perf_counter()
+    rules = compile_pronunciation_rules(overrides)
+    print(f"compile        {(time.perf_counter() - start) * 1000:9.1f} ms  ({len(rules)} rules)")
+
+    for segment in segments:
+        expected = apply_rules_per_regex(segment, rules)
+        if apply_pronunciation_rules(segment, rules) != expected:
+            raise SystemExit(f"Mismatch on segment: {segment!r}")
+
+    baseline = _time("per-regex", apply_rules_per_regex, segments, rules, args.repeat)
+    single = _time("single-pass", apply_pronunciation_rules, segments, rules, args.repeat)
+    print(f"speedup        {baseline / single:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
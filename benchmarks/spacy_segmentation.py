@@ -0,0 +1,101 @@
+"""Benchmark: spaCy sentence segmentation modes against the parser.
+
+Usage::
+
+    python -m benchmarks.spacy_segmentation [--language en-us] [--file book.txt] [--repeat 3]
+
+Segments the same text with every mode from ``abogen.spacy_utils`` and
+reports sentences per second plus boundary agreement with ``parser`` mode
+(precision/recall/F1 over sentence end offsets). Without ``--file`` a
+synthetic text with quotes, abbreviations and parentheses is used. Modes
+whose model is not installed are skipped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+
+from abogen.domain.enums import Language
+from abogen.spacy_utils import SEGMENTATION_MODES, get_spacy_model
+
+
+def _synthetic_text(paragraphs: int, rng: random.Random) -> str:
+    templates = [
+        "Dr. Watson looked up from the paper. \"Are you certain?\" he asked.",
+        "The train left at 9 a.m. sharp (or so the timetable claimed).",
+        "She whispered, \"Not now.\" Then she was gone!",
+        "Mr. and Mrs. Smith arrived late; nobody minded.",
+        "It cost $4.50 in 1999, i.e. far less than today.",
+        "\"Why?\" \"Because,\" said the boy, \"it was there.\"",
+    ]
+    return "\n\n".join(
+        " ".join(rng.choice(templates) for _ in range(rng.randint(3, 8)))
+        for _ in range(paragraphs)
+    )
+
+
+def _segment(nlp, paragraphs: List[str]) -> Tuple[Set[Tuple[int, int]], int]:
+    """Return (paragraph index, sentence end offset) pairs and the sentence count."""
+    boundaries: Set[Tuple[int, int]] = set()
+    count = 0
+    for index, doc in enumerate(nlp.pipe(paragraphs)):
+        for sent in doc.sents:
+            if sent.text.strip():
+                boundaries.add((index, len(doc.text[: sent.end_char].rstrip())))
+                count += 1
+    return boundaries, count
+
+
+def _time_mode(nlp, paragraphs: List[str], repeat: int) -> Tuple[float, Set[Tuple[int, int]], int]:
+    best = float("inf")
+    boundaries: Set[Tuple[int, int]] = set()
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        boundaries, count = _segment(nlp, paragraphs)
+        best = min(best, time.perf_counter() - start)
+    return best, boundaries, count
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--language", default="en-us")
+    parser.add_argument("--file", type=Path)
+    parser.add_argument("--paragraphs", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    language = Language.from_str(args.language)
+    if args.file:
+        text = args.file.read_text(encoding="utf-8")
+    else:
+        text = _synthetic_text(args.paragraphs, random.Random(1234))
+    paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
+
+    reference: Optional[Set[Tuple[int, int]]] = None
+    print(f"{'mode':<12} {'sent/s':>10} {'sentences':>10} {'precision':>10} {'recall':>8} {'F1':>6}")
+    for mode in SEGMENTATION_MODES:
+        nlp = get_spacy_model(language, log_callback=lambda msg: None, mode=mode)
+        if nlp is None:
+            print(f"{mode:<12} {'(model unavailable)':>10}")
+            continue
+        _segment(nlp, paragraphs[:5])  # warm-up
+        seconds, boundaries, count = _time_mode(nlp, paragraphs, args.repeat)
+        if mode == "parser":
+            reference = boundaries
+        line = f"{mode:<12} {count / seconds:10.0f} {count:10d}"
+        if reference is not None:
+            agreed = len(boundaries & reference)
+            precision = agreed / len(boundaries) if boundaries else 0.0
+            recall = agreed / len(reference) if reference else 0.0
+            f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+            line += f" {precision:10.3f} {recall:8.3f} {f1:6.3f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
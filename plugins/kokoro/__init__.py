@@ -52,7 +52,7 @@ PLUGIN_MANIFEST = PluginManifest(
     api_version="1.0",
     description="Kokoro TTS engine - high quality multilingual text-to-speech",
     author="Kokoro Team",
-    capabilities=("voice_list",),
+    capabilities=("voice_list", "streaming"),
     requires=RequirementManifest(
         internet=False,
     ),
@@ -11,7 +11,8 @@ Callers outside this module never see engine-specific codes.
 from __future__ import annotations
 
 import logging
-from typing import Any
+from dataclasses import replace
+from typing import Any, Iterator
 
 import numpy as np
 
@@ -101,7 +102,8 @@ def language_for_voice_id(voice_id: str | None) -> Language:
 class KokoroSession:
     """EngineSession implementation for Kokoro.
 
-    Owns mutable execution state for synthesis.
+    Owns mutable execution state for synthesis. Also implements the
+    SegmentStreamer and StreamingSynthesizer capabilities.
     NOT thread-safe.
     """
 
@@ -109,8 +111,12 @@ class KokoroSession:
         self._pipeline = pipeline
         self._disposed = False
 
-    def synthesize(self, request: SynthesisRequest) -> SynthesizedAudio:
-        """Synthesize audio from text using Kokoro."""
+    def synthesizeSegments(self, request: SynthesisRequest) -> Iterator[AudioSegment]:
+        """Yield segments as Kokoro produces them. Implements SegmentStreamer.
+
+        Each segment's ``audio`` is a zero-copy float32 view of the model
+        output, so only the segment currently in flight is held in memory.
+        """
         if self._disposed:
             raise EngineError("Session disposed")
 
@@ -119,22 +125,20 @@ class KokoroSession:
             speed = request.parameters.values.get("speed", 1.0)
             split_pattern = request.parameters.values.get("split_pattern", None)
 
-            sample_rate = _KOKORO_SAMPLE_RATE
-            audio_parts: list[np.ndarray] = []
-            segments: list[AudioSegment] = []
             for segment in self._pipeline(
                 request.text,
                 voice=voice,
                 speed=speed,
                 split_pattern=split_pattern,
             ):
+                if self._disposed:
+                    raise EngineError("Session disposed")
                 audio = segment.audio
                 if hasattr(audio, "numpy"):
                     audio = audio.numpy()
-                audio = np.asarray(audio, dtype="float32")
+                audio = np.ascontiguousarray(audio, dtype="float32").reshape(-1)
                 if audio.size == 0:
                     continue
-                audio_parts.append(audio)
 
                 tokens = tuple(
                     TokenTiming(
@@ -145,36 +149,48 @@ class KokoroSession:
                     )
                     for tok in (getattr(segment, "tokens", None) or [])
                 )
-                segments.append(
-                    AudioSegment(
-                        graphemes=str(getattr(segment, "graphemes", "") or ""),
-                        audio=audio.tobytes(),
-                        sample_rate=sample_rate,
-                        tokens=tokens,
-                    )
-                )
-
-            if not audio_parts:
-                return SynthesizedAudio(
-                    data=b"",
-                    format=AudioFormat(mime="audio/wav", extension="wav"),
-                    duration=Duration(seconds=0.0),
+                yield AudioSegment(
+                    graphemes=str(getattr(segment, "graphemes", "") or ""),
+                    audio=memoryview(audio).cast("B"),
+                    sample_rate=_KOKORO_SAMPLE_RATE,
+                    tokens=tokens,
                 )
+        except EngineError:
+            raise
+        except Exception as e:
+            raise EngineError(f"Synthesis failed: {e}") from e
 
-            combined = np.concatenate(audio_parts).astype("float32", copy=False)
-            audio_bytes = combined.tobytes()
-            duration_seconds = len(combined) / sample_rate
+    def synthesizeStream(self, request: SynthesisRequest) -> Iterator[bytes]:
+        """Yield raw float32 PCM chunks. Implements StreamingSynthesizer."""
+        for segment in self.synthesizeSegments(request):
+            yield bytes(segment.audio)
 
+    def synthesize(self, request: SynthesisRequest) -> SynthesizedAudio:
+        """Synthesize audio from text using Kokoro."""
+        segments: list[AudioSegment] = []
+        parts: list[bytes] = []
+        for segment in self.synthesizeSegments(request):
+            data = bytes(segment.audio)
+            parts.append(data)
+            segments.append(replace(segment, audio=data))
+
+        if not parts:
             return SynthesizedAudio(
-                data=audio_bytes,
+                data=b"",
                 format=AudioFormat(mime="audio/wav", extension="wav"),
-                duration=Duration(seconds=duration_seconds),
-                segments=tuple(segments),
+                duration=Duration(seconds=0.0),
             )
-        except EngineError:
-            raise
-        except Exception as e:
-            raise EngineError(f"Synthesis failed: {e}") from e
+
+        audio_bytes = b"".join(parts)
+        # float32 → 4 bytes per sample
+        duration_seconds = len(audio_bytes) / 4 / _KOKORO_SAMPLE_RATE
+
+        return SynthesizedAudio(
+            data=audio_bytes,
+            format=AudioFormat(mime="audio/wav", extension="wav"),
+            duration=Duration(seconds=duration_seconds),
+            segments=tuple(segments),
+        )
 
     def dispose(self) -> None:
         """Release session resources. Idempotent."""
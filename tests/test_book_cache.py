@@ -0,0 +1,104 @@
+"""Tests for the content-hash parsed-book cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from abogen import book_cache
+from abogen.application.conversion_planner import build_conversion_plan
+from abogen.application.conversion_request import ConversionRequest
+from abogen.book_cache import BookCache, book_cache_key, cached_extract_from_path
+from abogen.text_extractor import ExtractedChapter, ExtractionResult
+
+MARKDOWN = "# One\n\n" + "First chapter text. " * 40 + "\n\n# Two\n\n" + "Second chapter text. " * 40 + "\n"
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = BookCache(tmp_path / "books.sqlite3", max_bytes=10 * 1024 * 1024)
+    monkeypatch.setattr(book_cache, "get_book_cache", lambda: cache)
+    yield cache
+    cache.close()
+
+
+def _fail(*args, **kwargs):
+    raise AssertionError("book parsed on a cache hit")
+
+
+def test_same_content_under_new_name_is_not_reparsed(tmp_path, cache, monkeypatch):
+    first = tmp_path / "upload_a_book.md"
+    first.write_text(MARKDOWN, encoding="utf-8")
+    result = cached_extract_from_path(first)
+    result.metadata["title"] = "Changed by caller"
+
+    second = tmp_path / "upload_b_book.md"
+    second.write_text(MARKDOWN, encoding="utf-8")
+    monkeypatch.setattr(book_cache, "extract_from_path", _fail)
+    again = cached_extract_from_path(second)
+
+    assert [(c.title, c.text) for c in again.chapters] == [(c.title, c.text) for c in result.chapters]
+    assert again.metadata.get("title") != "Changed by caller"
+
+
+def test_cover_round_trips(tmp_path, cache, monkeypatch):
+    path = tmp_path / "book.epub"
+    path.write_bytes(b"not really an epub")
+    extracted = ExtractionResult(
+        chapters=[ExtractedChapter(title="Ch", text="Body")],
+        metadata={"title": "T"},
+        cover_image=b"\x89PNG...",
+        cover_mime="image/png",
+    )
+    monkeypatch.setattr(book_cache, "extract_from_path", lambda _: extracted)
+    cached_extract_from_path(path)
+
+    monkeypatch.setattr(book_cache, "extract_from_path", _fail)
+    again = cached_extract_from_path(path)
+    assert (again.cover_image, again.cover_mime, again.metadata) == (b"\x89PNG...", "image/png", {"title": "T"})
+
+
+def test_key_tracks_content_kind_and_options(tmp_path):
+    path = tmp_path / "a.md"
+    path.write_text("one", encoding="utf-8")
+    key = book_cache_key(path, "extraction", True)
+    assert book_cache_key(path, "extraction", False) != key
+    assert book_cache_key(path, "parser", True) != key
+    path.write_text("two", encoding="utf-8")
+    assert book_cache_key(path, "extraction", True) != key
+
+
+def test_planner_reads_book_chapters_from_cache(tmp_path, cache, monkeypatch):
+    path = Path(tmp_path / "book.md")
+    path.write_text(MARKDOWN, encoding="utf-8")
+    cached_extract_from_path(path)
+
+    monkeypatch.setattr(book_cache, "extract_from_path", _fail)
+    plan = build_conversion_plan(ConversionRequest(source_path=path, voice="M1"))
+    assert [chapter.title for chapter in plan.chapters] == ["One", "Two"]
+    assert "Second chapter text." in plan.chapters[1].body_text
+
+
+def test_pdfs_are_left_to_the_page_cache(tmp_path, cache, monkeypatch):
+    import fitz  # PyMuPDF
+
+    from abogen import pdf_pages
+    from abogen.pdf_pages import PdfPageCache
+
+    pages = PdfPageCache(tmp_path / "pages.sqlite3", max_bytes=10 * 1024 * 1024)
+    monkeypatch.setattr(pdf_pages, "get_pdf_page_cache", lambda: pages)
+    path = tmp_path / "book.pdf"
+    doc = fitz.open()
+    doc.new_page().insert_text((50, 50), "Only page")
+    doc.save(str(path))
+    doc.close()
+
+    first = cached_extract_from_path(path)
+    assert book_cache.lookup(path, "parser", "pdf", True) == (None, None)
+    assert cache._conn.execute("SELECT COUNT(*) FROM books").fetchone()[0] == 0
+    assert pages._conn.execute("SELECT COUNT(*) FROM books").fetchone()[0] == 1
+
+    monkeypatch.setattr(pdf_pages, "iter_pdf_page_texts", _fail)
+    assert [c.text for c in cached_extract_from_path(path).chapters] == [c.text for c in first.chapters]
+    pages.close()
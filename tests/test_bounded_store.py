@@ -0,0 +1,110 @@
+"""Tests for the size-bounded SQLite store shared by the on-disk caches."""
+
+from __future__ import annotations
+
+import pytest
+
+from abogen.book_cache import BookCache
+from abogen.bounded_store import SharedStore, cache_limit_bytes
+from abogen.entity_cache import EntityCache
+from abogen.llm_cache import LLMNormalizationCache, cache_key
+from abogen.pdf_pages import PdfPageCache
+
+_TEXT = "".join(chr(0x4E00 + i % 500) for i in range(3000))
+_SUMMARY = {"people": [{"label": f"Person {i}", "samples": [str(i) * 50]} for i in range(200)]}
+_PAGES = ["x" * 4000 + str(i) for i in range(3)]
+
+
+def _llm_key(name):
+    return cache_key("model", "prompt", name, "paragraph")
+
+
+# (store class, put(cache, name), read(cache, name) -> value or None, expected value)
+CACHES = {
+    "book": (
+        BookCache,
+        lambda cache, name: cache.put(name, {"text": _TEXT}),
+        lambda cache, name: cache.get(name),
+        ({"text": _TEXT}, None),
+    ),
+    "entity": (
+        EntityCache,
+        lambda cache, name: cache.put(name, _SUMMARY),
+        lambda cache, name: cache.get(name),
+        _SUMMARY,
+    ),
+    "pdf_pages": (
+        PdfPageCache,
+        lambda cache, name: cache.put(name, _PAGES),
+        lambda cache, name: None if cache.iter_pages(name) is None else list(cache.iter_pages(name)),
+        _PAGES,
+    ),
+    "llm": (
+        LLMNormalizationCache,
+        lambda cache, name: cache.put_many({_llm_key(name): _TEXT}),
+        lambda cache, name: cache.get_many([_llm_key(name)]).get(_llm_key(name)),
+        _TEXT,
+    ),
+}
+
+
+@pytest.mark.parametrize("kind", list(CACHES))
+def test_least_recently_used_entries_are_evicted(tmp_path, kind):
+    store_class, put, read, expected = CACHES[kind]
+    probe = store_class(tmp_path / "probe.sqlite3", max_bytes=10 * 1024 * 1024)
+    put(probe, "probe")
+    size = probe._conn.execute(f"SELECT size FROM {probe.table}").fetchone()[0]
+    probe.close()
+
+    cache = store_class(tmp_path / "lru.sqlite3", max_bytes=int(size * 2.5))
+    put(cache, "a")
+    put(cache, "b")
+    assert read(cache, "a") == expected
+    put(cache, "c")
+
+    assert read(cache, "b") is None
+    assert read(cache, "a") == expected
+    assert read(cache, "c") == expected
+    for table in (*cache.child_tables, cache.table):
+        keys = {row[0] for row in cache._conn.execute(f"SELECT key FROM {table}")}
+        assert len(keys) == 2
+    cache.close()
+
+
+def test_entries_over_the_whole_budget_are_not_stored(tmp_path):
+    cache = EntityCache(tmp_path / "small.sqlite3", max_bytes=16)
+    cache.put("big", _SUMMARY)
+    assert cache.get("big") is None
+    cache.close()
+
+
+def test_undecodable_entry_is_dropped_as_a_miss(tmp_path):
+    cache = EntityCache(tmp_path / "corrupt.sqlite3", max_bytes=1024 * 1024)
+    cache._store("bad", 3, {"payload": b"not zlib"})
+    assert cache.get("bad") is None
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert cache._conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0] == 0
+    cache.close()
+
+
+def test_shared_store_reads_budget_and_reopens(tmp_path, monkeypatch):
+    opened = []
+
+    def open_store(max_bytes):
+        opened.append(max_bytes)
+        return EntityCache(tmp_path / f"shared{len(opened)}.sqlite3", max_bytes)
+
+    shared = SharedStore(open_store, "ABOGEN_TEST_CACHE_MB", 8)
+    monkeypatch.setenv("ABOGEN_TEST_CACHE_MB", "0")
+    assert shared.get() is None
+
+    monkeypatch.setenv("ABOGEN_TEST_CACHE_MB", "bogus")
+    first = shared.get()
+    assert shared.get() is first
+    assert opened == [8 * 1024 * 1024]
+
+    shared.reset()
+    monkeypatch.setenv("ABOGEN_TEST_CACHE_MB", "2")
+    assert shared.get() is not first
+    assert opened[-1] == cache_limit_bytes("ABOGEN_TEST_CACHE_MB", 8) == 2 * 1024 * 1024
+    shared.reset()
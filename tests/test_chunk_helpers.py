@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 
-from abogen.chunking import chunk_text
+from abogen.chunking import _search_source_span, chunk_text
 from abogen.domain.voice_resolution import chunk_voice_spec
 from abogen.domain.chunk_utils import group_chunks_by_chapter
 
@@ -84,3 +84,22 @@ def test_chunk_text_display_preserves_whitespace() -> None:
     assert second_display == "Third paragraph."
     first_original = str(chunks[0].get("original_text") or "")
     assert first_original.endswith("\n\n")
+
+
+def test_search_source_span_ignores_whitespace_width() -> None:
+    source = "Intro.  Alpha\tbeta\n gamma.  Alpha beta gamma."
+
+    assert _search_source_span(source, "Alpha beta gamma.", 0) == (6, 28)
+    assert _search_source_span(source, "Alpha beta gamma.", 28) == (28, 45)
+    # A leading space needs whitespace before the match; a trailing one after it.
+    assert _search_source_span(source, " Intro.", 0) is None
+    assert _search_source_span(source, "gamma. ", 30) is None
+    assert _search_source_span(source, "Alpha gamma", 0) is None
+
+
+def test_chunk_text_aligns_repeated_sentences_in_order() -> None:
+    text = "Yes. No. Yes.\n\nYes."
+
+    chunks = chunk_text(chapter_index=0, chapter_title="Chapter 1", text=text, level="sentence")
+
+    assert "".join(str(chunk["display_text"]) for chunk in chunks) == text
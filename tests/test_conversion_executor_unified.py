@@ -5,6 +5,7 @@ to test the executor without real TTS or audio I/O.
 """
 
 import tempfile
+from dataclasses import replace
 from pathlib import Path
 from typing import Any, List, Optional
 from unittest.mock import MagicMock
@@ -616,6 +617,334 @@ class TestHeadingDedup:
             assert result.total_segments >= 2
 
 
+class VariableLengthBackend(FakeBackend):
+    """Fake backend whose audio length depends on the input text."""
+
+    def __call__(self, text: str, *, voice: Any, speed: float = 1.0, split_pattern: str = "", **kwargs: Any) -> List:
+        self.synthesized.append(text)
+
+        class FakeSegment:
+            def __init__(self, text: str):
+                self.graphemes = text
+                self.audio = np.full(240 * len(text), 0.01, dtype=np.float32)
+                self.tokens = []
+
+        return [FakeSegment(text)]
+
+
+class VariableLengthPipelineProvider(FakePipelineProvider):
+    def get(self, provider: str, language: str, use_gpu: bool) -> FakeBackend:
+        key = f"{provider}:{language}"
+        if key not in self.backends:
+            self.backends[key] = VariableLengthBackend()
+        return self.backends[key]
+
+
+def _srt_entries(content: str) -> List[float]:
+    """Flatten SRT timestamps into seconds for approximate comparison."""
+    import re
+
+    times = []
+    for h, m, sec, ms in re.findall(r"(\d+):(\d+):(\d+),(\d+)", content):
+        times.append(int(h) * 3600 + int(m) * 60 + int(sec) + int(ms) / 1000)
+    return times
+
+
+def _marker_times(markers: List[dict]) -> List[float]:
+    return [value for marker in markers for value in (marker["start"], marker["end"])]
+
+
+class TestParallelChapters:
+    """Chapter-parallel synthesis must match the serial output."""
+
+    def _plan(self, tmpdir: str, *, chapter_workers: int = 1) -> ConversionPlan:
+        from abogen.domain.config_types import SubtitleConfig
+        from abogen.domain.enums import SubtitleMode
+
+        req = ConversionRequest(
+            direct_text="Text",
+            voice="M1",
+            silence_between_chapters=0.5,
+            subtitle=SubtitleConfig(mode=SubtitleMode.LINE),
+            chapter_workers=chapter_workers,
+            save=SaveConfig(
+                mode="custom_folder",
+                output_folder=Path(tmpdir),
+                save_chapters_separately=True,
+                merge_chapters_at_end=True,
+            ),
+        )
+        chapters = []
+        for index, body in enumerate(["Short one.", "A somewhat longer second chapter.", "Third."], 1):
+            chapters.append(
+                ChapterPlan(
+                    index=index,
+                    title=f"Part {index}",
+                    original_title=f"Part {index}",
+                    body_text=body,
+                    segments=[
+                        SegmentPlan(text=body, voice_spec="M1", kind="body", source="chunk", chunk_id=f"c{index}", chunk_index=0)
+                    ],
+                    voice_spec="M1",
+                )
+            )
+        return ConversionPlan(
+            request=req,
+            metadata={},
+            chapters=chapters,
+            output_layout=OutputLayout(parent_dir=Path(tmpdir), audio_dir=Path(tmpdir)),
+        )
+
+    def _run(self, tmpdir: str, workers: int):
+        plan = self._plan(tmpdir, chapter_workers=workers)
+        result = execute_conversion(
+            plan,
+            FakeEvents(),
+            VariableLengthPipelineProvider(),
+            FakeVoiceResolver(),
+            TTSContext(),
+            pipeline_provider_factory=VariableLengthPipelineProvider,
+        )
+        import soundfile as sf
+
+        audio, _ = sf.read(str(result.audio_path), dtype="float32")
+        subtitles = result.audio_path.with_suffix(".srt").read_text(encoding="utf-8")
+        return result, audio, subtitles
+
+    def test_parallel_matches_serial(self):
+        with tempfile.TemporaryDirectory() as serial_dir, tempfile.TemporaryDirectory() as parallel_dir:
+            serial, serial_audio, serial_subs = self._run(serial_dir, 1)
+            parallel, parallel_audio, parallel_subs = self._run(parallel_dir, 3)
+
+            assert len(parallel_audio) == len(serial_audio)
+            assert np.allclose(parallel_audio, serial_audio, atol=1e-4)
+            assert _srt_entries(parallel_subs) == pytest.approx(_srt_entries(serial_subs), abs=0.002)
+            assert _marker_times(parallel.chapter_markers) == pytest.approx(_marker_times(serial.chapter_markers))
+            assert [m["chapter_index"] for m in parallel.chapter_markers] == [0, 1, 2]
+            assert _marker_times(parallel.chunk_markers) == pytest.approx(_marker_times(serial.chunk_markers))
+            assert [p.name for p in parallel.chapter_paths] == [p.name for p in serial.chapter_paths]
+
+    def test_parallel_requires_pipeline_factory(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plan = self._plan(tmpdir, chapter_workers=3)
+            result = execute_conversion(
+                plan, FakeEvents(), VariableLengthPipelineProvider(), FakeVoiceResolver(), TTSContext()
+            )
+            assert [m["chapter_index"] for m in result.chapter_markers] == [0, 1, 2]
+
+    def test_parallel_propagates_cancellation(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plan = self._plan(tmpdir, chapter_workers=2)
+            events = FakeEvents()
+            events.cancelled = True
+            with pytest.raises(RuntimeError):
+                execute_conversion(
+                    plan,
+                    events,
+                    VariableLengthPipelineProvider(),
+                    FakeVoiceResolver(),
+                    TTSContext(),
+                    pipeline_provider_factory=VariableLengthPipelineProvider,
+                )
+
+    def test_failed_chapter_stops_other_workers_at_once(self):
+        import time
+
+        class _SlowOrFailing(VariableLengthPipelineProvider):
+            def get(self, provider: str, language: str, use_gpu: bool) -> FakeBackend:
+                backend = super().get(provider, language, use_gpu)
+
+                def _call(text: str, **kwargs: Any) -> List:
+                    if "Fail" in text:
+                        raise OSError("simulated crash")
+                    time.sleep(0.05)
+                    return backend(text, **kwargs)
+
+                return _call
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plan = self._plan(tmpdir, chapter_workers=2)
+            first = plan.chapters[0]
+            first.segments = [replace(first.segments[0], text=f"Slow part {i}.") for i in range(60)]
+            plan.chapters[1].segments = [replace(plan.chapters[1].segments[0], text="Fail now.")]
+
+            started = time.monotonic()
+            with pytest.raises(OSError, match="simulated crash"):
+                execute_conversion(
+                    plan,
+                    FakeEvents(),
+                    VariableLengthPipelineProvider(),
+                    FakeVoiceResolver(),
+                    TTSContext(),
+                    pipeline_provider_factory=_SlowOrFailing,
+                )
+            assert time.monotonic() - started < 1.5
+
+
+class _FailingPipelineProvider(VariableLengthPipelineProvider):
+    """Raises when asked to synthesize text containing ``fail_on``."""
+
+    def __init__(self, fail_on: str) -> None:
+        super().__init__()
+        self.fail_on = fail_on
+
+    def get(self, provider: str, language: str, use_gpu: bool) -> FakeBackend:
+        backend = super().get(provider, language, use_gpu)
+        fail_on = self.fail_on
+
+        class _Failing:
+            synthesized = backend.synthesized
+
+            def __call__(self, text: str, **kwargs: Any) -> List:
+                if fail_on in text:
+                    raise OSError("simulated crash")
+                return backend(text, **kwargs)
+
+        return _Failing()
+
+
+class TestCheckpointResume:
+    """Checkpointed runs resume at the first unfinished chapter."""
+
+    _plan = TestParallelChapters._plan
+
+    def _run(self, tmpdir: str, provider: Any, checkpoint: Any, plan: Optional[ConversionPlan] = None):
+        plan = plan or self._plan(tmpdir)
+        result = execute_conversion(
+            plan, FakeEvents(), provider, FakeVoiceResolver(), TTSContext(), checkpoint=checkpoint
+        )
+        import soundfile as sf
+
+        audio, _ = sf.read(str(result.audio_path), dtype="float32")
+        subtitles = result.audio_path.with_suffix(".srt").read_text(encoding="utf-8")
+        return result, audio, subtitles
+
+    def _synthesized(self, provider: VariableLengthPipelineProvider) -> List[str]:
+        return [text for backend in provider.backends.values() for text in backend.synthesized]
+
+    def test_resume_after_crash_matches_uninterrupted_run(self):
+        from abogen.application.conversion_checkpoint import CheckpointStore
+
+        with tempfile.TemporaryDirectory() as ref_dir, tempfile.TemporaryDirectory() as out_dir, \
+                tempfile.TemporaryDirectory() as ckpt_dir:
+            reference, ref_audio, ref_subs = self._run(ref_dir, VariableLengthPipelineProvider(), None)
+
+            with pytest.raises(OSError):
+                self._run(out_dir, _FailingPipelineProvider("Third"), CheckpointStore(ckpt_dir))
+            assert CheckpointStore(ckpt_dir).completed() == [1, 2]
+            assert {p.suffix for p in Path(ckpt_dir).glob("chapter_*")} == {".flac"}
+
+            provider = VariableLengthPipelineProvider()
+            resumed, audio, subs = self._run(out_dir, provider, CheckpointStore(ckpt_dir))
+
+            assert self._synthesized(provider) == ["Part three.", "Third."]
+            assert np.allclose(audio, ref_audio, atol=1e-4)
+            assert _srt_entries(subs) == pytest.approx(_srt_entries(ref_subs), abs=0.002)
+            assert _marker_times(resumed.chapter_markers) == pytest.approx(_marker_times(reference.chapter_markers))
+            assert _marker_times(resumed.chunk_markers) == pytest.approx(_marker_times(reference.chunk_markers))
+            assert [p.name for p in resumed.chapter_paths] == [p.name for p in reference.chapter_paths]
+
+    def test_changed_chapter_is_rerendered(self):
+        from abogen.application.conversion_checkpoint import CheckpointStore
+
+        with tempfile.TemporaryDirectory() as out_dir, tempfile.TemporaryDirectory() as ckpt_dir:
+            self._run(out_dir, VariableLengthPipelineProvider(), CheckpointStore(ckpt_dir))
+
+            plan = self._plan(out_dir)
+            plan.chapters[1].segments[0].text = "An edited second chapter."
+            provider = VariableLengthPipelineProvider()
+            self._run(out_dir, provider, CheckpointStore(ckpt_dir), plan)
+            assert self._synthesized(provider) == ["Part two.", "An edited second chapter."]
+
+    def test_torn_manifest_line_is_ignored(self):
+        from abogen.application.conversion_checkpoint import MANIFEST_NAME, CheckpointStore
+
+        with tempfile.TemporaryDirectory() as out_dir, tempfile.TemporaryDirectory() as ckpt_dir:
+            self._run(out_dir, VariableLengthPipelineProvider(), CheckpointStore(ckpt_dir))
+            with open(Path(ckpt_dir) / MANIFEST_NAME, "a", encoding="utf-8") as handle:
+                handle.write('{"version": 1, "chap')
+            assert CheckpointStore(ckpt_dir).completed() == [1, 2, 3]
+
+
+class TestIncrementalRender:
+    """Unchanged chapters are reused from the previous project render."""
+
+    _plan = TestParallelChapters._plan
+    _run = TestCheckpointResume._run
+    _synthesized = TestCheckpointResume._synthesized
+
+    def test_only_edited_chapter_is_synthesized(self):
+        from abogen.application.conversion_checkpoint import (
+            PROJECT_RENDER_DIR,
+            find_previous_project_store,
+            open_project_store,
+        )
+
+        with tempfile.TemporaryDirectory() as base, tempfile.TemporaryDirectory() as ref_dir:
+            first_root = Path(base) / "20240101-000000_book"
+            second_root = Path(base) / "20240102-000000_book"
+            self._run(str(first_root), VariableLengthPipelineProvider(), open_project_store(first_root))
+            assert (first_root / PROJECT_RENDER_DIR / "chapter_00001.flac").is_file()
+
+            previous = find_previous_project_store(second_root)
+            assert previous is not None and previous.directory.parent == first_root
+
+            edited = self._plan(str(second_root))
+            edited.chapters[1].segments[0].text = "An edited second chapter."
+            provider = VariableLengthPipelineProvider()
+            store = open_project_store(second_root)
+            result = execute_conversion(
+                edited, FakeEvents(), provider, FakeVoiceResolver(), TTSContext(),
+                checkpoint=store, previous_render=previous,
+            )
+            assert self._synthesized(provider) == ["Part two.", "An edited second chapter."]
+            assert store.completed() == [1, 2, 3]
+
+            reference_plan = self._plan(ref_dir)
+            reference_plan.chapters[1].segments[0].text = "An edited second chapter."
+            reference, ref_audio, _ = self._run(ref_dir, VariableLengthPipelineProvider(), None, reference_plan)
+            import soundfile as sf
+
+            audio, _ = sf.read(str(result.audio_path), dtype="float32")
+            assert len(audio) == len(ref_audio)
+            assert np.allclose(audio, ref_audio, atol=1e-4)
+            assert _marker_times(result.chapter_markers) == pytest.approx(_marker_times(reference.chapter_markers))
+
+    def test_compact_drops_stale_records_and_shards(self):
+        from abogen.application.conversion_checkpoint import MANIFEST_NAME, open_project_store
+
+        with tempfile.TemporaryDirectory() as root:
+            store = open_project_store(root)
+            self._run(root, VariableLengthPipelineProvider(), store)
+            edited = self._plan(root)
+            edited.chapters[2].segments[0].text = "Third, revised."
+            self._run(root, VariableLengthPipelineProvider(), store, edited)
+            manifest = store.directory / MANIFEST_NAME
+            assert len(manifest.read_text(encoding="utf-8").splitlines()) == 4
+
+            store.compact(2)
+            assert len(manifest.read_text(encoding="utf-8").splitlines()) == 2
+            assert sorted(p.name for p in store.directory.glob("chapter_*")) == [
+                "chapter_00001.flac",
+                "chapter_00002.flac",
+            ]
+
+
+    def test_shard_key_ignores_settings_that_do_not_change_audio(self):
+        from abogen.application.conversion_checkpoint import shard_key
+
+        with tempfile.TemporaryDirectory() as root:
+            plan = self._plan(root)
+
+            def key(**settings: Any) -> str:
+                base = {"normalization_numbers": True, "llm_model": "m", "llm_concurrency": 4, "llm_cache": True}
+                context = TTSContext(runtime_settings=dict(base, **settings))
+                return shard_key(plan, 1, plan.chapters[0], tts_context=context)
+
+            assert key(llm_concurrency=1, llm_cache=False, llm_timeout=5.0, llm_api_key="x") == key()
+            assert key(normalization_numbers=False) != key()
+            assert key(llm_model="other") != key()
+
 class TestMarkerCollector:
     """Tests for MarkerCollector."""
 
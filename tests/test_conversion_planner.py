@@ -364,6 +364,23 @@ class TestPlannerChapters:
         titles = [ch.title for ch in plan.chapters]
         assert titles == ["Ch A", "Ch B", "Ch C"]
 
+    def test_chapter_fingerprints_track_edits(self):
+        """Only chapters whose text or rendering settings change get a new fingerprint."""
+        text = "<<CHAPTER_MARKER:Ch A>>\nText A\n<<CHAPTER_MARKER:Ch B>>\nText B"
+        base = build_conversion_plan(ConversionRequest(direct_text=text, voice="M1"))
+        same = build_conversion_plan(ConversionRequest(direct_text=text, voice="M1"))
+        edited = build_conversion_plan(
+            ConversionRequest(direct_text=text.replace("Text B", "Text B, revised"), voice="M1")
+        )
+        faster = build_conversion_plan(ConversionRequest(direct_text=text, voice="M1", speed=1.2))
+
+        fingerprints = [ch.fingerprint for ch in base.chapters]
+        assert all(fingerprints)
+        assert [ch.fingerprint for ch in same.chapters] == fingerprints
+        assert edited.chapters[0].fingerprint == fingerprints[0]
+        assert edited.chapters[1].fingerprint != fingerprints[1]
+        assert not set(ch.fingerprint for ch in faster.chapters) & set(fingerprints)
+
 
 # ─── Domain-level regression tests ─────────────────────────────────
 
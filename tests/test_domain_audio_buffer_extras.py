@@ -1,10 +1,10 @@
-"""Tests for domain/audio_buffer.py — fit_audio_to_duration, ffmpeg_time_stretch."""
+"""Tests for domain/audio_buffer.py — fit_audio_to_duration, ffmpeg_time_stretch, SlidingMixer, PeakLimiter."""
 
 import numpy as np
 import pytest
 from unittest.mock import patch
 
-from abogen.domain.audio_buffer import fit_audio_to_duration, ffmpeg_time_stretch, SAMPLE_RATE
+from abogen.domain.audio_buffer import PeakLimiter, SlidingMixer, fit_audio_to_duration, ffmpeg_time_stretch, SAMPLE_RATE
 
 
 class TestFitAudioToDuration:
@@ -74,3 +74,35 @@ def test_stretch_reduces_duration(mock_popen):
   assert len(result) < len(audio)
   assert len(result) > 0
   assert result.dtype == np.float32
+
+
+class TestSlidingMixer:
+  def test_matches_whole_buffer_mix(self):
+    rng = np.random.default_rng(0)
+    clips = sorted((int(rng.integers(0, 50000)), rng.standard_normal(int(rng.integers(1, 9000))).astype("float32")) for _ in range(40))
+    expected = np.zeros(60000, dtype="float32")
+    for start, clip in clips:
+      expected[start:start + clip.size] += clip
+
+    blocks = []
+    mixer = SlidingMixer(blocks.append, block_samples=1000)
+    for start, clip in clips:
+      mixer.add(clip, start)
+    mixer.finish(60000)
+    np.testing.assert_allclose(np.concatenate(blocks), expected, atol=1e-6)
+    assert max(b.size for b in blocks) <= 1000
+
+
+class TestPeakLimiter:
+  def test_limits_peaks_and_recovers(self):
+    limiter = PeakLimiter(frame_samples=240, release_seconds=0.05)
+    block = np.full(SAMPLE_RATE, 0.5, dtype="float32")
+    block[:2400] = 2.0
+    out = limiter.process(block)
+    assert np.abs(out).max() <= 1.0
+    assert out[-1] == pytest.approx(0.5, abs=1e-3)
+    assert limiter.limited_frames == 10
+
+  def test_quiet_blocks_pass_through(self):
+    block = np.full(1000, 0.3, dtype="float32")
+    assert PeakLimiter().process(block) is block
@@ -6,7 +6,9 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch, call
 import subprocess
 
-from abogen.domain.audio_sink import AudioSink, open_audio_sink, _ensure_ffmpeg
+import pytest
+
+from abogen.domain.audio_sink import AudioSink, background_sink, open_audio_sink, _ensure_ffmpeg
 
 
 class TestAudioSinkDataclass:
@@ -187,3 +189,68 @@ class TestOpenAudioSinkCompressed:
         meta = {"title": "Test", "artist": "Author"}
         open_audio_sink(tmp_path / "meta.opus", "opus", metadata=meta)
         mock_build.assert_called_once_with(tmp_path / "meta.opus", "opus", metadata=meta)
+
+
+class TestBackgroundSink:
+    def test_wav_background_writes_in_order(self, tmp_path: Path):
+        out = tmp_path / "bg.wav"
+        blocks = [np.full(1000, i / 100, dtype="float32") for i in range(50)]
+        sink = open_audio_sink(out, "wav", subtype="FLOAT", background_queue=4)
+        for block in blocks:
+            sink.write(block)
+        sink.close()
+        data, _ = sf.read(str(out), dtype="float32")
+        np.testing.assert_array_equal(data, np.concatenate(blocks))
+        assert sink.stats().blocks_written == 50
+        assert sink.stats().max_queue_depth <= 4
+
+    def test_full_queue_records_stall_time(self):
+        import threading
+
+        release = threading.Event()
+        written = []
+        slow = AudioSink(write=lambda d: (release.wait(), written.append(d)), close=lambda: None)
+        sink = background_sink(slow, max_blocks=1)
+        timer = threading.Timer(0.1, release.set)
+        timer.start()
+        for _ in range(3):
+            sink.write(np.zeros(10, dtype="float32"))
+        sink.close()
+        assert len(written) == 3
+        assert sink.stats().stall_seconds > 0.05
+
+    def test_writer_error_surfaces_on_write_and_close(self):
+        def failing(data):
+            raise OSError("disk full")
+
+        sink = background_sink(AudioSink(write=failing, close=lambda: None), max_blocks=2)
+        sink.write(np.zeros(10, dtype="float32"))
+        with pytest.raises(OSError, match="disk full"):
+            for _ in range(100):
+                sink.write(np.zeros(10, dtype="float32"))
+        with pytest.raises(OSError, match="disk full"):
+            sink.close()
+
+    def test_close_is_idempotent_and_closes_inner(self):
+        closed = []
+        sink = background_sink(AudioSink(write=lambda d: None, close=lambda: closed.append(True)))
+        sink.close()
+        sink.close()
+        assert closed == [True]
+
+    @patch("abogen.domain.audio_sink._ensure_ffmpeg")
+    @patch("abogen.domain.audio_sink.build_ffmpeg_command")
+    @patch("abogen.domain.audio_sink.subprocess.Popen")
+    def test_compressed_write_passes_buffer_without_copy(self, mock_popen, mock_build, mock_ensure, tmp_path: Path):
+        mock_build.return_value = ["ffmpeg", "-y", "-i", "pipe:0", "out.mp3"]
+        proc = MagicMock()
+        proc.stdin.closed = False
+        mock_popen.return_value = proc
+
+        data = np.arange(8, dtype="float32")
+        sink = open_audio_sink(tmp_path / "zc.mp3", "mp3")
+        sink.write(data)
+        sink.close()
+        payload = proc.stdin.write.call_args[0][0]
+        assert isinstance(payload, memoryview)
+        assert bytes(payload) == data.tobytes()
@@ -303,3 +303,52 @@ class TestBuildTtsContext:
         result = merge_pronunciation_overrides(source)
         assert isinstance(result, list)
         assert len(result) >= 1
+
+
+class TestFrozenNormalizationSettings:
+    """TTSContext resolves settings once; the per-segment path does none."""
+
+    def test_build_tts_context_freezes_settings(self):
+        ctx = build_tts_context(
+            language=Language.EN_US,
+            pronunciation=PronunciationConfig(
+                normalization_overrides={"normalization_numbers": False}
+            ),
+        )
+        assert ctx.apostrophe_config is not None
+        assert ctx.apostrophe_config.convert_numbers is False
+        assert ctx.runtime_settings["normalization_numbers"] is False
+        with pytest.raises(TypeError):
+            ctx.runtime_settings["normalization_numbers"] = True
+
+    def test_normalize_does_no_settings_work(self):
+        from abogen.domain.normalization import (
+            get_settings_resolution_stats,
+            reset_settings_resolution_stats,
+        )
+
+        ctx = build_tts_context(language=Language.EN_US)
+        reset_settings_resolution_stats()
+        with patch("abogen.domain.normalization.get_runtime_settings") as mock_settings:
+            for _ in range(5):
+                ctx.normalize("It's a test.")
+        mock_settings.assert_not_called()
+        assert get_settings_resolution_stats().calls == 0
+
+    def test_hand_built_context_resolves_once(self):
+        from abogen.domain.normalization import (
+            get_settings_resolution_stats,
+            reset_settings_resolution_stats,
+        )
+
+        ctx = TTSContext()
+        reset_settings_resolution_stats()
+        first = ctx.normalize("It's a test.")
+        second = ctx.normalize("It's a test.")
+        assert first == second
+        assert get_settings_resolution_stats().calls == 1
+
+    def test_frozen_matches_unfrozen_output(self):
+        ctx = build_tts_context(language=Language.EN_US)
+        text = "It's 1990's news: Dr. Smith paid $5."
+        assert ctx.normalize(text) == prepare_text_for_tts(text)
@@ -2,6 +2,8 @@
 
 import os
 import tempfile
+import threading
+import time
 from dataclasses import dataclass
 from typing import Optional
 from unittest.mock import MagicMock
@@ -14,6 +16,7 @@ from abogen.domain.subtitle_processor import (
     format_time_range,
     speed_up_audio,
     process_subtitle_entries,
+    subtitle_workers,
 )
 
 
@@ -167,3 +170,110 @@ class TestProcessSubtitleEntries:
         assert len(result) > 0
         # Buffer should be at least as long as the last subtitle end
         assert len(result) >= int(6.0 * 24000)
+
+    def test_streams_long_timeline_to_sink_in_small_window(self):
+        # Three hours of one-second entries every ten seconds.
+        subtitles = [(float(t), t + 1.0, "Hi") for t in range(0, 3 * 3600, 10)]
+        blocks = []
+        sink = MagicMock()
+        sink.write.side_effect = blocks.append
+        result = process_subtitle_entries(
+            subtitles, backend=fake_backend, voice=None, audio_sink=sink,
+        )
+        assert len(result) == 0
+        assert max(len(b) for b in blocks) <= 10 * 24000
+        assert sum(len(b) for b in blocks) == int(subtitles[-1][1] * 24000) + 24000
+
+    def test_overlapping_entries_are_limited_not_clipped(self):
+        def loud_backend(text, voice=None, speed=1.0, split_pattern=None):
+            return [FakeResult(audio=np.full(24000, 0.8, dtype="float32"))]
+
+        subtitles = [(0.0, 1.0, "A"), (0.5, 1.5, "B"), (5.0, 6.0, "C")]
+        result = process_subtitle_entries(subtitles, backend=loud_backend, voice=None)
+        assert np.abs(result).max() <= 1.0
+        # Audio away from the overlap keeps its level.
+        assert result[int(5.5 * 24000)] == pytest.approx(0.8)
+
+    def test_unsorted_entries_are_mixed_at_their_start(self):
+        subtitles = [(4.0, 5.0, "Later"), (0.0, 1.0, "First")]
+        result = process_subtitle_entries(subtitles, backend=fake_backend, voice=None)
+        assert np.abs(result[:24000]).max() > 0
+        assert np.abs(result[4 * 24000 : 5 * 24000]).max() > 0
+
+
+# --- parallel synthesis ---
+
+class _CountingBackend:
+    """Deterministic backend that records how many calls overlap."""
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def __init__(self):
+        self.disposed = False
+
+    def __call__(self, text, voice=None, speed=1.0, split_pattern=None):
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        time.sleep(0.01)
+        with cls.lock:
+            cls.active -= 1
+        return [FakeResult(audio=np.full(int(len(text) * 2400 / speed), 0.1, dtype="float32"))]
+
+    def dispose(self):
+        self.disposed = True
+
+
+class TestParallelSubtitleEntries:
+    SUBTITLES = [(i * 1.0, i * 1.0 + 0.8, "word " * (1 + i % 4)) for i in range(24)]
+
+    def test_matches_serial_output_and_runs_concurrently(self):
+        serial = process_subtitle_entries(self.SUBTITLES, backend=_CountingBackend(), voice=None)
+        _CountingBackend.peak = 0
+        created = []
+
+        def factory():
+            created.append(_CountingBackend())
+            return created[-1]
+
+        parallel = process_subtitle_entries(
+            self.SUBTITLES, backend=_CountingBackend(), voice=None,
+            backend_factory=factory, workers=3,
+        )
+        np.testing.assert_array_equal(parallel, serial)
+        assert _CountingBackend.peak > 1
+        assert 1 <= len(created) <= 2
+        assert all(backend.disposed for backend in created)
+
+    def test_progress_and_logs_stay_in_entry_order(self):
+        logs, progress = [], []
+        process_subtitle_entries(
+            self.SUBTITLES, backend=_CountingBackend(), voice=None,
+            backend_factory=_CountingBackend, workers=4,
+            log_callback=logs.append,
+            progress_callback=lambda p, e: progress.append(p),
+        )
+        assert [line.split("]")[0] for line in logs] == [f"\n[{i}/24" for i in range(1, 25)]
+        assert progress == sorted(progress)
+
+    def test_workers_from_environment(self, monkeypatch):
+        monkeypatch.setenv("ABOGEN_SUBTITLE_WORKERS", "4")
+        assert subtitle_workers() == 4
+        monkeypatch.setenv("ABOGEN_SUBTITLE_WORKERS", "x")
+        assert subtitle_workers() == 1
+
+
+def test_cancelled_stream_is_not_padded_to_full_length():
+    subtitles = [(0.0, 1.0, "Hi"), (3 * 3600.0, 3 * 3600.0 + 1.0, "Bye")]
+    calls = [0]
+
+    def cancel():
+        calls[0] += 1
+        return calls[0] > 3
+
+    sink = MagicMock()
+    process_subtitle_entries(subtitles, backend=fake_backend, voice=None, audio_sink=sink, cancel_check=cancel)
+    assert sink.write.call_count == 0
@@ -0,0 +1,99 @@
+"""Tests for batched entity extraction."""
+
+from __future__ import annotations
+
+import pytest
+
+spacy = pytest.importorskip("spacy")
+
+from abogen import entity_analysis
+from abogen.entity_analysis import extract_entities
+from abogen.entity_cache import EntityCache
+
+
+@pytest.fixture
+def ruler_model(monkeypatch):
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns(
+        [
+            {"label": "PERSON", "pattern": "Alice"},
+            {"label": "PERSON", "pattern": "Bob"},
+            {"label": "GPE", "pattern": "London"},
+        ]
+    )
+    monkeypatch.setattr(entity_analysis, "_load_model", lambda language: nlp)
+    monkeypatch.setattr(entity_analysis, "_model_version", lambda name: None)
+    return nlp
+
+
+CHAPTERS = [
+    {"index": 0, "text": "Alice went to London.\n\nBob stayed home.\n\nAlice wrote to Bob."},
+    {"index": 3, "text": "In London, Bob met Alice again."},
+    {"index": 4, "text": "   "},
+]
+
+
+def test_summary_is_independent_of_batching(ruler_model, monkeypatch):
+    monkeypatch.setattr(entity_analysis, "_DOC_TARGET_CHARS", 10)
+    split = extract_entities(CHAPTERS, batch_size=1)
+    monkeypatch.setattr(entity_analysis, "_DOC_TARGET_CHARS", 100_000)
+    whole = extract_entities(CHAPTERS, batch_size=64)
+
+    for part in ("people", "entities", "stats", "model"):
+        assert split.summary[part] == whole.summary[part]
+    # Index samples are raw sentences; a whole-chapter doc keeps the
+    # paragraph break in front of them.
+    assert [
+        (entry["token"], entry["count"], [sample.strip() for sample in entry["samples"]])
+        for entry in split.summary["index"]["tokens"]
+    ] == [
+        (entry["token"], entry["count"], [sample.strip() for sample in entry["samples"]])
+        for entry in whole.summary["index"]["tokens"]
+    ]
+    assert split.cache_key == whole.cache_key
+    people = {entry["label"]: entry for entry in split.summary["people"]}
+    assert people["Alice"]["count"] == 3
+    assert people["Bob"]["chapter_indices"] == [0, 3]
+    assert people["Alice"]["samples"][0] == {"excerpt": "Alice went to London.", "chapter_index": 0}
+    assert [entry["label"] for entry in split.summary["entities"]] == ["London"]
+
+
+def test_timings_break_down_elapsed(ruler_model):
+    result = extract_entities(CHAPTERS)
+    assert set(result.timings) == {"load", "parse", "aggregate"}
+    assert sum(result.timings.values()) == pytest.approx(result.elapsed)
+
+
+def test_pipe_settings_from_environment(monkeypatch):
+    monkeypatch.setenv("ABOGEN_ENTITY_BATCH_SIZE", "8")
+    monkeypatch.setenv("ABOGEN_ENTITY_PROCESSES", "bogus")
+    assert entity_analysis._pipe_settings(None, None) == (8, 1)
+    assert entity_analysis._pipe_settings(0, 4) == (1, 4)
+
+
+class TestEntityCache:
+
+    def test_known_book_skips_spacy(self, ruler_model, monkeypatch, tmp_path):
+        cache = EntityCache(tmp_path / "entities.sqlite3", max_bytes=1024 * 1024)
+        monkeypatch.setattr("abogen.entity_cache.get_entity_cache", lambda: cache)
+        monkeypatch.setattr(entity_analysis, "_model_version", lambda name: "3.8.0")
+        first = extract_entities(CHAPTERS)
+
+        def _fail(language):
+            raise AssertionError("model loaded on a cache hit")
+
+        monkeypatch.setattr(entity_analysis, "_load_model", _fail)
+        second = extract_entities(CHAPTERS)
+        assert second.summary == first.summary
+        assert second.cache_key == first.cache_key
+        assert set(second.timings) == {"cache"}
+        assert cache.hits == 1
+
+        # A different model version is a different key.
+        monkeypatch.setattr(entity_analysis, "_load_model", lambda language: ruler_model)
+        monkeypatch.setattr(entity_analysis, "_model_version", lambda name: "3.9.0")
+        extract_entities(CHAPTERS)
+        assert cache.misses == 2
+        cache.close()
@@ -0,0 +1,114 @@
+"""Tests for the shared EPUB content engine."""
+
+from __future__ import annotations
+
+import pytest
+
+from abogen import epub_content
+from abogen.epub_content import EpubDocuments, document_text, html_to_text
+
+XHTML = (
+    '<?xml version="1.0" encoding="utf-8"?>\n<!DOCTYPE html>\n'
+    '<html xmlns="http://www.w3.org/1999/xhtml"><head><title>Doc</title>'
+    "<style>p { color: red }</style></head><body>"
+    "<h1>One</h1><p>First<sup>1</sup> para.</p>\n<!-- note -->\n"
+    '<ol start="3"><li>three</li><li><p>four</p></li></ol>'
+    "<p>Tom &amp; Jerry</p><script>var x = 1;</script></body></html>"
+)
+
+
+@pytest.fixture(params=["html.parser", "lxml"])
+def backend(request, monkeypatch):
+    if request.param == "lxml":
+        pytest.importorskip("lxml")
+    monkeypatch.setenv("ABOGEN_HTML_PARSER", request.param)
+    return request.param
+
+
+def test_block_breaks_numbering_and_dropped_content(backend):
+    text = html_to_text(XHTML, clean=lambda raw: raw)
+    assert epub_content.html_parser_backend() == backend
+    assert "First para." in text
+    assert "3) three" in text and "4) four" in text
+    assert "Tom & Jerry" in text
+    assert "color" not in text and "var x" not in text and "1 para" not in text
+    assert text.startswith("DocOne\n\nFirst para.\n\n")
+
+
+def test_options_turn_off_breaks_and_numbering(backend):
+    text = html_to_text("<ol><li>a</li><li>b</li></ol>", block_breaks=False, number_lists=False, clean=lambda raw: raw)
+    assert text == "ab"
+
+
+def test_whitespace_only_runs_collapse(backend):
+    html = "<div><span>a</span>\n\n\n<span>b</span> <pre>  x\n\n</pre></div>"
+    assert epub_content.walk_html(html).text == "a\nb   x\n\n\n\n"
+
+
+def test_stdlib_parser_is_the_default(monkeypatch):
+    monkeypatch.delenv("ABOGEN_HTML_PARSER", raising=False)
+    assert epub_content.html_parser_backend() == "html.parser"
+    assert html_to_text("<ul><li>a<li>b</ul>") == "ab"
+    assert html_to_text("<p>x<![CDATA[y]]></p>") == "xy"
+
+
+def test_document_title_comes_from_one_walk():
+    assert document_text(XHTML, "Fallback") == (html_to_text(XHTML), "Doc")
+    # Level order wins over document order, as with the soup lookups.
+    headings = "<body><h2>Second</h2><h1> </h1><h1>Late</h1><h3>Third</h3></body>"
+    assert document_text(headings, "Fallback")[1] == "Second"
+    assert document_text("<p>plain</p>", "Fallback")[1] == "Fallback"
+
+
+class _Item:
+    def __init__(self, name):
+        self._name = name
+
+    def get_name(self):
+        return self._name
+
+
+class _Book:
+    def __init__(self, names):
+        self.spine = [(name, "yes") for name in names]
+        self._items = {name: _Item(name) for name in names}
+
+    def get_item_with_id(self, item_id):
+        return self._items.get(item_id)
+
+
+class TestEpubDocuments:
+
+    def test_anchor_positions_are_indexed_once(self, monkeypatch):
+        html = '<p>Intro</p><h2 class="x" id="a">A</h2><a name="b"></a><div id=\'c\'>C</div>'
+        documents = EpubDocuments(_Book(["ch1.xhtml"]), {"ch1.xhtml": html})
+        calls = []
+        real_index = epub_content._index_anchors
+        monkeypatch.setattr(epub_content, "_index_anchors", lambda text: calls.append(1) or real_index(text))
+
+        assert html[documents.position("ch1.xhtml", "a") :].startswith('<h2 class="x" id="a">')
+        assert html[documents.position("ch1.xhtml", "b") :].startswith('<a name="b">')
+        assert html[documents.position("ch1.xhtml", "c") :].startswith("<div id='c'>")
+        assert documents.position("ch1.xhtml", "missing") == 0
+        assert documents.position("ch1.xhtml", None) == 0
+        assert len(calls) == 1
+
+    def test_slices_span_documents(self):
+        content = {"a.xhtml": "<p>A1</p><p id='x'>A2</p>", "b.xhtml": "<p>B</p>", "c.xhtml": "<p id='y'>C</p>"}
+        documents = EpubDocuments(_Book(["a.xhtml", "b.xhtml", "c.xhtml"]), content)
+        x = documents.position("a.xhtml", "x")
+
+        assert documents.slice("a.xhtml", 0, "a.xhtml", x) == "<p>A1</p>"
+        assert documents.slice("a.xhtml", x, "c.xhtml", 0) == "<p id='x'>A2</p><p>B</p>"
+        assert documents.slice("b.xhtml", 0, None) == "<p>B</p><p id='y'>C</p>"
+        assert documents.docs_between("c.xhtml", "b.xhtml") == ["a.xhtml"]
+        assert documents.prefix("b.xhtml", 3) == "<p>A1</p><p id='x'>A2</p><p>"
+        assert documents.find_doc_key("Text/b%2Exhtml") == ("b.xhtml", 1)
+
+    def test_blank_slice_falls_back_to_the_whole_document(self, caplog):
+        content = {"a.xhtml": "<p>A</p><p id='x'></p>"}
+        documents = EpubDocuments(_Book(["a.xhtml"]), content)
+        x = documents.position("a.xhtml", "x")
+
+        assert documents.slice("a.xhtml", x, "a.xhtml", x, source="a.xhtml#x") == content["a.xhtml"]
+        assert "a.xhtml#x" in caplog.text and "full document fallback" in caplog.text
@@ -0,0 +1,96 @@
+"""Tests for the bounded job log buffer and the SSE log stream."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from abogen.webui.app import create_app
+from abogen.webui.job_logs import JobLog, JobLogBuffer
+from abogen.webui.service import Job, JobStatus
+
+
+@pytest.fixture
+def spill_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr("abogen.webui.job_logs._spill_dir", lambda: tmp_path)
+    return tmp_path
+
+
+def _fill(buffer: JobLogBuffer, count: int, start: int = 0) -> None:
+    for index in range(start, start + count):
+        buffer.append(JobLog(timestamp=float(index), message=f"line {index}"))
+
+
+class TestJobLogBuffer:
+
+    def test_ring_is_bounded_and_spills_history(self, spill_dir):
+        buffer = JobLogBuffer(capacity=16, job_id="job")
+        _fill(buffer, 100)
+
+        assert len(buffer) <= 16
+        assert buffer[-1].message == "line 99"
+        assert buffer.next_seq == 100
+        assert (spill_dir / "job.jsonl.gz").exists()
+
+        history = buffer.since(0)
+        assert [seq for seq, _ in history] == list(range(100))
+        assert [entry.message for _, entry in buffer.since(95)] == [f"line {i}" for i in range(95, 100)]
+
+        buffer.discard_spill()
+        assert not (spill_dir / "job.jsonl.gz").exists()
+
+    def test_restore_continues_sequence(self, spill_dir):
+        buffer = JobLogBuffer(capacity=16, job_id="restored")
+        buffer.restore([JobLog(timestamp=1.0, message="a"), JobLog(timestamp=2.0, message="b")], 40)
+        assert [seq for seq, _ in buffer.since(0)] == [38, 39]
+        _fill(buffer, 1)
+        assert buffer.since(40)[0][0] == 40
+
+    def test_wait_wakes_on_append(self, spill_dir):
+        buffer = JobLogBuffer(capacity=16)
+        threading.Timer(0.05, lambda: _fill(buffer, 1)).start()
+        started = time.monotonic()
+        assert buffer.wait(0, timeout=5.0)
+        assert time.monotonic() - started < 2.0
+        assert not buffer.wait(1, timeout=0.01)
+
+
+def test_stream_resumes_from_last_event_id(tmp_path, spill_dir):
+    app = create_app(
+        {
+            "TESTING": True,
+            "SECRET_KEY": "test",
+            "OUTPUT_FOLDER": str(tmp_path / "output"),
+            "UPLOAD_FOLDER": str(tmp_path / "uploads"),
+        }
+    )
+    service = app.extensions["conversion_service"]
+    job = Job(
+        id="sse-job",
+        original_filename="sample.txt",
+        stored_path=tmp_path / "sample.txt",
+        language="a",
+        voice="af_alloy",
+        speed=1.0,
+        use_gpu=False,
+        subtitle_mode="Disabled",
+        output_format="wav",
+        save_mode="Save next to input file",
+        output_folder=tmp_path,
+        replace_single_newlines=False,
+        subtitle_format="srt",
+        created_at=time.time(),
+    )
+    for index in range(5):
+        job.add_log(f"entry {index}")
+    job.status = JobStatus.COMPLETED
+    service._jobs[job.id] = job
+
+    with app.test_client() as client:
+        body = client.get("/jobs/sse-job/logs/stream", headers={"Last-Event-ID": "2"}).get_data(as_text=True)
+
+    assert "id: 3\n" in body and "id: 4\n" in body
+    assert "entry 2" not in body
+    assert body.count("data: ") == 2
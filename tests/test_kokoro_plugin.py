@@ -6,6 +6,7 @@ These tests verify that the Kokoro plugin:
 - Creates a valid Engine
 - Satisfies the Engine/EngineSession contract (via EngineContractMixin)
 - Implements VoiceLister capability
+- Streams segments through SegmentStreamer / StreamingSynthesizer
 """
 
 from __future__ import annotations
@@ -198,6 +199,109 @@ class TestKokoroVoiceLister:
         engine.dispose()
 
 
+# ──────────────────────────────────────────────────────────────
+# Streaming
+# ──────────────────────────────────────────────────────────────
+
+class _LazyPipeline:
+    """Generator pipeline that records how many segments were produced."""
+
+    def __init__(self, lengths: list[int]) -> None:
+        self.lengths = lengths
+        self.produced = 0
+
+    def __call__(self, text, voice, speed, split_pattern=None, **kwargs):
+        import numpy as np
+
+        class Token:
+            def __init__(self, text: str, start: float, end: float) -> None:
+                self.text = text
+                self.whitespace = " "
+                self.start_ts = start
+                self.end_ts = end
+
+        class Segment:
+            def __init__(self, index: int, length: int) -> None:
+                self.graphemes = f"s{index}"
+                self.audio = np.full(length, index + 1, dtype="float32")
+                self.tokens = [Token(f"s{index}", 0.0, length / 24000)]
+
+        for index, length in enumerate(self.lengths):
+            self.produced += 1
+            yield Segment(index, length)
+
+
+def _request(text: str = "one. two. three.") -> SynthesisRequest:
+    return SynthesisRequest(
+        text=text,
+        voice=VoiceSelection(source="builtin", key="af_nova"),
+        parameters=ParameterValues(values={"speed": 1.0}),
+        format=AudioFormat(mime="audio/wav", extension="wav"),
+    )
+
+
+class TestKokoroStreaming:
+
+    def test_session_implements_streaming_capabilities(self) -> None:
+        from abogen.tts_plugin.capabilities import SegmentStreamer, StreamingSynthesizer
+
+        session = _make_mock_engine().createSession()
+        assert isinstance(session, SegmentStreamer)
+        assert isinstance(session, StreamingSynthesizer)
+
+    def test_segments_are_yielded_lazily(self) -> None:
+        from plugins.kokoro.engine import KokoroEngine
+
+        pipeline = _LazyPipeline([100, 0, 50])
+        session = KokoroEngine(pipeline).createSession()
+        stream = session.synthesizeSegments(_request())
+
+        first = next(stream)
+        assert pipeline.produced == 1
+        assert first.graphemes == "s0"
+        assert first.tokens[0].end == pytest.approx(100 / 24000)
+
+        rest = list(stream)
+        # The empty segment is dropped.
+        assert [seg.graphemes for seg in rest] == ["s2"]
+
+    def test_synthesize_matches_stream(self) -> None:
+        import numpy as np
+        from plugins.kokoro.engine import KokoroEngine
+
+        session = KokoroEngine(_LazyPipeline([100, 50])).createSession()
+        result = session.synthesize(_request())
+        streamed = b"".join(
+            KokoroEngine(_LazyPipeline([100, 50])).createSession().synthesizeStream(_request())
+        )
+
+        assert result.data == streamed
+        assert result.duration.seconds == pytest.approx(150 / 24000)
+        assert all(isinstance(seg.audio, bytes) for seg in result.segments)
+        assert np.frombuffer(result.segments[1].audio, dtype="float32")[0] == 2.0
+
+    def test_pipeline_streams_without_buffering(self) -> None:
+        import numpy as np
+        from abogen.tts_plugin.utils import Pipeline
+        from plugins.kokoro.engine import KokoroEngine
+
+        backend = _LazyPipeline([100, 50])
+        pipeline = Pipeline(KokoroEngine(backend))
+        segments = pipeline("one. two.", voice="af_nova")
+
+        first = next(segments)
+        assert backend.produced == 1
+        assert isinstance(first.audio, np.ndarray)
+        assert first.audio.dtype == np.float32
+        assert first.audio.shape == (100,)
+        assert first.tokens[0].text == "s0"
+
+        second = next(segments)
+        assert second.audio.shape == (50,)
+        assert float(second.audio[0]) == 2.0
+        pipeline.dispose()
+
+
 # ──────────────────────────────────────────────────────────────
 # Language mapping helpers
 # ──────────────────────────────────────────────────────────────
@@ -0,0 +1,217 @@
+"""Tests for LLM normalization: keep-alive client, batching, concurrency and cache."""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+
+import pytest
+
+from abogen.kokoro_text_normalization import ApostropheConfig, _normalize_with_llm
+from abogen.llm_cache import LLMNormalizationCache, cache_key
+from abogen.llm_client import (
+    LLMClientError,
+    LLMConfiguration,
+    close_connections,
+    generate_completion,
+)
+
+
+# ─── Fake OpenAI-compatible server ───────────────────────────────
+
+
+class _FakeLLM:
+    """Expands "can't" -> "cannot" via the regex tool; records traffic."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.requests: List[Dict[str, Any]] = []
+        self.connections: set[int] = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def respond(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        user = payload["messages"][1]["content"]
+        numbered = re.findall(r"\[(\d+)\] ([^\n]*)", user)
+        replacements = []
+        if numbered:
+            for number, sentence in numbered:
+                if "can't" in sentence:
+                    replacements.append(
+                        {"pattern": "can't", "replacement": "cannot", "sentence": int(number)}
+                    )
+        elif "can't" in user:
+            replacements.append({"pattern": "can't", "replacement": "cannot"})
+        arguments = json.dumps({"replacements": replacements})
+        return {
+            "choices": [
+                {
+                    "message": {
+                        "content": None,
+                        "tool_calls": [
+                            {"function": {"name": "apply_regex_replacements", "arguments": arguments}}
+                        ],
+                    }
+                }
+            ]
+        }
+
+
+@pytest.fixture
+def fake_llm():
+    state = _FakeLLM()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            payload = json.loads(self.rfile.read(length))
+            with state.lock:
+                state.requests.append(payload)
+                state.connections.add(id(self.connection))
+                state.in_flight += 1
+                state.max_in_flight = max(state.max_in_flight, state.in_flight)
+            time.sleep(state.delay)
+            with state.lock:
+                state.in_flight -= 1
+            body = json.dumps(state.respond(payload)).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state.base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    yield state
+    close_connections()
+    server.shutdown()
+    server.server_close()
+
+
+def _settings(fake: _FakeLLM, **extra: Any) -> Dict[str, Any]:
+    settings = {
+        "llm_base_url": fake.base_url,
+        "llm_api_key": "",
+        "llm_model": "fake-model",
+        "llm_timeout": 5.0,
+        "llm_concurrency": 1,
+        "llm_batch_size": 1,
+        "llm_cache": False,
+    }
+    settings.update(extra)
+    return settings
+
+
+# ─── Client ──────────────────────────────────────────────────────
+
+
+class TestKeepAliveClient:
+
+    def test_requests_reuse_one_connection(self, fake_llm):
+        config = LLMConfiguration(base_url=fake_llm.base_url, api_key="", model="m")
+        for _ in range(3):
+            completion = generate_completion(config, system_message="s", user_message="I can't")
+            assert completion.tool_calls
+        assert len(fake_llm.requests) == 3
+        assert len(fake_llm.connections) == 1
+
+    def test_connection_error_raises_client_error(self):
+        config = LLMConfiguration(base_url="http://127.0.0.1:9/v1", api_key="", model="m", timeout=1.0)
+        with pytest.raises(LLMClientError):
+            generate_completion(config, system_message="s", user_message="u")
+
+
+# ─── Normalization ───────────────────────────────────────────────
+
+
+class TestNormalizeWithLLM:
+
+    TEXT = "I can't go. She can't stay.\n\n  We can't wait. Fine.  \n"
+
+    def test_sequential_matches_expected(self, fake_llm):
+        result = _normalize_with_llm(self.TEXT, settings=_settings(fake_llm), config=ApostropheConfig())
+        assert result == "I cannot go. She cannot stay.\n\n  We cannot wait. Fine.  \n"
+        assert len(fake_llm.requests) == 4
+
+    def test_batching_packs_sentences_per_paragraph(self, fake_llm):
+        result = _normalize_with_llm(
+            self.TEXT, settings=_settings(fake_llm, llm_batch_size=8), config=ApostropheConfig()
+        )
+        assert result == "I cannot go. She cannot stay.\n\n  We cannot wait. Fine.  \n"
+        # One call per paragraph.
+        assert len(fake_llm.requests) == 2
+        assert fake_llm.requests[0]["tools"][0]["function"]["parameters"]["properties"][
+            "replacements"
+        ]["items"]["required"][-1] == "sentence"
+
+    def test_concurrent_requests_keep_order(self, fake_llm):
+        fake_llm.delay = 0.05
+        text = " ".join(f"Line {i} can't end." for i in range(8))
+        result = _normalize_with_llm(
+            text, settings=_settings(fake_llm, llm_concurrency=4), config=ApostropheConfig()
+        )
+        assert result == " ".join(f"Line {i} cannot end." for i in range(8))
+        assert 1 < fake_llm.max_in_flight <= 4
+
+    def test_parallel_jobs_with_different_concurrency(self, fake_llm):
+        from concurrent.futures import ThreadPoolExecutor
+
+        fake_llm.delay = 0.02
+        text = " ".join(f"Line {i} can't end." for i in range(6))
+
+        def job(concurrency: int) -> str:
+            return _normalize_with_llm(
+                text, settings=_settings(fake_llm, llm_concurrency=concurrency), config=ApostropheConfig()
+            )
+
+        with ThreadPoolExecutor(max_workers=4) as jobs:
+            results = list(jobs.map(job, [2, 3, 2, 3]))
+        assert results == [" ".join(f"Line {i} cannot end." for i in range(6))] * 4
+
+    def test_cache_skips_known_sentences(self, fake_llm, tmp_path, monkeypatch):
+        cache = LLMNormalizationCache(tmp_path / "llm.sqlite3")
+        monkeypatch.setattr("abogen.llm_cache.get_llm_cache", lambda: cache)
+        settings = _settings(fake_llm, llm_cache=True)
+
+        first = _normalize_with_llm(self.TEXT, settings=settings, config=ApostropheConfig())
+        calls = len(fake_llm.requests)
+        second = _normalize_with_llm(self.TEXT, settings=settings, config=ApostropheConfig())
+
+        assert first == second
+        assert len(fake_llm.requests) == calls
+        assert cache.hits == 4
+
+        # A different prompt template is a different key.
+        _normalize_with_llm(
+            "I can't go.", settings=dict(settings, llm_prompt="Fix: {{ sentence }}"), config=ApostropheConfig()
+        )
+        assert len(fake_llm.requests) == calls + 1
+        cache.close()
+
+
+class TestLLMCache:
+
+    def test_round_trip_and_key_parts(self, tmp_path):
+        cache = LLMNormalizationCache(tmp_path / "c.sqlite3")
+        key = cache_key("m", "p", "I can't.", "I can't. Really.")
+        cache.put_many({key: "I cannot."})
+        assert cache.get_many([key]) == {key: "I cannot."}
+        assert cache.get_many([cache_key("other", "p", "I can't.", "I can't. Really.")]) == {}
+        assert cache.get_many([cache_key("m", "p", "I can't.", "Different paragraph.")]) == {}
+        cache.close()
+
+        reopened = LLMNormalizationCache(tmp_path / "c.sqlite3")
+        assert reopened.get_many([key]) == {key: "I cannot."}
+        reopened.close()
@@ -0,0 +1,82 @@
+"""Tests for the look-ahead producer stage."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from abogen.domain.lookahead import Lookahead, lookahead_items
+
+
+def test_items_arrive_in_order_from_a_worker_thread():
+    threads = []
+
+    def source():
+        for index in range(50):
+            threads.append(threading.current_thread())
+            yield index
+
+    with Lookahead(source(), depth=4) as ahead:
+        assert list(ahead) == list(range(50))
+    assert threading.current_thread() not in threads
+    assert ahead.stats.items == 50
+
+
+def test_depth_zero_produces_inline():
+    threads = []
+
+    def source():
+        threads.append(threading.current_thread())
+        yield "a"
+
+    assert list(Lookahead(source(), depth=0)) == ["a"]
+    assert threads == [threading.current_thread()]
+
+
+def test_source_errors_surface_at_their_position():
+    def source():
+        yield 1
+        raise ValueError("boom")
+
+    ahead = Lookahead(source(), depth=2)
+    assert next(ahead) == 1
+    with pytest.raises(ValueError, match="boom"):
+        next(ahead)
+    ahead.close()
+
+
+def test_close_stops_a_blocked_producer():
+    produced = []
+
+    def source():
+        for index in range(1000):
+            produced.append(index)
+            yield index
+
+    ahead = Lookahead(source(), depth=2)
+    assert next(ahead) == 0
+    ahead.close()
+    assert len(produced) < 10
+    assert list(ahead) == []
+
+
+def test_stats_report_producer_time_hidden_behind_the_consumer():
+    def source():
+        for index in range(5):
+            time.sleep(0.02)
+            yield index
+
+    with Lookahead(source(), depth=8) as ahead:
+        for _ in ahead:
+            time.sleep(0.05)
+    assert ahead.stats.produce_seconds >= 0.09
+    assert ahead.stats.hidden_seconds > ahead.stats.wait_seconds
+
+
+def test_queue_depth_comes_from_environment(monkeypatch):
+    monkeypatch.setenv("ABOGEN_NORMALIZE_LOOKAHEAD", "0")
+    assert lookahead_items() == 0
+    monkeypatch.setenv("ABOGEN_NORMALIZE_LOOKAHEAD", "bogus")
+    assert lookahead_items() == 16
@@ -0,0 +1,104 @@
+"""Tests for parallel PDF page extraction and the page cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import fitz  # PyMuPDF
+import pytest
+
+from abogen import pdf_pages
+from abogen.book_parser import PdfParser
+from abogen.pdf_pages import PdfPageCache, iter_pdf_page_texts, pdf_cache_key
+
+
+def _make_pdf(path, pages):
+    doc = fitz.open()
+    for index in range(pages):
+        page = doc.new_page()
+        page.insert_text((50, 50), f"Page {index + 1} opening line")
+        page.insert_text((50, 80), f"Body text [{index}] of page {index + 1}.")
+        page.insert_text((50, 700), str(index + 1))
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+@pytest.fixture
+def page_cache(tmp_path, monkeypatch):
+    cache = PdfPageCache(tmp_path / "pages.sqlite3", max_bytes=10 * 1024 * 1024)
+    monkeypatch.setattr(pdf_pages, "get_pdf_page_cache", lambda: cache)
+    yield cache
+    cache.close()
+
+
+def test_parallel_extraction_matches_serial(tmp_path, monkeypatch):
+    monkeypatch.setattr(pdf_pages, "_PAGES_PER_TASK", 4)
+    path = _make_pdf(tmp_path / "book.pdf", 10)
+
+    serial = list(iter_pdf_page_texts(path, 10, True, workers=1))
+    parallel = list(iter_pdf_page_texts(path, 10, True, workers=2))
+
+    assert parallel == serial
+    assert serial[2].startswith("Page 3 opening line Body text")
+    assert "[2]" not in serial[2] and not serial[2].endswith("3")
+
+
+def test_worker_count(monkeypatch):
+    monkeypatch.setenv("ABOGEN_PDF_WORKERS", "8")
+    assert pdf_pages.pdf_page_workers(10) == 1
+    assert pdf_pages.pdf_page_workers(1000) == 8
+    assert pdf_pages.pdf_page_workers(70) == 3
+    monkeypatch.setenv("ABOGEN_PDF_WORKERS", "bogus")
+    assert 1 <= pdf_pages.pdf_page_workers(1000) <= pdf_pages.DEFAULT_MAX_WORKERS
+
+
+def test_second_open_reads_pages_from_cache(tmp_path, page_cache, monkeypatch):
+    path = _make_pdf(tmp_path / "cached.pdf", 3)
+    with PdfParser(path) as parser:
+        first = dict(parser.process_content()[0])
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("pages extracted on a cache hit")
+
+    monkeypatch.setattr(pdf_pages, "iter_pdf_page_texts", _fail)
+    with PdfParser(path) as parser:
+        assert dict(parser.process_content()[0]) == first
+        assert "Page 2 - Page 2 opening line" in parser.processed_nav_structure[0]["children"][1]["title"]
+
+
+def test_navigation_is_available_before_pages(tmp_path, page_cache):
+    path = _make_pdf(tmp_path / "toc.pdf", 2)
+    shown = []
+    with PdfParser(path) as parser:
+        parser.process_content(
+            on_navigation=lambda nav: shown.append((nav, dict(parser.content_texts)))
+        )
+        ((nav, texts_then),) = shown
+        assert texts_then == {}
+        assert [child["title"] for child in nav[0]["children"]] == ["Page 1", "Page 2"]
+        titles = [child["title"] for child in parser.processed_nav_structure[0]["children"]]
+        assert titles[0].startswith("Page 1 - Page 1 opening line")
+
+
+def test_text_extractor_shares_the_page_cache(tmp_path, page_cache, monkeypatch):
+    from abogen.text_extractor import extract_from_path
+
+    path = _make_pdf(tmp_path / "shared.pdf", 2)
+    first = extract_from_path(Path(path))
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("pages extracted on a cache hit")
+
+    monkeypatch.setattr(pdf_pages, "iter_pdf_page_texts", _fail)
+    second = extract_from_path(Path(path))
+    assert [c.text for c in second.chapters] == [c.text for c in first.chapters]
+    assert [c.title for c in first.chapters] == ["Page 1", "Page 2"]
+
+
+def test_cache_key_tracks_content_and_options(tmp_path):
+    path = _make_pdf(tmp_path / "a.pdf", 1)
+    key = pdf_cache_key(path, True)
+    assert pdf_cache_key(path, False) != key
+    _make_pdf(tmp_path / "a.pdf", 2)
+    assert pdf_cache_key(path, True) != key
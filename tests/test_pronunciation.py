@@ -208,6 +208,77 @@ class TestApplyPronunciationRules:
         result = apply_pronunciation_rules("This is a Test", rules)
         assert "tst" in result.lower()
 
+    def test_longest_token_wins_overlap(self):
+        from abogen.domain.pronunciation import compile_pronunciation_rules, apply_pronunciation_rules
+
+        rules = compile_pronunciation_rules(
+            [
+                {"token": "New York", "pronunciation": "NY"},
+                {"token": "York City", "pronunciation": "YC"},
+            ]
+        )
+        assert apply_pronunciation_rules("New York City, New York's", rules) == "New YC, NY's"
+
+    def test_shorter_rule_fills_gap_after_overlap(self):
+        from abogen.domain.pronunciation import compile_pronunciation_rules, apply_pronunciation_rules
+
+        rules = compile_pronunciation_rules(
+            [
+                {"token": "X Y Z W", "pronunciation": "long"},
+                {"token": "A X", "pronunciation": "ax"},
+                {"token": "A", "pronunciation": "a"},
+            ]
+        )
+        assert apply_pronunciation_rules("A X Y Z W. A X.", rules) == "a long. ax."
+
+    def test_shared_prefixes_and_word_boundaries(self):
+        from abogen.domain.pronunciation import compile_pronunciation_rules, apply_pronunciation_rules
+
+        rules = compile_pronunciation_rules(
+            [
+                {"token": "Jam", "pronunciation": "jahm"},
+                {"token": "James", "pronunciation": "jaymz"},
+            ]
+        )
+        counter: dict[str, int] = {}
+        result = apply_pronunciation_rules("James\u2019 jam, Jamesy JAM's", rules, counter)
+        assert result == "jaymz\u2019 jahm, Jamesy jahm's"
+        assert counter == {"james": 1, "jam": 2}
+
+    def test_plain_rule_list_is_accepted(self):
+        from abogen.domain.pronunciation import compile_pronunciation_rules, apply_pronunciation_rules
+
+        rules = list(compile_pronunciation_rules([{"token": "dog", "pronunciation": "dawg"}]))
+        assert apply_pronunciation_rules("a dog's life", rules) == "a dawg's life"
+
+    def test_matches_per_rule_substitution(self):
+        from abogen.domain.pronunciation import compile_pronunciation_rules, apply_pronunciation_rules
+
+        overrides = [
+            {"token": "Gandalf", "pronunciation": "GAN-dalf"},
+            {"token": "Gandalf the Grey", "pronunciation": "GAN-dalf the grey"},
+            {"token": "Frodo", "pronunciation": "FRO-doh"},
+            {"token": "Bag End", "pronunciation": "bag end"},
+            {"token": "Sam", "pronunciation": "sahm"},
+        ]
+        rules = compile_pronunciation_rules(overrides)
+        text = "Gandalf the Grey met Frodo at Bag End; Sam's cart and Gandalf\u2019s staff. Samwise."
+
+        expected = text
+        expected_counts: dict[str, int] = {}
+        for rule in rules:
+            key = rule["normalized"]
+
+            def _sub(match, rule=rule, key=key):
+                expected_counts[key] = expected_counts.get(key, 0) + 1
+                return rule["replacement"] + (match.group("possessive") or "")
+
+            expected = rule["pattern"].sub(_sub, expected)
+
+        counter: dict[str, int] = {}
+        assert apply_pronunciation_rules(text, rules, counter) == expected
+        assert counter == expected_counts
+
 
 class TestApplyHeteronymSentenceRules:
     """apply_heteronym_sentence_rules applies sentence-level replacements."""
@@ -0,0 +1,172 @@
+"""Tests for the persistent synthesized-segment cache."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import pytest
+
+from abogen.domain.conversion_engine import SegmentStats, SynthParams, run_tts_segment_loop
+from abogen.domain.enums import Language, SubtitleMode
+from abogen.domain.normalization import TTSContext
+from abogen.domain.segment_cache import SegmentCache, segment_cache_key
+
+
+@dataclass
+class _Token:
+    text: str
+    start_ts: float
+    end_ts: float
+    whitespace: str = ""
+
+
+@dataclass
+class _Segment:
+    graphemes: str
+    audio: Any
+    tokens: list = field(default_factory=list)
+
+
+class _CountingBackend:
+    """Deterministic pipeline: one segment per sentence, audio derived from text."""
+
+    plugin_id = "fake"
+    language = Language.EN_US
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, text: str, voice: Any, speed: float = 1.0, split_pattern: str = "", **kwargs: Any):
+        self.calls += 1
+        for sentence in [s for s in text.split(". ") if s]:
+            samples = 2400 * len(sentence.split())
+            audio = np.linspace(-0.5, 0.5, samples, dtype=np.float32) * (len(sentence) % 7 + 1) / 8
+            words = sentence.split()
+            tokens = [
+                _Token(word, i * 0.1, (i + 1) * 0.1, " " if i < len(words) - 1 else "")
+                for i, word in enumerate(words)
+            ]
+            yield _Segment(graphemes=sentence, audio=audio, tokens=tokens)
+
+
+class _Sink:
+    def __init__(self) -> None:
+        self.written: list[np.ndarray] = []
+
+    def write(self, audio: np.ndarray) -> None:
+        self.written.append(np.asarray(audio))
+
+
+def _run(text, backend, cache, *, start=0.0, cancel=lambda: False, voice="af_nova"):
+    sink = _Sink()
+    params = SynthParams(
+        tts_context=TTSContext(),
+        stats=SegmentStats(current_time=start, total_characters=len(text)),
+        check_cancel=cancel,
+        on_progress=lambda pct, etr: None,
+        audio_sink=sink,
+        subtitle_mode=SubtitleMode.SENTENCE.value,
+        segment_cache=cache,
+    )
+    count, tokens = run_tts_segment_loop(
+        text=text, params=params, backend=backend, voice=voice, speed=1.0, split_pattern=r"\n+"
+    )
+    return count, tokens, sink, params.stats
+
+
+TEXT = "The quick brown fox. Jumps over. The lazy dog"
+
+
+class TestSegmentCacheReplay:
+
+    def test_hit_replays_identical_audio_and_timings(self, tmp_path):
+        cache = SegmentCache(tmp_path, max_bytes=10 * 1024 * 1024)
+        backend = _CountingBackend()
+
+        first = _run(TEXT, backend, cache, start=2.0)
+        second = _run(TEXT, backend, cache, start=5.0)
+
+        assert backend.calls == 1
+        assert cache.stats().hits == 1 and cache.stats().misses == 1
+        assert first[0] == second[0] == 3
+        for a, b in zip(first[2].written, second[2].written):
+            np.testing.assert_array_equal(a, b)
+        assert second[3].current_time == pytest.approx(first[3].current_time + 3.0)
+        assert len(first[1]) == len(second[1]) == 9
+        for original, replayed in zip(first[1], second[1]):
+            assert replayed["start"] == pytest.approx(original["start"] + 3.0)
+            assert replayed["end"] == pytest.approx(original["end"] + 3.0)
+            assert replayed["text"] == original["text"]
+            assert replayed["whitespace"] == original["whitespace"]
+
+    def test_key_changes_with_voice_speed_and_text(self):
+        backend = _CountingBackend()
+        base = dict(backend=backend, voice="a", speed=1.0, total_steps=None, text="x", split_pattern="")
+        key = segment_cache_key(**base)
+        assert key == segment_cache_key(**base)
+        assert key != segment_cache_key(**dict(base, voice="b"))
+        assert key != segment_cache_key(**dict(base, speed=1.1))
+        assert key != segment_cache_key(**dict(base, text="y"))
+        assert key != segment_cache_key(**dict(base, total_steps=8))
+        # Tensor voices are keyed by content.
+        assert segment_cache_key(**dict(base, voice=np.ones(4))) == segment_cache_key(
+            **dict(base, voice=np.ones(4))
+        )
+
+    def test_backend_without_plugin_id_is_not_cached(self, tmp_path):
+        cache = SegmentCache(tmp_path, max_bytes=10 * 1024 * 1024)
+        backend = _CountingBackend()
+        backend.plugin_id = None
+        _run(TEXT, backend, cache)
+        _run(TEXT, backend, cache)
+        assert backend.calls == 2
+        assert cache.stats().entries == 0
+
+    def test_cancelled_call_is_not_stored(self, tmp_path):
+        cache = SegmentCache(tmp_path, max_bytes=10 * 1024 * 1024)
+        backend = _CountingBackend()
+        checks = iter([False, True])
+        _run(TEXT, backend, cache, cancel=lambda: next(checks, True))
+        assert cache.stats().stores == 0
+        _run(TEXT, backend, cache)
+        assert backend.calls == 2
+
+
+class TestSegmentCacheEviction:
+
+    def test_lru_eviction_and_persistence(self, tmp_path):
+        backend = _CountingBackend()
+        probe = SegmentCache(tmp_path / "probe", max_bytes=10 * 1024 * 1024)
+        _run("one two three", backend, probe)
+        entry_size = probe.stats().bytes
+
+        cache = SegmentCache(tmp_path / "lru", max_bytes=int(entry_size * 2.5))
+        _run("one two three", backend, cache)
+        _run("four five six", backend, cache)
+        _run("one two three", backend, cache)  # refresh recency
+        _run("seven eight nine", backend, cache)
+
+        stats = cache.stats()
+        assert stats.evictions == 1
+        assert stats.entries == 2
+        assert stats.bytes <= cache.max_bytes
+
+        reopened = SegmentCache(tmp_path / "lru", max_bytes=cache.max_bytes)
+        calls = backend.calls
+        _run("one two three", backend, reopened)
+        _run("seven eight nine", backend, reopened)
+        assert backend.calls == calls
+        _run("four five six", backend, reopened)
+        assert backend.calls == calls + 1
+
+    def test_corrupt_entry_is_dropped(self, tmp_path):
+        cache = SegmentCache(tmp_path, max_bytes=10 * 1024 * 1024)
+        backend = _CountingBackend()
+        _run(TEXT, backend, cache)
+        for path in tmp_path.glob("*.npz"):
+            path.write_bytes(b"not a zip")
+        _run(TEXT, backend, cache)
+        assert backend.calls == 2
+        assert cache.stats().entries == 1
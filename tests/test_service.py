@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import io
+import json
+import threading
 import time
 from abogen.webui.service import (
+    ConversionService,
     Job,
     JobStatus,
+    STATE_VERSION,
     build_service,
     _JOB_LOGGER,
 )
@@ -204,10 +208,206 @@ def test_retry_removes_failed_job(tmp_path):
         job_ids = {entry.id for entry in service.list_jobs()}
         assert job.id not in job_ids
         assert new_job.id in job_ids
+        # The retry resumes from the original job's chapter checkpoint.
+        assert new_job.resume_token == job.id
     finally:
         service.shutdown()
 
 
+def _enqueue_sample(service, source, outputs, **overrides):
+    options = dict(
+        original_filename=source.name,
+        stored_path=source,
+        language="a",
+        voice="af_alloy",
+        speed=1.0,
+        use_gpu=False,
+        subtitle_mode="Disabled",
+        output_format="wav",
+        save_mode="Save next to input file",
+        output_folder=outputs,
+        replace_single_newlines=False,
+        subtitle_format="srt",
+        total_characters=10,
+    )
+    options.update(overrides)
+    return service.enqueue(**options)
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+def test_service_runs_jobs_concurrently_with_multiple_workers(tmp_path, monkeypatch):
+    monkeypatch.setenv("ABOGEN_QUEUE_STATE_PATH", str(tmp_path / "state" / "queue_state.json"))
+    outputs = tmp_path / "outputs"
+    outputs.mkdir()
+    source = tmp_path / "sample.txt"
+    source.write_text("hello", encoding="utf-8")
+
+    release = threading.Event()
+    running: set[str] = set()
+    running_lock = threading.Lock()
+
+    def runner(job):
+        with running_lock:
+            running.add(job.id)
+        release.wait(timeout=5)
+
+    service = ConversionService(outputs, runner, uploads_root=tmp_path / "uploads", poll_interval=0.05, max_workers=2)
+    try:
+        first = _enqueue_sample(service, source, outputs)
+        second = _enqueue_sample(service, source, outputs)
+        third = _enqueue_sample(service, source, outputs)
+
+        assert _wait_for(lambda: len(running) == 2)
+        assert running == {first.id, second.id}
+        assert third.status is JobStatus.PENDING
+        assert third.queue_position == 1
+        assert first.queue_position is None
+
+        release.set()
+        assert _wait_for(lambda: all(job.status is JobStatus.COMPLETED for job in (first, second, third)))
+    finally:
+        release.set()
+        service.shutdown()
+
+
+def test_service_admission_limits_provider_and_large_jobs(tmp_path, monkeypatch):
+    monkeypatch.setenv("ABOGEN_QUEUE_STATE_PATH", str(tmp_path / "state" / "queue_state.json"))
+    outputs = tmp_path / "outputs"
+    outputs.mkdir()
+    source = tmp_path / "sample.txt"
+    source.write_text("hello", encoding="utf-8")
+
+    release = threading.Event()
+    started: list[str] = []
+
+    def runner(job):
+        started.append(job.id)
+        release.wait(timeout=5)
+
+    service = ConversionService(
+        outputs,
+        runner,
+        uploads_root=tmp_path / "uploads",
+        poll_interval=0.05,
+        max_workers=4,
+        max_jobs_per_provider=2,
+        large_job_characters=1_000,
+        max_large_jobs=1,
+    )
+    try:
+        big = _enqueue_sample(service, source, outputs, total_characters=5_000)
+        big_blocked = _enqueue_sample(service, source, outputs, total_characters=5_000)
+        small = _enqueue_sample(service, source, outputs)
+        kokoro_blocked = _enqueue_sample(service, source, outputs)
+        supertonic = _enqueue_sample(service, source, outputs, tts_provider="supertonic")
+
+        assert _wait_for(lambda: len(started) == 3)
+        time.sleep(0.2)
+        assert set(started) == {big.id, small.id, supertonic.id}
+        assert big_blocked.queue_position == 1
+        assert kokoro_blocked.queue_position == 2
+
+        release.set()
+        assert _wait_for(
+            lambda: all(job.status is JobStatus.COMPLETED for job in (big, big_blocked, small, kokoro_blocked, supertonic))
+        )
+    finally:
+        release.set()
+        service.shutdown()
+
+
+def test_service_state_survives_restart_and_writes_deltas(tmp_path, monkeypatch):
+    state_path = tmp_path / "state" / "queue_state.json"
+    monkeypatch.setenv("ABOGEN_QUEUE_STATE_PATH", str(state_path))
+    outputs = tmp_path / "outputs"
+    outputs.mkdir()
+    source = tmp_path / "sample.txt"
+    source.write_text("hello", encoding="utf-8")
+
+    service = ConversionService(outputs, lambda job: None, uploads_root=tmp_path / "uploads", poll_interval=0.05)
+    try:
+        jobs = [_enqueue_sample(service, source, outputs) for _ in range(3)]
+        assert _wait_for(lambda: all(job.status is JobStatus.COMPLETED for job in jobs))
+
+        writes: list[dict] = []
+        original_write = service._store.write
+
+        def spy(**kwargs):
+            writes.append(kwargs)
+            original_write(**kwargs)
+
+        monkeypatch.setattr(service._store, "write", spy)
+        jobs[0].add_log("note")
+        service._persist_state()
+        service._persist_state()
+        assert [sorted(write["upserts"]) for write in writes] == [[jobs[0].id]]
+
+        assert service.delete(jobs[1].id)
+        assert writes[-1]["deletes"] == [jobs[1].id]
+        assert not writes[-1]["upserts"]
+    finally:
+        service.shutdown()
+        service._store.close()
+
+    assert not state_path.exists()
+    restored = ConversionService(outputs, lambda job: None, uploads_root=tmp_path / "uploads", poll_interval=0.05)
+    try:
+        assert {job.id for job in restored.list_jobs()} == {jobs[0].id, jobs[2].id}
+        assert restored.get_job(jobs[0].id).logs[-1].message == "note"
+        assert restored.get_job(jobs[2].id).status is JobStatus.COMPLETED
+    finally:
+        restored.shutdown()
+        restored._store.close()
+
+
+def test_service_imports_legacy_json_state(tmp_path, monkeypatch):
+    state_path = tmp_path / "state" / "queue_state.json"
+    monkeypatch.setenv("ABOGEN_QUEUE_STATE_PATH", str(state_path))
+    outputs = tmp_path / "outputs"
+    outputs.mkdir()
+    source = tmp_path / "sample.txt"
+    source.write_text("hello", encoding="utf-8")
+
+    service = ConversionService(outputs, lambda job: None, uploads_root=tmp_path / "uploads")
+    job = Job(
+        id="legacy-job",
+        original_filename="sample.txt",
+        stored_path=source,
+        language="a",
+        voice="af_alloy",
+        speed=1.0,
+        use_gpu=False,
+        subtitle_mode="Disabled",
+        output_format="wav",
+        save_mode="Save next to input file",
+        output_folder=outputs,
+        replace_single_newlines=False,
+        subtitle_format="srt",
+        created_at=time.time(),
+    )
+    job.status = JobStatus.FAILED
+    legacy = {"version": STATE_VERSION, "jobs": [service._serialize_job(job)], "queue": []}
+    service._store.close()
+    state_path.with_suffix(".sqlite3").unlink()
+    state_path.write_text(json.dumps(legacy), encoding="utf-8")
+
+    restored = ConversionService(outputs, lambda job: None, uploads_root=tmp_path / "uploads")
+    try:
+        imported = restored.get_job("legacy-job")
+        assert imported is not None and imported.status is JobStatus.FAILED
+    finally:
+        restored.shutdown()
+        restored._store.close()
+
+
 def test_audiobookshelf_metadata_uses_book_number(tmp_path):
     source = tmp_path / "book.txt"
     source.write_text("content", encoding="utf-8")
@@ -0,0 +1,108 @@
+"""Tests for spaCy segmentation modes."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+pytest.importorskip("spacy")
+
+from abogen import spacy_utils
+from abogen.domain.enums import Language
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    spacy_utils.clear_cache()
+    yield
+    spacy_utils.clear_cache()
+
+
+def test_mode_from_environment(monkeypatch):
+    monkeypatch.delenv("ABOGEN_SPACY_SEGMENTER", raising=False)
+    assert spacy_utils.segmentation_mode() == "parser"
+    monkeypatch.setenv("ABOGEN_SPACY_SEGMENTER", " Senter ")
+    assert spacy_utils.segmentation_mode() == "senter"
+    monkeypatch.setenv("ABOGEN_SPACY_SEGMENTER", "bogus")
+    assert spacy_utils.segmentation_mode() == "parser"
+
+
+def test_sentencizer_mode_needs_no_model():
+    messages = []
+    sentences = spacy_utils.segment_sentences(
+        "Hello there. How are you? Fine!", Language.EN_US, log_callback=messages.append, mode="sentencizer"
+    )
+    assert sentences == ["Hello there.", "How are you?", "Fine!"]
+    assert any("'blank:en' (sentencizer segmentation)" in message for message, _ in messages)
+
+
+def test_pipeline_is_shared_across_threads():
+    loaded = []
+
+    def load():
+        loaded.append(spacy_utils.get_spacy_model(Language.EN_US, lambda msg: None, mode="sentencizer"))
+
+    threads = [threading.Thread(target=load) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert loaded[0] is not None
+    assert all(nlp is loaded[0] for nlp in loaded)
+
+
+# ─── Model registry ───
+
+
+@pytest.fixture
+def saved_model(tmp_path):
+    import spacy
+
+    nlp = spacy.blank("en")
+    nlp.add_pipe("entity_ruler").add_patterns([{"label": "PERSON", "pattern": "Alice"}])
+    nlp.add_pipe("sentencizer")
+    nlp.disable_pipe("sentencizer")
+    path = tmp_path / "model"
+    nlp.to_disk(path)
+    return str(path)
+
+
+def test_views_share_one_loaded_model(saved_model):
+    default = spacy_utils.pipeline_view(saved_model)
+    segmenter = spacy_utils.pipeline_view(saved_model, include=["sentencizer"])
+
+    assert default.nlp is segmenter.nlp
+    assert spacy_utils.pipeline_view(saved_model) is default
+    assert default.pipe_names == ["entity_ruler"]
+    assert segmenter.pipe_names == ["sentencizer"]
+
+    doc = default("Alice waved. Bob left.")
+    assert [ent.text for ent in doc.ents] == ["Alice"]
+    assert [sent.text for sent in segmenter("Alice waved. Bob left.").sents] == ["Alice waved.", "Bob left."]
+    # The shared pipeline itself is never changed by a view.
+    assert default.nlp.pipe_names == ["entity_ruler"]
+
+
+def test_view_pipe_keeps_contexts(saved_model):
+    view = spacy_utils.pipeline_view(saved_model, exclude=["entity_ruler"], sentences=True)
+    assert view.pipe_names == ["sentencizer"]
+
+    results = list(view.pipe([("One. Two.", 1), ("Three.", 2)], as_tuples=True, batch_size=1))
+    assert [(len(list(doc.sents)), context) for doc, context in results] == [(2, 1), (1, 2)]
+
+
+def test_idle_models_are_evicted_and_reported(saved_model):
+    first = spacy_utils.load_model(saved_model)
+    spacy_utils.pipeline_view(saved_model)
+
+    (report,) = spacy_utils.model_memory_report()
+    assert report["model"] == saved_model
+    assert report["components"] == ["entity_ruler", "sentencizer"]
+    assert report["views"] == ["entity_ruler"]
+    assert report["weights_bytes"] >= 0
+
+    assert spacy_utils.evict_models(max_idle_seconds=3600) == []
+    assert spacy_utils.evict_models(max_idle_seconds=0) == [saved_model]
+    assert spacy_utils.model_memory_report() == []
+    assert spacy_utils.load_model(saved_model) is not first
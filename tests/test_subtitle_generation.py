@@ -1,8 +1,11 @@
 """Tests for abogen.domain.subtitle_generation module."""
 
+import math
+
 import pytest
 
 from abogen.domain.enums import Language
+from abogen.domain.token_timings import TokenBatch, TokenColumns
 from abogen.domain.subtitle_generation import (
     process_subtitle_tokens,
     PUNCTUATION_SENTENCE,
@@ -204,3 +207,60 @@ class TestPunctuationConstants:
         assert "." in PUNCTUATION_SENTENCE_COMMA
         assert "!" in PUNCTUATION_SENTENCE_COMMA
         assert "?" in PUNCTUATION_SENTENCE_COMMA
+
+
+class TestTokenBatch:
+    """Tests for the columnar token representation."""
+
+    TOKENS = [
+        {"start": 0.0, "end": 0.4, "text": "Hello,", "whitespace": " "},
+        {"start": 0.4, "end": 0.9, "text": "world.", "whitespace": " "},
+        {"start": None, "end": None, "text": "Again", "whitespace": ""},
+    ]
+
+    def test_spans_and_missing_times(self):
+        """Test span text is one slice and missing times are NaN."""
+        batch = TokenBatch.from_dicts(self.TOKENS)
+        assert len(batch) == 3
+        assert batch.span_text(0, 1) == "Hello, world. "
+        assert batch.text(2) == "Again"
+        assert batch.whitespace(0) == " "
+        assert math.isnan(batch.starts[2])
+        assert batch.total_duration() == pytest.approx(0.9)
+        assert [t["text"] for t in batch.shifted(1.0)] == ["Hello,", "world.", "Again"]
+        assert batch.shifted(1.0).starts[1] == pytest.approx(1.4)
+
+    @pytest.mark.parametrize(
+        "mode, expected",
+        [
+            ("Sentence", [(0.0, 0.9, "Hello, world."), (None, 2.0, "Again")]),
+            ("Sentence + Comma", [(0.0, 0.4, "Hello,"), (0.4, 0.9, "world."), (None, 2.0, "Again")]),
+            ("Line", [(0.0, 2.0, "Hello, world. Again")]),
+            (
+                "Sentence + Highlighting",
+                [(0.0, 0.9, "{\\kf40}Hello, {\\kf50}world."), (None, 2.0, "{\\kf50}Again")],
+            ),
+            ("2", [(0.0, 0.9, "Hello, world."), (None, 2.0, "Again")]),
+        ],
+    )
+    @pytest.mark.parametrize("as_batch", [False, True])
+    def test_entries_per_mode(self, mode, expected, as_batch):
+        """Test every mode gives the same entries for dicts and a batch."""
+        tokens = TokenBatch.from_dicts(self.TOKENS) if as_batch else self.TOKENS
+        entries = []
+        process_subtitle_tokens(tokens, entries, 50, mode, Language.EN_US, fallback_end_time=2.0)
+        assert entries == expected
+
+    def test_iteration_keeps_missing_times_as_none(self):
+        """Test dicts read back from a batch or columns match the input."""
+        columns = TokenColumns()
+        columns.extend(self.TOKENS)
+        assert list(columns) == self.TOKENS
+        assert list(columns.batch()) == self.TOKENS
+        assert list(TokenBatch.from_dicts(self.TOKENS)) == self.TOKENS
+
+    def test_untimed_karaoke_token_gets_half_second(self):
+        """Test tokens without times are highlighted for 0.5 s."""
+        entries = []
+        process_subtitle_tokens(self.TOKENS[2:], entries, 50, "Sentence + Highlighting", Language.EN_US)
+        assert entries == [(None, None, "{\\kf50}Again")]
@@ -359,3 +359,38 @@ def test_currency_magnitude():
         assert (
             expected.lower() in normalized.lower()
         ), f"Failed for {input_text}: got '{normalized}'"
+
+
+class _RecordingPipeline:
+    """Blank English tokenizer standing in for the tagged model."""
+
+    def __init__(self):
+        import spacy
+
+        self._nlp = spacy.blank("en")
+        self.batches = []
+
+    def pipe(self, texts, batch_size=None):
+        texts = list(texts)
+        self.batches.append(texts)
+        return (self._nlp.make_doc(text) for text in texts)
+
+
+def test_contraction_resolver_parses_only_ambiguous_sentences(monkeypatch):
+    pytest.importorskip("spacy")
+    from abogen import spacy_contraction_resolver as resolver
+
+    pipeline = _RecordingPipeline()
+    monkeypatch.setattr(resolver, "_load_spacy_model", lambda model: pipeline)
+    monkeypatch.setattr(resolver, "_SENTENCE_MEMO", type(resolver._SENTENCE_MEMO)())
+    text = "The sun rose. Then it's morning! Nothing else. He'd gone.\n\nThen it's morning!"
+
+    resolutions = resolver.resolve_ambiguous_contractions(text)
+
+    assert pipeline.batches == [["Then it's morning!", "He'd gone."]]
+    assert sorted(text[start:end] for start, end in resolutions) == ["He'd", "it's", "it's"]
+    first = text.index("it's")
+    assert resolutions[(first, first + 4)].expansion == "it is"
+
+    resolver.resolve_ambiguous_contractions("Then it's morning!")
+    assert len(pipeline.batches) == 1